@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Import-time regression benchmark for CLI startup.
+
+Runs ``python -X importtime`` for the module graph each command loads
+before it does any work and fails when a command exceeds the startup
+budget or imports a module reserved for network commands (aiohttp,
+jsonschema, keyring). The budget covers non-network commands, which
+should start almost instantly.
+
+Usage:
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py --budget-ms 150 --repeat 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Startup budget for non-network commands, in milliseconds of import time
+STARTUP_BUDGET_MS = 250
+
+# Modules only network commands (install, update, upgrade, auth, token,
+# remove) may load
+NETWORK_MODULES = ("aiohttp", "jsonschema", "keyring")
+
+# Command -> modules imported before the command runs
+COMMANDS = {
+    "--help": ["my_unicorn.main"],
+    "catalog": ["my_unicorn.main", "my_unicorn.cli.commands.catalog"],
+    "config": ["my_unicorn.main", "my_unicorn.cli.commands.config"],
+    "cache": ["my_unicorn.main", "my_unicorn.cli.commands.cache"],
+    "migrate": ["my_unicorn.main", "my_unicorn.cli.commands.migrate"],
+    "backup": ["my_unicorn.main", "my_unicorn.cli.commands.backup"],
+}
+
+_MARKER = "--bench-startup--"
+
+
+def measure(modules: list[str]) -> tuple[float, set[str]]:
+    """Import modules in a fresh interpreter.
+
+    Returns:
+        Total import time in milliseconds and the names of all modules
+        imported
+
+    """
+    code = f"import sys; print({_MARKER!r}, file=sys.stderr); " + "; ".join(
+        f"import {module}" for module in modules
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    lines = result.stderr.split(_MARKER, 1)[1].splitlines()
+
+    total_us = 0
+    imported: set[str] = set()
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        imported.add(name.strip())
+        # Top-level entries include the time of everything they import
+        if not name.startswith("  ", 1):
+            total_us += int(cumulative)
+    return total_us / 1000, imported
+
+
+def main() -> int:
+    """Measure every command and compare against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=STARTUP_BUDGET_MS,
+        help=f"import time budget per command (default: {STARTUP_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="runs per command; the fastest is reported (default: 5)",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for command, modules in COMMANDS.items():
+        runs = [measure(modules) for _ in range(max(1, args.repeat))]
+        best_ms = min(ms for ms, _ in runs)
+        imported = runs[0][1]
+        network = sorted(
+            {name.split(".")[0] for name in imported} & set(NETWORK_MODULES)
+        )
+        status = "ok"
+        if best_ms > args.budget_ms:
+            status = "OVER BUDGET"
+            failed = True
+        if network:
+            status = f"imports {', '.join(network)}"
+            failed = True
+        print(f"{command:<10} {best_ms:8.1f} ms  {status}")
+
+    print(f"Budget: {args.budget_ms:.0f} ms per command")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Build the precompiled catalog index.
+
+Parses every catalog JSON file in src/my_unicorn/catalog/ and writes
+src/my_unicorn/catalog/catalog.index, which is committed and shipped with
+the package so catalog listing and lookups do not parse per-app files. Run it
+and commit the result after editing the catalog; the test suite fails while
+the committed index is stale. my-unicorn also rebuilds a stale index on first
+use, writing it to the user cache directory.
+"""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from my_unicorn.config.catalog_index import CATALOG_INDEX_NAME, CatalogIndex  # noqa: E402
+
+CATALOG_DIR = SRC_DIR / "my_unicorn" / "catalog"
+
+
+def main() -> int:
+    """Build the catalog index and report invalid entries."""
+    index = CatalogIndex.build(CATALOG_DIR)
+    if not index.names():
+        print(f"No catalog entries found in {CATALOG_DIR}")
+        return 1
+    index_path = CATALOG_DIR / CATALOG_INDEX_NAME
+    if not index.write(index_path):
+        print(f"Failed to write {index_path}")
+        return 1
+
+    print(f"Indexed {len(index.names())} catalog entries in {index_path}")
+    invalid = 0
+    for name in index.names():
+        try:
+            index.get(name)
+        except ValueError as e:
+            print(f"  {e}")
+            invalid += 1
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,16 +2,35 @@
 
 This module contains all command handler implementations that provide
 the core functionality for each CLI command.
+
+Handlers are imported on first attribute access, so importing one command
+module does not load the dependencies of every other command.
 """
 
-from .auth import AuthHandler
-from .base import BaseCommandHandler
-from .catalog import CatalogHandler
-from .config import ConfigHandler
-from .install import InstallCommandHandler
-from .remove import RemoveHandler
-from .update import UpdateHandler
-from .upgrade import UpgradeHandler
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .auth import AuthHandler
+    from .base import BaseCommandHandler
+    from .catalog import CatalogHandler
+    from .config import ConfigHandler
+    from .install import InstallCommandHandler
+    from .remove import RemoveHandler
+    from .update import UpdateHandler
+    from .upgrade import UpgradeHandler
+
+# Exported name -> submodule defining it
+_HANDLER_MODULES = {
+    "AuthHandler": "auth",
+    "BaseCommandHandler": "base",
+    "CatalogHandler": "catalog",
+    "ConfigHandler": "config",
+    "InstallCommandHandler": "install",
+    "RemoveHandler": "remove",
+    "UpdateHandler": "update",
+    "UpgradeHandler": "upgrade",
+}
 
 __all__ = [
     "AuthHandler",
@@ -23,3 +42,13 @@ __all__ = [
     "UpdateHandler",
     "UpgradeHandler",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a command handler when it is first accessed."""
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
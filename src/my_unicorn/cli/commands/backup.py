@@ -128,7 +128,7 @@ class BackupHandler(BaseCommandHandler):
             return
 
         version = config.get("state", {}).get("version", "unknown")
-        if backup_path := service.create_backup(
+        if backup_path := await service.create_backup_async(
             appimage_path, app_name, version
         ):
             logger.info(
@@ -5,16 +5,22 @@ inherit from, ensuring consistent interface and shared functionality
 across commands.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from argparse import Namespace
+from typing import TYPE_CHECKING
 
-from my_unicorn.config import ConfigManager
-from my_unicorn.config.schemas.validator import ConfigValidator
-from my_unicorn.core.auth import GitHubAuthManager
-from my_unicorn.core.cache import ReleaseCacheManager
-from my_unicorn.core.update import UpdateManager
 from my_unicorn.logger import get_logger
 
+if TYPE_CHECKING:
+    from argparse import Namespace
+
+    from my_unicorn.config import ConfigManager
+    from my_unicorn.config.schemas.validator import ConfigValidator
+    from my_unicorn.core.auth import GitHubAuthManager
+    from my_unicorn.core.cache import ReleaseCacheManager
+    from my_unicorn.core.update import UpdateManager
+
 logger = get_logger(__name__)
 
 
@@ -43,20 +49,22 @@ class BaseCommandHandler(ABC):
             validator=validator,
         )
 
-        # In production, CLIRunner creates all dependencies and injects them
-        # into handlers via _create_handler() factory method.
+        # In production, CLIRunner injects the config manager and validator
+        # via _create_handler(); the other services are created on first use.
 
     Note:
         Concrete handlers must implement the execute() method.
         CLIRunner acts as the composition root, creating and injecting
-        all dependencies.
+        the shared dependencies. Services that are not injected are created
+        lazily, so a command only imports the modules it actually uses
+        (e.g. ``catalog`` never loads aiohttp or keyring).
     """
 
     def __init__(
         self,
         config_manager: ConfigManager,
-        auth_manager: GitHubAuthManager,
-        update_manager: UpdateManager,
+        auth_manager: GitHubAuthManager | None = None,
+        update_manager: UpdateManager | None = None,
         cache_manager: ReleaseCacheManager | None = None,
         validator: ConfigValidator | None = None,
     ) -> None:
@@ -64,19 +72,63 @@ class BaseCommandHandler(ABC):
 
         Args:
             config_manager: Configuration management instance
-            auth_manager: GitHub authentication manager
-            update_manager: Update management instance
+            auth_manager: Optional GitHub authentication manager
+                (created on first use if not provided)
+            update_manager: Optional update management instance
+                (created on first use if not provided)
             cache_manager: Optional release cache manager
+                (created on first use if not provided)
             validator: Optional config validator
 
         """
         self.config_manager = config_manager
         self.global_config = config_manager.load_global_config()
-        self.auth_manager = auth_manager
-        self.update_manager = update_manager
-        self.cache_manager = cache_manager
+        self._auth_manager = auth_manager
+        self._update_manager = update_manager
+        self._cache_manager = cache_manager
         self.validator = validator
 
+    @property
+    def auth_manager(self) -> GitHubAuthManager:
+        """GitHub authentication manager (created on first access)."""
+        if self._auth_manager is None:
+            from my_unicorn.core.auth import GitHubAuthManager  # noqa: PLC0415
+
+            self._auth_manager = GitHubAuthManager.create_default()
+        return self._auth_manager
+
+    @auth_manager.setter
+    def auth_manager(self, auth_manager: GitHubAuthManager) -> None:
+        self._auth_manager = auth_manager
+
+    @property
+    def cache_manager(self) -> ReleaseCacheManager:
+        """Release cache manager (created on first access)."""
+        if self._cache_manager is None:
+            from my_unicorn.core.cache import ReleaseCacheManager  # noqa: PLC0415
+
+            self._cache_manager = ReleaseCacheManager(self.config_manager)
+        return self._cache_manager
+
+    @cache_manager.setter
+    def cache_manager(self, cache_manager: ReleaseCacheManager) -> None:
+        self._cache_manager = cache_manager
+
+    @property
+    def update_manager(self) -> UpdateManager:
+        """Update manager (created on first access)."""
+        if self._update_manager is None:
+            from my_unicorn.core.update import UpdateManager  # noqa: PLC0415
+
+            self._update_manager = UpdateManager(
+                self.config_manager, self.auth_manager, self.cache_manager
+            )
+        return self._update_manager
+
+    @update_manager.setter
+    def update_manager(self, update_manager: UpdateManager) -> None:
+        self._update_manager = update_manager
+
     @abstractmethod
     async def execute(self, args: Namespace) -> None:
         """Execute the command with the given arguments.
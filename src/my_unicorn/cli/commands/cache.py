@@ -1,7 +1,8 @@
 """Cache command handler for my-unicorn CLI.
 
 Handles cache management operations for the CLI, including clearing
-cache entries and displaying cache statistics.
+cache entries and displaying cache statistics for the release cache and
+the icon cache.
 
 Dependency Injection:
     CacheHandler receives its cache_manager via BaseCommandHandler's
@@ -12,6 +13,7 @@ Dependency Injection:
 import sys
 from argparse import Namespace
 
+from my_unicorn.core.icon_cache import IconCache
 from my_unicorn.logger import get_logger
 
 from .base import BaseCommandHandler
@@ -23,7 +25,7 @@ class CacheHandler(BaseCommandHandler):
     """Handler for cache command operations.
 
     Provides cache management functionality:
-    - Clearing cache entries
+    - Clearing release and icon cache entries
     - Displaying cache statistics
 
     Note:
@@ -56,8 +58,8 @@ class CacheHandler(BaseCommandHandler):
         except KeyboardInterrupt:
             logger.info("Cache operation interrupted by user")
             sys.exit(130)
-        except Exception as e:
-            logger.error("Cache operation failed: %s", e)
+        except Exception:
+            logger.exception("Cache operation failed")
             sys.exit(1)
 
     async def _handle_clear(self, args: Namespace) -> None:
@@ -72,7 +74,11 @@ class CacheHandler(BaseCommandHandler):
         """
         if args.all:
             await self.cache_manager.clear_cache()
+            self._clear_icon_cache()
             logger.info("✓ Cleared all cache entries")
+        elif getattr(args, "icons", False):
+            removed = self._clear_icon_cache()
+            logger.info("✓ Cleared %d cached icons", removed)
         elif args.app_name:
             # Parse owner/repo from app name
             owner, repo = self._parse_app_name(args.app_name)
@@ -110,10 +116,48 @@ class CacheHandler(BaseCommandHandler):
 
             if "error" in stats:
                 logger.info("!Error getting stats: %s", stats["error"])
+
+            self._show_icon_cache_stats()
         except Exception as e:
             logger.info("× Failed to get cache stats: %s", e)
             sys.exit(1)
 
+    def _get_icon_cache(self) -> IconCache | None:
+        """Return the icon cache of the configured cache directory."""
+        global_config = self.config_manager.load_global_config()
+        return IconCache.from_global_config(global_config)
+
+    def _clear_icon_cache(self) -> int:
+        """Remove all icon cache entries.
+
+        Returns:
+            Number of icons removed from the cache
+
+        """
+        icon_cache = self._get_icon_cache()
+        if icon_cache is None or not icon_cache.db_path.exists():
+            return 0
+        return icon_cache.clear()
+
+    def _show_icon_cache_stats(self) -> None:
+        """Display icon cache statistics."""
+        icon_cache = self._get_icon_cache()
+        if icon_cache is None:
+            return
+        if not icon_cache.db_path.exists():
+            logger.info("📭 No icons cached")
+            return
+        stats = icon_cache.get_stats()
+        logger.info("🖼️ Icon Cache: %s", stats["cache_directory"])
+        logger.info("Cached Icons: %s", stats["icons"])
+        logger.info("Known AppImages: %s", stats["appimages"])
+        logger.info("Icon Size: %s bytes", stats["icon_bytes"])
+        missing = stats["missing_icons"]
+        if isinstance(missing, int) and missing > 0:
+            logger.info("× Missing Icons: %s", missing)
+        if "error" in stats:
+            logger.info("!Error getting icon stats: %s", stats["error"])
+
     def _parse_app_name(self, app_name: str) -> tuple[str, str]:
         """Parse app name to (owner, repo).
 
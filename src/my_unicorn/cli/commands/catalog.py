@@ -5,15 +5,21 @@ installed AppImages, showing available apps with descriptions, and displaying
 detailed information about specific applications.
 """
 
-from argparse import Namespace
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from my_unicorn.cli.commands.base import BaseCommandHandler
-from my_unicorn.config import ConfigManager
-from my_unicorn.config.schemas.validator import ConfigValidator
-from my_unicorn.core.auth import GitHubAuthManager
-from my_unicorn.core.cache import ReleaseCacheManager
 from my_unicorn.core.catalog import CatalogService
-from my_unicorn.core.update import UpdateManager
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+
+    from my_unicorn.config import ConfigManager
+    from my_unicorn.config.schemas.validator import ConfigValidator
+    from my_unicorn.core.auth import GitHubAuthManager
+    from my_unicorn.core.cache import ReleaseCacheManager
+    from my_unicorn.core.update import UpdateManager
 
 
 class CatalogHandler(BaseCommandHandler):
@@ -22,8 +28,8 @@ class CatalogHandler(BaseCommandHandler):
     def __init__(
         self,
         config_manager: ConfigManager,
-        auth_manager: GitHubAuthManager,
-        update_manager: UpdateManager,
+        auth_manager: GitHubAuthManager | None = None,
+        update_manager: UpdateManager | None = None,
         cache_manager: ReleaseCacheManager | None = None,
         validator: ConfigValidator | None = None,
     ) -> None:
@@ -43,7 +43,10 @@ class InstallCommandHandler(BaseCommandHandler):
         # Create progress display for CLI
         # Each target has 4 operations: download, verify, icon, install
         total_operations = len(targets) * 4
-        progress_display = ProgressDisplay()
+        progress_display = ProgressDisplay(
+            mode=getattr(args, "progress", "ascii"),
+            output_path=getattr(args, "progress_output", None),
+        )
 
         # Use ServiceContainer for dependency injection
         container = ServiceContainer(
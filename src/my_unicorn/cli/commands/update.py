@@ -28,7 +28,10 @@ class UpdateHandler(BaseCommandHandler):
     async def execute(self, args: Namespace) -> None:
         """Execute update command using ServiceContainer for DI."""
         try:
-            progress_display = ProgressDisplay()
+            progress_display = ProgressDisplay(
+                mode=getattr(args, "progress", "ascii"),
+                output_path=getattr(args, "progress_output", None),
+            )
 
             container = ServiceContainer(
                 config_manager=self.config_manager,
@@ -49,7 +52,9 @@ class UpdateHandler(BaseCommandHandler):
 
                     if getattr(args, "check_only", False):
                         results = await service.check_for_updates(
-                            app_names=app_names, refresh_cache=refresh
+                            app_names=app_names,
+                            refresh_cache=refresh,
+                            allow_stale=True,
                         )
                     else:
                         results = await service.perform_updates(
@@ -60,15 +65,19 @@ class UpdateHandler(BaseCommandHandler):
             finally:
                 await container.cleanup()
 
-            # Display results after cleanup
-            if getattr(args, "check_only", False):
-                display_check_results(results)
-            else:
-                display_update_results(results)
+            try:
+                # Display results after cleanup
+                if getattr(args, "check_only", False):
+                    display_check_results(results)
+                else:
+                    display_update_results(results)
 
-            display_invalid_apps(
-                results.get("invalid_apps", []), self.config_manager
-            )
+                display_invalid_apps(
+                    results.get("invalid_apps", []), self.config_manager
+                )
+            finally:
+                # Stale check results are refreshed once they are shown
+                await service.finish_background_refresh()
         except Exception as e:
             display_update_error(f"Update operation failed: {e}")
             logger.exception("Update operation failed")
@@ -71,6 +71,8 @@ class ServiceContainer:
 
     Attributes:
         config: Configuration manager for accessing global and app settings.
+            All services receive this instance, so they share its store of
+            loaded app configs (``config.app_config_store``).
         progress: Progress reporter for UI feedback during operations.
 
     Available Services (lazy-loaded singletons):
@@ -137,9 +139,6 @@ class ServiceContainer:
         self.config = config_manager or ConfigManager()
         self.progress = progress_reporter or NullProgressReporter()
 
-        # Load global configuration once
-        self._global_config: GlobalConfig | None = None
-
         # Lazy initialization of services - created on first access
         self._session: aiohttp.ClientSession | None = None
         self._auth_manager: GitHubAuthManager | None = None
@@ -155,15 +154,16 @@ class ServiceContainer:
 
     @property
     def global_config(self) -> GlobalConfig:
-        """Global configuration (loaded once, cached).
+        """Global configuration snapshot injected into services.
+
+        The snapshot is shared and read-only. It is parsed again only when
+        the settings file changes on disk.
 
         Returns:
             Global configuration dictionary with directory paths and settings.
 
         """
-        if self._global_config is None:
-            self._global_config = self.config.load_global_config()
-        return self._global_config
+        return self.config.global_config_snapshot()
 
     @property
     def install_dir(self) -> Path:
@@ -213,7 +213,8 @@ class ServiceContainer:
         """
         if self._cache_manager is None:
             self._cache_manager = ReleaseCacheManager(
-                config_manager=self.config
+                config_manager=self.config,
+                global_config=self.global_config,
             )
         return self._cache_manager
 
@@ -244,6 +245,7 @@ class ServiceContainer:
                 session=self.session,
                 progress_reporter=self.progress,
                 auth_manager=self.auth_manager,
+                global_config=self.global_config,
             )
         return self._download_service
 
@@ -259,6 +261,7 @@ class ServiceContainer:
             self._verification_service = VerificationService(
                 download_service=self.download_service,
                 progress_reporter=self.progress,
+                cache_manager=self.cache_manager,
             )
         return self._verification_service
 
@@ -288,6 +291,7 @@ class ServiceContainer:
                 auth_manager=self.auth_manager,
                 cache_manager=self.cache_manager,
                 progress_reporter=self.progress,
+                global_config=self.global_config,
             )
         return self._github_client
 
@@ -322,6 +326,7 @@ class ServiceContainer:
                 verification_service=self.verification_service,
                 backup_service=self.backup_service,
                 progress_reporter=self.progress,
+                global_config=self.global_config,
             )
         return self._post_download_processor
 
@@ -357,6 +362,7 @@ class ServiceContainer:
             github_client=self.github_client,
             post_download_processor=self.post_download_processor,
             progress_reporter=self.progress,
+            global_config=self.global_config,
         )
 
     def create_install_application_service(self) -> InstallApplicationService:
@@ -376,6 +382,7 @@ class ServiceContainer:
             config_manager=self.config,
             install_dir=self.install_dir,
             progress_reporter=self.progress,
+            global_config=self.global_config,
         )
 
     def create_update_manager(self) -> UpdateManager:
@@ -392,6 +399,7 @@ class ServiceContainer:
             config_manager=self.config,
             auth_manager=self.auth_manager,
             progress_reporter=self.progress,
+            global_config=self.global_config,
         )
 
     def create_update_application_service(self) -> UpdateApplicationService:
@@ -6,6 +6,7 @@ interface for defining CLI commands and their options.
 
 import argparse
 from argparse import Namespace
+from pathlib import Path
 from typing import Any
 
 
@@ -83,8 +84,10 @@ Examples:
         """Add global options to the main parser.
 
         Adds the --version flag which prints the package version and
-        exits. Avoids using -v to prevent conflict with subcommand
-        --verbose flags.
+        exits, the --timings/--timings-json flags which report where
+        the run spent its time, and the --progress/--progress-output
+        flags which select how progress is reported. Avoids using -v to
+        prevent conflict with subcommand --verbose flags.
 
         Args:
             parser (argparse.ArgumentParser): The main parser to add
@@ -98,6 +101,38 @@ Examples:
             action="store_true",
             help="Show my-unicorn version and exit",
         )
+        parser.add_argument(
+            "--timings",
+            action="store_true",
+            help=(
+                "Print a per-phase and per-app timing breakdown at the end "
+                "(or set MY_UNICORN_TIMINGS=1)"
+            ),
+        )
+        parser.add_argument(
+            "--timings-json",
+            metavar="PATH",
+            type=Path,
+            help=(
+                "Also write the timing breakdown as JSON to PATH "
+                "(or set MY_UNICORN_TIMINGS_JSON)"
+            ),
+        )
+        parser.add_argument(
+            "--progress",
+            choices=("ascii", "jsonl"),
+            default="ascii",
+            help=(
+                "Progress output: ascii progress bars (default) or jsonl "
+                "events for unattended runs"
+            ),
+        )
+        parser.add_argument(
+            "--progress-output",
+            metavar="PATH",
+            type=Path,
+            help="Write jsonl progress events to PATH (file or FIFO)",
+        )
 
     def _add_subcommands(self, parser: argparse.ArgumentParser) -> None:
         """Add all subcommands to the parser.
@@ -533,6 +568,11 @@ Examples:
         clear_group.add_argument(
             "--all", action="store_true", help="Clear all cache entries"
         )
+        clear_group.add_argument(
+            "--icons",
+            action="store_true",
+            help="Clear the cache of extracted icons",
+        )
 
         # Stats command - show cache statistics
         cache_subparsers.add_parser(
@@ -8,38 +8,66 @@ all shared dependencies (config, cache, validator) and injecting
 them into command handlers.
 """
 
+import importlib
 import logging
 import os
 import sys
 from argparse import Namespace
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
-from typing import Protocol
+from typing import Final, Protocol
 
 from my_unicorn import __version__
-from my_unicorn.cli.commands.auth import AuthHandler
-from my_unicorn.cli.commands.backup import BackupHandler
-from my_unicorn.cli.commands.cache import CacheHandler
-from my_unicorn.cli.commands.catalog import CatalogHandler
-from my_unicorn.cli.commands.config import ConfigHandler
-from my_unicorn.cli.commands.install import InstallCommandHandler
-from my_unicorn.cli.commands.migrate import MigrateHandler
-from my_unicorn.cli.commands.remove import RemoveHandler
-from my_unicorn.cli.commands.token import TokenHandler
-from my_unicorn.cli.commands.update import UpdateHandler
-from my_unicorn.cli.commands.upgrade import UpgradeHandler
+from my_unicorn.cli.commands.base import BaseCommandHandler
 from my_unicorn.cli.parser import CLIParser
 from my_unicorn.config import ConfigManager
 from my_unicorn.config.schemas.validator import ConfigValidator
 from my_unicorn.constants import LOCKFILE_PATH
-from my_unicorn.core.auth import GitHubAuthManager
-from my_unicorn.core.cache import ReleaseCacheManager
 from my_unicorn.core.locking import LockManager
-from my_unicorn.core.update import UpdateManager
 from my_unicorn.exceptions import LockError
-from my_unicorn.logger import get_logger, update_logger_from_config
+from my_unicorn.logger import (
+    enable_timings,
+    format_timing_report,
+    get_logger,
+    set_console_stream,
+    timing_report,
+    timing_span,
+    timings_enabled,
+    update_logger_from_config,
+    write_timing_report,
+)
 
 logger = get_logger(__name__)
 
+# Command name -> (module, handler class). Command modules are imported
+# only when their command runs, so e.g. ``catalog`` or ``config`` never
+# load aiohttp, keyring or the download and update machinery.
+COMMAND_HANDLERS: Final[dict[str, tuple[str, str]]] = {
+    "install": ("my_unicorn.cli.commands.install", "InstallCommandHandler"),
+    "update": ("my_unicorn.cli.commands.update", "UpdateHandler"),
+    "upgrade": ("my_unicorn.cli.commands.upgrade", "UpgradeHandler"),
+    "catalog": ("my_unicorn.cli.commands.catalog", "CatalogHandler"),
+    "migrate": ("my_unicorn.cli.commands.migrate", "MigrateHandler"),
+    "remove": ("my_unicorn.cli.commands.remove", "RemoveHandler"),
+    "backup": ("my_unicorn.cli.commands.backup", "BackupHandler"),
+    "cache": ("my_unicorn.cli.commands.cache", "CacheHandler"),
+    "token": ("my_unicorn.cli.commands.token", "TokenHandler"),
+    "auth": ("my_unicorn.cli.commands.auth", "AuthHandler"),
+    "config": ("my_unicorn.cli.commands.config", "ConfigHandler"),
+}
+
+
+def _timings_requested() -> bool:
+    """Return whether --timings/--timings-json or MY_UNICORN_TIMINGS is set.
+
+    Checked before argument parsing so the config load is timed as well.
+    """
+    if os.environ.get("MY_UNICORN_TIMINGS", "") not in {"", "0"}:
+        return True
+    if os.environ.get("MY_UNICORN_TIMINGS_JSON"):
+        return True
+    return any(arg.startswith("--timings") for arg in sys.argv[1:])
+
 
 class CommandHandler(Protocol):
     """Protocol for command handlers with execute method.
@@ -56,13 +84,60 @@ class CommandHandler(Protocol):
         ...
 
 
+class LazyCommandHandlers(Mapping[str, CommandHandler]):
+    """Command handlers keyed by command, created on first lookup.
+
+    Looking up a command imports its module and instantiates the handler
+    once; iterating or testing membership imports nothing.
+    """
+
+    def __init__(
+        self,
+        commands: Mapping[str, tuple[str, str]],
+        create_handler: Callable[[type[CommandHandler]], CommandHandler],
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            commands: Command name to (module, handler class name)
+            create_handler: Instantiates a handler class
+
+        """
+        self._commands = commands
+        self._create_handler = create_handler
+        self._handlers: dict[str, CommandHandler] = {}
+
+    def __getitem__(self, command: str) -> CommandHandler:
+        """Return the handler of a command, importing it if needed."""
+        handler = self._handlers.get(command)
+        if handler is None:
+            module_name, class_name = self._commands[command]
+            module = importlib.import_module(module_name)
+            handler = self._create_handler(getattr(module, class_name))
+            self._handlers[command] = handler
+        return handler
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over command names."""
+        return iter(self._commands)
+
+    def __len__(self) -> int:
+        """Return the number of commands."""
+        return len(self._commands)
+
+    def __contains__(self, command: object) -> bool:
+        """Return whether a command is known, without importing it."""
+        return command in self._commands
+
+
 class CLIRunner:
     """CLI command runner and orchestrator.
 
     Acts as the composition root for the application's dependency injection
-    pattern. Creates all shared dependencies (ConfigValidator, ConfigManager,
-    ReleaseCacheManager, GitHubAuthManager, UpdateManager) and injects them
-    into command handlers.
+    pattern. Creates the shared dependencies every command needs
+    (ConfigValidator, ConfigManager) and injects them into command handlers.
+    Services only some commands use (ReleaseCacheManager, GitHubAuthManager,
+    UpdateManager) are created by the handler on first use.
 
     Usage:
         # Standard usage (creates all dependencies internally):
@@ -72,11 +147,9 @@ class CLIRunner:
         # Dependencies created in __init__:
         # 1. ConfigValidator() - no dependencies
         # 2. ConfigManager(validator=validator)
-        # 3. ReleaseCacheManager(config_manager, ttl_hours=24)
-        # 4. GitHubAuthManager.create_default()
-        # 5. UpdateManager(config_manager, auth_manager)
 
-        # All handlers receive the same instances via _create_handler()
+        # The handler of the dispatched command is imported and created
+        # on first lookup in command_handlers via _create_handler()
 
     Note:
         This class implements the composition root pattern. All dependency
@@ -88,42 +161,31 @@ class CLIRunner:
     def __init__(self) -> None:
         """Initialize CLI runner with shared dependencies.
 
-        Sets up configuration, authentication, update management,
-        logging, and command handlers.
+        Sets up configuration, logging, and the command handler registry.
 
-        Acts as the composition root: creates ConfigValidator,
-        ConfigManager, ReleaseCacheManager, and other shared
-        dependencies, then injects them into command handlers.
+        Acts as the composition root: creates ConfigValidator and
+        ConfigManager, then injects them into command handlers.
         """
+        if _timings_requested():
+            enable_timings()
+
         # Create validator first (no dependencies)
         self.validator = ConfigValidator()
 
         # Create config manager with injected validator
-        self.config_manager = ConfigManager(validator=self.validator)
-        self.global_config = self.config_manager.load_global_config()
-
-        # Create cache manager with injected config
-        self.cache_manager = ReleaseCacheManager(
-            self.config_manager, ttl_hours=24
-        )
+        with timing_span("config"):
+            self.config_manager = ConfigManager(validator=self.validator)
+            self.global_config = self.config_manager.load_global_config()
 
         # Update logger with config-based log levels
         update_logger_from_config()
 
-        # Create auth manager with default keyring storage
-        self.auth_manager = GitHubAuthManager.create_default()
-
-        # Create update manager with injected dependencies
-        self.update_manager = UpdateManager(
-            self.config_manager,
-            self.auth_manager,
-            self.cache_manager,
-        )
-
         # Initialize command handlers
         self._init_command_handlers()
 
-    def _create_handler(self, handler_class: type) -> CommandHandler:
+    def _create_handler(
+        self, handler_class: type[CommandHandler]
+    ) -> CommandHandler:
         """Create command handler with standard dependencies.
 
         Args:
@@ -132,37 +194,25 @@ class CLIRunner:
         Returns:
             Instantiated handler with injected dependencies.
         """
-        # UpgradeHandler doesn't need dependencies
-        if handler_class is UpgradeHandler:
-            return handler_class()  # type: ignore[no-any-return]
+        # Handlers not based on BaseCommandHandler (upgrade) take no
+        # dependencies
+        if not issubclass(handler_class, BaseCommandHandler):
+            return handler_class()
 
-        return handler_class(  # type: ignore[no-any-return]
+        return handler_class(
             config_manager=self.config_manager,
-            auth_manager=self.auth_manager,
-            update_manager=self.update_manager,
-            cache_manager=self.cache_manager,
             validator=self.validator,
         )
 
     def _init_command_handlers(self) -> None:
-        """Initialize all command handlers with shared dependencies.
+        """Initialize the registry of command handlers.
 
-        Prepares command handler instances for each supported CLI
-        command.
+        Handlers are imported and created when their command is looked up,
+        so startup only pays for the command that runs.
         """
-        self.command_handlers = {
-            "install": self._create_handler(InstallCommandHandler),
-            "update": self._create_handler(UpdateHandler),
-            "upgrade": self._create_handler(UpgradeHandler),
-            "catalog": self._create_handler(CatalogHandler),
-            "migrate": self._create_handler(MigrateHandler),
-            "remove": self._create_handler(RemoveHandler),
-            "backup": self._create_handler(BackupHandler),
-            "cache": self._create_handler(CacheHandler),
-            "token": self._create_handler(TokenHandler),
-            "auth": self._create_handler(AuthHandler),
-            "config": self._create_handler(ConfigHandler),
-        }
+        self.command_handlers = LazyCommandHandlers(
+            COMMAND_HANDLERS, self._create_handler
+        )
 
     async def run(self) -> None:
         """Run the CLI application.
@@ -175,10 +225,22 @@ class CLIRunner:
             Exception: For any unexpected errors during execution.
 
         """
+        timings_json: str | Path | None = os.environ.get(
+            "MY_UNICORN_TIMINGS_JSON"
+        )
         try:
             # Parse command-line arguments
             parser = CLIParser(self.global_config)  # type: ignore[arg-type]
             args = parser.parse_args()
+            if getattr(args, "progress", "ascii") == "jsonl":
+                # stdout carries the event stream; log lines go to stderr
+                set_console_stream(sys.stderr)
+            if getattr(args, "timings_json", None):
+                timings_json = args.timings_json
+            if (
+                getattr(args, "timings", False) or timings_json
+            ) and not timings_enabled():
+                enable_timings()
 
             # Global: --version should print package version and exit early.
             if getattr(args, "version", False):
@@ -211,6 +273,26 @@ class CLIRunner:
         except Exception:
             logger.exception("Unexpected error")
             sys.exit(1)
+        finally:
+            if timings_enabled():
+                self._report_timings(timings_json)
+
+    def _report_timings(self, json_path: str | Path | None) -> None:
+        """Print the timing breakdown and optionally write it as JSON.
+
+        Args:
+            json_path: File to write the JSON report to, if any
+
+        """
+        report = timing_report()
+        logger.info(format_timing_report(report))
+        if json_path:
+            try:
+                write_timing_report(report, Path(json_path))
+            except OSError as e:
+                logger.warning(
+                    "Failed to write timings to %s: %s", json_path, e
+                )
 
     async def _execute_command(self, args: Namespace) -> None:
         """Execute the specified command with the appropriate handler.
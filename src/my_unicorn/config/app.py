@@ -2,6 +2,8 @@
 
 import copy
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -10,12 +12,13 @@ import orjson
 if TYPE_CHECKING:
     from my_unicorn.config.catalog import CatalogLoader
 
+from my_unicorn.config.app_store import AppConfigStore, FileSignature
 from my_unicorn.config.paths import Paths
 from my_unicorn.config.schemas.validator import (
     SchemaValidationError,
     validate_app_state,
 )
-from my_unicorn.constants import APP_CONFIG_VERSION
+from my_unicorn.constants import APP_CONFIG_LOAD_WORKERS, APP_CONFIG_VERSION
 from my_unicorn.types import AppStateConfig
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,7 @@ class AppConfigManager:
         self,
         apps_dir: Path | None = None,
         catalog_manager: "CatalogLoader | None" = None,
+        store: AppConfigStore | None = None,
     ) -> None:
         """Initialize app config manager.
 
@@ -35,10 +39,22 @@ class AppConfigManager:
             apps_dir: Apps directory path (defaults to Paths.APPS_DIR)
             catalog_manager: Catalog manager for loading catalog entries
                 (optional for testing)
+            store: Store of loaded configs shared for the run
+                (creates a new one if None)
 
         """
         self.apps_dir = apps_dir or Paths.APPS_DIR
         self.catalog_manager = catalog_manager
+        self.store = store or AppConfigStore()
+
+    @staticmethod
+    def _file_signature(app_file: Path) -> FileSignature | None:
+        """Return (st_mtime_ns, st_size) of a state file, None if missing."""
+        try:
+            stat = app_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     def load_app_config(self, app_name: str) -> dict | None:
         """Load merged effective configuration (SINGLE SOURCE OF TRUTH).
@@ -56,10 +72,19 @@ class AppConfigManager:
             ValueError: If config file is invalid or needs migration
 
         """
+        signature = self._file_signature(self.apps_dir / f"{app_name}.json")
+        if signature is None:
+            return None
+        effective = self.store.get_effective(app_name, signature)
+        if effective is not None:
+            return effective
+
         raw_config = self.load_raw_app_config(app_name)
         if not raw_config:
             return None
-        return self._build_effective_config(raw_config)
+        effective = self._build_effective_config(raw_config)
+        self.store.put_effective(app_name, signature, effective)
+        return effective
 
     def load_raw_app_config(self, app_name: str) -> AppStateConfig | None:
         """Load raw app state config without merging.
@@ -79,30 +104,115 @@ class AppConfigManager:
 
         """
         app_file = self.apps_dir / f"{app_name}.json"
-        if not app_file.exists():
+        signature = self._file_signature(app_file)
+        if signature is None:
             return None
+        cached = self.store.get_raw(app_name, signature)
+        if cached is not None:
+            return cached
 
-        try:
-            with app_file.open("rb") as f:
-                config_data = orjson.loads(f.read())
-
-            # Validate config version (no auto-migration)
-            current_version = config_data.get("config_version")
-            if current_version != APP_CONFIG_VERSION:
-                msg = (
-                    f"Config for '{app_name}' is version {current_version}, "
-                    f"expected {APP_CONFIG_VERSION}. "
-                    f"Run 'my-unicorn migrate' to upgrade."
+        config_data = self._check_app_state(
+            app_name, self._read_app_file(app_name, app_file)
+        )
+        self.store.put_raw(app_name, signature, config_data)
+        return config_data
+
+    def load_all_app_configs(
+        self, app_names: list[str] | None = None
+    ) -> tuple[dict[str, dict], dict[str, str]]:
+        """Load the effective configs of many apps in one pass.
+
+        The apps directory is scanned once, state files not already in the
+        store are read and parsed by a thread pool, then validated and
+        merged with their catalog entries.
+
+        Args:
+            app_names: Apps to load, or None for all installed apps
+
+        Returns:
+            Tuple of (configs, errors) where:
+            - configs: Dictionary mapping app names to effective configs
+            - errors: Dictionary mapping app names to the error message of
+              state files that are invalid or need migration
+
+        """
+        files = self._scan_app_files()
+        if app_names is not None:
+            files = {name: files[name] for name in app_names if name in files}
+
+        configs: dict[str, dict] = {}
+        errors: dict[str, str] = {}
+        pending: dict[str, FileSignature] = {}
+        for app_name, signature in files.items():
+            effective = self.store.get_effective(app_name, signature)
+            if effective is None:
+                pending[app_name] = signature
+            else:
+                configs[app_name] = effective
+
+        workers = min(APP_CONFIG_LOAD_WORKERS, len(pending)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                app_name: executor.submit(
+                    self._read_app_file,
+                    app_name,
+                    self.apps_dir / f"{app_name}.json",
                 )
-                raise ValueError(msg) from None
+                for app_name in pending
+            }
+            for app_name, future in futures.items():
+                try:
+                    raw_config = self._check_app_state(
+                        app_name, future.result()
+                    )
+                except ValueError as e:
+                    errors[app_name] = str(e)
+                    continue
+                signature = pending[app_name]
+                self.store.put_raw(app_name, signature, raw_config)
+                effective = self._build_effective_config(raw_config)
+                self.store.put_effective(app_name, signature, effective)
+                configs[app_name] = effective
+
+        return dict(sorted(configs.items())), errors
+
+    def _scan_app_files(self) -> dict[str, FileSignature]:
+        """Return the signature of every state file in the apps directory."""
+        files: dict[str, FileSignature] = {}
+        try:
+            with os.scandir(self.apps_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files[entry.name[:-5]] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return files
+
+    @staticmethod
+    def _read_app_file(app_name: str, app_file: Path) -> dict[str, Any]:
+        """Read and parse a state file.
 
-            # Validate against schema
-            validate_app_state(config_data, app_name)
+        Args:
+            app_name: Name of the application
+            app_file: Path of the state file
 
-            return cast("AppStateConfig", config_data)
-        except SchemaValidationError as e:
-            msg = f"Invalid app config for {app_name}: {e}"
-            raise ValueError(msg) from e
+        Returns:
+            Parsed state file
+
+        Raises:
+            ValueError: If the file cannot be read or is not valid JSON
+
+        """
+        try:
+            with app_file.open("rb") as f:
+                return orjson.loads(f.read())  # type: ignore[no-any-return]
         except orjson.JSONDecodeError as e:
             msg = f"Invalid JSON in app config for {app_name}: {e}"
             raise ValueError(msg) from e
@@ -110,6 +220,42 @@ class AppConfigManager:
             msg = f"Failed to load app_config for {app_name}: {e}"
             raise ValueError(msg) from e
 
+    @staticmethod
+    def _check_app_state(
+        app_name: str, config_data: dict[str, Any]
+    ) -> AppStateConfig:
+        """Check the version and schema of a parsed state file.
+
+        Args:
+            app_name: Name of the application
+            config_data: Parsed state file
+
+        Returns:
+            Validated app state config
+
+        Raises:
+            ValueError: If the config is invalid or needs migration
+
+        """
+        # Validate config version (no auto-migration)
+        current_version = config_data.get("config_version")
+        if current_version != APP_CONFIG_VERSION:
+            msg = (
+                f"Config for '{app_name}' is version {current_version}, "
+                f"expected {APP_CONFIG_VERSION}. "
+                f"Run 'my-unicorn migrate' to upgrade."
+            )
+            raise ValueError(msg)
+
+        # Validate against schema
+        try:
+            validate_app_state(config_data, app_name)
+        except SchemaValidationError as e:
+            msg = f"Invalid app config for {app_name}: {e}"
+            raise ValueError(msg) from e
+
+        return cast("AppStateConfig", config_data)
+
     def save_app_config(
         self,
         app_name: str,
@@ -143,6 +289,11 @@ class AppConfigManager:
                         option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
                     )
                 )
+            signature = self._file_signature(app_file)
+            if skip_validation or signature is None:
+                self.store.invalidate(app_name)
+            else:
+                self.store.put_raw(app_name, signature, config)
         except SchemaValidationError as e:
             msg = f"Cannot save invalid app config for {app_name}: {e}"
             raise ValueError(msg) from e
@@ -173,6 +324,7 @@ class AppConfigManager:
 
         """
         app_file = self.apps_dir / f"{app_name}.json"
+        self.store.invalidate(app_name)
         if app_file.exists():
             app_file.unlink()
             return True
@@ -0,0 +1,124 @@
+"""Per-run store of loaded app configurations.
+
+One update reads the same app state several times: when checking for
+updates, when preparing the update, when creating the backup and when
+writing the new state. ``AppConfigStore`` keeps the raw state and the
+merged effective config of every app loaded during the run, so each file
+is read, parsed, validated and merged with its catalog entry once.
+
+Entries are keyed by ``(st_mtime_ns, st_size)`` of the state file, so a
+file changed by another process is loaded again. Configs are stored as
+immutable orjson snapshots and every read decodes a fresh copy, which is
+several times faster than ``copy.deepcopy`` and lets callers modify the
+returned dictionaries freely.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+import orjson
+
+if TYPE_CHECKING:
+    from my_unicorn.types import AppStateConfig
+
+# (st_mtime_ns, st_size) of an app state file
+FileSignature = tuple[int, int]
+
+
+class AppConfigStore:
+    """Snapshots of app state files and effective configs by app name."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._raw: dict[str, tuple[FileSignature, bytes]] = {}
+        self._effective: dict[str, tuple[FileSignature, bytes]] = {}
+
+    @staticmethod
+    def _get(
+        entries: dict[str, tuple[FileSignature, bytes]],
+        app_name: str,
+        signature: FileSignature,
+    ) -> Any:  # noqa: ANN401
+        entry = entries.get(app_name)
+        if entry is None or entry[0] != signature:
+            return None
+        return orjson.loads(entry[1])
+
+    def get_raw(
+        self, app_name: str, signature: FileSignature
+    ) -> AppStateConfig | None:
+        """Return a copy of a stored app state.
+
+        Args:
+            app_name: Application name
+            signature: Current signature of the app state file
+
+        Returns:
+            App state, or None if not stored for this file signature
+
+        """
+        return cast(
+            "AppStateConfig | None", self._get(self._raw, app_name, signature)
+        )
+
+    def get_effective(
+        self, app_name: str, signature: FileSignature
+    ) -> dict[str, Any] | None:
+        """Return a copy of a stored effective config.
+
+        Args:
+            app_name: Application name
+            signature: Current signature of the app state file
+
+        Returns:
+            Effective config, or None if not stored for this file signature
+
+        """
+        return cast(
+            "dict[str, Any] | None",
+            self._get(self._effective, app_name, signature),
+        )
+
+    def put_raw(
+        self, app_name: str, signature: FileSignature, config: AppStateConfig
+    ) -> None:
+        """Store a validated app state.
+
+        The stored effective config is dropped, as it was built from the
+        previous state.
+
+        Args:
+            app_name: Application name
+            signature: Signature of the file the state was read from
+            config: Validated app state
+
+        """
+        self._raw[app_name] = (signature, orjson.dumps(config))
+        self._effective.pop(app_name, None)
+
+    def put_effective(
+        self,
+        app_name: str,
+        signature: FileSignature,
+        config: dict[str, Any],
+    ) -> None:
+        """Store an effective config.
+
+        Args:
+            app_name: Application name
+            signature: Signature of the state file the config was built from
+            config: Effective config
+
+        """
+        self._effective[app_name] = (signature, orjson.dumps(config))
+
+    def invalidate(self, app_name: str) -> None:
+        """Forget everything stored for an app."""
+        self._raw.pop(app_name, None)
+        self._effective.pop(app_name, None)
+
+    def clear(self) -> None:
+        """Forget all stored configs."""
+        self._raw.clear()
+        self._effective.clear()
@@ -1,16 +1,15 @@
 """Catalog loader for AppImage catalog entries.
 
 This module handles loading and validating catalog entries from the bundled
-catalog directory, ensuring they conform to the v2 catalog schema.
+catalog directory, ensuring they conform to the v2 catalog schema. Entries
+are read through the precompiled catalog index (see ``catalog_index``).
 """
 
 from pathlib import Path
-from typing import cast
-
-import orjson
 
+from my_unicorn.config.catalog_index import CatalogIndex
 from my_unicorn.config.paths import Paths
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
 from my_unicorn.types import CatalogConfig
 
 logger = get_logger(__name__)
@@ -19,14 +18,38 @@ logger = get_logger(__name__)
 class CatalogLoader:
     """Load and validate app catalog entries."""
 
-    def __init__(self, catalog_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        catalog_dir: Path | None = None,
+        index_cache_dir: Path | None = None,
+    ) -> None:
         """Initialize catalog loader.
 
         Args:
             catalog_dir: Optional custom catalog directory.
                         Defaults to bundled catalog.
+            index_cache_dir: Optional directory for rebuilt catalog
+                        indexes. If None, a stale index is rebuilt in memory.
         """
         self.catalog_dir = catalog_dir or Paths.CATALOG_DIR
+        self.index_cache_dir = index_cache_dir
+        self._index: CatalogIndex | None = None
+        self._index_dir: Path | None = None
+
+    def _get_index(self) -> CatalogIndex:
+        """Return the catalog index, loading it on first use."""
+        if self._index is None or self._index_dir != self.catalog_dir:
+            with timing_span("catalog"):
+                self._index = CatalogIndex.open(
+                    self.catalog_dir, self.index_cache_dir
+                )
+            self._index_dir = self.catalog_dir
+        return self._index
+
+    def _refresh_index(self) -> CatalogIndex:
+        """Reload the catalog index after catalog files were added."""
+        self._index = None
+        return self._get_index()
 
     def load(self, app_name: str) -> CatalogConfig:
         """Load catalog entry for app.
@@ -41,21 +64,14 @@ class CatalogLoader:
             FileNotFoundError: If catalog entry doesn't exist
             ValueError: If catalog entry is invalid
         """
-        path = self.catalog_dir / f"{app_name}.json"
-
-        if not path.exists():
-            msg = f"Catalog entry not found for '{app_name}'"
-            raise FileNotFoundError(msg)
-
-        # Load JSON
-        with path.open("rb") as f:
-            try:
-                data = orjson.loads(f.read())
-            except orjson.JSONDecodeError as e:
-                msg = f"Invalid JSON in catalog entry for '{app_name}': {e}"
-                raise ValueError(msg) from e
+        index = self._get_index()
+        if app_name not in index and self._has_file(app_name):
+            index = self._refresh_index()
+        return index.get(app_name)
 
-        return cast("CatalogConfig", data)
+    def _has_file(self, app_name: str) -> bool:
+        """Check for a catalog file created after the index was loaded."""
+        return (self.catalog_dir / f"{app_name}.json").exists()
 
     def load_all(self) -> tuple[dict[str, CatalogConfig], list[str]]:
         """Load all catalog entries.
@@ -68,10 +84,10 @@ class CatalogLoader:
         catalog_entries = {}
         failed_apps = []
 
-        for path in self.catalog_dir.glob("*.json"):
-            app_name = path.stem
+        index = self._get_index()
+        for app_name in index.names():
             try:
-                catalog_entries[app_name] = self.load(app_name)
+                catalog_entries[app_name] = index.get(app_name)
             except (FileNotFoundError, ValueError) as e:
                 # Skip invalid entries but log the error
                 logger.warning(
@@ -90,8 +106,7 @@ class CatalogLoader:
         Returns:
             True if catalog entry exists, False otherwise
         """
-        path = self.catalog_dir / f"{app_name}.json"
-        return path.exists()
+        return app_name in self._get_index() or self._has_file(app_name)
 
     def list_apps(self) -> list[str]:
         """List all available apps in catalog.
@@ -99,7 +114,7 @@ class CatalogLoader:
         Returns:
             List of app names
         """
-        return [path.stem for path in self.catalog_dir.glob("*.json")]
+        return self._get_index().names()
 
     def validate_catalog(self) -> tuple[list[str], list[str]]:
         """Validate all catalog entries.
@@ -0,0 +1,370 @@
+"""Precompiled index of the catalog directory.
+
+Listing or looking up catalog entries used to glob the catalog directory
+and parse every per-app JSON file. The index (``catalog.index`` shipped next
+to the JSON files) holds all entries in one file, so a lookup is a
+dictionary access plus decoding one compact JSON slice.
+
+Layout::
+
+    header  magic (8 bytes), format version (u32), table length (u32)
+    table   orjson object {"entries": {app: [offset, length]},
+                           "errors": {app: message},
+                           "digests": {app: sha256 of the JSON file}}
+    blob    compact orjson catalog entries, addressed by the table
+
+An index is stale when files were added or removed, or when a catalog JSON
+file newer than the index no longer matches its recorded digest. Checking
+digests only for newer files keeps a fresh index free of per-app reads,
+while an index installed with an arbitrary file modification order (git
+checkouts, wheel installs) is still accepted. An index that passed the
+digest check is written to the user cache directory, which is read first,
+so the check happens once rather than on every start. A stale shipped index
+is likewise rebuilt into the cache, never into the package directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import orjson
+
+from my_unicorn.logger import get_logger
+
+if TYPE_CHECKING:
+    from my_unicorn.types import CatalogConfig
+
+logger = get_logger(__name__)
+
+CATALOG_INDEX_NAME = "catalog.index"
+
+_MAGIC = b"MUCATIDX"
+_VERSION = 3
+_HEADER = struct.Struct("<8sII")
+
+
+class CatalogIndexError(ValueError):
+    """Raised when an index file is truncated or has an unknown format."""
+
+
+def scan_catalog(catalog_dir: Path) -> dict[str, int]:
+    """Return the modification time of each catalog JSON file.
+
+    Args:
+        catalog_dir: Catalog directory
+
+    Returns:
+        Dictionary mapping app names to modification times in nanoseconds
+
+    """
+    sources: dict[str, int] = {}
+    try:
+        with os.scandir(catalog_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    sources[entry.name[:-5]] = entry.stat().st_mtime_ns
+    except FileNotFoundError:
+        pass
+    return sources
+
+
+def cached_index_name(catalog_dir: Path) -> str:
+    """Return the cache file name of the index of a catalog directory.
+
+    The name is derived from the resolved directory path, so installs
+    sharing one cache directory do not overwrite each other's index.
+
+    Args:
+        catalog_dir: Catalog directory
+
+    Returns:
+        File name inside the cache directory
+
+    """
+    digest = hashlib.sha256(str(catalog_dir.resolve()).encode()).hexdigest()
+    return f"catalog-{digest[:16]}.index"
+
+
+class CatalogIndex:
+    """All entries of a catalog directory, addressed by app name."""
+
+    def __init__(
+        self,
+        blob: bytes,
+        entries: dict[str, list[int]],
+        errors: dict[str, str],
+        digests: dict[str, str],
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            blob: Concatenated compact JSON catalog entries
+            entries: ``[offset, length]`` of each entry in blob
+            errors: Parse error message of each unparsable entry
+            digests: SHA-256 hex digest of each indexed JSON file
+
+        """
+        self._blob = blob
+        self._entries = entries
+        self._errors = errors
+        self._digests = digests
+
+    @classmethod
+    def build(
+        cls, catalog_dir: Path, sources: dict[str, int] | None = None
+    ) -> CatalogIndex:
+        """Build the index by parsing every catalog JSON file.
+
+        Args:
+            catalog_dir: Catalog directory
+            sources: Result of ``scan_catalog``, scanned if not given
+
+        Returns:
+            Index of the catalog directory
+
+        """
+        if sources is None:
+            sources = scan_catalog(catalog_dir)
+        blob = bytearray()
+        entries: dict[str, list[int]] = {}
+        errors: dict[str, str] = {}
+        digests: dict[str, str] = {}
+        for app_name in sorted(sources):
+            try:
+                raw = (catalog_dir / f"{app_name}.json").read_bytes()
+            except OSError:
+                continue
+            digests[app_name] = hashlib.sha256(raw).hexdigest()
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError as e:
+                errors[app_name] = str(e)
+                continue
+            encoded = orjson.dumps(data)
+            entries[app_name] = [len(blob), len(encoded)]
+            blob += encoded
+        return cls(bytes(blob), entries, errors, digests)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CatalogIndex:
+        """Load an index from its serialized form.
+
+        Args:
+            data: Index file content
+
+        Returns:
+            Loaded index
+
+        Raises:
+            CatalogIndexError: If the data is not a valid index
+
+        """
+        if len(data) < _HEADER.size:
+            msg = "Catalog index is truncated"
+            raise CatalogIndexError(msg)
+        magic, version, table_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            msg = f"Unsupported catalog index format (version {version})"
+            raise CatalogIndexError(msg)
+        blob_start = _HEADER.size + table_size
+        try:
+            table = orjson.loads(data[_HEADER.size : blob_start])
+        except orjson.JSONDecodeError as e:
+            msg = f"Corrupted catalog index table: {e}"
+            raise CatalogIndexError(msg) from e
+        blob = data[blob_start:]
+        entries = table.get("entries", {})
+        if any(
+            offset + length > len(blob) for offset, length in entries.values()
+        ):
+            msg = "Catalog index is truncated"
+            raise CatalogIndexError(msg)
+        return cls(
+            blob, entries, table.get("errors", {}), table.get("digests", {})
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index.
+
+        Returns:
+            Index file content
+
+        """
+        table = orjson.dumps(
+            {
+                "entries": self._entries,
+                "errors": self._errors,
+                "digests": self._digests,
+            }
+        )
+        return _HEADER.pack(_MAGIC, _VERSION, len(table)) + table + self._blob
+
+    @classmethod
+    def open(
+        cls, catalog_dir: Path, cache_dir: Path | None = None
+    ) -> CatalogIndex:
+        """Load the index of a catalog directory, rebuilding it if stale.
+
+        The index cached for this catalog directory is used when it is
+        fresh, then the one shipped in the catalog directory. An index that
+        needed its digests checked is written to the cache directory with a
+        new modification time, so the next start skips the check. Otherwise
+        the index is rebuilt and written to the cache directory.
+
+        Args:
+            catalog_dir: Catalog directory
+            cache_dir: Directory for rebuilt indexes; if None, a rebuilt
+                index is only kept in memory
+
+        Returns:
+            Index matching the current catalog JSON files
+
+        """
+        sources = scan_catalog(catalog_dir)
+        cache_path = (
+            cache_dir / cached_index_name(catalog_dir) if cache_dir else None
+        )
+        for index_path in (cache_path, catalog_dir / CATALOG_INDEX_NAME):
+            if index_path is None:
+                continue
+            loaded = cls._load_fresh(index_path, catalog_dir, sources)
+            if loaded is None:
+                continue
+            index, digests_checked = loaded
+            if digests_checked and cache_path is not None:
+                index.write(cache_path)
+            return index
+
+        index = cls.build(catalog_dir, sources)
+        if sources and cache_path is not None:
+            index.write(cache_path)
+        return index
+
+    @classmethod
+    def _load_fresh(
+        cls, index_path: Path, catalog_dir: Path, sources: dict[str, int]
+    ) -> tuple[CatalogIndex, bool] | None:
+        """Load an index file unless it is missing, invalid or stale.
+
+        Returns:
+            The index and whether catalog files had to be digested to
+            accept it, or None if the index cannot be used
+
+        """
+        try:
+            index_mtime_ns = index_path.stat().st_mtime_ns
+            index = cls.from_bytes(index_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, CatalogIndexError) as e:
+            logger.debug("Ignoring catalog index %s: %s", index_path, e)
+            return None
+        if not index.is_fresh(catalog_dir, sources, index_mtime_ns):
+            logger.debug("Catalog index %s is stale", index_path)
+            return None
+        digests_checked = any(
+            mtime_ns > index_mtime_ns for mtime_ns in sources.values()
+        )
+        return index, digests_checked
+
+    def is_fresh(
+        self, catalog_dir: Path, sources: dict[str, int], index_mtime_ns: int
+    ) -> bool:
+        """Check whether the index matches the catalog JSON files.
+
+        Files newer than the index are compared with their recorded
+        digest, so only files whose content changed make the index stale.
+
+        Args:
+            catalog_dir: Catalog directory
+            sources: Result of ``scan_catalog``
+            index_mtime_ns: Modification time of the index file
+
+        Returns:
+            True if the index holds the current catalog entries
+
+        """
+        if self.names() != sorted(sources):
+            return False
+        for app_name, mtime_ns in sources.items():
+            if mtime_ns <= index_mtime_ns:
+                continue
+            try:
+                raw = (catalog_dir / f"{app_name}.json").read_bytes()
+            except OSError:
+                return False
+            if hashlib.sha256(raw).hexdigest() != self._digests.get(app_name):
+                return False
+        return True
+
+    def write(self, index_path: Path) -> bool:
+        """Write the index atomically.
+
+        Args:
+            index_path: Destination path
+
+        Returns:
+            True if written, False if the directory is not writable
+
+        """
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=index_path.parent, prefix=f".{index_path.name}."
+            )
+        except OSError as e:
+            logger.debug("Cannot write catalog index %s: %s", index_path, e)
+            return False
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), 0o644)
+                f.write(self.to_bytes())
+            tmp_path.replace(index_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.debug("Cannot write catalog index %s: %s", index_path, e)
+            return False
+        return True
+
+    def names(self) -> list[str]:
+        """Return the names of all indexed apps, valid or not."""
+        return sorted([*self._entries, *self._errors])
+
+    def __contains__(self, app_name: object) -> bool:
+        """Check whether an app has a catalog file."""
+        return app_name in self._entries or app_name in self._errors
+
+    def get(self, app_name: str) -> CatalogConfig:
+        """Decode the catalog entry of an app.
+
+        Args:
+            app_name: Application name
+
+        Returns:
+            Catalog entry dictionary
+
+        Raises:
+            FileNotFoundError: If the app has no catalog entry
+            ValueError: If the catalog entry is not valid JSON
+
+        """
+        entry = self._entries.get(app_name)
+        if entry is None:
+            if app_name in self._errors:
+                error = self._errors[app_name]
+                msg = (
+                    f"Invalid JSON in catalog entry for '{app_name}': {error}"
+                )
+                raise ValueError(msg)
+            msg = f"Catalog entry not found for '{app_name}'"
+            raise FileNotFoundError(msg)
+        offset, length = entry
+        return cast(
+            "CatalogConfig", orjson.loads(self._blob[offset : offset + length])
+        )
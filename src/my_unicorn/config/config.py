@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import cast
 
 from my_unicorn.config.app import AppConfigManager
+from my_unicorn.config.app_store import AppConfigStore
 from my_unicorn.config.catalog import CatalogLoader
 from my_unicorn.config.paths import Paths
 from my_unicorn.config.schemas.validator import ConfigValidator
@@ -79,7 +80,14 @@ class ConfigManager:
 
         # Initialize specialized managers
         self.global_config_manager = GlobalConfigManager(self._config_dir)
-        self.catalog_loader = CatalogLoader(self._catalog_dir)
+        catalog_index_dir = (
+            self._config_dir / "cache" / "catalog"
+            if config_dir
+            else Paths.CATALOG_INDEX_CACHE_DIR
+        )
+        self.catalog_loader = CatalogLoader(
+            self._catalog_dir, catalog_index_dir
+        )
 
         # Determine apps_dir based on config_dir
         apps_dir = self._config_dir / "apps" if config_dir else Paths.APPS_DIR
@@ -114,6 +122,11 @@ class ConfigManager:
         """Get the apps configuration directory path."""
         return self.app_config_manager.apps_dir
 
+    @property
+    def app_config_store(self) -> AppConfigStore:
+        """Get the store of app configs loaded during this run."""
+        return self.app_config_manager.store
+
     @property
     def catalog_dir(self) -> Path:
         """Get the catalog directory path."""
@@ -143,6 +156,13 @@ class ConfigManager:
         """Load global configuration from INI file."""
         return self.global_config_manager.load_global_config()  # type: ignore[no-any-return]
 
+    def global_config_snapshot(self) -> GlobalConfig:
+        """Return the shared read-only global configuration.
+
+        Reparsed only when the settings file changes on disk.
+        """
+        return self.global_config_manager.load_global_config_snapshot()  # type: ignore[no-any-return]
+
     def save_global_config(self, config: GlobalConfig) -> None:
         """Save global configuration to INI file."""
         self.global_config_manager.save_global_config(config)
@@ -189,6 +209,21 @@ class ConfigManager:
             app_name, config, skip_validation=skip_validation
         )
 
+    def load_all_app_configs(
+        self, app_names: list[str] | None = None
+    ) -> tuple[dict[str, dict], dict[str, str]]:
+        """Load effective configs of many apps in one parallel pass.
+
+        Args:
+            app_names: Apps to load, or None for all installed apps
+
+        Returns:
+            Tuple of (configs, errors) mapping app names to effective configs
+            and to error messages of invalid state files
+
+        """
+        return self.app_config_manager.load_all_app_configs(app_names)
+
     def list_installed_apps(self) -> list[str]:
         """Get list of installed apps."""
         return self.app_config_manager.list_installed_apps()
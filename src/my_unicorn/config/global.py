@@ -2,7 +2,9 @@
 
 import configparser
 import logging
+import threading
 from pathlib import Path
+from typing import Any, NoReturn, cast
 
 from my_unicorn.config.migration.global_config import ConfigMigration
 from my_unicorn.config.parser import (
@@ -11,19 +13,36 @@ from my_unicorn.config.parser import (
 )
 from my_unicorn.config.paths import Paths
 from my_unicorn.constants import (
+    BACKUP_STRATEGIES,
+    DEFAULT_BACKUP_STRATEGY,
+    DEFAULT_CACHE_STALE_HOURS,
+    DEFAULT_CACHE_TTL_HOURS,
     DEFAULT_CONSOLE_LOG_LEVEL,
+    DEFAULT_DOWNLOAD_SEGMENTS,
     DEFAULT_LOG_LEVEL,
     DEFAULT_MAX_BACKUP,
     DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_SEGMENT_THRESHOLD_MB,
+    DEFAULT_TIMEOUT_SECONDS,
     DIRECTORY_KEYS,
     GLOBAL_CONFIG_VERSION,
+    KEY_BACKUP_STRATEGY,
+    KEY_CACHE_STALE_HOURS,
+    KEY_CACHE_TTL_HOURS,
     KEY_CONFIG_VERSION,
     KEY_CONSOLE_LOG_LEVEL,
+    KEY_DOWNLOAD_SEGMENTS,
     KEY_LOG_LEVEL,
     KEY_MAX_BACKUP,
     KEY_MAX_CONCURRENT_DOWNLOADS,
+    KEY_RETRY_ATTEMPTS,
+    KEY_SEGMENT_THRESHOLD_MB,
+    KEY_TIMEOUT_SECONDS,
     MAX_CONCURRENT_DOWNLOADS,
+    MAX_DOWNLOAD_SEGMENTS,
     MIN_CONCURRENT_DOWNLOADS,
+    MIN_DOWNLOAD_SEGMENTS,
     SECTION_DEFAULT,
     SECTION_DIRECTORY,
     SECTION_NETWORK,
@@ -36,6 +55,67 @@ logger = logging.getLogger(__name__)
 # Type alias for raw INI config dictionary
 RawConfigDict = dict[str, str | dict[str, str]]
 
+# (st_mtime_ns, st_size) of a settings file
+SettingsSignature = tuple[int, int]
+
+
+class FrozenDict(dict):
+    """Read-only dict used for shared global config snapshots.
+
+    It is still a ``dict`` for ``isinstance`` checks and typed-dict access,
+    but every mutating method raises ``TypeError``. ``copy.copy``,
+    ``copy.deepcopy`` and ``copy()`` return plain, mutable dicts.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *_args: object, **_kwargs: object) -> NoReturn:
+        msg = "Global config snapshots are read-only"
+        raise TypeError(msg)
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self) -> dict[str, Any]:
+        """Return a mutable deep copy."""
+        return cast("dict[str, Any]", _thaw(self))
+
+    def __copy__(self) -> dict[str, Any]:
+        """Return a mutable deep copy."""
+        return cast("dict[str, Any]", _thaw(self))
+
+    def __deepcopy__(self, _memo: dict[int, object]) -> dict[str, Any]:
+        """Return a mutable deep copy."""
+        return cast("dict[str, Any]", _thaw(self))
+
+
+def _freeze(value: object) -> object:
+    """Return a read-only copy of nested config dictionaries."""
+    if isinstance(value, dict):
+        return FrozenDict({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: object) -> object:
+    """Return a mutable copy of a frozen config."""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+# Parsed global config snapshots shared by every manager in the process,
+# keyed by settings file
+_snapshots: dict[Path, tuple[SettingsSignature, GlobalConfig]] = {}
+_snapshots_lock = threading.Lock()
+
+
+def _settings_signature(settings_file: Path) -> SettingsSignature | None:
+    try:
+        stat = settings_file.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 
 def _convert_configparser_to_dict(
     config: configparser.ConfigParser,
@@ -116,21 +196,52 @@ def _extract_network_config(config_dict: RawConfigDict) -> NetworkConfig:
         return value
 
     network_dict = config_dict.get(SECTION_NETWORK, {})
+    if not isinstance(network_dict, dict):
+        network_dict = {}
+
+    def get_int(key: str, default: int) -> int:
+        """Get an integer network value with comments stripped."""
+        return int(strip_comments(network_dict.get(key, default)))
 
     return NetworkConfig(
-        retry_attempts=int(
-            strip_comments(network_dict.get("retry_attempts", 3))
-        )
-        if isinstance(network_dict, dict)
-        else 3,
-        timeout_seconds=int(
-            strip_comments(network_dict.get("timeout_seconds", 10))
-        )
-        if isinstance(network_dict, dict)
-        else 10,
+        retry_attempts=get_int(KEY_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS),
+        timeout_seconds=get_int(KEY_TIMEOUT_SECONDS, DEFAULT_TIMEOUT_SECONDS),
+        download_segments=clamp(
+            get_int(KEY_DOWNLOAD_SEGMENTS, DEFAULT_DOWNLOAD_SEGMENTS),
+            MIN_DOWNLOAD_SEGMENTS,
+            MAX_DOWNLOAD_SEGMENTS,
+        ),
+        segment_threshold_mb=max(
+            1,
+            get_int(KEY_SEGMENT_THRESHOLD_MB, DEFAULT_SEGMENT_THRESHOLD_MB),
+        ),
+        cache_ttl_hours=max(
+            1, get_int(KEY_CACHE_TTL_HOURS, DEFAULT_CACHE_TTL_HOURS)
+        ),
+        cache_stale_hours=max(
+            0, get_int(KEY_CACHE_STALE_HOURS, DEFAULT_CACHE_STALE_HOURS)
+        ),
     )
 
 
+def _parse_backup_strategy(value: str) -> str:
+    """Validate the configured backup strategy.
+
+    Args:
+        value: Raw backup_strategy value
+
+    Returns:
+        The strategy, or the default if the value is not recognized
+    """
+    strategy = value.strip().strip('"').lower()
+    if strategy in BACKUP_STRATEGIES:
+        return strategy
+    logger.warning(
+        "Unknown backup_strategy %r, using %s", value, DEFAULT_BACKUP_STRATEGY
+    )
+    return DEFAULT_BACKUP_STRATEGY
+
+
 class GlobalConfigManager:
     """Manages global INI configuration."""
 
@@ -160,9 +271,17 @@ class GlobalConfigManager:
                 DEFAULT_MAX_CONCURRENT_DOWNLOADS
             ),
             KEY_MAX_BACKUP: str(DEFAULT_MAX_BACKUP),
+            KEY_BACKUP_STRATEGY: DEFAULT_BACKUP_STRATEGY,
             KEY_LOG_LEVEL: DEFAULT_LOG_LEVEL,
             KEY_CONSOLE_LOG_LEVEL: DEFAULT_CONSOLE_LOG_LEVEL,
-            SECTION_NETWORK: {"retry_attempts": "3", "timeout_seconds": "10"},
+            SECTION_NETWORK: {
+                KEY_RETRY_ATTEMPTS: str(DEFAULT_RETRY_ATTEMPTS),
+                KEY_TIMEOUT_SECONDS: str(DEFAULT_TIMEOUT_SECONDS),
+                KEY_DOWNLOAD_SEGMENTS: str(DEFAULT_DOWNLOAD_SEGMENTS),
+                KEY_SEGMENT_THRESHOLD_MB: str(DEFAULT_SEGMENT_THRESHOLD_MB),
+                KEY_CACHE_TTL_HOURS: str(DEFAULT_CACHE_TTL_HOURS),
+                KEY_CACHE_STALE_HOURS: str(DEFAULT_CACHE_STALE_HOURS),
+            },
             SECTION_DIRECTORY: {
                 "download": str(home / "Downloads"),
                 "storage": str(home / "Applications"),
@@ -255,6 +374,36 @@ class GlobalConfigManager:
 
         return self._convert_to_global_config(config)
 
+    def load_global_config_snapshot(self) -> GlobalConfig:
+        """Return the shared, read-only snapshot of the global configuration.
+
+        The settings file is parsed again only when its modification time
+        or size changed since the snapshot was taken; otherwise this costs a
+        single ``stat``. The snapshot is shared by all callers in the
+        process, so it cannot be modified. Use ``load_global_config`` to get
+        a configuration to edit and save.
+
+        Returns:
+            Read-only global configuration
+
+        """
+        signature = _settings_signature(self.settings_file)
+        with _snapshots_lock:
+            cached = _snapshots.get(self.settings_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        config = cast("GlobalConfig", _freeze(self.load_global_config()))
+        # Loading may create or migrate the file; only keep the snapshot if
+        # nothing else changed the file while it was parsed
+        loaded_signature = _settings_signature(self.settings_file)
+        if loaded_signature is not None and (
+            signature is None or signature == loaded_signature
+        ):
+            with _snapshots_lock:
+                _snapshots[self.settings_file] = (loaded_signature, config)
+        return config
+
     def save_global_config(self, config: GlobalConfig) -> None:
         """Save global configuration to INI file with user-friendly comments.
 
@@ -262,6 +411,8 @@ class GlobalConfigManager:
             config: Global configuration to save
 
         """
+        with _snapshots_lock:
+            _snapshots.pop(self.settings_file, None)
         comment_manager = ConfigCommentManager()
 
         # Build configuration content with comments
@@ -282,6 +433,9 @@ class GlobalConfigManager:
                     config["max_concurrent_downloads"]
                 ),
                 "max_backup": str(config["max_backup"]),
+                "backup_strategy": config.get(
+                    "backup_strategy", DEFAULT_BACKUP_STRATEGY
+                ),
                 "log_level": config["log_level"],
                 "console_log_level": config["console_log_level"],
             }
@@ -301,6 +455,26 @@ class GlobalConfigManager:
             network_data: dict[str, str] = {
                 "retry_attempts": str(network_section["retry_attempts"]),
                 "timeout_seconds": str(network_section["timeout_seconds"]),
+                "download_segments": str(
+                    network_section.get(
+                        "download_segments", DEFAULT_DOWNLOAD_SEGMENTS
+                    )
+                ),
+                "segment_threshold_mb": str(
+                    network_section.get(
+                        "segment_threshold_mb", DEFAULT_SEGMENT_THRESHOLD_MB
+                    )
+                ),
+                "cache_ttl_hours": str(
+                    network_section.get(
+                        "cache_ttl_hours", DEFAULT_CACHE_TTL_HOURS
+                    )
+                ),
+                "cache_stale_hours": str(
+                    network_section.get(
+                        "cache_stale_hours", DEFAULT_CACHE_STALE_HOURS
+                    )
+                ),
             }
 
             for key, value in network_data.items():
@@ -382,6 +556,13 @@ class GlobalConfigManager:
                 MAX_CONCURRENT_DOWNLOADS,
             ),
             max_backup=int(get_scalar_config("max_backup", 1)),
+            backup_strategy=_parse_backup_strategy(
+                str(
+                    get_scalar_config(
+                        "backup_strategy", DEFAULT_BACKUP_STRATEGY
+                    )
+                )
+            ),
             log_level=str(get_scalar_config("log_level", "INFO")),
             console_log_level=str(
                 get_scalar_config(
@@ -0,0 +1,147 @@
+"""Release cache migration module.
+
+Older versions stored each cached GitHub release in its own JSON file,
+``cache/releases/{owner}_{repo}[_{cache_type}].json``. The release cache now
+keeps every entry in a single SQLite database. This module reads the legacy
+files, hands each entry to the new store and removes the file afterwards.
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+import orjson
+
+from my_unicorn.logger import get_logger
+from my_unicorn.types import CacheEntry
+
+logger = get_logger(__name__)
+
+# Cache types other than "stable" were stored with a filename suffix
+LEGACY_CACHE_TYPE_SUFFIXES = ("prerelease", "latest")
+
+
+def parse_legacy_cache_filename(
+    stem: str, release_data: dict[str, Any]
+) -> tuple[str, str, str] | None:
+    """Recover (owner, repo, cache_type) from a legacy cache filename.
+
+    The owner and repo recorded in the release data are preferred, since
+    repository names may contain underscores. Otherwise the first underscore
+    separates owner and repo, as GitHub owners cannot contain one.
+
+    Args:
+        stem: Filename without the ``.json`` extension
+        release_data: Release data stored in the file
+
+    Returns:
+        Tuple of (owner, repo, cache_type), or None if unrecognized
+
+    """
+    owner = release_data.get("owner")
+    repo = release_data.get("repo")
+    if isinstance(owner, str) and isinstance(repo, str):
+        prefix = f"{owner}_{repo}"
+        if stem == prefix:
+            return owner, repo, "stable"
+        if stem.startswith(f"{prefix}_"):
+            return owner, repo, stem[len(prefix) + 1 :]
+
+    owner, _, rest = stem.partition("_")
+    if not owner or not rest:
+        return None
+    for cache_type in LEGACY_CACHE_TYPE_SUFFIXES:
+        if rest.endswith(f"_{cache_type}"):
+            return owner, rest[: -len(cache_type) - 1], cache_type
+    return owner, rest, "stable"
+
+
+def load_legacy_cache_file(
+    cache_file: Path,
+) -> tuple[str, str, str, CacheEntry] | None:
+    """Read one legacy JSON cache file.
+
+    Args:
+        cache_file: Path to the ``.json`` cache file
+
+    Returns:
+        Tuple of (owner, repo, cache_type, entry), or None if the file is
+        unreadable or not a release cache entry
+
+    """
+    try:
+        data = orjson.loads(cache_file.read_bytes())  # pylint: disable=no-member
+    except (OSError, ValueError) as e:
+        logger.debug("Unreadable legacy cache file %s: %s", cache_file, e)
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get("cached_at"), str)
+        or not isinstance(data.get("release_data"), dict)
+    ):
+        return None
+
+    try:
+        datetime.fromisoformat(data["cached_at"])
+    except ValueError:
+        logger.debug(
+            "Invalid timestamp in legacy cache file %s: %s",
+            cache_file,
+            data["cached_at"],
+        )
+        return None
+
+    key = parse_legacy_cache_filename(cache_file.stem, data["release_data"])
+    if key is None:
+        return None
+    return (*key, cast("CacheEntry", data))
+
+
+def migrate_json_release_cache(
+    cache_dir: Path,
+    save_entry: Callable[[str, str, str, CacheEntry], None],
+) -> int:
+    """Move legacy JSON cache files into the release cache database.
+
+    Each file is removed once its entry is saved. Unreadable files and
+    entries rejected by ``save_entry`` with ValueError are removed as well,
+    matching how the JSON cache discarded corrupted files. If ``save_entry``
+    raises any other error, the remaining files are left in place so the
+    migration can be retried.
+
+    Args:
+        cache_dir: Directory holding the legacy ``*.json`` files
+        save_entry: Callback storing (owner, repo, cache_type, entry)
+
+    Returns:
+        Number of migrated entries
+
+    """
+    migrated = 0
+    for cache_file in sorted(cache_dir.glob("*.json")):
+        legacy = load_legacy_cache_file(cache_file)
+        if legacy is None:
+            logger.warning(
+                "Discarding unreadable release cache file: %s",
+                cache_file.name,
+            )
+        else:
+            try:
+                save_entry(*legacy)
+            except ValueError as e:
+                logger.warning(
+                    "Discarding invalid release cache file %s: %s",
+                    cache_file.name,
+                    e,
+                )
+            else:
+                migrated += 1
+        cache_file.unlink(missing_ok=True)
+
+    if migrated:
+        logger.info(
+            "Migrated %d release cache entries to %s", migrated, cache_dir
+        )
+    return migrated
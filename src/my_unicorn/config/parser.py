@@ -82,6 +82,8 @@ class ConfigCommentManager:
 # config_version: Version of configuration format (DO NOT EDIT)
 # max_concurrent_downloads: Max simultaneous downloads (1-10)
 # max_backup: Number of backup copies to keep when updating apps (0-5)
+# backup_strategy: How backups share AppImage bytes
+#   (auto, copy, hardlink, reflink, move)
 # log_level: Detail level for log files (DEBUG, INFO, WARNING, ERROR)
 # console_log_level: Console output detail level (DEBUG, INFO, etc.)
 
@@ -94,6 +96,11 @@ class ConfigCommentManager:
 #
 # retry_attempts: Number of times to retry failed downloads (1-10)
 # timeout_seconds: Seconds to wait before timing out requests (5-60)
+# download_segments: Parallel connections per large download (1 disables)
+# segment_threshold_mb: Minimum asset size in MB for segmented downloads
+# cache_ttl_hours: Hours a cached release is used without asking GitHub
+# cache_stale_hours: Extra hours an expired release may answer update
+#   checks while it is refreshed in the background (0 disables)
 
 """,
             SECTION_DIRECTORY: """
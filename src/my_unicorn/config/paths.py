@@ -28,6 +28,7 @@ class Paths:
 
     # User config directories
     CACHE_DIR = CONFIG_DIR / "cache" / "releases"
+    CATALOG_INDEX_CACHE_DIR = CONFIG_DIR / "cache" / "catalog"
     APPS_DIR = CONFIG_DIR / DEFAULT_APPS_DIR_NAME
     LOGS_DIR = CONFIG_DIR / "logs"
     BACKUPS_DIR = APPS_DIR / "backups"
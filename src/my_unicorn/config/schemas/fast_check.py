@@ -0,0 +1,257 @@
+"""Fast-path checks generated from JSON schemas.
+
+``compile_schema`` turns a schema into nested closures that only answer
+"is this instance valid?". They skip the jsonschema machinery (reference
+resolution, error objects, ``best_match``), so valid configurations, the
+common case, are checked in a fraction of the time. Invalid instances are
+passed on to the jsonschema validator, which produces the error message.
+
+Only the Draft 7 keywords used by the bundled schemas are compiled. A
+schema using any other keyword is not compiled, so the fast path never
+accepts an instance that jsonschema would reject.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+Check = Callable[[Any], bool]
+
+# Keywords without effect on validation ("format" is only asserted when
+# a format checker is passed to the validator, which this package does not)
+_ANNOTATIONS = frozenset(
+    {"$schema", "$id", "title", "description", "default", "format"}
+)
+
+
+class UnsupportedSchemaError(ValueError):
+    """Raised when a schema uses a keyword the compiler does not support."""
+
+
+def _is_integer(value: object) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (
+        isinstance(value, float) and value.is_integer()
+    )
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+_TYPE_CHECKS: dict[str, Check] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "integer": _is_integer,
+    "number": _is_number,
+}
+
+
+def _equal(first: object, second: object) -> bool:
+    """Compare like jsonschema, which does not treat booleans as numbers."""
+    if isinstance(first, bool) or isinstance(second, bool):
+        return type(first) is type(second) and first == second
+    return bool(first == second)
+
+
+def _compile_type(expected: str | list[str]) -> Check:
+    names = [expected] if isinstance(expected, str) else expected
+    try:
+        checks = [_TYPE_CHECKS[name] for name in names]
+    except KeyError as e:
+        msg = f"Unsupported type: {e}"
+        raise UnsupportedSchemaError(msg) from e
+    return lambda value: any(check(value) for check in checks)
+
+
+def _compile_scalar(schema: dict[str, Any]) -> list[Check]:
+    checks: list[Check] = []
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+        checks.append(
+            lambda value: (
+                not isinstance(value, str) or len(value) >= min_length
+            )
+        )
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+        checks.append(
+            lambda value: (
+                not isinstance(value, str) or pattern.search(value) is not None
+            )
+        )
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+        checks.append(lambda value: not _is_number(value) or value >= minimum)
+    if "maximum" in schema:
+        maximum = schema["maximum"]
+        checks.append(lambda value: not _is_number(value) or value <= maximum)
+    return checks
+
+
+def _compile_object(schema: dict[str, Any]) -> list[Check]:
+    checks: list[Check] = []
+    required = tuple(schema.get("required", ()))
+    if required:
+        checks.append(
+            lambda value: (
+                not isinstance(value, dict)
+                or all(key in value for key in required)
+            )
+        )
+    properties = {
+        key: compile_schema(subschema)
+        for key, subschema in schema.get("properties", {}).items()
+    }
+    if properties:
+        checks.append(
+            lambda value: (
+                not isinstance(value, dict)
+                or all(
+                    check(value[key])
+                    for key, check in properties.items()
+                    if key in value
+                )
+            )
+        )
+    additional = schema.get("additionalProperties", True)
+    if additional is False:
+        allowed = frozenset(properties)
+        checks.append(
+            lambda value: (
+                not isinstance(value, dict) or allowed.issuperset(value)
+            )
+        )
+    elif additional is not True:
+        known = frozenset(properties)
+        additional_check = compile_schema(additional)
+        checks.append(
+            lambda value: (
+                not isinstance(value, dict)
+                or all(
+                    additional_check(item)
+                    for key, item in value.items()
+                    if key not in known
+                )
+            )
+        )
+    return checks
+
+
+def _compile_array(schema: dict[str, Any]) -> list[Check]:
+    checks: list[Check] = []
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+        checks.append(
+            lambda value: (
+                not isinstance(value, list) or len(value) >= min_items
+            )
+        )
+    if "items" in schema:
+        if not isinstance(schema["items"], dict):
+            msg = "Only a single items schema is supported"
+            raise UnsupportedSchemaError(msg)
+        item_check = compile_schema(schema["items"])
+        checks.append(
+            lambda value: (
+                not isinstance(value, list)
+                or all(item_check(item) for item in value)
+            )
+        )
+    return checks
+
+
+def _compile_combinators(schema: dict[str, Any]) -> list[Check]:
+    checks: list[Check] = []
+    if "allOf" in schema:
+        all_of = [compile_schema(subschema) for subschema in schema["allOf"]]
+        checks.append(lambda value: all(check(value) for check in all_of))
+    if "oneOf" in schema:
+        one_of = [compile_schema(subschema) for subschema in schema["oneOf"]]
+        checks.append(
+            lambda value: sum(1 for check in one_of if check(value)) == 1
+        )
+    if "not" in schema:
+        negated = compile_schema(schema["not"])
+        checks.append(lambda value: not negated(value))
+    if "if" in schema:
+        condition = compile_schema(schema["if"])
+        then = compile_schema(schema.get("then", {}))
+        otherwise = compile_schema(schema.get("else", {}))
+        checks.append(
+            lambda value: then(value) if condition(value) else otherwise(value)
+        )
+    return checks
+
+
+_COMPILED_KEYWORDS = frozenset(
+    {
+        "type",
+        "const",
+        "enum",
+        "minLength",
+        "pattern",
+        "minimum",
+        "maximum",
+        "required",
+        "properties",
+        "additionalProperties",
+        "minItems",
+        "items",
+        "allOf",
+        "oneOf",
+        "not",
+        "if",
+        "then",
+        "else",
+    }
+)
+
+
+def compile_schema(schema: dict[str, Any]) -> Check:
+    """Compile a JSON schema into a validity check.
+
+    Args:
+        schema: Draft 7 JSON schema
+
+    Returns:
+        Function returning True if an instance is valid
+
+    Raises:
+        UnsupportedSchemaError: If the schema uses unsupported keywords
+
+    """
+    unsupported = set(schema) - _COMPILED_KEYWORDS - _ANNOTATIONS
+    if unsupported:
+        msg = f"Unsupported schema keywords: {sorted(unsupported)}"
+        raise UnsupportedSchemaError(msg)
+
+    checks: list[Check] = []
+    if "type" in schema:
+        checks.append(_compile_type(schema["type"]))
+    for option in [schema.get("const"), *schema.get("enum", ())]:
+        if isinstance(option, dict | list):
+            msg = "Only scalar const and enum values are supported"
+            raise UnsupportedSchemaError(msg)
+    if "const" in schema:
+        const = schema["const"]
+        checks.append(lambda value: _equal(value, const))
+    if "enum" in schema:
+        enum = schema["enum"]
+        checks.append(
+            lambda value: any(_equal(value, option) for option in enum)
+        )
+    checks += _compile_scalar(schema)
+    checks += _compile_object(schema)
+    checks += _compile_array(schema)
+    checks += _compile_combinators(schema)
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: all(check(value) for check in checks)
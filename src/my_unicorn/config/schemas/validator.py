@@ -1,18 +1,30 @@
 """JSON Schema validation for My Unicorn configuration files.
 
 This module provides validation utilities for catalog and app state
-configuration files using JSON Schema.
+configuration files using JSON Schema. Schemas are loaded and compiled on
+first use and shared by all validator instances; valid configurations are
+accepted by checks compiled from the schema (see ``fast_check``) and only
+invalid ones go through jsonschema for error reporting.
 """
 
+from __future__ import annotations
+
+import functools
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import orjson
-from jsonschema import Draft7Validator, ValidationError
-from jsonschema.exceptions import best_match
 
+from my_unicorn.config.schemas.fast_check import (
+    Check,
+    UnsupportedSchemaError,
+    compile_schema,
+)
 from my_unicorn.logger import get_logger
 
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator, ValidationError
+
 logger = get_logger(__name__)
 
 # Schema file paths
@@ -84,31 +96,29 @@ class ConfigValidator:
         explicitly or accept via dependency injection.
     """
 
-    def __init__(self) -> None:
-        """Initialize validator with loaded schemas."""
-        # Load app state, cache, and global config schemas
-        self._app_state_v1_schema = self._load_schema(APP_STATE_V1_SCHEMA_PATH)
-        self._app_state_v2_schema = self._load_schema(APP_STATE_V2_SCHEMA_PATH)
-        self._cache_release_schema = self._load_schema(
-            CACHE_RELEASE_SCHEMA_PATH
-        )
-        self._global_config_v1_schema = self._load_schema(
-            GLOBAL_CONFIG_V1_SCHEMA_PATH
-        )
+    @staticmethod
+    def _find_error(
+        schema_path: Path, config: dict[str, Any]
+    ) -> ValidationError | None:
+        """Validate a configuration against a schema.
 
-        # Create validators
-        self._app_state_v1_validator = Draft7Validator(
-            self._app_state_v1_schema
-        )
-        self._app_state_v2_validator = Draft7Validator(
-            self._app_state_v2_schema
-        )
-        self._cache_release_validator = Draft7Validator(
-            self._cache_release_schema
-        )
-        self._global_config_v1_validator = Draft7Validator(
-            self._global_config_v1_schema
-        )
+        jsonschema is only imported when the fast-path check rejects the
+        configuration, so valid configurations never load it.
+
+        Args:
+            schema_path: Path to schema file
+            config: Configuration dictionary
+
+        Returns:
+            Most relevant validation error, None if the configuration is valid
+
+        """
+        fast_check = _load_fast_check(schema_path)
+        if fast_check is not None and fast_check(config):
+            return None
+        from jsonschema.exceptions import best_match  # noqa: PLC0415
+
+        return best_match(_load_validator(schema_path).iter_errors(config))
 
     @staticmethod
     def _load_schema(schema_path: Path) -> dict[str, Any]:
@@ -213,16 +223,14 @@ class ConfigValidator:
         """
         # Detect version and select appropriate validator
         version = self._detect_app_state_version(config)
-        validator = (
-            self._app_state_v1_validator
+        schema_path = (
+            APP_STATE_V1_SCHEMA_PATH
             if version == "1.0.0"
-            else self._app_state_v2_validator
+            else APP_STATE_V2_SCHEMA_PATH
         )
 
-        errors = list(validator.iter_errors(config))
-        if errors:
-            # Get the most relevant error
-            best_error = best_match(errors)
+        best_error = self._find_error(schema_path, config)
+        if best_error is not None:
             error_msg = self._format_validation_error(best_error, "app_state")
 
             # Add app name to error if provided
@@ -264,10 +272,8 @@ class ConfigValidator:
             SchemaValidationError: If validation fails
 
         """
-        errors = list(self._cache_release_validator.iter_errors(config))
-        if errors:
-            # Get the most relevant error
-            best_error = best_match(errors)
+        best_error = self._find_error(CACHE_RELEASE_SCHEMA_PATH, config)
+        if best_error is not None:
             error_msg = self._format_validation_error(best_error, "cache")
 
             # Add cache name to error if provided
@@ -295,10 +301,8 @@ class ConfigValidator:
             SchemaValidationError: If validation fails
 
         """
-        errors = list(self._global_config_v1_validator.iter_errors(config))
-        if errors:
-            # Get the most relevant error
-            best_error = best_match(errors)
+        best_error = self._find_error(GLOBAL_CONFIG_V1_SCHEMA_PATH, config)
+        if best_error is not None:
             error_msg = self._format_validation_error(
                 best_error, "global_config"
             )
@@ -315,6 +319,29 @@ class ConfigValidator:
         logger.debug("Global config validation passed")
 
 
+@functools.cache
+def _load_validator(schema_path: Path) -> Draft7Validator:
+    """Compile the jsonschema validator of a schema on first use."""
+    from jsonschema import Draft7Validator  # noqa: PLC0415
+
+    return Draft7Validator(ConfigValidator._load_schema(schema_path))  # noqa: SLF001
+
+
+@functools.cache
+def _load_fast_check(schema_path: Path) -> Check | None:
+    """Compile the fast-path check of a schema on first use.
+
+    Returns:
+        Validity check, or None if the schema cannot be compiled
+
+    """
+    try:
+        return compile_schema(ConfigValidator._load_schema(schema_path))  # noqa: SLF001
+    except UnsupportedSchemaError as e:
+        logger.debug("No fast-path check for %s: %s", schema_path.name, e)
+        return None
+
+
 def validate_app_state(
     config: dict[str, Any],
     app_name: str | None = None,
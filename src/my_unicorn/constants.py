@@ -42,13 +42,33 @@ LOCKFILE_PATH: Final[Path] = Path("/tmp/my-unicorn.lock")  # noqa: S108
 # Default apps dir name under config
 DEFAULT_APPS_DIR_NAME: Final[str] = "apps"
 
+# Threads reading and parsing app state files when loading all apps at once
+APP_CONFIG_LOAD_WORKERS: Final[int] = 8
+
 # Configuration defaults
 DEFAULT_LOG_LEVEL: Final[str] = "INFO"
 
 # Defaults used by the global config manager
 DEFAULT_MAX_CONCURRENT_DOWNLOADS: Final[int] = 5
 DEFAULT_MAX_BACKUP: Final[int] = 1
+DEFAULT_BACKUP_STRATEGY: Final[str] = "auto"
 DEFAULT_CONSOLE_LOG_LEVEL: Final[str] = "INFO"
+DEFAULT_RETRY_ATTEMPTS: Final[int] = 3
+DEFAULT_TIMEOUT_SECONDS: Final[int] = 10
+
+# Segmented downloads: number of parallel byte ranges per asset and the
+# minimum asset size (in MB) before an asset is split into segments.
+# A segment count of 1 disables segmented downloads.
+DEFAULT_DOWNLOAD_SEGMENTS: Final[int] = 4
+DEFAULT_SEGMENT_THRESHOLD_MB: Final[int] = 50
+MIN_DOWNLOAD_SEGMENTS: Final[int] = 1
+MAX_DOWNLOAD_SEGMENTS: Final[int] = 16
+
+# Release cache: entries are fresh for the TTL, then served as stale for up
+# to the stale window while update checks refresh them in the background.
+# A stale window of 0 disables stale-while-revalidate.
+DEFAULT_CACHE_TTL_HOURS: Final[int] = 24
+DEFAULT_CACHE_STALE_HOURS: Final[int] = 168
 
 # Date/time formats used in config headers and saved timestamps
 ISO_DATETIME_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
@@ -61,6 +81,7 @@ SECTION_DIRECTORY: Final[str] = "directory"
 KEY_CONFIG_VERSION: Final[str] = "config_version"
 KEY_MAX_CONCURRENT_DOWNLOADS: Final[str] = "max_concurrent_downloads"
 KEY_MAX_BACKUP: Final[str] = "max_backup"
+KEY_BACKUP_STRATEGY: Final[str] = "backup_strategy"
 KEY_LOG_LEVEL: Final[str] = "log_level"
 KEY_CONSOLE_LOG_LEVEL: Final[str] = "console_log_level"
 
@@ -98,6 +119,10 @@ CONFIG_MIGRATION_PRINT_PREFIX: Final[str] = "Config Migration"
 # Network and directory key names used in migration/validation
 KEY_RETRY_ATTEMPTS: Final[str] = "retry_attempts"
 KEY_TIMEOUT_SECONDS: Final[str] = "timeout_seconds"
+KEY_DOWNLOAD_SEGMENTS: Final[str] = "download_segments"
+KEY_SEGMENT_THRESHOLD_MB: Final[str] = "segment_threshold_mb"
+KEY_CACHE_TTL_HOURS: Final[str] = "cache_ttl_hours"
+KEY_CACHE_STALE_HOURS: Final[str] = "cache_stale_hours"
 
 KEY_STORAGE: Final[str] = "storage"
 
@@ -251,6 +276,31 @@ BACKUP_METADATA_TMP_SUFFIX: Final[str] = ".json.tmp"
 # Temporary file suffix used when creating temp backup copies
 BACKUP_TEMP_SUFFIX: Final[str] = ".tmp"
 
+# How backups and restores share AppImage bytes. "auto" probes each pair
+# of devices once, preferring a hard link, then a reflink, then a copy.
+# "move" renames the installed file into the backup directory and only
+# applies where the installed file is about to be replaced.
+BACKUP_STRATEGY_AUTO: Final[str] = "auto"
+BACKUP_STRATEGY_COPY: Final[str] = "copy"
+BACKUP_STRATEGY_HARDLINK: Final[str] = "hardlink"
+BACKUP_STRATEGY_REFLINK: Final[str] = "reflink"
+BACKUP_STRATEGY_MOVE: Final[str] = "move"
+BACKUP_STRATEGIES: Final[tuple[str, ...]] = (
+    BACKUP_STRATEGY_AUTO,
+    BACKUP_STRATEGY_COPY,
+    BACKUP_STRATEGY_HARDLINK,
+    BACKUP_STRATEGY_REFLINK,
+    BACKUP_STRATEGY_MOVE,
+)
+
+# Content-addressed AppImage store inside the cache directory; blobs are
+# named by their SHA-256 digest and shared with installs and backups
+BLOB_STORE_DIRNAME: Final[str] = "blobs"
+
+# Icon cache inside the cache directory; maps installed icons to the
+# AppImages and in-image files they were extracted from
+ICON_CACHE_DIRNAME: Final[str] = "icons"
+
 # AppImage filename suffix (case sensitive)
 APPIMAGE_SUFFIX: Final[str] = ".AppImage"
 
@@ -367,8 +417,25 @@ MAX_CONCURRENT_DOWNLOADS = 20
 
 
 # API NETWORK RELATED
+HTTP_NOT_MODIFIED = 304
 HTTP_NOT_FOUND = 404
 
+# GRAPHQL BATCHED RELEASE LOOKUPS
+# Used by update checks when a token is configured (GraphQL requires auth).
+# Each repository costs at most GRAPHQL_RELEASES_PER_REPO release nodes, so
+# a query of GRAPHQL_REPOS_PER_QUERY repositories stays far below GitHub's
+# node limit while checking 50 apps in two round trips. The release window
+# matches the default page of the REST /releases endpoint (30), so both
+# paths pick the prerelease from the same releases.
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_REPOS_PER_QUERY = 25
+GRAPHQL_RELEASES_PER_REPO = 30
+GRAPHQL_ASSETS_PER_RELEASE = 100
+
+# STALE-WHILE-REVALIDATE
+# Maximum concurrent background refreshes of stale release cache entries
+STALE_REFRESH_MAX_CONCURRENT = 4
+
 # API ASSET FILTERING
 #
 # These keywords are used to filter out unstable
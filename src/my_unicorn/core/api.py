@@ -2,6 +2,11 @@
 
 This module handles direct HTTP communication with the GitHub API,
 including authentication, rate limiting, and retry logic.
+
+Release requests are conditional when the cache holds ``ETag`` or
+``Last-Modified`` validators for them. A ``304 Not Modified`` reply is not
+counted against GitHub's primary rate limit and only refreshes the cache
+timestamp.
 """
 
 from __future__ import annotations
@@ -19,6 +24,7 @@ from my_unicorn.config.validation import ConfigurationValidator
 from my_unicorn.constants import (
     CHECKSUM_FILE_SUFFIXES,
     HTTP_NOT_FOUND,
+    HTTP_NOT_MODIFIED,
     INCOMPATIBLE_PLATFORM_EXTENSIONS,
     INCOMPATIBLE_PLATFORM_PATTERNS,
     UNSTABLE_VERSION_KEYWORDS,
@@ -28,7 +34,7 @@ from my_unicorn.core.protocols.progress import (
     NullProgressReporter,
     ProgressReporter,
 )
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
 from my_unicorn.types import ChecksumFileInfo
 from my_unicorn.utils.asset_validation import (
     SPECIFIC_CHECKSUM_EXTENSIONS,
@@ -41,6 +47,8 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from my_unicorn.core.cache import ReleaseCacheManager
+    from my_unicorn.core.revalidation import StaleReleaseRefresher
+    from my_unicorn.types import GlobalConfig
 
 logger = get_logger(__name__)
 
@@ -49,6 +57,18 @@ _HTTP_UNAUTHORIZED = 401
 _HTTP_FORBIDDEN = 403
 
 
+class NotModified:
+    """Sentinel type for a ``304 Not Modified`` API response."""
+
+    def __repr__(self) -> str:
+        """Return a readable representation for logs."""
+        return "NOT_MODIFIED"
+
+
+# Returned by ReleaseAPIClient when a conditional request found no changes
+NOT_MODIFIED = NotModified()
+
+
 def create_api_timeout(base_seconds: int) -> aiohttp.ClientTimeout:
     """Create configured timeout for GitHub API requests.
 
@@ -111,6 +131,7 @@ class ReleaseAPIClient:
         auth_manager: GitHubAuthManager,
         shared_api_task_id: str | None = None,
         progress_reporter: ProgressReporter | None = None,
+        network_config: Mapping[str, Any] | None = None,
     ) -> None:
         """Initialize the API client.
 
@@ -121,6 +142,8 @@ class ReleaseAPIClient:
             auth_manager: GitHub authentication manager
             shared_api_task_id: Optional shared API progress task ID
             progress_reporter: Optional progress reporter for tracking
+            network_config: ``[network]`` section of the global config
+                (loaded from the settings file if not provided)
 
         """
         self.owner = owner
@@ -130,10 +153,13 @@ class ReleaseAPIClient:
         self.shared_api_task_id = shared_api_task_id
         self.progress_reporter = progress_reporter or NullProgressReporter()
 
-        # Load network config once at construction time rather than on
-        # every API call to avoid repeated disk/parse overhead.
-        _config = ConfigManager()
-        _network_cfg = _config.load_global_config()["network"]
+        # Read network config once at construction time rather than on
+        # every API call; callers creating many clients pass it in.
+        _network_cfg = (
+            network_config
+            if network_config is not None
+            else ConfigManager().load_global_config()["network"]
+        )
         self._retry_attempts: int = int(_network_cfg.get("retry_attempts", 3))
         self._timeout_seconds: int = int(
             _network_cfg.get("timeout_seconds", 10)
@@ -142,6 +168,11 @@ class ReleaseAPIClient:
         # Caches a confirmed branch name for the lifetime of this instance.
         self._default_branch_cache: str | None = None
 
+        # Validators of the most recent 200 response, stored with the
+        # cached release so the next refresh can be a conditional request.
+        self.last_etag: str | None = None
+        self.last_modified: str | None = None
+
     async def update_shared_progress(self, description: str) -> None:
         """Update shared API progress task.
 
@@ -232,15 +263,69 @@ class ReleaseAPIClient:
 
         return None
 
-    async def _fetch_from_api(self, url: str, description: str) -> Any | None:
+    @staticmethod
+    def _get_header(response: aiohttp.ClientResponse, name: str) -> str | None:
+        """Return a response header value, or None if missing or empty."""
+        value = response.headers.get(name)
+        return value if isinstance(value, str) and value else None
+
+    @staticmethod
+    def _conditional_headers(
+        etag: str | None, last_modified: str | None
+    ) -> dict[str, str]:
+        """Build conditional request headers from cached validators."""
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    async def _read_response(
+        self, response: aiohttp.ClientResponse, url: str
+    ) -> Any:  # noqa: ANN401
+        """Return the JSON body of a successful response.
+
+        Records the response's ``ETag`` and ``Last-Modified`` validators for
+        the caller to cache.
+
+        Args:
+            response: Successful (2xx or 304) API response
+            url: Requested URL, for logging
+
+        Returns:
+            Parsed JSON response, or NOT_MODIFIED for a 304 reply.
+
+        """
+        if response.status == HTTP_NOT_MODIFIED:
+            logger.debug("Not modified since last fetch: %s", url)
+            return NOT_MODIFIED
+
+        self.last_etag = self._get_header(response, "ETag")
+        self.last_modified = self._get_header(response, "Last-Modified")
+        return await response.json()
+
+    async def _fetch_from_api(
+        self,
+        url: str,
+        description: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> Any | None:
         """Fetch data from GitHub API with retry and rate-limit handling.
 
+        When ``etag`` or ``last_modified`` is given the request is sent with
+        ``If-None-Match``/``If-Modified-Since`` headers.
+
         Args:
             url: API URL to fetch
             description: Description for progress tracking
+            etag: ``ETag`` of a previously cached response
+            last_modified: ``Last-Modified`` of a previously cached response
 
         Returns:
-            Parsed JSON response, or None if the resource was not found (404).
+            Parsed JSON response, None if the resource was not found (404),
+            or NOT_MODIFIED if a conditional request found no changes (304).
 
         Raises:
             aiohttp.ClientResponseError: On 401 (bad token) immediately, or
@@ -266,17 +351,21 @@ class ReleaseAPIClient:
             )
 
         timeout = create_api_timeout(self._timeout_seconds)
+        conditional_headers = self._conditional_headers(etag, last_modified)
 
         for attempt in range(1, self._retry_attempts + 1):
             # Refresh headers on every attempt — ensures the latest token is
             # always used (e.g. if the user ran `my-unicorn token --save`
             # and restarted mid-session, though unlikely for a CLI).
-            headers = self.auth_manager.apply_auth({})
+            headers = self.auth_manager.apply_auth(dict(conditional_headers))
 
             try:
-                async with self.session.get(
-                    url=url, headers=headers, timeout=timeout
-                ) as response:
+                async with (
+                    timing_span("api"),
+                    self.session.get(
+                        url=url, headers=headers, timeout=timeout
+                    ) as response,
+                ):
                     if response.status == HTTP_NOT_FOUND:
                         return None
 
@@ -325,7 +414,7 @@ class ReleaseAPIClient:
                     ):
                         await self.update_shared_progress(description)
 
-                    return await response.json()
+                    return await self._read_response(response, url)
 
             except aiohttp.ClientResponseError as e:
                 # 401 already logged above; re-raise immediately, no retries.
@@ -386,21 +475,30 @@ class ReleaseAPIClient:
         # Explicit return satisfies static type checkers.
         return None  # pragma: no cover
 
-    async def fetch_stable_release(self) -> dict[str, Any] | None:
+    async def fetch_stable_release(
+        self, etag: str | None = None, last_modified: str | None = None
+    ) -> dict[str, Any] | NotModified | None:
         """Fetch the latest stable release.
 
+        Args:
+            etag: ``ETag`` of the cached response, for a conditional request
+            last_modified: ``Last-Modified`` of the cached response
+
         Returns:
-            Release data dict or None if no stable release found.
+            Release data dict, NOT_MODIFIED if the cached release is still
+            current, or None if no stable release found.
 
         """
         url = (
             f"https://api.github.com/repos/{self.owner}/"
             f"{self.repo}/releases/latest"
         )
-        data = await self._fetch_from_api(url, "Fetched stable release")
+        data = await self._fetch_from_api(
+            url, "Fetched stable release", etag, last_modified
+        )
 
-        if data is None:
-            return None
+        if data is None or data is NOT_MODIFIED:
+            return data
 
         if not isinstance(data, dict):
             logger.warning(
@@ -413,18 +511,27 @@ class ReleaseAPIClient:
 
         return data
 
-    async def fetch_prerelease(self) -> dict[str, Any] | None:
+    async def fetch_prerelease(
+        self, etag: str | None = None, last_modified: str | None = None
+    ) -> dict[str, Any] | NotModified | None:
         """Fetch the latest prerelease.
 
+        Args:
+            etag: ``ETag`` of the cached response, for a conditional request
+            last_modified: ``Last-Modified`` of the cached response
+
         Returns:
-            Release data dict or None if no prerelease found.
+            Release data dict, NOT_MODIFIED if the cached release list is
+            still current, or None if no prerelease found.
 
         """
         url = f"https://api.github.com/repos/{self.owner}/{self.repo}/releases"
-        data = await self._fetch_from_api(url, "Fetched prerelease")
+        data = await self._fetch_from_api(
+            url, "Fetched prerelease", etag, last_modified
+        )
 
-        if data is None:
-            return None
+        if data is None or data is NOT_MODIFIED:
+            return data
 
         if not isinstance(data, list):
             logger.warning(
@@ -543,6 +650,8 @@ class ReleaseFetcher:
         auth_manager: GitHubAuthManager | None = None,
         shared_api_task_id: str | None = None,
         progress_reporter: ProgressReporter | None = None,
+        stale_refresher: StaleReleaseRefresher | None = None,
+        network_config: Mapping[str, Any] | None = None,
     ) -> None:
         """Initialize the release fetcher.
 
@@ -556,6 +665,12 @@ class ReleaseFetcher:
                          (creates default if not provided)
             shared_api_task_id: Optional shared API progress task ID
             progress_reporter: Optional progress reporter for tracking
+            stale_refresher: Optional refresher enabling
+                            stale-while-revalidate; expired entries within
+                            the stale window are returned and refreshed
+                            in the background
+            network_config: ``[network]`` section of the global config
+                           (loaded from the settings file if not provided)
 
         """
         self.owner = owner
@@ -570,8 +685,10 @@ class ReleaseFetcher:
             self.auth_manager,
             shared_api_task_id,
             progress_reporter=self.progress_reporter,
+            network_config=network_config,
         )
         self.shared_api_task_id = shared_api_task_id
+        self.stale_refresher = stale_refresher
 
     async def _get_from_cache(
         self, cache_type: str = "stable"
@@ -601,6 +718,23 @@ class ReleaseFetcher:
             )
             return Release.from_dict(cached_data)
 
+        if self.stale_refresher:
+            stale_data = await self.cache_manager.get_stale_release(
+                self.owner, self.repo, cache_type=cache_type
+            )
+            if stale_data:
+                logger.debug(
+                    "Using stale %s release data for %s/%s, "
+                    "refreshing in background",
+                    cache_type,
+                    self.owner,
+                    self.repo,
+                )
+                self.stale_refresher.schedule(
+                    self.owner, self.repo, cache_type
+                )
+                return Release.from_dict(stale_data)
+
         return None
 
     async def _save_to_cache(
@@ -617,7 +751,12 @@ class ReleaseFetcher:
             return
 
         await self.cache_manager.save_release_data(
-            self.owner, self.repo, release.to_dict(), cache_type=cache_type
+            self.owner,
+            self.repo,
+            release.to_dict(),
+            cache_type=cache_type,
+            etag=self.api_client.last_etag,
+            last_modified=self.api_client.last_modified,
         )
         logger.debug(
             "Cached %s release data for %s/%s",
@@ -626,6 +765,83 @@ class ReleaseFetcher:
             self.repo,
         )
 
+    async def _fetch_from_api_with_cache(
+        self, cache_type: str, ignore_cache: bool
+    ) -> Release | None:
+        """Fetch a release from the API, revalidating any cached entry.
+
+        Validators stored with an expired cache entry are sent with the
+        request. A ``304 Not Modified`` reply reuses the cached release and
+        only bumps its timestamp.
+
+        Args:
+            cache_type: Cache type ('stable' or 'prerelease')
+            ignore_cache: If True, always request the full response
+
+        Returns:
+            Release, or None if the API has no matching release
+
+        """
+        fetch = (
+            self.api_client.fetch_prerelease
+            if cache_type == "prerelease"
+            else self.api_client.fetch_stable_release
+        )
+
+        etag = last_modified = None
+        if self.cache_manager and not ignore_cache:
+            (
+                etag,
+                last_modified,
+            ) = await self.cache_manager.get_cache_validators(
+                self.owner, self.repo, cache_type=cache_type
+            )
+
+        api_data = await fetch(etag=etag, last_modified=last_modified)
+        if api_data is NOT_MODIFIED:
+            cached_data = None
+            if self.cache_manager:
+                cached_data = await self.cache_manager.refresh_cached_release(
+                    self.owner, self.repo, cache_type=cache_type
+                )
+            if cached_data:
+                logger.debug(
+                    "Cached %s release for %s/%s is still current",
+                    cache_type,
+                    self.owner,
+                    self.repo,
+                )
+                return Release.from_dict(cached_data)
+            # Cache entry vanished since the request; fetch it in full.
+            api_data = await fetch()
+
+        if not isinstance(api_data, dict):
+            return None
+
+        release = Release.from_api_response(self.owner, self.repo, api_data)
+
+        # Filter for platform compatibility before caching
+        release = release.filter_for_platform()
+        await self._save_to_cache(release, cache_type=cache_type)
+        return release
+
+    async def revalidate(self, cache_type: str = "stable") -> Release | None:
+        """Refresh a cached release from the API.
+
+        The request is conditional when validators are cached, so an
+        unchanged release only bumps the cache timestamp.
+
+        Args:
+            cache_type: Cache type ('stable' or 'prerelease')
+
+        Returns:
+            Current release, or None if the API has no matching release
+
+        """
+        return await self._fetch_from_api_with_cache(
+            cache_type, ignore_cache=False
+        )
+
     async def fetch_latest_release(
         self, ignore_cache: bool = False
     ) -> Release:
@@ -654,16 +870,10 @@ class ReleaseFetcher:
                     )
                 return cached
 
-        api_data = await self.api_client.fetch_stable_release()
-        if api_data is None:
+        release = await self._fetch_from_api_with_cache("stable", ignore_cache)
+        if release is None:
             msg = f"No stable release found for {self.owner}/{self.repo}"
             raise ValueError(msg)
-
-        release = Release.from_api_response(self.owner, self.repo, api_data)
-
-        # Filter for platform compatibility before caching
-        release = release.filter_for_platform()
-        await self._save_to_cache(release, cache_type="stable")
         return release
 
     async def fetch_latest_prerelease(
@@ -694,16 +904,12 @@ class ReleaseFetcher:
                     )
                 return cached
 
-        api_data = await self.api_client.fetch_prerelease()
-        if api_data is None:
+        release = await self._fetch_from_api_with_cache(
+            "prerelease", ignore_cache
+        )
+        if release is None:
             msg = f"No prerelease found for {self.owner}/{self.repo}"
             raise ValueError(msg)
-
-        release = Release.from_api_response(self.owner, self.repo, api_data)
-
-        # Filter for platform compatibility before caching
-        release = release.filter_for_platform()
-        await self._save_to_cache(release, cache_type="prerelease")
         return release
 
     async def fetch_latest_release_or_prerelease(
@@ -777,16 +983,7 @@ class ReleaseFetcher:
                 await self._update_progress_for_cache_hit()
                 return cached
 
-        api_data = await self.api_client.fetch_stable_release()
-        if api_data:
-            release = Release.from_api_response(
-                self.owner, self.repo, api_data
-            )
-            # Filter for platform compatibility before caching
-            release = release.filter_for_platform()
-            await self._save_to_cache(release, cache_type="stable")
-            return release
-        return None
+        return await self._fetch_from_api_with_cache("stable", ignore_cache)
 
     async def _fetch_prerelease_with_cache(
         self, ignore_cache: bool
@@ -798,16 +995,9 @@ class ReleaseFetcher:
                 await self._update_progress_for_cache_hit()
                 return cached
 
-        api_data = await self.api_client.fetch_prerelease()
-        if api_data:
-            release = Release.from_api_response(
-                self.owner, self.repo, api_data
-            )
-            # Filter for platform compatibility before caching
-            release = release.filter_for_platform()
-            await self._save_to_cache(release, cache_type="prerelease")
-            return release
-        return None
+        return await self._fetch_from_api_with_cache(
+            "prerelease", ignore_cache
+        )
 
     async def fetch_specific_release(self, tag: str) -> Release:
         """Fetch a specific release by tag.
@@ -861,6 +1051,7 @@ class GitHubClient:
         auth_manager: GitHubAuthManager | None = None,
         cache_manager: ReleaseCacheManager | None = None,
         progress_reporter: ProgressReporter | None = None,
+        global_config: GlobalConfig | None = None,
     ) -> None:
         """Initialize GitHub client.
 
@@ -871,6 +1062,8 @@ class GitHubClient:
             cache_manager: Optional cache manager for release data
                           (None disables caching)
             progress_reporter: Optional progress reporter for tracking
+            global_config: Optional global configuration providing the
+                          network settings (loaded once if not provided)
 
         """
         self.session = session
@@ -878,6 +1071,18 @@ class GitHubClient:
         self.cache_manager = cache_manager
         self.progress_reporter = progress_reporter or NullProgressReporter()
         self.shared_api_task_id: str | None = None
+        self._network_config: Mapping[str, Any] | None = (
+            global_config.get("network") if global_config else None
+        )
+
+    @property
+    def network_config(self) -> Mapping[str, Any]:
+        """``[network]`` section of the global config, loaded once."""
+        if self._network_config is None:
+            self._network_config = ConfigManager().load_global_config()[
+                "network"
+            ]
+        return self._network_config
 
     def set_shared_api_task(self, task_id: str | None) -> None:
         """Set the shared API progress task ID.
@@ -910,6 +1115,7 @@ class GitHubClient:
                 auth_manager=self.auth_manager,
                 shared_api_task_id=self.shared_api_task_id,
                 progress_reporter=self.progress_reporter,
+                network_config=self.network_config,
             )
             return await fetcher.fetch_latest_release_or_prerelease(
                 prefer_prerelease=False
@@ -946,6 +1152,7 @@ class GitHubClient:
                 auth_manager=self.auth_manager,
                 shared_api_task_id=self.shared_api_task_id,
                 progress_reporter=self.progress_reporter,
+                network_config=self.network_config,
             )
             return await fetcher.fetch_specific_release(tag)
         except Exception:
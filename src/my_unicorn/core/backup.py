@@ -9,7 +9,7 @@ This module provides the main service for:
 - Ensuring atomic file operations for backup and restore processes
 """
 
-import hashlib
+import contextlib
 import shutil
 import tempfile
 from datetime import datetime
@@ -25,8 +25,15 @@ from my_unicorn.constants import (
     BACKUP_METADATA_FILENAME,
     BACKUP_METADATA_TMP_PREFIX,
     BACKUP_METADATA_TMP_SUFFIX,
+    BACKUP_STRATEGY_AUTO,
+    BACKUP_STRATEGY_COPY,
+    BACKUP_STRATEGY_MOVE,
+    BACKUP_STRATEGY_REFLINK,
     BACKUP_TEMP_SUFFIX,
+    DEFAULT_BACKUP_STRATEGY,
 )
+from my_unicorn.core.blob_store import BlobStore, replace_file
+from my_unicorn.core.hashing import hash_file, hash_file_async
 from my_unicorn.logger import get_logger
 from my_unicorn.utils.datetime_utils import get_current_datetime_local_iso
 
@@ -57,6 +64,10 @@ class BackupService:
         """
         self.config_manager = config_manager
         self.global_config = global_config
+        self.blob_store = BlobStore.from_global_config(global_config)
+        self.backup_strategy = global_config.get(
+            "backup_strategy", DEFAULT_BACKUP_STRATEGY
+        )
 
     @classmethod
     def create_default(
@@ -80,28 +91,38 @@ class BackupService:
 
             config_manager = ConfigManager()
 
-        global_config = config_manager.load_global_config()
+        global_config = config_manager.global_config_snapshot()
 
         return cls(
             config_manager=config_manager,
             global_config=global_config,
         )
 
-    def create_backup(
+    def create_backup(  # noqa: PLR0913
         self,
         file_path: Path,
         app_name: str,
         version: str | None = None,
         *,
         skip_cleanup: bool = False,
+        replace_source: bool = False,
+        sha256: str | None = None,
     ) -> Path | None:
         """Create versioned backup of existing file.
 
+        The backup is created with the configured backup strategy. The
+        ``move`` strategy is only used when ``replace_source`` is set;
+        otherwise the file is shared like with ``auto``.
+
         Args:
             file_path: Path to file to backup
             app_name: Name of the application
             version: Version string to include in backup name
             skip_cleanup: If True, skip cleanup of old backups (default: False)
+            replace_source: True if the caller is about to replace
+                ``file_path``, so it may be moved into the backup
+            sha256: Known SHA-256 digest of ``file_path``, hashed here if
+                the blob store needs it and it is not given
 
         Returns:
             Path to backup file or None if no existing file
@@ -117,23 +138,7 @@ class BackupService:
 
         # Determine version
         if not version:
-            app_config = self.config_manager.load_app_config(app_name)
-            if app_config:
-                # Check config version to determine structure
-                config_version = app_config.get("config_version", "1.0.0")
-                if config_version == "2.0.0":
-                    # v2 config: version is in state section
-                    state_dict = cast(
-                        "dict[str, Any]", app_config.get("state", {})
-                    )
-                    version = state_dict.get("version", "unknown")
-                else:
-                    # v1 config: version is in appimage section
-                    version = app_config.get("appimage", {}).get(
-                        "version", "unknown"
-                    )
-            else:
-                version = "unknown"
+            version = self._get_installed_version(app_name)
 
         # Create backup filename
         stem = file_path.stem
@@ -141,36 +146,30 @@ class BackupService:
         backup_filename = f"{stem}-{version}{suffix}"
         backup_path = app_backup_dir / backup_filename
 
-        # Copy file to backup location atomically
-        with tempfile.NamedTemporaryFile(
-            dir=app_backup_dir,
-            prefix=f".{backup_filename}_",
-            suffix=BACKUP_TEMP_SUFFIX,
-            delete=False,
-        ) as tmp_file:
-            temp_path = Path(tmp_file.name)
+        strategy = self._effective_strategy(replace_source=replace_source)
 
+        # Share file to backup location atomically
         try:
-            shutil.copy2(file_path, temp_path)
-            temp_path.replace(backup_path)
+            if self._uses_blob_store(strategy):
+                sha256 = self._store_file(file_path, sha256)
+            else:
+                sha256 = None
+            method = replace_file(
+                file_path, backup_path, strategy, BACKUP_TEMP_SUFFIX
+            )
 
             # Update metadata
             metadata = BackupMetadata(app_backup_dir)
-            # Version should not be None at this point
-            if version is None:
-                msg = f"Version is None when creating backup for {app_name}"
-                logger.error(msg)
-                raise ValueError(msg)
-            metadata.add_version(version, backup_filename, backup_path)
+            metadata.add_version(
+                version, backup_filename, backup_path, sha256=sha256
+            )
 
         except OSError:
-            # Cleanup temp file on error
-            if temp_path.exists():
-                temp_path.unlink()
             logger.exception("Failed to create backup for %s", app_name)
             raise
         else:
             logger.info("Backup created: %s (v%s)", backup_path, version)
+            logger.debug("Backup of %s created by %s", app_name, method)
 
             # Cleanup old backups after successful backup (unless skipped)
             if not skip_cleanup:
@@ -178,6 +177,111 @@ class BackupService:
 
             return backup_path
 
+    def _get_installed_version(self, app_name: str) -> str:
+        """Read the installed version of an app from its config.
+
+        Args:
+            app_name: Name of the application
+
+        Returns:
+            Installed version, or "unknown" if not recorded
+
+        """
+        app_config = self.config_manager.load_app_config(app_name)
+        if not app_config:
+            return "unknown"
+        # Check config version to determine structure
+        config_version = app_config.get("config_version", "1.0.0")
+        if config_version == "2.0.0":
+            # v2 config: version is in state section
+            state_dict = cast("dict[str, Any]", app_config.get("state", {}))
+            return cast("str", state_dict.get("version", "unknown"))
+        # v1 config: version is in appimage section
+        return cast(
+            "str", app_config.get("appimage", {}).get("version", "unknown")
+        )
+
+    async def create_backup_async(
+        self,
+        file_path: Path,
+        app_name: str,
+        version: str | None = None,
+        *,
+        skip_cleanup: bool = False,
+        replace_source: bool = False,
+    ) -> Path | None:
+        """Create versioned backup of existing file from async code.
+
+        Same as ``create_backup``, but a file that is not yet in the blob
+        store is hashed on the hashing thread pool instead of blocking the
+        event loop.
+
+        Args:
+            file_path: Path to file to backup
+            app_name: Name of the application
+            version: Version string to include in backup name
+            skip_cleanup: If True, skip cleanup of old backups (default: False)
+            replace_source: True if the caller is about to replace
+                ``file_path``, so it may be moved into the backup
+
+        Returns:
+            Path to backup file or None if no existing file
+
+        """
+        sha256 = None
+        strategy = self._effective_strategy(replace_source=replace_source)
+        if self.blob_store is not None and self._uses_blob_store(strategy):
+            sha256 = self.blob_store.find_digest(file_path)
+            if sha256 is None:
+                # A missing file is reported by create_backup
+                with contextlib.suppress(FileNotFoundError):
+                    sha256 = await hash_file_async(file_path, "sha256")
+        return self.create_backup(
+            file_path,
+            app_name,
+            version,
+            skip_cleanup=skip_cleanup,
+            replace_source=replace_source,
+            sha256=sha256,
+        )
+
+    def _effective_strategy(self, *, replace_source: bool) -> str:
+        """Return the backup strategy to use for one backup."""
+        if self.backup_strategy == BACKUP_STRATEGY_MOVE and not replace_source:
+            return BACKUP_STRATEGY_AUTO
+        return self.backup_strategy
+
+    @staticmethod
+    def _uses_blob_store(strategy: str) -> bool:
+        """Check whether backups with a strategy are added to the store."""
+        return strategy not in {BACKUP_STRATEGY_COPY, BACKUP_STRATEGY_REFLINK}
+
+    def _store_file(
+        self, file_path: Path, sha256: str | None = None
+    ) -> str | None:
+        """Add a file to the blob store and return its SHA-256 digest.
+
+        Files already linked into the store are recognised without reading
+        them; others are hashed once, unless ``sha256`` is given, and
+        stored.
+
+        Args:
+            file_path: File to store
+            sha256: Known SHA-256 digest of the file
+
+        Returns:
+            SHA-256 hex digest, or None if no blob store is configured
+
+        """
+        if self.blob_store is None:
+            return None
+        if sha256 is None:
+            sha256 = self.blob_store.find_digest(file_path)
+        if sha256 is None:
+            sha256 = hash_file(file_path, "sha256")
+        self.blob_store.add(file_path, sha256)
+        return sha256
+
     def restore_latest_backup(
         self, app_name: str, destination_dir: Path
     ) -> Path | None:
@@ -246,7 +350,7 @@ class BackupService:
         if not app_config:
             return None
 
-        app_rename, destination_path = self._determine_app_path_and_rename(
+        _, destination_path = self._determine_app_path_and_rename(
             app_name,
             app_config,
             destination_dir,
@@ -262,10 +366,7 @@ class BackupService:
             )
 
         try:
-            appimage_name = f"{app_rename}.AppImage"
-            self._perform_atomic_restore(
-                backup_path, destination_path, destination_dir, appimage_name
-            )
+            self._perform_atomic_restore(backup_path, destination_path)
 
             self._update_config_after_restore(
                 app_name,
@@ -334,37 +435,43 @@ class BackupService:
         self,
         backup_path: Path,
         destination_path: Path,
-        destination_dir: Path,
-        appimage_name: str,
     ) -> None:
-        """Restore file atomically using temporary file.
+        """Restore file atomically by linking the backup into place.
+
+        The restored AppImage shares its bytes with the backup when the
+        backup strategy and filesystem allow it, so restoring copies no
+        data. The backup itself is never moved.
 
         Args:
             backup_path: Path to backup file
             destination_path: Final destination path
-            destination_dir: Destination directory
-            appimage_name: Name of the AppImage
 
         Raises:
-            Exception: If restore fails
+            OSError: If restore fails
 
         """
-        with tempfile.NamedTemporaryFile(
-            dir=destination_dir,
-            prefix=f".{appimage_name}_",
-            suffix=BACKUP_TEMP_SUFFIX,
-            delete=False,
-        ) as tmp_file:
-            temp_path = Path(tmp_file.name)
+        strategy = self.backup_strategy
+        if strategy == BACKUP_STRATEGY_MOVE:
+            # The backup stays in place after a restore
+            strategy = BACKUP_STRATEGY_AUTO
+        replace_file(
+            backup_path, destination_path, strategy, BACKUP_TEMP_SUFFIX
+        )
+        destination_path.chmod(0o755)
 
-        try:
-            shutil.copy2(backup_path, temp_path)
-            temp_path.replace(destination_path)
-            destination_path.chmod(0o755)
-        except Exception:
-            if temp_path.exists():
-                temp_path.unlink()
-            raise
+    def reinstate_backup(self, backup_path: Path, file_path: Path) -> None:
+        """Put a backup back at the path it was created from.
+
+        Used when an update fails after the ``move`` strategy moved the
+        installed AppImage into the backup directory.
+
+        Args:
+            backup_path: Path to backup file
+            file_path: Original path of the backed up file
+
+        """
+        self._perform_atomic_restore(backup_path, file_path)
+        logger.info("Put back %s from backup %s", file_path, backup_path)
 
     def _update_config_after_restore(
         self,
@@ -632,12 +739,16 @@ class BackupService:
                 metadata.metadata_file.unlink()
             if not any(app_backup_dir.iterdir()):
                 app_backup_dir.rmdir()
+            if versions and self.blob_store is not None:
+                self.blob_store.prune()
             return
 
         # Keep only the most recent max_backups versions
         versions = metadata.list_versions()  # Already sorted newest to oldest
         versions_to_remove = versions[max_backups:]
         delete_old_backups(versions_to_remove, metadata, app_backup_dir)
+        if versions_to_remove and self.blob_store is not None:
+            self.blob_store.prune()
 
     def list_apps_with_backups(self) -> list[str]:
         """List all apps that have backups.
@@ -743,7 +854,11 @@ class BackupMetadata:
         logger.debug("Saved metadata to %s", self.metadata_file)
 
     def add_version(
-        self, version: str, filename: str, file_path: Path
+        self,
+        version: str,
+        filename: str,
+        file_path: Path,
+        sha256: str | None = None,
     ) -> None:
         """Add a version entry to metadata with checksum.
 
@@ -751,12 +866,13 @@ class BackupMetadata:
             version: Version string
             filename: Name of the backup file
             file_path: Path to the backup file for checksum calculation
+            sha256: Known SHA-256 digest of the file; computed if omitted
 
         """
         metadata = self.load()
 
-        # Calculate checksum
-        sha256_hash = self._calculate_sha256(file_path)
+        # Calculate checksum unless already known
+        sha256_hash = sha256 or self._calculate_sha256(file_path)
 
         # Add version entry
         metadata["versions"][version] = {
@@ -873,6 +989,8 @@ class BackupMetadata:
             logger.warning("No checksum stored for version %s", version)
             return False
 
+        # Always rehash: a backup linked to its blob shares the blob's
+        # inode, so corruption in place would change both together
         actual_hash = self._calculate_sha256(file_path)
         is_valid: bool = actual_hash == stored_hash
 
@@ -896,11 +1014,7 @@ class BackupMetadata:
             SHA256 checksum as hex string
 
         """
-        sha256_hash = hashlib.sha256()
-        with file_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+        return hash_file(file_path, "sha256")
 
 
 def validate_backup_exists(backup_path: Path) -> None:
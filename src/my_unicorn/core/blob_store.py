@@ -0,0 +1,337 @@
+"""Content-addressed store for AppImage files.
+
+AppImages are stored once under their SHA-256 digest, and installs and
+backups reference the stored bytes through hard links. Backing up an
+installed AppImage before an update then costs a directory entry instead
+of a full copy, and the digest of a stored file is known without
+rehashing it.
+
+Blobs are only ever hard links, since references to a blob are counted
+through its link count. Backups outside the store share files with
+``os.link`` when possible, then with a reflink (``FICLONE``) on filesystems
+such as Btrfs and XFS, and copy them as a last resort; the method that
+works is detected once per pair of devices. Installs and backups always
+replace files by renaming a new entry over them, never by writing in place,
+so shared bytes are never modified.
+"""
+
+from __future__ import annotations
+
+import errno
+import fcntl
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from my_unicorn.constants import (
+    BACKUP_STRATEGY_AUTO,
+    BACKUP_STRATEGY_COPY,
+    BACKUP_STRATEGY_HARDLINK,
+    BACKUP_STRATEGY_MOVE,
+    BACKUP_STRATEGY_REFLINK,
+    BLOB_STORE_DIRNAME,
+)
+from my_unicorn.logger import get_logger
+
+if TYPE_CHECKING:
+    from my_unicorn.types import GlobalConfig
+
+logger = get_logger(__name__)
+
+# ioctl request cloning a whole file (linux/fs.h)
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+# Errors meaning the filesystem cannot share the file, not that it failed
+_UNSHAREABLE_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.EPERM,
+        errno.EMLINK,
+        errno.ENOTSUP,
+        errno.EOPNOTSUPP,
+        errno.EINVAL,
+        errno.ENOTTY,
+    }
+)
+
+
+def _reflink(source: Path, destination: Path) -> bool:
+    """Clone ``source`` to the new file ``destination`` with FICLONE."""
+    with source.open("rb") as src, destination.open("xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError as e:
+            if e.errno not in _UNSHAREABLE_ERRNOS:
+                raise
+            failed = True
+        else:
+            failed = False
+    if failed:
+        destination.unlink()
+        return False
+    shutil.copystat(source, destination)
+    return True
+
+
+# Sharing method found to work for each (source, destination) device pair
+_detected_methods: dict[tuple[int, int], str] = {}
+
+
+def _share_with(method: str, source: Path, destination: Path) -> bool:
+    """Create ``destination`` from ``source`` with one sharing method.
+
+    Returns:
+        False if the filesystem does not support ``method``
+
+    """
+    if method == BACKUP_STRATEGY_HARDLINK:
+        try:
+            os.link(source, destination)
+        except OSError as e:
+            if e.errno not in _UNSHAREABLE_ERRNOS:
+                raise
+            return False
+        return True
+    if method == BACKUP_STRATEGY_REFLINK:
+        return _reflink(source, destination)
+    if method == BACKUP_STRATEGY_MOVE:
+        try:
+            source.rename(destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            return False
+        return True
+    shutil.copy2(source, destination)
+    return True
+
+
+def share_file(
+    source: Path,
+    destination: Path,
+    strategy: str = BACKUP_STRATEGY_AUTO,
+) -> str:
+    """Create ``destination`` holding the bytes of ``source``.
+
+    With the ``auto`` strategy, a hard link, a reflink and a copy are tried
+    in that order the first time two devices are paired, and the method
+    that worked is reused for that pair afterwards. Explicit strategies
+    fall back to a copy when the filesystem does not support them.
+
+    Args:
+        source: Existing file
+        destination: Path to create; must not exist
+        strategy: One of BACKUP_STRATEGIES
+
+    Returns:
+        The method that created ``destination``
+
+    Raises:
+        OSError: If the file cannot be shared or copied
+
+    """
+    if strategy != BACKUP_STRATEGY_AUTO:
+        if _share_with(strategy, source, destination):
+            return strategy
+        logger.debug(
+            "%s is not supported for %s, copying instead", strategy, source
+        )
+        _share_with(BACKUP_STRATEGY_COPY, source, destination)
+        return BACKUP_STRATEGY_COPY
+
+    key = (source.stat().st_dev, destination.parent.stat().st_dev)
+    detected = _detected_methods.get(key)
+    if detected is not None and _share_with(detected, source, destination):
+        return detected
+
+    for method in (
+        BACKUP_STRATEGY_HARDLINK,
+        BACKUP_STRATEGY_REFLINK,
+        BACKUP_STRATEGY_COPY,
+    ):
+        if _share_with(method, source, destination):
+            if detected is None:
+                _detected_methods[key] = method
+                logger.debug(
+                    "Using %s to share files from device %d to %d",
+                    method,
+                    *key,
+                )
+            return method
+    return BACKUP_STRATEGY_COPY  # pragma: no cover - copy always succeeds
+
+
+def replace_file(
+    source: Path,
+    destination: Path,
+    strategy: str = BACKUP_STRATEGY_AUTO,
+    suffix: str = ".tmp",
+) -> str:
+    """Atomically make ``destination`` hold the bytes of ``source``.
+
+    The new entry is created next to ``destination`` and renamed over it,
+    so readers see either the old or the new file.
+
+    Args:
+        source: Existing file
+        destination: Path to create or replace
+        strategy: One of BACKUP_STRATEGIES
+        suffix: Suffix of the temporary entry
+
+    Returns:
+        The method that created ``destination``
+
+    """
+    temp_path = destination.with_name(
+        f".{destination.name}_{uuid.uuid4().hex}{suffix}"
+    )
+    try:
+        method = share_file(source, temp_path, strategy)
+        temp_path.replace(destination)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return method
+
+
+class BlobStore:
+    """SHA-256 keyed store of files shared by installs and backups.
+
+    A blob is referenced by every hard link to it; blobs only linked from
+    the store itself are unreferenced and removed by ``prune``. Blobs are
+    therefore never stored as reflinks or copies, which have their own
+    inode and would look unreferenced.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the blobs
+
+        """
+        self.root = root
+
+    @classmethod
+    def from_global_config(
+        cls, global_config: GlobalConfig
+    ) -> BlobStore | None:
+        """Create the store inside the configured cache directory.
+
+        Args:
+            global_config: Global configuration
+
+        Returns:
+            BlobStore instance, or None if no cache directory is configured
+
+        """
+        cache_dir = global_config["directory"].get("cache")
+        if not cache_dir:
+            return None
+        return cls(Path(cache_dir) / BLOB_STORE_DIRNAME)
+
+    def blob_path(self, digest: str) -> Path:
+        """Return the path of the blob for a SHA-256 hex digest."""
+        return self.root / digest.lower()
+
+    def add(self, file_path: Path, digest: str) -> bool:
+        """Store the bytes of a file under its digest without copying.
+
+        Args:
+            file_path: File whose SHA-256 digest is ``digest``
+            digest: SHA-256 hex digest of the file
+
+        Returns:
+            True if the blob is stored, False if the file cannot be hard
+            linked into the store (for example on another filesystem)
+
+        """
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return True
+        temp_path = self.root / f".{uuid.uuid4().hex}.tmp"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if not _share_with(BACKUP_STRATEGY_HARDLINK, file_path, temp_path):
+                logger.debug(
+                    "Blob store cannot link %s, not storing it", file_path
+                )
+                return False
+            temp_path.replace(blob)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            logger.warning("Failed to store %s: %s", file_path, e)
+            return False
+        logger.debug("Stored %s as blob %s", file_path.name, digest)
+        return True
+
+    def find_digest(self, file_path: Path) -> str | None:
+        """Return the digest of a file that is a link to a stored blob.
+
+        Only directory entries are compared, so this never reads file
+        contents.
+
+        Args:
+            file_path: File to look up
+
+        Returns:
+            SHA-256 hex digest, or None if the file is not a stored blob
+
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        if stat.st_nlink < 2 or not self.root.is_dir():  # noqa: PLR2004
+            return None
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.inode() != stat.st_ino or entry.name[0] == ".":
+                    continue
+                if entry.stat().st_dev == stat.st_dev:
+                    return entry.name
+        return None
+
+    def is_blob_of(self, digest: str, file_path: Path) -> bool:
+        """Check whether a file is a link to the blob for ``digest``.
+
+        Args:
+            digest: SHA-256 hex digest
+            file_path: File to check
+
+        Returns:
+            True if ``file_path`` and the blob are the same file
+
+        """
+        try:
+            return self.blob_path(digest).samefile(file_path)
+        except OSError:
+            return False
+
+    def prune(self) -> int:
+        """Remove blobs no longer referenced by any install or backup.
+
+        Returns:
+            Number of blobs removed
+
+        """
+        if not self.root.is_dir():
+            return 0
+        removed = 0
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.name[0] == ".":
+                    continue
+                try:
+                    if entry.stat().st_nlink > 1:
+                        continue
+                    Path(entry.path).unlink()
+                except OSError as e:
+                    logger.warning("Failed to prune blob %s: %s", entry, e)
+                    continue
+                removed += 1
+        if removed:
+            logger.debug("Pruned %d unreferenced blobs", removed)
+        return removed
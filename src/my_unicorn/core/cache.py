@@ -6,18 +6,35 @@ frequent operations like update checks and widget scripts.
 
 The cache stores complete GitHubReleaseDetails objects with TTL (Time To
 Live) validation to ensure data freshness while minimizing API calls.
+Entries also keep the ``ETag``/``Last-Modified`` validators of the API
+response so an expired entry can be revalidated with a conditional request.
+
+All entries live in one SQLite database (``cache/releases/releases.db``)
+indexed by repository and expiry, so bulk lookups, statistics and cleanup
+are single queries. Per-repository JSON files written by older versions are
+imported on first use by ``config.migration.release_cache``.
 """
 
 import contextlib
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Any
 
 import orjson
 
 from my_unicorn.config import ConfigManager
+from my_unicorn.config.migration.release_cache import (
+    migrate_json_release_cache,
+)
+from my_unicorn.constants import (
+    DEFAULT_CACHE_STALE_HOURS,
+    DEFAULT_CACHE_TTL_HOURS,
+    KEY_CACHE_STALE_HOURS,
+    KEY_CACHE_TTL_HOURS,
+)
 from my_unicorn.logger import get_logger
-from my_unicorn.types import CacheEntry
+from my_unicorn.types import CacheEntry, GlobalConfig
 from my_unicorn.utils.datetime_utils import (
     get_current_datetime_local,
     get_current_datetime_local_iso,
@@ -25,16 +42,43 @@ from my_unicorn.utils.datetime_utils import (
 
 logger = get_logger(__name__)
 
+RELEASE_CACHE_DB_NAME = "releases.db"
+
+# Expiry expression shared by queries and the index that serves them
+_EXPIRES_AT = "cached_at + ttl_hours * 3600"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS releases (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    cache_type TEXT NOT NULL,
+    cached_at REAL NOT NULL,
+    ttl_hours INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (owner, repo, cache_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS releases_expires_at ON releases ({_EXPIRES_AT});
+CREATE INDEX IF NOT EXISTS releases_cached_at ON releases (cached_at);
+"""
+
+# Keys per bulk lookup query, well below SQLite's bound parameter limit
+_BULK_LOOKUP_CHUNK = 250
+
 
 class ReleaseCacheManager:
     """Manages persistent caching of GitHub release data.
 
     This cache system:
-    - Stores complete GitHubReleaseDetails in JSON files
+    - Stores complete GitHubReleaseDetails in a single SQLite database
     - Uses TTL-based validation (default: 24 hours)
     - Provides transparent fallback to API calls
     - Handles cache corruption gracefully
-    - Uses atomic writes to prevent file corruption
+    - Writes each entry in a transaction to prevent corruption
+    - Keeps HTTP validators for conditional revalidation of expired entries
+    - Serves expired entries within the stale window on request, for
+      stale-while-revalidate lookups
 
     Usage:
         # Create explicitly:
@@ -50,50 +94,162 @@ class ReleaseCacheManager:
     """
 
     def __init__(
-        self, config_manager: ConfigManager | None = None, ttl_hours: int = 24
+        self,
+        config_manager: ConfigManager | None = None,
+        ttl_hours: int | None = None,
+        stale_hours: int | None = None,
+        global_config: GlobalConfig | None = None,
     ):
         """Initialize the release cache manager.
 
         Args:
             config_manager: Configuration manager instance (optional)
-            ttl_hours: Cache TTL in hours (default: 24)
+            ttl_hours: Cache TTL in hours (default: ``cache_ttl_hours``
+                from the network config, 24 if unset)
+            stale_hours: Hours past the TTL an entry may still be served
+                as stale (default: ``cache_stale_hours`` from the network
+                config, 168 if unset)
+            global_config: Global configuration (loaded through
+                config_manager if not provided)
 
         """
         self.config_manager = config_manager or ConfigManager()
-        self.ttl_hours = ttl_hours
 
         # Get cache directory from configuration
-        global_config = self.config_manager.load_global_config()
+        if global_config is None:
+            global_config = self.config_manager.load_global_config()
+        network_config: Mapping[str, Any] = global_config.get("network", {})
+        self.ttl_hours = (
+            ttl_hours
+            if ttl_hours is not None
+            else int(
+                network_config.get(
+                    KEY_CACHE_TTL_HOURS, DEFAULT_CACHE_TTL_HOURS
+                )
+            )
+        )
+        self.stale_hours = (
+            stale_hours
+            if stale_hours is not None
+            else int(
+                network_config.get(
+                    KEY_CACHE_STALE_HOURS, DEFAULT_CACHE_STALE_HOURS
+                )
+            )
+        )
         self.cache_dir = global_config["directory"]["cache"] / "releases"
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / RELEASE_CACHE_DB_NAME
 
-    def _get_cache_file_path(
-        self, owner: str, repo: str, cache_type: str = "stable"
-    ) -> Path:
-        """Get cache file path for a specific repository.
+        # Schema setup and legacy migration run on first database access
+        self._database_ready = False
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the cache database for one transaction.
+
+        Commits on success and rolls back on error. The connection is closed
+        afterwards, so no handle outlives the call.
+        """
+        if not self._database_ready:
+            self._init_database()
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _create_schema(self) -> None:
+        """Create the cache tables and indexes if they do not exist."""
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            connection.executescript(_SCHEMA)
+        finally:
+            connection.close()
+
+    def _init_database(self) -> None:
+        """Create the schema, replacing an unreadable database.
+
+        Legacy JSON cache files are imported once the schema exists.
+        """
+        try:
+            self._create_schema()
+        except sqlite3.DatabaseError as e:
+            if isinstance(e, sqlite3.OperationalError):
+                raise
+            logger.warning(
+                "Release cache database corrupted, resetting: %s", e
+            )
+            self.db_path.unlink(missing_ok=True)
+            self._create_schema()
+        self._database_ready = True
+        self._migrate_json_cache()
+
+    def _migrate_json_cache(self) -> None:
+        """Import per-repository JSON files left by older versions."""
+        try:
+            migrate_json_release_cache(self.cache_dir, self._write_cache_entry)
+        except (sqlite3.Error, OSError):
+            logger.exception("Failed to migrate legacy release cache")
+
+    def _write_cache_entry(
+        self, owner: str, repo: str, cache_type: str, cache_entry: CacheEntry
+    ) -> None:
+        """Insert or replace a cache entry.
 
         Args:
             owner: Repository owner
             repo: Repository name
             cache_type: Type of cache ("stable", "prerelease", "latest")
+            cache_entry: Entry to store; ``cached_at`` must be ISO 8601
 
-        Returns:
-            Path to cache file
+        Raises:
+            ValueError: If ``cached_at`` is not a valid timestamp
+            sqlite3.Error: If the database cannot be written
 
         """
-        if cache_type == "stable":
-            filename = f"{owner}_{repo}.json"
-        else:
-            filename = f"{owner}_{repo}_{cache_type}.json"
-        return self.cache_dir / filename
+        cached_at = datetime.fromisoformat(cache_entry["cached_at"])
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO releases "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    owner,
+                    repo,
+                    cache_type,
+                    cached_at.timestamp(),
+                    int(cache_entry.get("ttl_hours", self.ttl_hours)),
+                    cache_entry.get("etag"),
+                    cache_entry.get("last_modified"),
+                    orjson.dumps(cache_entry["release_data"]),  # pylint: disable=no-member
+                ),
+            )
 
-    def _is_cache_fresh(self, cache_entry: CacheEntry) -> bool:
+    def _delete_cache_entry(
+        self, owner: str, repo: str, cache_type: str
+    ) -> None:
+        """Remove a single cache entry, ignoring database errors."""
+        with (
+            contextlib.suppress(sqlite3.Error),
+            self._connect() as connection,
+        ):
+            connection.execute(
+                "DELETE FROM releases "
+                "WHERE owner = ? AND repo = ? AND cache_type = ?",
+                (owner, repo, cache_type),
+            )
+
+    def _is_cache_fresh(
+        self, cache_entry: CacheEntry, grace_hours: int = 0
+    ) -> bool:
         """Check if cache entry is still fresh based on TTL.
 
         Args:
             cache_entry: Cache entry to validate
+            grace_hours: Extra hours accepted past the TTL
 
         Returns:
             True if cache is fresh, False if expired
@@ -102,7 +258,7 @@ class ReleaseCacheManager:
         try:
             cached_at = datetime.fromisoformat(cache_entry["cached_at"])
             ttl_hours = cache_entry.get("ttl_hours", self.ttl_hours)
-            expiry = cached_at + timedelta(hours=ttl_hours)
+            expiry = cached_at + timedelta(hours=ttl_hours + grace_hours)
             return get_current_datetime_local() < expiry
         except (ValueError, KeyError) as e:
             logger.debug("Invalid cache timestamp format: %s", e)
@@ -128,46 +284,239 @@ class ReleaseCacheManager:
             Cached release data or None if not available/expired
 
         """
-        cache_file = self._get_cache_file_path(owner, repo, cache_type)
+        try:
+            cache_entry = self._read_cache_entry(owner, repo, cache_type)
+        except Exception:
+            logger.exception(
+                "Unexpected error reading cache for %s/%s", owner, repo
+            )
+            return None
+
+        if cache_entry is None:
+            logger.debug("No cache entry found for %s/%s", owner, repo)
+            return None
+
+        # Validate cache freshness
+        if not ignore_ttl and not self._is_cache_fresh(cache_entry):
+            logger.debug("Cache expired for %s/%s", owner, repo)
+            return None
+
+        logger.debug("Cache hit for %s/%s", owner, repo)
+        return cache_entry["release_data"]
+
+    async def get_stale_release(
+        self, owner: str, repo: str, cache_type: str = "stable"
+    ) -> dict[str, Any] | None:
+        """Get cached release data that may be past its TTL.
 
-        if not cache_file.exists():
-            logger.debug("No cache file found for %s/%s", owner, repo)
+        Entries are served until ``stale_hours`` after they expire, so a
+        caller can answer from the cache while refreshing it.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            cache_type: Type of cache ("stable", "prerelease", "latest")
+
+        Returns:
+            Cached release data, or None if missing or beyond the stale
+            window
+
+        """
+        if self.stale_hours <= 0:
+            return None
+        try:
+            cache_entry = self._read_cache_entry(owner, repo, cache_type)
+        except sqlite3.Error as e:
+            logger.debug("Failed to read cache entry: %s", e)
+            return None
+        if cache_entry is None or not self._is_cache_fresh(
+            cache_entry, grace_hours=self.stale_hours
+        ):
             return None
 
+        logger.debug("Stale cache hit for %s/%s", owner, repo)
+        return cache_entry["release_data"]
+
+    async def get_cached_releases(
+        self,
+        keys: Iterable[tuple[str, str, str]],
+        *,
+        include_stale: bool = False,
+    ) -> dict[tuple[str, str, str], dict[str, Any]]:
+        """Get fresh cached release data for many repositories at once.
+
+        Args:
+            keys: (owner, repo, cache_type) tuples to look up
+            include_stale: Also return expired entries that are still
+                within the stale window
+
+        Returns:
+            Mapping of (owner, repo, cache_type) to release data for every
+            key with a fresh entry; missing or expired keys are omitted
+
+        """
+        unique = list(dict.fromkeys(keys))
+        # Entries must expire after the cutoff to be returned
+        cutoff = get_current_datetime_local().timestamp()
+        if include_stale:
+            cutoff -= max(self.stale_hours, 0) * 3600
+        results: dict[tuple[str, str, str], dict[str, Any]] = {}
+
         try:
-            # Read cache file
-            cache_data = orjson.loads(cache_file.read_bytes())  # pylint: disable=no-member
-            cache_entry = CacheEntry(cache_data)
+            with self._connect() as connection:
+                for start in range(0, len(unique), _BULK_LOOKUP_CHUNK):
+                    chunk = unique[start : start + _BULK_LOOKUP_CHUNK]
+                    # Only placeholders are interpolated into the query
+                    values = ", ".join("(?, ?, ?)" for _ in chunk)
+                    query = (
+                        "SELECT owner, repo, cache_type, payload "  # noqa: S608
+                        "FROM releases WHERE (owner, repo, cache_type) "
+                        f"IN (VALUES {values}) AND {_EXPIRES_AT} > ?"
+                    )
+                    params = [
+                        *(part for key in chunk for part in key),
+                        cutoff,
+                    ]
+                    for owner, repo, cache_type, payload in connection.execute(
+                        query, params
+                    ):
+                        with contextlib.suppress(ValueError):
+                            release_data = orjson.loads(payload)  # pylint: disable=no-member
+                            results[owner, repo, cache_type] = release_data
+        except sqlite3.Error:
+            logger.exception("Failed to read release cache")
+
+        logger.debug(
+            "Bulk cache lookup: %d/%d fresh entries", len(results), len(unique)
+        )
+        return results
 
-            # Validate cache freshness
-            if not ignore_ttl and not self._is_cache_fresh(cache_entry):
-                logger.debug("Cache expired for %s/%s", owner, repo)
-                return None
+    def _read_cache_entry(
+        self, owner: str, repo: str, cache_type: str
+    ) -> CacheEntry | None:
+        """Read a cache entry regardless of its age.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            cache_type: Type of cache ("stable", "prerelease", "latest")
+
+        Returns:
+            Cache entry, or None if missing or unreadable. Entries with a
+            corrupted payload are removed.
 
-            logger.debug("Cache hit for %s/%s", owner, repo)
-            return cache_entry["release_data"]
+        Raises:
+            sqlite3.Error: If the database cannot be read
 
-        except (ValueError, KeyError, TypeError) as e:
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT cached_at, ttl_hours, etag, last_modified, payload "
+                "FROM releases "
+                "WHERE owner = ? AND repo = ? AND cache_type = ?",
+                (owner, repo, cache_type),
+            ).fetchone()
+        if row is None:
+            return None
+
+        cached_at, ttl_hours, etag, last_modified, payload = row
+        try:
+            release_data = orjson.loads(payload)  # pylint: disable=no-member
+        except ValueError as e:
             # orjson raises ValueError for JSON errors
             logger.warning(
-                "Cache file corrupted for %s/%s: %s", owner, repo, e
+                "Cache entry corrupted for %s/%s: %s", owner, repo, e
             )
-            # Remove corrupted cache file
-            with contextlib.suppress(OSError):
-                cache_file.unlink()
+            self._delete_cache_entry(owner, repo, cache_type)
             return None
-        except Exception as e:
-            logger.error(
-                "Unexpected error reading cache for %s/%s: %s", owner, repo, e
-            )
+        if not isinstance(release_data, dict):
+            return None
+
+        cache_entry = CacheEntry(
+            {
+                "cached_at": datetime.fromtimestamp(cached_at)
+                .astimezone()
+                .isoformat(),
+                "ttl_hours": ttl_hours,
+                "release_data": release_data,
+            }
+        )
+        if etag:
+            cache_entry["etag"] = etag
+        if last_modified:
+            cache_entry["last_modified"] = last_modified
+        return cache_entry
+
+    async def get_cache_validators(
+        self, owner: str, repo: str, cache_type: str = "stable"
+    ) -> tuple[str | None, str | None]:
+        """Get the HTTP validators stored with a cache entry.
+
+        Expired entries are included, since revalidating them is the point
+        of a conditional request.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            cache_type: Type of cache ("stable", "prerelease", "latest")
+
+        Returns:
+            Tuple of (ETag, Last-Modified), each None when not stored
+
+        """
+        try:
+            cache_entry = self._read_cache_entry(owner, repo, cache_type)
+        except sqlite3.Error as e:
+            logger.debug("Failed to read cache validators: %s", e)
+            return None, None
+        if cache_entry is None:
+            return None, None
+        return cache_entry.get("etag"), cache_entry.get("last_modified")
+
+    async def refresh_cached_release(
+        self, owner: str, repo: str, cache_type: str = "stable"
+    ) -> dict[str, Any] | None:
+        """Mark a cache entry as fresh after a ``304 Not Modified`` reply.
+
+        Only ``cached_at`` is bumped; the stored release data and validators
+        are kept as they are.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            cache_type: Type of cache ("stable", "prerelease", "latest")
+
+        Returns:
+            Cached release data, or None if the entry is no longer available
+
+        """
+        try:
+            cache_entry = self._read_cache_entry(owner, repo, cache_type)
+        except sqlite3.Error as e:
+            logger.debug("Failed to read cache entry: %s", e)
+            return None
+        if cache_entry is None:
             return None
 
+        await self.save_release_data(
+            owner,
+            repo,
+            cache_entry["release_data"],
+            cache_type,
+            etag=cache_entry.get("etag"),
+            last_modified=cache_entry.get("last_modified"),
+        )
+        logger.debug("Revalidated cache for %s/%s", owner, repo)
+        return cache_entry["release_data"]
+
     async def save_release_data(
         self,
         owner: str,
         repo: str,
         release_data: dict[str, Any],
         cache_type: str = "stable",
+        etag: str | None = None,
+        last_modified: str | None = None,
     ) -> None:
         """Save release data to cache with current timestamp.
 
@@ -176,17 +525,18 @@ class ReleaseCacheManager:
         Filtering happens in github_client.py via Release.filter_for_platform()
         before the data is passed to this method.
 
-        Uses atomic write operation to prevent file corruption.
+        The entry is written in a single transaction, replacing any previous
+        entry for the same repository and cache type.
 
         Args:
             owner: Repository owner
             repo: Repository name
             release_data: Pre-filtered release data to cache
             cache_type: Type of cache ("stable", "prerelease", "latest")
+            etag: ``ETag`` header of the API response, if any
+            last_modified: ``Last-Modified`` header of the API response
 
         """
-        cache_file = self._get_cache_file_path(owner, repo, cache_type)
-
         try:
             # Create cache entry with current timestamp
             # Note: No filtering here - data is pre-filtered by ReleaseFetcher
@@ -197,26 +547,62 @@ class ReleaseCacheManager:
                     "release_data": release_data,
                 }
             )
+            if etag:
+                cache_entry["etag"] = etag
+            if last_modified:
+                cache_entry["last_modified"] = last_modified
 
-            # Use atomic write: write to temporary file, then rename
-            temp_file = cache_file.with_suffix(".tmp")
-            temp_file.write_bytes(
-                orjson.dumps(  # pylint: disable=no-member
-                    cache_entry,
-                    option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z,  # pylint: disable=no-member
-                )
-            )
-
-            # Atomic move (rename is atomic on most filesystems)
-            temp_file.replace(cache_file)
+            self._write_cache_entry(owner, repo, cache_type, cache_entry)
 
             logger.debug("Cached release data for %s/%s", owner, repo)
 
-        except Exception as e:
-            logger.error("Failed to save cache for %s/%s: %s", owner, repo, e)
-            # Clean up temporary file if it exists
-            with contextlib.suppress(OSError, UnboundLocalError):
-                temp_file.unlink()
+        except Exception:
+            logger.exception("Failed to save cache for %s/%s", owner, repo)
+
+    async def update_release_data(
+        self,
+        owner: str,
+        repo: str,
+        release_data: dict[str, Any],
+        cache_type: str = "stable",
+    ) -> None:
+        """Save release data that was fetched without HTTP validators.
+
+        Used for releases resolved through GraphQL, whose responses carry
+        no ``ETag`` or ``Last-Modified``. The validators stored by the REST
+        path are kept, so later conditional requests still revalidate. If
+        the cached release is the same one, the entry is only refreshed,
+        which also keeps its cached checksum files.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            release_data: Pre-filtered release data to cache
+            cache_type: Type of cache ("stable", "prerelease", "latest")
+
+        """
+        try:
+            cache_entry = self._read_cache_entry(owner, repo, cache_type)
+        except sqlite3.Error as e:
+            logger.debug("Failed to read cache entry: %s", e)
+            cache_entry = None
+        if cache_entry is None:
+            await self.save_release_data(owner, repo, release_data, cache_type)
+            return
+
+        cached_release = cache_entry["release_data"]
+        if cached_release.get("original_tag_name") == release_data.get(
+            "original_tag_name"
+        ) and cached_release.get("assets") == release_data.get("assets"):
+            release_data = cached_release
+        await self.save_release_data(
+            owner,
+            repo,
+            release_data,
+            cache_type,
+            etag=cache_entry.get("etag"),
+            last_modified=cache_entry.get("last_modified"),
+        )
 
     async def clear_cache(
         self, owner: str | None = None, repo: str | None = None
@@ -230,93 +616,73 @@ class ReleaseCacheManager:
 
         """
         try:
-            if owner and repo:
-                # Clear specific app cache
-                cache_file = self._get_cache_file_path(owner, repo)
-                if cache_file.exists():
-                    cache_file.unlink()
+            with self._connect() as connection:
+                if owner and repo:
+                    # Clear specific app cache (all cache types)
+                    connection.execute(
+                        "DELETE FROM releases WHERE owner = ? AND repo = ?",
+                        (owner, repo),
+                    )
                     logger.debug("Cleared cache for %s/%s", owner, repo)
-            else:
-                # Clear all cache
-                cache_files = list(self.cache_dir.glob("*.json"))
-                for cache_file in cache_files:
-                    cache_file.unlink()
-                logger.debug("Cleared %d cache entries", len(cache_files))
+                else:
+                    # Clear all cache
+                    cursor = connection.execute("DELETE FROM releases")
+                    logger.debug("Cleared %d cache entries", cursor.rowcount)
 
-        except Exception as e:
-            logger.error("Failed to clear cache: %s", e)
+        except Exception:
+            logger.exception("Failed to clear cache")
 
     async def cleanup_expired_cache(self, max_age_days: int = 30) -> None:
-        """Remove cache files older than specified days.
+        """Remove cache entries older than specified days.
 
         Args:
-            max_age_days: Maximum age in days for cache files
+            max_age_days: Maximum age in days for cache entries
 
         """
         try:
             cutoff = get_current_datetime_local() - timedelta(
                 days=max_age_days
             )
-            removed_count = 0
-
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    cache_data = orjson.loads(cache_file.read_bytes())  # pylint: disable=no-member
-                    cached_at = datetime.fromisoformat(cache_data["cached_at"])
-
-                    if cached_at < cutoff:
-                        cache_file.unlink()
-                        removed_count += 1
-
-                except Exception:
-                    # Remove corrupted cache files
-                    cache_file.unlink()
-                    removed_count += 1
+            with self._connect() as connection:
+                removed_count = connection.execute(
+                    "DELETE FROM releases WHERE cached_at < ?",
+                    (cutoff.timestamp(),),
+                ).rowcount
 
             if removed_count > 0:
                 logger.info("Cleaned up %d old cache entries", removed_count)
 
-        except Exception as e:
-            logger.error("Failed to cleanup cache: %s", e)
+        except Exception:
+            logger.exception("Failed to cleanup cache")
 
     async def get_cache_stats(self) -> dict[str, int | str]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache statistics
+            Dictionary with cache statistics. ``corrupted_entries`` is
+            always 0 since corrupted payloads are removed when read.
 
         """
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_files = len(cache_files)
-            fresh_count = 0
-            expired_count = 0
-            corrupted_count = 0
-
-            for cache_file in cache_files:
-                try:
-                    cache_data = orjson.loads(cache_file.read_bytes())  # pylint: disable=no-member
-                    cache_entry = CacheEntry(cache_data)
-
-                    if self._is_cache_fresh(cache_entry):
-                        fresh_count += 1
-                    else:
-                        expired_count += 1
-
-                except Exception:
-                    corrupted_count += 1
+            now = get_current_datetime_local().timestamp()
+            with self._connect() as connection:
+                total_count, fresh_count = connection.execute(
+                    "SELECT COUNT(*), COUNT(*) "  # noqa: S608
+                    f"FILTER (WHERE {_EXPIRES_AT} > ?) FROM releases",
+                    (now,),
+                ).fetchone()
 
             return {
-                "total_entries": total_files,
+                "total_entries": total_count,
                 "fresh_entries": fresh_count,
-                "expired_entries": expired_count,
-                "corrupted_entries": corrupted_count,
+                "expired_entries": total_count - fresh_count,
+                "corrupted_entries": 0,
                 "cache_directory": str(self.cache_dir),
                 "ttl_hours": self.ttl_hours,
             }
 
         except Exception as e:
-            logger.error("Failed to get cache stats: %s", e)
+            logger.exception("Failed to get cache stats")
             return {
                 "total_entries": 0,
                 "fresh_entries": 0,
@@ -391,7 +757,17 @@ class ReleaseCacheManager:
                 checksum_files.append(file_data)
 
             release_data["checksum_files"] = checksum_files
-            await self.save_release_data(owner, repo, release_data, cache_type)
+            etag, last_modified = await self.get_cache_validators(
+                owner, repo, cache_type
+            )
+            await self.save_release_data(
+                owner,
+                repo,
+                release_data,
+                cache_type,
+                etag=etag,
+                last_modified=last_modified,
+            )
             logger.debug(
                 "Stored checksum file %s for %s/%s",
                 file_data.get("filename"),
@@ -400,9 +776,9 @@ class ReleaseCacheManager:
             )
             return True
 
-        except Exception as e:
-            logger.error(
-                "Failed to store checksum file for %s/%s: %s", owner, repo, e
+        except Exception:
+            logger.exception(
+                "Failed to store checksum file for %s/%s", owner, repo
             )
             return False
 
@@ -445,9 +821,9 @@ class ReleaseCacheManager:
                 None,
             )
 
-        except Exception as e:
-            logger.error(
-                "Failed to get checksum file for %s/%s: %s", owner, repo, e
+        except Exception:
+            logger.exception(
+                "Failed to get checksum file for %s/%s", owner, repo
             )
             return None
 
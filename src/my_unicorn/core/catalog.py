@@ -206,14 +206,13 @@ class CatalogService:
             - installed_date: Installation date (formatted as YYYY-MM-DD)
             - status: Status message (e.g., "OK", "migration needed")
         """
-        apps = self.config_manager.list_installed_apps()
+        configs, errors = self.config_manager.load_all_app_configs()
         app_details = []
 
-        for app in sorted(apps):
-            try:
-                config = self.config_manager.load_app_config(app)
-            except ValueError as e:
-                if "migrate" in str(e).lower():
+        for app in sorted([*configs, *errors]):
+            config = configs.get(app)
+            if app in errors:
+                if "migrate" in errors[app].lower():
                     app_details.append(
                         {
                             "app_name": app,
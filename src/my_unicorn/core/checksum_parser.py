@@ -5,7 +5,7 @@ from __future__ import annotations
 import base64
 import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from my_unicorn.constants import (
     DEFAULT_HASH_TYPE,
@@ -48,6 +48,18 @@ _BSD_CHECKSUM_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Version numbers stripped from filenames to build relaxed match variants
+_VERSION_BEFORE_ARCH_PATTERN = re.compile(r"-\d+(?=-[a-z0-9_]+\.AppImage$)")
+_VERSION_BEFORE_SUFFIX_PATTERN = re.compile(r"-\d+(?=\.AppImage$)")
+_VERSION_PATTERN = re.compile(r"-\d+")
+
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+_YAML_MAPPING_INDICATORS = frozenset(":{?")
+# Root-level YAML keys describing the release rather than a file
+_YAML_METADATA_KEYS = frozenset(
+    {"version", "path", "releaseDate", "releaseNotes"}
+)
+
 
 @dataclass(frozen=True)
 class ChecksumEntry:
@@ -67,6 +79,8 @@ class ChecksumFileResult:
         filename: Filename of the checksum file.
         algorithm: Hash algorithm used (SHA256, SHA512).
         hashes: Mapping of asset filename to hash value.
+        format_type: Detected format ("yaml", "bsd" or "traditional"),
+            or None when unknown.
 
     """
 
@@ -74,49 +88,25 @@ class ChecksumFileResult:
     filename: str
     algorithm: str
     hashes: dict[str, str]
+    format_type: str | None = None
 
     def to_cache_dict(self) -> dict[str, str | dict[str, str]]:
         """Convert to dictionary format for cache storage.
 
         Returns:
-            Dictionary with source, filename, algorithm, and hashes fields.
+            Dictionary with source, filename, algorithm, and hashes fields,
+            plus format_type when it is known.
 
         """
-        return {
+        cache_dict: dict[str, str | dict[str, str]] = {
             "source": self.source,
             "filename": self.filename,
             "algorithm": self.algorithm,
             "hashes": self.hashes,
         }
-
-
-class ChecksumParser:
-    """Abstract base class for parsing checksum files.
-
-    This class defines the interface for parsers that extract checksum
-    information from various checksum file formats (e.g., SHA256SUMS,
-    BSD checksums, YAML checksums). Concrete implementations must
-    override the parse method to handle specific formats.
-
-    The parser is responsible for finding the hash value for a given
-    filename within the checksum content and returning it as a
-    ChecksumEntry object.
-    """
-
-    def parse(
-        self, content: str, filename: str, hash_type: HashType | None = None
-    ) -> ChecksumEntry | None:
-        """Parse checksum content for a specific file.
-
-        Args:
-            content: The checksum file content.
-            filename: The filename to find.
-            hash_type: Optional expected hash type.
-
-        Returns:
-            A ChecksumEntry or None if not found.
-        """
-        raise NotImplementedError
+        if self.format_type:
+            cache_dict["format_type"] = self.format_type
+        return cache_dict
 
 
 def _looks_like_bsd(content: str) -> bool:
@@ -134,73 +124,6 @@ def _looks_like_bsd(content: str) -> bool:
     )
 
 
-def _parse_all_bsd_checksums(content: str) -> dict[str, str]:
-    """Parse all filename-to-hash mappings from BSD checksum format.
-
-    Args:
-        content: The checksum file content.
-
-    Returns:
-        Dictionary mapping filenames to hash values.
-
-    """
-    hashes: dict[str, str] = {}
-
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-
-        match = _BSD_CHECKSUM_PATTERN.match(line)
-        if match:
-            filename = match.group("filename")
-            hash_value = match.group("hash")
-            hashes[filename] = hash_value
-
-    return hashes
-
-
-class BSDChecksumParser(ChecksumParser):
-    """Parser for BSD checksum format (e.g., "SHA256 (file) = hash")."""
-
-    def parse(
-        self, content: str, filename: str, _hash_type: HashType | None = None
-    ) -> ChecksumEntry | None:
-        """Parse BSD checksum content.
-
-        Args:
-            content: The BSD checksum content.
-            filename: The filename to find.
-            _hash_type: Unused for BSD parser (required by interface).
-
-        Returns:
-            A ChecksumEntry or None.
-        """
-        for raw_line in content.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-
-            match = _BSD_CHECKSUM_PATTERN.match(line)
-            if not match:
-                continue
-
-            algo = match.group("algo").lower()
-            file_in_checksum = match.group("filename")
-            if file_in_checksum != filename:
-                continue
-
-            hash_value = match.group("hash")
-            algorithm: HashType = (
-                cast("HashType", algo)
-                if algo in SUPPORTED_HASH_ALGORITHMS
-                else DEFAULT_HASH_TYPE
-            )
-            return ChecksumEntry(filename, hash_value, algorithm)
-
-        return None
-
-
 def find_checksum_entry(
     content: str, filename: str, hash_type: HashType | None = None
 ) -> ChecksumEntry | None:
@@ -214,15 +137,7 @@ def find_checksum_entry(
     Returns:
         A ChecksumEntry or None if not found.
     """
-    parser: ChecksumParser
-    if _is_yaml_content(content):
-        parser = YAMLChecksumParser()
-    elif _looks_like_bsd(content):
-        parser = BSDChecksumParser()
-    else:
-        parser = StandardChecksumParser()
-
-    return parser.parse(content, filename, hash_type)
+    return ChecksumManifest.parse(content).find(filename, hash_type)
 
 
 def parse_checksum_file(
@@ -285,11 +200,7 @@ def parse_all_checksums(content: str) -> dict[str, str]:
         Dictionary mapping filenames to hash values.
 
     """
-    if _is_yaml_content(content):
-        return _parse_all_yaml_checksums(content)
-    if _looks_like_bsd(content):
-        return _parse_all_bsd_checksums(content)
-    return _parse_all_traditional_checksums(content)
+    return ChecksumManifest.parse(content).hashes
 
 
 def _parse_sha256sums_line(line: str) -> tuple[str, str] | None:
@@ -323,397 +234,371 @@ def _generate_variants(name: str) -> set[str]:
     Returns:
         A set of filename variants.
     """
-    variants = {name}
-
-    variants.update(
-        re.sub(r"-\d+(?=-[a-z0-9_]+\.AppImage$)", "", name) for _ in (0,)
-    )
-    variants.add(re.sub(r"-\d+(?=\.AppImage$)", "", name))
-    variants.add(re.sub(r"-\d+", "", name))
+    variants = {
+        name,
+        _VERSION_BEFORE_ARCH_PATTERN.sub("", name),
+        _VERSION_BEFORE_SUFFIX_PATTERN.sub("", name),
+        _VERSION_PATTERN.sub("", name),
+    }
 
     return {variant for variant in variants if variant}
 
 
-def _parse_hash_only_content(content: str, hash_type: HashType) -> str | None:
-    """Parse checksum files that contain a single raw hash only.
+def _load_yaml_mapping(content: str) -> dict | None:
+    """Load content as YAML if it is a YAML mapping.
 
-    This is used for formats like `.sha512` files that sometimes
-    contain only a hash without filename mapping.
+    Args:
+        content: The content to load.
 
-    Rules:
-    - Must contain exactly one non-empty, non-comment line
-    - Must be a valid hex string
-    - Must match the expected hash length for the detected hash type
+    Returns:
+        The parsed mapping, or None if the content is not a YAML dict.
     """
-    lines = [
-        line.strip()
-        for line in content.strip().split("\n")
-        if line.strip() and not line.strip().startswith("#")
-    ]
-
-    if len(lines) != 1:
+    if not _YAML_AVAILABLE:
         return None
 
-    candidate = lines[0]
+    content_stripped = content.strip()
+    if not content_stripped:
+        return None
+    # Every YAML mapping needs a ":", "{" or "?" indicator; skip the slow
+    # YAML scanner for plain SHA256SUMS files
+    if not _YAML_MAPPING_INDICATORS.intersection(content_stripped):
+        return None
 
-    if not all(c in "0123456789abcdefABCDEF" for c in candidate):
+    try:
+        data = yaml.safe_load(content_stripped)
+    except yaml.YAMLError:
         return None
 
-    expected_length = _HASH_TYPE_LENGTH_MAP[hash_type]
-    if len(candidate) != expected_length:
-        logger.debug(
-            "   Hash-only candidate length %d does not match %s length %d",
-            len(candidate),
-            hash_type,
-            expected_length,
-        )
+    if not isinstance(data, dict):
         return None
+    logger.debug("   Detected YAML format checksum file")
+    return data
 
-    return candidate
 
+def _collect_yaml_checksums(data: dict) -> dict[str, str]:
+    """Collect all filename-to-hash mappings from parsed YAML data."""
+    # electron-builder: files is a list of {url, sha512, size}
+    hashes = _collect_yaml_files_list(data.get("files"))
 
-def _parse_traditional_checksum_file(
-    content: str, filename: str, hash_type: HashType
-) -> str | None:
-    """Parse a traditional checksum file (e.g., SHA256SUMS)."""
-
-    logger.debug("   Parsing as traditional checksum file format")
-    logger.debug("   Looking for: %s", filename)
-    logger.debug("   Hash type: %s", hash_type)
-
-    lines = content.strip().split("\n")
-    logger.debug("   Total lines: %d", len(lines))
-
-    target_variants = _generate_variants(filename)
-
-    # Hash-only fallback for .sha256/.sha512 style files. The checksum
-    # filename is not available here, so rely on the already-detected hash
-    # type passed by the caller and validate the raw hash length strictly.
-    hash_only = _parse_hash_only_content(content, hash_type)
-    if hash_only:
-        logger.debug("   ✓ Hash-only checksum detected (fallback mode)")
-        logger.debug("   Hash: %s", hash_only)
-        return hash_only
-
-    # Standard filename-based parsing
-    for line_num, raw_line in enumerate(lines, 1):
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
+    # Also capture root-level entry (primary file)
+    root_path = data.get("path")
+    if root_path:
+        result = _extract_hash_from_dict(data)
+        if result:
+            hashes[root_path] = result[0]
 
-        parsed = _parse_sha256sums_line(line)
-        if not parsed:
-            continue
+    # Fallback: generic {filename: hash_str} flat structure
+    if not hashes:
+        hashes = _collect_yaml_flat_mapping(data)
 
-        hash_value, file_in_checksum = parsed
+    return hashes
 
-        # Validate hash_value is hex
-        if not all(char in "0123456789abcdefABCDEF" for char in hash_value):
+
+def _collect_yaml_files_list(files: object) -> dict[str, str]:
+    """Collect the hashes of a YAML files section listing file entries."""
+    hashes: dict[str, str] = {}
+    if not isinstance(files, list):
+        return hashes
+    for entry in files:
+        if not isinstance(entry, dict):
+            continue
+        filename = entry.get("url") or entry.get("name")
+        if not filename:
             continue
+        result = _extract_hash_from_dict(entry)
+        if result:
+            hashes[filename] = result[0]
+    return hashes
 
-        logger.debug(
-            "   Line %d: hash=%s... file=%s",
-            line_num,
-            hash_value[:16],
-            file_in_checksum,
-        )
 
-        # direct match
-        if file_in_checksum == filename or file_in_checksum.endswith(
-            f"/{filename}"
-        ):
-            logger.debug("   ✓ Match found on line %d", line_num)
-            logger.debug("   Hash: %s", hash_value)
-            return hash_value
+def _collect_yaml_flat_mapping(data: dict) -> dict[str, str]:
+    """Collect the hashes of a YAML mapping of filenames to hashes."""
+    hashes: dict[str, str] = {}
+    for key, value in data.items():
+        if isinstance(value, str) and key not in _YAML_METADATA_KEYS:
+            hashes[key] = _normalize_hash_value(value)
+        elif isinstance(value, dict):
+            result = _extract_hash_from_dict(value)
+            if result:
+                hashes[key] = result[0]
+    return hashes
 
-        # relaxed variant match
-        file_variants = _generate_variants(file_in_checksum)
-        if target_variants.intersection(file_variants):
-            logger.debug(
-                "   !Relaxed match found on line %d (variants): %s",
-                line_num,
-                file_in_checksum,
-            )
-            logger.debug("   Hash: %s", hash_value)
-            return hash_value
 
-    logger.debug("   No match found for %s", filename)
-    return None
+class ChecksumManifest:
+    """Checksum file parsed once and indexed for lookups.
 
+    Parsing detects the format (YAML, BSD or traditional), reads every
+    entry and indexes it by filename, so looking up each asset of a
+    release is a dictionary lookup instead of a scan of the whole file.
+    Traditional files are also indexed by path suffix and by the
+    version-stripped variants of each filename; a lookup returns the
+    first line matching the filename or one of its variants.
 
-def _parse_all_traditional_checksums(content: str) -> dict[str, str]:
-    """Parse all filename-to-hash mappings from traditional checksum format.
+    Attributes:
+        format_type: Detected format ("yaml", "bsd" or "traditional"), or
+            "unknown" for cache entries stored without a format.
+        hashes: Mapping of every filename to its hash value, as stored in
+            the checksum cache.
+        cached: Whether the manifest was rebuilt from the checksum cache
+            rather than parsed from a downloaded file.
 
-    Args:
-        content: The checksum file content.
+    """
 
-    Returns:
-        Dictionary mapping filenames to hash values.
+    def __init__(self, format_type: str) -> None:
+        """Initialize an empty manifest; use parse() to build one.
 
-    """
-    hashes: dict[str, str] = {}
+        Args:
+            format_type: Detected format ("yaml", "bsd" or "traditional").
 
-    for raw_line in content.strip().split("\n"):
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
+        """
+        self.format_type = format_type
+        self.hashes: dict[str, str] = {}
+        self.cached = False
+        # YAML and BSD: filename -> (hash, algorithm) of its first entry
+        self._entries: dict[str, tuple[str, HashType]] = {}
+        # Traditional: variant or path suffix -> (line number, hash)
+        self._variants: dict[str, tuple[int, str]] = {}
+        self._suffixes: dict[str, tuple[int, str]] = {}
+        self._hash_only: str | None = None
+
+    @classmethod
+    def parse(cls, content: str) -> ChecksumManifest:
+        """Parse checksum file content.
 
-        parsed = _parse_sha256sums_line(line)
-        if not parsed:
-            continue
+        Args:
+            content: The checksum file content.
 
-        hash_value, filename = parsed
+        Returns:
+            The indexed manifest.
 
-        if not all(char in "0123456789abcdefABCDEF" for char in hash_value):
-            continue
+        """
+        data = _load_yaml_mapping(content)
+        if data is not None:
+            manifest = cls("yaml")
+            manifest._index_yaml(data)
+        elif _looks_like_bsd(content):
+            manifest = cls("bsd")
+            manifest._index_bsd(content)
+        else:
+            manifest = cls("traditional")
+            manifest._index_traditional(content)
 
-        hashes[filename] = hash_value
+        logger.debug(
+            "   Indexed %d entries of %s checksum file",
+            len(manifest.hashes),
+            manifest.format_type,
+        )
+        return manifest
 
-    return hashes
+    @classmethod
+    def from_cache(cls, file_data: dict[str, Any]) -> ChecksumManifest:
+        """Rebuild a manifest from a checksum cache entry.
 
+        The cache keeps the hashes of every file listed in the checksum
+        file, so the rebuilt manifest answers the same lookups without
+        downloading the file again. Only traditional files are also
+        looked up by variant and path suffix; every other format,
+        including entries cached before the format was recorded, is
+        looked up by exact name.
 
-class StandardChecksumParser(ChecksumParser):
-    """Parser for traditional checksum files (SHA256SUMS, etc.)."""
+        Args:
+            file_data: Cached checksum file data (source, filename,
+                algorithm, hashes and optionally format_type).
+
+        Returns:
+            The indexed manifest.
 
-    def parse(
-        self, content: str, filename: str, hash_type: HashType | None = None
+        """
+        filename = str(file_data.get("filename", ""))
+        hashes = file_data.get("hashes") or {}
+        format_type = file_data.get("format_type")
+        if not format_type:
+            is_yaml = filename.lower().endswith(YAML_CHECKSUM_EXTENSIONS)
+            format_type = "yaml" if is_yaml else "unknown"
+
+        manifest = cls(format_type)
+        if format_type == "traditional":
+            for line_num, (name, hash_value) in enumerate(hashes.items(), 1):
+                manifest._index_traditional_entry(line_num, name, hash_value)
+        else:
+            default_hash = (
+                YAML_DEFAULT_HASH
+                if format_type == "yaml"
+                else DEFAULT_HASH_TYPE
+            )
+            for name, hash_value in hashes.items():
+                manifest._entries[name] = (
+                    hash_value,
+                    _HASH_LENGTH_MAP.get(len(hash_value), default_hash),
+                )
+
+        manifest.hashes = dict(hashes)
+        manifest.cached = True
+        return manifest
+
+    def find(
+        self, filename: str, hash_type: HashType | None = None
     ) -> ChecksumEntry | None:
-        """Parse traditional checksum content.
+        """Find the checksum entry of a file.
 
         Args:
-            content: The checksum content.
             filename: The filename to find.
-            hash_type: Optional expected hash type.
+            hash_type: Optional expected hash type (used by traditional
+                files to validate hash-only content and as the algorithm).
 
         Returns:
-            A ChecksumEntry or None.
+            A ChecksumEntry or None if not found.
+
         """
-        expected_algorithm = hash_type or DEFAULT_HASH_TYPE
-        hash_value = _parse_traditional_checksum_file(
-            content, filename, expected_algorithm
+        if self.format_type != "traditional":
+            entry = self._entries.get(filename)
+            if entry is None:
+                logger.debug("   No match found for %s", filename)
+                return None
+            return ChecksumEntry(filename, *entry)
+
+        hash_value = self._find_traditional(
+            filename, hash_type or DEFAULT_HASH_TYPE
         )
         if not hash_value:
             return None
-
         algorithm = hash_type or _HASH_LENGTH_MAP.get(
             len(hash_value), DEFAULT_HASH_TYPE
         )
         return ChecksumEntry(filename, hash_value, algorithm)
 
+    def _find_traditional(
+        self, filename: str, hash_type: HashType
+    ) -> str | None:
+        """Look up a file in a traditional checksum file."""
+        if self._hash_only:
+            expected_length = _HASH_TYPE_LENGTH_MAP[hash_type]
+            if len(self._hash_only) == expected_length:
+                logger.debug("   ✓ Hash-only checksum detected")
+                return self._hash_only
+            logger.debug(
+                "   Hash-only candidate length %d does not match %s length %d",
+                len(self._hash_only),
+                hash_type,
+                expected_length,
+            )
 
-def _is_yaml_content(content: str) -> bool:
-    """Check if the content appears to be YAML format.
-
-    Args:
-        content: The content to check.
-
-    Returns:
-        True if the content is valid YAML and a dict, False otherwise.
-    """
-    if not _YAML_AVAILABLE:
-        return False
-
-    content_stripped = content.strip()
-    if not content_stripped:
-        return False
-
-    try:
-        data = yaml.safe_load(content_stripped)
-        if isinstance(data, dict):
-            logger.debug("   Detected YAML format checksum file")
-            return True
-    except yaml.YAMLError:
-        pass
-
-    return False
-
-
-def _parse_yaml_root_level(
-    data: dict, filename: str
-) -> tuple[str, HashType] | None:
-    """Parse YAML checksum file at root level.
-
-    Args:
-        data: The parsed YAML data.
-        filename: The filename to find the hash for.
-
-    Returns:
-        A tuple of (hash_value, algorithm) or None if not found.
-    """
-    if "path" in data and data["path"] == filename:
-        return _extract_hash_from_dict(data)
-
-    return None
-
-
-def _parse_yaml_files_dict(
-    files: dict, filename: str
-) -> tuple[str, HashType] | None:
-    """Parse YAML files section when it's a dictionary.
-
-    Args:
-        files: The files dictionary from YAML.
-        filename: The filename to find.
-
-    Returns:
-        A tuple of (hash_value, algorithm) or None.
-    """
-    hash_value = files.get(filename)
-    if not hash_value:
-        return None
-
-    if isinstance(hash_value, str):
-        normalized_hash = _normalize_hash_value(hash_value)
-        return normalized_hash, YAML_DEFAULT_HASH
-    if isinstance(hash_value, dict):
-        return _extract_hash_from_dict(hash_value)
-
-    return None
-
-
-def _parse_yaml_files_list(
-    files: list, filename: str
-) -> tuple[str, HashType] | None:
-    """Parse YAML files section when it's a list.
-
-    Args:
-        files: The files list from YAML.
-        filename: The filename to find.
-
-    Returns:
-        A tuple of (hash_value, algorithm) or None.
-    """
-    for file_entry in files:
-        if not isinstance(file_entry, dict):
-            continue
-
-        file_name = file_entry.get("name") or file_entry.get("url")
-        if file_name != filename:
-            continue
-
-        preferred = _extract_hash_from_dict(file_entry)
-        if preferred:
-            return preferred
-
-    return None
-
-
-def _parse_yaml_checksum_file(
-    content: str, filename: str
-) -> tuple[str, HashType] | None:
-    """Parse a YAML checksum file.
-
-    Args:
-        content: The YAML content as string.
-        filename: The filename to find the hash for.
+        matches = [
+            self._variants[variant]
+            for variant in _generate_variants(filename)
+            if variant in self._variants
+        ]
+        suffix_match = self._suffixes.get(filename)
+        if suffix_match:
+            matches.append(suffix_match)
+        if not matches:
+            logger.debug("   No match found for %s", filename)
+            return None
 
-    Returns:
-        Tuple of (hash_value, algorithm) or None.
-    """
-    if not _YAML_AVAILABLE:
-        logger.warning("! YAML parsing not available")
-        return None
+        line_num, hash_value = min(matches)
+        logger.debug("   ✓ Match found on line %d", line_num)
+        return hash_value
 
-    try:
-        data = yaml.safe_load(content)
-        logger.debug("   Parsed YAML checksum file")
-        logger.debug("   Structure keys: %s", list(data.keys()))
+    def _index_yaml(self, data: dict) -> None:
+        """Index an electron-builder style YAML checksum file."""
+        self.hashes = _collect_yaml_checksums(data)
 
         if "files" not in data:
-            return _parse_yaml_root_level(data, filename)
+            path = data.get("path")
+            if isinstance(path, str):
+                result = _extract_hash_from_dict(data)
+                if result:
+                    self._entries[path] = result
+            return
 
         files = data["files"]
-        logger.debug("   Files section type: %s", type(files))
-        logger.debug("   Looking for: %s", filename)
-
         if isinstance(files, dict):
-            return _parse_yaml_files_dict(files, filename)
-        if isinstance(files, list):
-            return _parse_yaml_files_list(files, filename)
-        return None  # noqa: TRY300 - multiple early returns in try block
-    except yaml.YAMLError:
-        logger.exception("× Failed to parse YAML checksum file")
-        return None
-
-
-def _parse_all_yaml_checksums(content: str) -> dict[str, str]:
-    """Parse all filename-to-hash mappings from YAML checksum format."""
-    if not _YAML_AVAILABLE or not yaml:
-        return {}
-
-    try:
-        data = yaml.safe_load(content)
-        if not isinstance(data, dict):
-            return {}
-    except yaml.YAMLError:
-        logger.debug("Failed to parse YAML for all checksums")
-        return {}
-
-    hashes: dict[str, str] = {}
+            self._index_yaml_files_dict(files)
+        elif isinstance(files, list):
+            self._index_yaml_files_list(files)
+
+    def _index_yaml_files_dict(self, files: dict) -> None:
+        """Index a YAML files section mapping filenames to hashes."""
+        for name, hash_value in files.items():
+            if not isinstance(name, str) or not hash_value:
+                continue
+            if isinstance(hash_value, str):
+                self._entries[name] = (
+                    _normalize_hash_value(hash_value),
+                    YAML_DEFAULT_HASH,
+                )
+            elif isinstance(hash_value, dict):
+                result = _extract_hash_from_dict(hash_value)
+                if result:
+                    self._entries[name] = result
 
-    # electron-builder: files is a list of {url, sha512, size}
-    files = data.get("files")
-    if isinstance(files, list):
-        for entry in files:
-            if not isinstance(entry, dict):
+    def _index_yaml_files_list(self, files: list) -> None:
+        """Index a YAML files section listing file entries."""
+        for file_entry in files:
+            if not isinstance(file_entry, dict):
                 continue
-            filename = entry.get("url") or entry.get("name")
-            if not filename:
+            name = file_entry.get("name") or file_entry.get("url")
+            if not isinstance(name, str) or name in self._entries:
                 continue
-            result = _extract_hash_from_dict(entry)
+            result = _extract_hash_from_dict(file_entry)
             if result:
-                hash_value, _ = result
-                hashes[filename] = hash_value
-
-    # Also capture root-level entry (primary file)
-    root_path = data.get("path")
-    if root_path:
-        result = _extract_hash_from_dict(data)
-        if result:
-            hash_value, _ = result
-            hashes[root_path] = hash_value
-
-    # Fallback: generic {filename: hash_str} flat structure
-    if not hashes:
-        for key, value in data.items():
-            if isinstance(value, str) and key not in (
-                "version",
-                "path",
-                "releaseDate",
-                "releaseNotes",
-            ):
-                hashes[key] = _normalize_hash_value(value)
-            elif isinstance(value, dict):
-                result = _extract_hash_from_dict(value)
-                if result:
-                    hash_value, _ = result
-                    hashes[key] = hash_value
-
-    return hashes
-
+                self._entries[name] = result
 
-class YAMLChecksumParser(ChecksumParser):
-    """Parser for electron-builder style YAML checksum files."""
-
-    def parse(
-        self, content: str, filename: str, _hash_type: HashType | None = None
-    ) -> ChecksumEntry | None:
-        """Parse YAML checksum content.
+    def _index_bsd(self, content: str) -> None:
+        """Index a BSD checksum file."""
+        for raw_line in content.splitlines():
+            match = _BSD_CHECKSUM_PATTERN.match(raw_line.strip())
+            if not match:
+                continue
 
-        Args:
-            content: The YAML content.
-            filename: The filename to find.
-            _hash_type: Unused for YAML parser (required by interface).
+            filename = match.group("filename")
+            hash_value = match.group("hash")
+            self.hashes[filename] = hash_value
+            if filename not in self._entries:
+                algo = match.group("algo").lower()
+                algorithm: HashType = (
+                    cast("HashType", algo)
+                    if algo in SUPPORTED_HASH_ALGORITHMS
+                    else DEFAULT_HASH_TYPE
+                )
+                self._entries[filename] = (hash_value, algorithm)
+
+    def _index_traditional(self, content: str) -> None:
+        """Index a traditional checksum file (e.g., SHA256SUMS)."""
+        lines = [
+            (line_num, line)
+            for line_num, raw_line in enumerate(content.strip().split("\n"), 1)
+            if (line := raw_line.strip()) and not line.startswith("#")
+        ]
+
+        # Hash-only files (.sha256/.sha512) hold a single raw hash
+        if len(lines) == 1 and _HEX_CHARS.issuperset(lines[0][1]):
+            self._hash_only = lines[0][1]
+            return
+
+        for line_num, line in lines:
+            parsed = _parse_sha256sums_line(line)
+            if not parsed:
+                continue
 
-        Returns:
-            A ChecksumEntry or None.
-        """
-        parsed = _parse_yaml_checksum_file(content, filename)
-        if not parsed:
-            return None
+            hash_value, filename = parsed
+            if not _HEX_CHARS.issuperset(hash_value):
+                continue
 
-        hash_value, algorithm = parsed
-        return ChecksumEntry(filename, hash_value, algorithm)
+            self.hashes[filename] = hash_value
+            self._index_traditional_entry(line_num, filename, hash_value)
+
+    def _index_traditional_entry(
+        self, line_num: int, filename: str, hash_value: str
+    ) -> None:
+        """Index one traditional entry by its variants and path suffixes."""
+        entry = (line_num, hash_value)
+        for variant in _generate_variants(filename):
+            self._variants.setdefault(variant, entry)
+        start = filename.find("/")
+        while start != -1:
+            self._suffixes.setdefault(filename[start + 1 :], entry)
+            start = filename.find("/", start + 1)
 
 
 def convert_base64_to_hex(base64_hash: str) -> str:
@@ -0,0 +1,177 @@
+"""Checksum file prefetch running alongside AppImage downloads.
+
+Install and update know which checksum file verification will use as
+soon as the release is known. Fetching it while the AppImage downloads,
+or reading it from the release cache, leaves only the hash comparison
+for after the download.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from my_unicorn.core.checksum_parser import ChecksumManifest
+from my_unicorn.core.download import DownloadError
+from my_unicorn.core.verify import (
+    prioritize_checksum_files,
+    resolve_checksum_files,
+)
+from my_unicorn.logger import get_logger
+
+if TYPE_CHECKING:
+    from my_unicorn.core.api import Asset
+    from my_unicorn.core.cache import ReleaseCacheManager
+    from my_unicorn.core.download import DownloadService
+    from my_unicorn.core.verify import VerificationService
+    from my_unicorn.types import ChecksumFileInfo
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class ChecksumPrefetch:
+    """Checksum file fetched while the AppImage is still downloading.
+
+    Created by ``prefetch_checksum_file`` and handed to
+    ``VerificationService.verify_file``, which uses the manifest instead of
+    downloading the checksum file once the AppImage is on disk.
+    """
+
+    checksum_file: ChecksumFileInfo
+    task: asyncio.Task[ChecksumManifest]
+
+    async def manifest_for(
+        self, checksum_file: ChecksumFileInfo
+    ) -> ChecksumManifest | None:
+        """Return the prefetched manifest of a checksum file.
+
+        Args:
+            checksum_file: Checksum file selected for verification.
+
+        Returns:
+            The manifest, or None when a different file was prefetched or
+            the prefetch failed (the caller downloads the file instead).
+
+        """
+        if checksum_file.url != self.checksum_file.url:
+            return None
+        try:
+            return await self.task
+        except (
+            aiohttp.ClientError,
+            TimeoutError,
+            OSError,
+            ValueError,
+            DownloadError,
+        ) as e:
+            logger.debug(
+                "Checksum prefetch failed for %s: %s",
+                checksum_file.filename,
+                e,
+            )
+            return None
+
+    def close(self) -> None:
+        """Cancel the fetch if it is still running.
+
+        Also retrieves the outcome of a finished fetch so an unused
+        failure is not reported as a never-retrieved task exception.
+        """
+        if not self.task.done():
+            self.task.cancel()
+        elif not self.task.cancelled():
+            self.task.exception()
+
+
+def prefetch_checksum_file(  # noqa: PLR0913
+    verification_service: VerificationService,
+    asset: Asset,
+    config: dict[str, Any],
+    *,
+    owner: str,
+    repo: str,
+    tag_name: str,
+    assets: list[Asset] | None = None,
+) -> ChecksumPrefetch | None:
+    """Start fetching the checksum file verification will use.
+
+    Resolves and prioritizes checksum files the same way
+    ``VerificationService.verify_file`` does, then fetches the best one
+    in a background task so it is ready when the download finishes.
+
+    Args:
+        verification_service: Service whose download service and cache
+            manager fetch the checksum file.
+        asset: GitHub asset being downloaded.
+        config: Verification configuration.
+        owner: Repository owner.
+        repo: Repository name.
+        tag_name: Release tag name.
+        assets: All GitHub release assets (enables auto-detection).
+
+    Returns:
+        The running prefetch, or None when the asset has no checksum
+        file. The caller closes it once verification is done.
+
+    """
+    checksum_files = resolve_checksum_files(
+        asset, config, assets, owner, repo, tag_name
+    )
+    if not checksum_files:
+        return None
+
+    best = prioritize_checksum_files(checksum_files, asset.name)[0]
+    logger.debug("Prefetching checksum file: %s", best.filename)
+    task = asyncio.create_task(
+        fetch_checksum_manifest(
+            best,
+            verification_service.download_service,
+            verification_service.cache_manager,
+            owner=owner,
+            repo=repo,
+            tag_name=tag_name,
+        )
+    )
+    return ChecksumPrefetch(best, task)
+
+
+async def fetch_checksum_manifest(  # noqa: PLR0913
+    checksum_file: ChecksumFileInfo,
+    download_service: DownloadService,
+    cache_manager: ReleaseCacheManager | None,
+    *,
+    owner: str,
+    repo: str,
+    tag_name: str,
+) -> ChecksumManifest:
+    """Load a checksum file from the release cache or download it.
+
+    Args:
+        checksum_file: Metadata for the checksum file.
+        download_service: Service for downloading the checksum file.
+        cache_manager: Optional cache manager holding checksum files that
+            passed an earlier verification.
+        owner: Repository owner.
+        repo: Repository name.
+        tag_name: Release tag name the cache entry must belong to.
+
+    Returns:
+        The parsed checksum manifest.
+
+    """
+    if cache_manager is not None:
+        cached = await cache_manager.get_checksum_file(
+            owner, repo, tag_name, checksum_file.url
+        )
+        if cached and cached.get("hashes"):
+            logger.debug(
+                "Using cached checksum file: %s", checksum_file.filename
+            )
+            return ChecksumManifest.from_cache(cached)
+
+    content = await download_service.download_checksum_file(checksum_file.url)
+    return ChecksumManifest.parse(content)
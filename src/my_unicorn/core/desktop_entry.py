@@ -31,7 +31,8 @@ from my_unicorn.constants import (
     DESKTOP_SYSTEM_APPLICATION_DIRS,
     DESKTOP_USER_APPLICATIONS_SUBPATH,
 )
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
+from my_unicorn.types import GlobalConfig
 from my_unicorn.utils.desktop_utils import (
     create_desktop_entry_name,
     sanitize_filename,
@@ -167,6 +168,7 @@ class DesktopEntry:
         appimage_path: Path,
         icon_path: Path | None = None,
         config_manager: ConfigManager | None = None,
+        global_config: GlobalConfig | None = None,
     ) -> None:
         """Initialize desktop entry manager.
 
@@ -176,6 +178,8 @@ class DesktopEntry:
                 without a version suffix).
             icon_path: Optional path to icon file.
             config_manager: Configuration manager for directory paths.
+            global_config: Optional global configuration snapshot
+                (loaded from config_manager if None).
 
         """
         self.app_name = app_name.lower()  # Normalize to lowercase
@@ -183,7 +187,9 @@ class DesktopEntry:
         self.icon_path = icon_path
         self.desktop_filename = create_desktop_entry_name(self.app_name)
         self.config_manager = config_manager or ConfigManager()
-        self.global_config = self.config_manager.load_global_config()
+        self.global_config = (
+            global_config or self.config_manager.load_global_config()
+        )
 
     def get_desktop_dirs(self) -> list[Path]:
         """Return desktop entry directories to check, highest priority first.
@@ -390,8 +396,9 @@ class DesktopEntry:
 
         if needs_update:
             try:
-                desktop_file_path.write_text(new_content, encoding="utf-8")
-                desktop_file_path.chmod(0o755)
+                with timing_span("desktop_entry"):
+                    desktop_file_path.write_text(new_content, encoding="utf-8")
+                    desktop_file_path.chmod(0o755)
                 logger.debug(
                     "️Desktop entry written: %s", desktop_file_path.name
                 )
@@ -442,7 +449,8 @@ class DesktopEntry:
                 keywords=keywords,
                 **kwargs,
             )
-            existing_file.write_text(content, encoding="utf-8")
+            with timing_span("desktop_entry"):
+                existing_file.write_text(content, encoding="utf-8")
             logger.debug("Updated desktop file: %s", existing_file)
             return existing_file
         except OSError as e:
@@ -504,11 +512,12 @@ class DesktopEntry:
             cmd = shutil.which("update-desktop-database")
             if cmd:
                 user_dir = Path.home() / ".local" / "share" / "applications"
-                subprocess.run(
-                    [cmd, str(user_dir)],
-                    check=False,
-                    capture_output=True,
-                )
+                with timing_span("desktop_database"):
+                    subprocess.run(
+                        [cmd, str(user_dir)],
+                        check=False,
+                        capture_output=True,
+                    )
                 logger.debug("Desktop database refreshed")
                 return True
         except Exception as e:
@@ -520,12 +529,14 @@ class DesktopEntry:
     def remove_desktop_entry_for_app(
         app_name: str,
         config_manager: ConfigManager | None = None,
+        global_config: GlobalConfig | None = None,
     ) -> bool:
         """Remove the desktop entry for an AppImage application.
 
         Args:
             app_name: Name of the application.
             config_manager: Configuration manager for directory paths.
+            global_config: Optional global configuration snapshot.
 
         Returns:
             True if the desktop file was removed.
@@ -536,5 +547,6 @@ class DesktopEntry:
             app_name,
             dummy_path,
             config_manager=config_manager,
+            global_config=global_config,
         )
         return desktop_entry.remove_desktop_file()
@@ -9,26 +9,50 @@ supporting alternative progress display backends.
 
 File I/O is performed asynchronously using aiofiles when available, with a
 fallback to synchronous I/O in a thread executor for compatibility.
+
+Downloads are written to a ``<name>.part`` file next to the destination and
+renamed into place once complete. When the server provides an ``ETag`` or
+``Last-Modified`` validator, resume metadata is persisted beside the partial
+file so an interrupted download (including a killed process) continues with
+an HTTP ``Range`` request instead of starting again from byte zero.
+
+AppImage downloads are hashed while they stream (SHA-256 and SHA-512), so
+verification can compare digests without reading the file back from disk.
 """
 
 import asyncio
 import contextlib
+import hashlib
+import os
+import re
+import time
 from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import IO, TypeVar
+from typing import IO, Literal, TypeVar
 from urllib.parse import urlparse
 
 import aiohttp
+import orjson
 
 from my_unicorn.config import ConfigManager
+from my_unicorn.constants import (
+    DEFAULT_DOWNLOAD_SEGMENTS,
+    DEFAULT_SEGMENT_THRESHOLD_MB,
+    SUPPORTED_HASH_ALGORITHMS,
+)
 from my_unicorn.core.api import Asset
 from my_unicorn.core.auth import GitHubAuthManager
+from my_unicorn.core.hashing import run_in_hash_executor
 from my_unicorn.core.protocols import (
     NullProgressReporter,
+    ProgressCounter,
     ProgressReporter,
     ProgressType,
+    SupportsProgressCounter,
 )
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
+from my_unicorn.types import GlobalConfig
 
 T = TypeVar("T")
 
@@ -50,6 +74,507 @@ PROGRESS_MB_THRESHOLD = 0.5
 CONTENT_PREVIEW_MAX = 200
 MIN_SIZE_FOR_PROGRESS = 1_048_576  # 1MB threshold for showing progress bars
 
+# Resume constants
+PART_SUFFIX = ".part"
+RESUME_STATE_SUFFIX = ".part.json"
+HTTP_PARTIAL_CONTENT = 206
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+# Segmented download constants
+SEGMENT_WRITE_BUFFER = 1_048_576  # Flush segment data to disk every 1MB
+RESUME_STATE_INTERVAL = 1.0  # Seconds between resume metadata writes
+
+
+@dataclass(slots=True)
+class ResumeState:
+    """Metadata persisted next to a partial download.
+
+    Attributes:
+        url: URL the partial file was downloaded from.
+        total: Full size of the remote file in bytes.
+        etag: ``ETag`` validator reported by the server, if any.
+        last_modified: ``Last-Modified`` validator reported by the server.
+        segments: ``[start, end, written]`` of every byte range of a
+            segmented download, None for a single-stream download.
+
+    """
+
+    url: str
+    total: int
+    etag: str | None = None
+    last_modified: str | None = None
+    segments: list[list[int]] | None = None
+
+    @property
+    def validator(self) -> str | None:
+        """Validator to send in ``If-Range`` (ETag preferred)."""
+        return self.etag or self.last_modified
+
+
+def get_part_path(dest: Path) -> Path:
+    """Return the path of the partial download file for ``dest``."""
+    return dest.with_name(dest.name + PART_SUFFIX)
+
+
+def get_resume_state_path(dest: Path) -> Path:
+    """Return the path of the resume metadata file for ``dest``."""
+    return dest.with_name(dest.name + RESUME_STATE_SUFFIX)
+
+
+def load_resume_state(dest: Path) -> ResumeState | None:
+    """Load persisted resume metadata for ``dest``.
+
+    Args:
+        dest: Final destination path of the download
+
+    Returns:
+        ResumeState if valid metadata exists, None otherwise
+
+    """
+    state_path = get_resume_state_path(dest)
+    try:
+        data = orjson.loads(state_path.read_bytes())
+        return ResumeState(
+            url=str(data["url"]),
+            total=int(data["total"]),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            segments=_parse_segments(data.get("segments")),
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug("Ignoring invalid resume state %s: %s", state_path, e)
+        return None
+
+
+def _parse_segments(value: object) -> list[list[int]] | None:
+    """Validate the stored byte ranges of a segmented download."""
+    if value is None:
+        return None
+    segments = [[int(v) for v in segment] for segment in value]  # type: ignore[attr-defined]
+    for start, end, written in segments:
+        if not 0 <= written <= end - start + 1:
+            msg = f"invalid segment {start}-{end} with {written} bytes"
+            raise ValueError(msg)
+    return segments
+
+
+def save_resume_state(dest: Path, state: ResumeState) -> None:
+    """Persist resume metadata for ``dest``.
+
+    Args:
+        dest: Final destination path of the download
+        state: Resume metadata to store
+
+    """
+    state_path = get_resume_state_path(dest)
+    try:
+        state_path.write_bytes(orjson.dumps(asdict(state)))
+    except OSError as e:
+        logger.debug("Failed to save resume state %s: %s", state_path, e)
+
+
+def discard_partial_download(dest: Path) -> None:
+    """Remove the partial file and resume metadata for ``dest``."""
+    for path in (get_part_path(dest), get_resume_state_path(dest)):
+        if path.exists():
+            logger.debug("Removing partial download: %s", path)
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def parse_content_range(value: str | None) -> tuple[int, int | None] | None:
+    """Parse a ``Content-Range`` header.
+
+    Args:
+        value: Header value such as ``bytes 100-199/1000``
+
+    Returns:
+        Tuple of (start offset, complete length or None if unknown),
+        or None if the header is missing or malformed
+
+    """
+    if not value:
+        return None
+    match = CONTENT_RANGE_PATTERN.match(value.strip())
+    if not match:
+        return None
+    total = None if match.group(3) == "*" else int(match.group(3))
+    return int(match.group(1)), total
+
+
+def split_byte_ranges(total: int, segments: int) -> list[tuple[int, int]]:
+    """Split ``total`` bytes into contiguous inclusive byte ranges.
+
+    Args:
+        total: Size of the file in bytes
+        segments: Desired number of ranges
+
+    Returns:
+        List of (start, end) tuples suitable for ``Range: bytes=start-end``
+
+    """
+    segments = max(1, min(segments, total))
+    size, remainder = divmod(total, segments)
+    ranges = []
+    start = 0
+    for index in range(segments):
+        length = size + (1 if index < remainder else 0)
+        ranges.append((start, start + length - 1))
+        start += length
+    return ranges
+
+
+class DownloadHasher:
+    """Incrementally compute every supported digest of downloaded data."""
+
+    def __init__(self) -> None:
+        """Create one hasher per algorithm in SUPPORTED_HASH_ALGORITHMS."""
+        self._hashers = {
+            name: hashlib.new(name) for name in SUPPORTED_HASH_ALGORITHMS
+        }
+
+    def update(self, data: bytes) -> None:
+        """Feed a chunk of downloaded data to all hashers."""
+        for hasher in self._hashers.values():
+            hasher.update(data)
+
+    def update_from_fd(self, fd: int, start: int, end: int) -> None:
+        """Feed bytes ``[start, end)`` of an open file to all hashers.
+
+        Args:
+            fd: File descriptor opened for reading
+            start: First byte offset to hash
+            end: Offset after the last byte to hash
+
+        """
+        position = start
+        while position < end:
+            size = min(SEGMENT_WRITE_BUFFER, end - position)
+            data = os.pread(fd, size, position)
+            if not data:
+                msg = f"Unexpected end of file at byte {position}"
+                raise OSError(msg)
+            self.update(data)
+            position += len(data)
+
+    def update_from_file(self, path: Path) -> None:
+        """Feed the current contents of ``path`` to all hashers."""
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(SEGMENT_WRITE_BUFFER), b""):
+                self.update(chunk)
+
+    def hexdigests(self) -> dict[str, str]:
+        """Return lowercase hex digests keyed by algorithm name."""
+        return {
+            name: hasher.hexdigest() for name, hasher in self._hashers.items()
+        }
+
+
+class ResumeMismatchError(aiohttp.ClientError):
+    """Raised when a ranged response does not match the partial file."""
+
+
+class _SegmentProgress:
+    """Progress of a segmented download reported as a single task."""
+
+    def __init__(self, reporter: ProgressReporter, completed: int) -> None:
+        self.reporter = reporter
+        self.task_id: str | None = None
+        self.counter: ProgressCounter | None = None
+        self.downloaded = completed
+        self._last_update = completed
+        self._step = PROGRESS_MB_THRESHOLD * 1024 * 1024
+
+    async def add(self, nbytes: int) -> None:
+        """Record bytes written by any segment."""
+        self.downloaded += nbytes
+        if self.counter is not None:
+            self.counter.add(nbytes)
+        elif (
+            self.task_id and self.downloaded - self._last_update >= self._step
+        ):
+            self._last_update = self.downloaded
+            await self.reporter.update_task(
+                self.task_id, completed=self.downloaded
+            )
+
+    async def finish(self, *, success: bool) -> None:
+        """Finish the progress task, if one was created."""
+        if not self.task_id:
+            return
+        if success:
+            await self.reporter.update_task(
+                self.task_id, completed=self.downloaded
+            )
+        await self.reporter.finish_task(
+            self.task_id,
+            success=success,
+            description=None if success else "download failed",
+        )
+
+
+class _SegmentedDownload:
+    """Byte ranges, partial file, resume metadata and hash of a download.
+
+    Attributes:
+        ranges: Inclusive (start, end) byte range of every segment
+        written: Bytes written so far to the start of every range
+        state: Resume metadata, stored once the server sent a validator
+        stale: Set when a response shows the partial file cannot be
+            continued, so it is discarded instead of kept for resume
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str,
+        dest: Path,
+        total: int,
+        ranges: list[tuple[int, int]],
+        written: list[int],
+        state: ResumeState | None = None,
+    ) -> None:
+        self.url = url
+        self.dest = dest
+        self.total = total
+        self.ranges = ranges
+        self.written = written
+        self.state = state
+        self.stale = False
+        self.fd = -1
+        self._hasher = DownloadHasher()
+        self._hash_lock = asyncio.Lock()
+        self._hashed = 0
+        self._state_saved_at = time.monotonic()
+
+    @classmethod
+    def plan(
+        cls, url: str, dest: Path, total: int, segments: int
+    ) -> "_SegmentedDownload":
+        """Continue the stored ranges of ``dest`` or split a new download.
+
+        Args:
+            url: URL to download from
+            dest: Destination path
+            total: File size in bytes
+            segments: Number of byte ranges for a new download
+
+        Returns:
+            Segmented download state
+
+        """
+        state = load_resume_state(dest)
+        part_path = get_part_path(dest)
+        if (
+            state is not None
+            and state.segments
+            and state.url == url
+            and state.total == total
+            and state.validator
+            and part_path.exists()
+            and part_path.stat().st_size == total
+        ):
+            download = cls(
+                url,
+                dest,
+                total,
+                [(start, end) for start, end, _ in state.segments],
+                [written for _, _, written in state.segments],
+                state,
+            )
+            logger.debug(
+                "Resuming %s with %s of %s bytes present",
+                dest.name,
+                download.completed,
+                total,
+            )
+            return download
+
+        discard_partial_download(dest)
+        ranges = split_byte_ranges(total, segments)
+        return cls(url, dest, total, ranges, [0] * len(ranges))
+
+    @property
+    def completed(self) -> int:
+        """Bytes written across all segments."""
+        return sum(self.written)
+
+    def open(self) -> None:
+        """Open the partial file, preallocating it for a new download."""
+        part_path = get_part_path(self.dest)
+        if self.completed:
+            self.fd = os.open(part_path, os.O_RDWR)
+            return
+        self.fd = os.open(
+            part_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+        try:
+            os.ftruncate(self.fd, self.total)
+            with contextlib.suppress(AttributeError, OSError):
+                os.posix_fallocate(self.fd, 0, self.total)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the partial file."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def segment_done(self, index: int) -> bool:
+        """Return whether every byte of a range has been written."""
+        start, end = self.ranges[index]
+        return start + self.written[index] > end
+
+    def range_headers(self, index: int) -> dict[str, str]:
+        """Build the request headers for the rest of a range."""
+        start, end = self.ranges[index]
+        headers = {"Range": f"bytes={start + self.written[index]}-{end}"}
+        if self.state is not None and self.state.validator:
+            headers["If-Range"] = self.state.validator
+        return headers
+
+    def accept_response(
+        self, index: int, response: aiohttp.ClientResponse
+    ) -> bool:
+        """Check that a response continues a range of the partial file.
+
+        The first ranged response with a validator creates the resume
+        metadata.
+
+        Args:
+            index: Index of the byte range
+            response: Response to the range request
+
+        Returns:
+            False if the server sent the full file instead of the range
+
+        Raises:
+            ResumeMismatchError: If the response belongs to another
+                version of the file or another offset
+
+        """
+        if response.status != HTTP_PARTIAL_CONTENT:
+            self.stale = True
+            return False
+        start, _ = self.ranges[index]
+        content_range = parse_content_range(
+            response.headers.get("Content-Range")
+        )
+        if (
+            content_range is None
+            or content_range[0] != start + self.written[index]
+            or content_range[1] not in (None, self.total)
+        ):
+            msg = "unexpected Content-Range for segment"
+            raise ResumeMismatchError(msg)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.state is None:
+            if etag or last_modified:
+                self.state = ResumeState(
+                    url=self.url,
+                    total=self.total,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
+        elif etag and self.state.etag and etag != self.state.etag:
+            self.stale = True
+            msg = "ETag changed between segments"
+            raise ResumeMismatchError(msg)
+        return True
+
+    def record_write(self, index: int, nbytes: int) -> None:
+        """Record bytes written to a range and persist the offsets.
+
+        The offsets are stored at most once per ``RESUME_STATE_INTERVAL``
+        and whenever a range completes. Stored offsets may lag behind the
+        partial file, which only re-downloads those bytes on resume.
+        """
+        self.written[index] += nbytes
+        if self.state is None:
+            return
+        elapsed = time.monotonic() - self._state_saved_at
+        if self.segment_done(index) or elapsed >= RESUME_STATE_INTERVAL:
+            self.save_state()
+
+    def save_state(self) -> None:
+        """Persist the written offsets of every range."""
+        if self.state is None:
+            return
+        self.state.segments = [
+            [start, end, written]
+            for (start, end), written in zip(
+                self.ranges, self.written, strict=True
+            )
+        ]
+        save_resume_state(self.dest, self.state)
+        self._state_saved_at = time.monotonic()
+
+    async def advance_hash(self) -> None:
+        """Hash the bytes of the file's contiguous written prefix."""
+        async with self._hash_lock:
+            end_offset = self._contiguous_end()
+            if end_offset > self._hashed:
+                with timing_span("hash"):
+                    await run_in_hash_executor(
+                        self._hasher.update_from_fd,
+                        self.fd,
+                        self._hashed,
+                        end_offset,
+                    )
+                self._hashed = end_offset
+
+    async def finish_hash(self) -> None:
+        """Hash the rest of the file once every segment is complete.
+
+        Raises:
+            DownloadError: If not every byte of the file was hashed
+
+        """
+        await self.advance_hash()
+        if self._hashed != self.total:
+            msg = (
+                f"Hashed {self._hashed} of {self.total} bytes for "
+                f"{self.dest.name}"
+            )
+            raise DownloadError(msg)
+
+    def finalize(self) -> dict[str, str]:
+        """Move the complete file into place and return its digests."""
+        get_part_path(self.dest).replace(self.dest)
+        get_resume_state_path(self.dest).unlink(missing_ok=True)
+        logger.debug("Download completed: %s", self.dest)
+        return self._hasher.hexdigests()
+
+    def cleanup(self) -> None:
+        """Keep a resumable partial file, discard anything else."""
+        if self.state is not None and not self.stale and self.completed:
+            self.save_state()
+            logger.debug(
+                "Keeping %s of %s bytes of %s for resume",
+                self.completed,
+                self.total,
+                self.dest.name,
+            )
+            return
+        discard_partial_download(self.dest)
+
+    def _contiguous_end(self) -> int:
+        """Return the offset up to which every byte has been written."""
+        end_offset = 0
+        for (start, end), written in zip(
+            self.ranges, self.written, strict=True
+        ):
+            end_offset = start + written
+            if end_offset <= end:
+                break
+        return end_offset
+
 
 class DownloadService:
     """Service for downloading AppImage files and associated assets."""
@@ -59,6 +584,7 @@ class DownloadService:
         session: aiohttp.ClientSession,
         progress_reporter: ProgressReporter | None = None,
         auth_manager: GitHubAuthManager | None = None,
+        global_config: GlobalConfig | None = None,
     ) -> None:
         """Initialize download service with HTTP session.
 
@@ -68,72 +594,547 @@ class DownloadService:
                 Uses NullProgressReporter if not provided.
             auth_manager: Optional GitHub authentication manager
                          (creates default if not provided)
+            global_config: Optional global configuration providing the
+                          network settings (loaded on first request if not
+                          provided)
 
         """
         self.session = session
         self.progress_reporter = progress_reporter or NullProgressReporter()
         self.auth_manager = auth_manager or GitHubAuthManager.create_default()
+        self._computed_digests: dict[Path, dict[str, str]] = {}
+        network = global_config.get("network") if global_config else None
+        self._network_config: dict | None = (
+            dict(network) if network is not None else None
+        )
 
     async def download_file(
         self,
         url: str,
         dest: Path,
         progress_type: ProgressType = ProgressType.DOWNLOAD,
-    ) -> None:
+        size: int | None = None,
+    ) -> dict[str, str]:
         """Download a file from URL to destination with retry logic.
 
+        Data is streamed into ``<dest>.part``. If a previous attempt (or a
+        previous process) left a resumable partial file, the download
+        continues from its current size with a ``Range`` request.
+
+        When ``size`` is known and at least the configured segment threshold,
+        the file is fetched as several concurrent byte ranges instead.
+
         Args:
             url: URL to download from
             dest: Destination path
             progress_type: Type of progress operation for categorization
+            size: Expected file size in bytes, if known
+
+        Returns:
+            Hex digests of the downloaded file keyed by algorithm name
 
         Raises:
             aiohttp.ClientError: If download fails after all retry attempts
 
         """
+        with timing_span("download"):
+            return await self._download_file(url, dest, progress_type, size)
+
+    async def _download_file(
+        self,
+        url: str,
+        dest: Path,
+        progress_type: ProgressType,
+        size: int | None,
+    ) -> dict[str, str]:
+        """Download a file, see download_file()."""
+        segments = self._get_segment_count(size)
+        resume_state = load_resume_state(dest)
+        if (
+            size
+            and segments > 1
+            and (resume_state is None or resume_state.segments is not None)
+        ):
+            digests = await self._download_segmented(
+                url, dest, size, segments, progress_type
+            )
+            if digests is not None:
+                return digests
+
+        state: ResumeState | None = None
+        offset = 0
+
+        def build_headers() -> dict[str, str]:
+            nonlocal state, offset
+            state, offset = self._get_resume_point(url, dest)
+            if state is None or not offset:
+                return {}
+            logger.debug(
+                "Resuming %s from byte %s of %s",
+                dest.name,
+                offset,
+                state.total,
+            )
+            headers = {"Range": f"bytes={offset}-"}
+            if state.validator:
+                headers["If-Range"] = state.validator
+            return headers
 
         def cleanup() -> None:
-            if dest.exists():
-                logger.debug("Removing partial download: %s", dest)
-                with contextlib.suppress(Exception):
-                    dest.unlink()
+            # Keep partial data that can be resumed on the next attempt
+            if load_resume_state(dest) is None:
+                discard_partial_download(dest)
+
+        def discard() -> None:
+            discard_partial_download(dest)
+
+        async def process(response: aiohttp.ClientResponse) -> dict[str, str]:
+            return await self._stream_to_part_file(
+                response, url, dest, progress_type, state, offset
+            )
+
+        return await self._make_request_with_retry(
+            url,
+            process,
+            dest.name,
+            cleanup_callback=cleanup,
+            discard_callback=discard,
+            headers_factory=build_headers,
+        )
+
+    async def _stream_to_part_file(  # noqa: PLR0913
+        self,
+        response: aiohttp.ClientResponse,
+        url: str,
+        dest: Path,
+        progress_type: ProgressType,
+        state: ResumeState | None,
+        offset: int,
+    ) -> dict[str, str]:
+        """Write a single-stream response to the partial file.
+
+        Appends to the partial file when the response continues it,
+        otherwise starts over and records new resume metadata.
+
+        Args:
+            response: Full or ranged HTTP response
+            url: URL being downloaded
+            dest: Final destination path
+            progress_type: Type of progress operation for categorization
+            state: Stored resume metadata, if resuming
+            offset: Byte offset requested when resuming
+
+        Returns:
+            Hex digests of the downloaded file keyed by algorithm name
+
+        Raises:
+            ResumeMismatchError: If a ranged response does not continue
+                the partial file
+
+        """
+        part_path = get_part_path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        resumed = (
+            state is not None
+            and offset > 0
+            and response.status == HTTP_PARTIAL_CONTENT
+        )
+        if resumed and state is not None:
+            reason = self._check_resumed_response(response, state, offset)
+            if reason:
+                logger.info(
+                    "Cannot resume %s (%s), restarting", dest.name, reason
+                )
+                discard_partial_download(dest)
+                raise ResumeMismatchError(reason)
+            start = offset
+        else:
+            # Full response: start over and record new resume metadata
+            start = 0
+            discard_partial_download(dest)
+            self._record_resume_state(url, dest, response)
+
+        remaining = int(response.headers.get("Content-Length", 0))
+        total = start + remaining if remaining > 0 else 0
+        mode: Literal["ab", "wb"] = "ab" if resumed else "wb"
+
+        hasher = DownloadHasher()
+        if start:
+            # Hash the bytes kept from the interrupted attempt first
+            with timing_span("hash"):
+                await run_in_hash_executor(hasher.update_from_file, part_path)
+
+        logger.debug("Downloading file: %s", dest.name)
+        logger.debug("   URL: %s", url)
+        logger.debug(
+            "   Size: %s bytes" if total > 0 else "   Size: Unknown",
+            f"{total:,}" if total > 0 else "",
+        )
+
+        # Show progress for files > 1MB when progress reporter is active
+        show_progress = (
+            total > MIN_SIZE_FOR_PROGRESS
+            and self.progress_reporter.is_active()
+        )
+        if show_progress:
+            await self._download_with_progress(
+                response,
+                part_path,
+                total,
+                progress_type,
+                offset=start,
+                mode=mode,
+                hasher=hasher,
+            )
+        else:
+            await self._download_without_progress(
+                response, part_path, mode=mode, hasher=hasher
+            )
+
+        part_path.replace(dest)
+        get_resume_state_path(dest).unlink(missing_ok=True)
+        logger.debug("Download completed: %s", dest)
+        return hasher.hexdigests()
+
+    def _progress_counter(self, task_id: str) -> ProgressCounter | None:
+        """Return a lock-free progress counter for a task, if available.
+
+        Reporters without counters are updated through update_task().
+
+        Args:
+            task_id: Progress task ID
+
+        Returns:
+            Counter to add downloaded bytes to, or None
+
+        """
+        if not isinstance(self.progress_reporter, SupportsProgressCounter):
+            return None
+        counter = self.progress_reporter.progress_counter(task_id)
+        return counter if isinstance(counter, ProgressCounter) else None
+
+    def _get_segment_count(self, size: int | None) -> int:
+        """Return how many segments to use for a file of ``size`` bytes.
+
+        Args:
+            size: Expected file size in bytes, or None if unknown
+
+        Returns:
+            Number of segments (1 means a single-stream download)
+
+        """
+        if not size:
+            return 1
+        network_cfg = self._load_network_config()
+        segments = int(
+            network_cfg.get("download_segments", DEFAULT_DOWNLOAD_SEGMENTS)
+        )
+        threshold_mb = int(
+            network_cfg.get(
+                "segment_threshold_mb", DEFAULT_SEGMENT_THRESHOLD_MB
+            )
+        )
+        if size < threshold_mb * 1024 * 1024:
+            return 1
+        return max(1, segments)
+
+    async def _download_segmented(
+        self,
+        url: str,
+        dest: Path,
+        total: int,
+        segments: int,
+        progress_type: ProgressType,
+    ) -> dict[str, str] | None:
+        """Download a file as concurrent byte ranges on the shared session.
+
+        The ``.part`` file is preallocated to ``total`` bytes and each range
+        is written at its own offset. Each segment retries independently and
+        continues from the last byte it wrote. Progress is reported as a
+        single task covering the whole file.
+
+        The byte ranges and the bytes written to each are kept in the resume
+        metadata, so an interrupted segmented download (including a killed
+        process) continues every range where it stopped.
+
+        Ranges arrive out of order, so the file is hashed as its contiguous
+        prefix grows, reading back freshly written (page-cached) bytes.
+
+        Args:
+            url: URL to download from
+            dest: Destination path
+            total: File size in bytes
+            segments: Number of byte ranges to fetch concurrently
+            progress_type: Type of progress operation for categorization
+
+        Returns:
+            Hex digests of the downloaded file, or None if the server does
+            not honour range requests and a single-stream download is needed
+
+        Raises:
+            DownloadError: If a segment fails after all retry attempts
 
-        async def process(response: aiohttp.ClientResponse) -> None:
-            total = int(response.headers.get("Content-Length", 0))
-            dest.parent.mkdir(parents=True, exist_ok=True)
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        download = _SegmentedDownload.plan(url, dest, total, segments)
+        download.open()
+        logger.debug(
+            "Downloading %s in %s segments (%s bytes)",
+            dest.name,
+            len(download.ranges),
+            f"{total:,}",
+        )
+
+        progress = await self._start_segment_progress(
+            dest.name, total, progress_type, download.completed
+        )
+        success = False
+        try:
+            success = await self._fetch_segments(download, progress)
+            if success:
+                await download.finish_hash()
+        finally:
+            download.close()
+            await progress.finish(success=success)
+            if not success:
+                download.cleanup()
 
-            logger.debug("Downloading file: %s", dest.name)
-            logger.debug("   URL: %s", url)
+        if not success:
             logger.debug(
-                "   Size: %s bytes" if total > 0 else "   Size: Unknown",
-                f"{total:,}" if total > 0 else "",
+                "Server ignored range requests for %s, using single stream",
+                dest.name,
             )
+            return None
+        return download.finalize()
+
+    async def _start_segment_progress(
+        self,
+        name: str,
+        total: int,
+        progress_type: ProgressType,
+        completed: int,
+    ) -> _SegmentProgress:
+        """Create the single progress task of a segmented download.
+
+        Args:
+            name: Name of the downloaded file
+            total: File size in bytes
+            progress_type: Type of progress operation for categorization
+            completed: Bytes already present from an interrupted attempt
 
-            # Show progress for files > 1MB when progress reporter is active
-            show_progress = (
-                total > MIN_SIZE_FOR_PROGRESS
-                and self.progress_reporter.is_active()
+        Returns:
+            Progress tracker shared by all segments
+
+        """
+        progress = _SegmentProgress(self.progress_reporter, completed)
+        if self.progress_reporter.is_active():
+            progress.task_id = await self.progress_reporter.add_task(
+                name=name,
+                progress_type=progress_type,
+                total=total,
             )
-            if show_progress:
-                await self._download_with_progress(
-                    response,
-                    dest,
-                    total,
-                    progress_type,
+            progress.counter = self._progress_counter(progress.task_id)
+            if completed:
+                await self.progress_reporter.update_task(
+                    progress.task_id, completed=completed
                 )
-            else:
-                await self._download_without_progress(response, dest)
+        return progress
+
+    async def _fetch_segments(
+        self, download: _SegmentedDownload, progress: _SegmentProgress
+    ) -> bool:
+        """Fetch every unfinished segment concurrently.
+
+        Args:
+            download: Segmented download state
+            progress: Progress tracker shared by all segments
 
-            logger.debug("Download completed: %s", dest)
+        Returns:
+            True if every segment was served as a range, False as soon as
+            one segment was not; the other segments are then cancelled,
+            since the file is fetched again as a single stream
+
+        """
+        tasks = [
+            asyncio.ensure_future(
+                self._fetch_segment(download, index, progress)
+            )
+            for index in range(len(download.ranges))
+            if not download.segment_done(index)
+        ]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not all(task.result() for task in done):
+                    return False
+        finally:
+            for task in pending:
+                task.cancel()
+            # Also retrieves errors of finished segments that went unread
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return True
+
+    async def _fetch_segment(
+        self,
+        download: _SegmentedDownload,
+        index: int,
+        progress: _SegmentProgress,
+    ) -> bool:
+        """Fetch the rest of one byte range, retrying from its last byte.
+
+        Args:
+            download: Segmented download state
+            index: Index of the byte range
+            progress: Progress tracker shared by all segments
+
+        Returns:
+            True once the range is complete, False if the server replied
+            with the full file instead of the range
+
+        """
+        start, end = download.ranges[index]
+
+        async def write(data: bytes) -> None:
+            offset = start + download.written[index]
+            await run_in_hash_executor(os.pwrite, download.fd, data, offset)
+            download.record_write(index, len(data))
+            await progress.add(len(data))
+            await download.advance_hash()
+
+        async def process(response: aiohttp.ClientResponse) -> bool:
+            if not download.accept_response(index, response):
+                return False
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                buffer += chunk
+                if len(buffer) >= SEGMENT_WRITE_BUFFER:
+                    data = bytes(buffer)
+                    buffer.clear()
+                    await write(data)
+            if buffer:
+                await write(bytes(buffer))
+
+            if not download.segment_done(index):
+                msg = "segment ended before its range was complete"
+                raise aiohttp.ClientPayloadError(msg)
+            return True
+
+        return await self._make_request_with_retry(
+            download.url,
+            process,
+            f"{download.dest.name} [{start}-{end}]",
+            headers_factory=lambda: download.range_headers(index),
+        )
+
+    def _get_resume_point(
+        self, url: str, dest: Path
+    ) -> tuple[ResumeState | None, int]:
+        """Determine whether an existing partial download can be resumed.
+
+        Args:
+            url: URL being downloaded
+            dest: Final destination path
+
+        Returns:
+            Tuple of (resume state, byte offset). The offset is 0 when the
+            download must start from scratch.
+
+        """
+        part_path = get_part_path(dest)
+        state = load_resume_state(dest)
+        if state is None or not part_path.exists():
+            return None, 0
+
+        offset = part_path.stat().st_size
+        if (
+            state.url != url
+            or not state.validator
+            or state.segments is not None
+        ):
+            logger.debug("Partial download for %s is stale", dest.name)
+            discard_partial_download(dest)
+            return None, 0
+        if offset >= state.total > 0:
+            # Complete or oversized partial file; content cannot be trusted
+            discard_partial_download(dest)
+            return None, 0
+        return state, offset
+
+    def _check_resumed_response(
+        self,
+        response: aiohttp.ClientResponse,
+        state: ResumeState,
+        offset: int,
+    ) -> str | None:
+        """Check that a 206 response continues the stored partial file.
+
+        Args:
+            response: Ranged HTTP response
+            state: Stored resume metadata
+            offset: Byte offset requested
 
-        await self._make_request_with_retry(
-            url, process, dest.name, cleanup_callback=cleanup
+        Returns:
+            Reason the response cannot be appended, or None if it matches
+
+        """
+        content_range = parse_content_range(
+            response.headers.get("Content-Range")
+        )
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if content_range is None or content_range[0] != offset:
+            return "unexpected Content-Range"
+        if content_range[1] is not None and content_range[1] != state.total:
+            return "remote size changed"
+        if state.etag and etag and etag != state.etag:
+            return "ETag changed"
+        if (
+            state.last_modified
+            and last_modified
+            and last_modified != state.last_modified
+        ):
+            return "Last-Modified changed"
+        return None
+
+    def _record_resume_state(
+        self, url: str, dest: Path, response: aiohttp.ClientResponse
+    ) -> None:
+        """Persist resume metadata for a fresh full download.
+
+        Metadata is only stored when the server provides a validator,
+        because a partial file cannot be safely resumed without one.
+
+        Args:
+            url: URL being downloaded
+            dest: Final destination path
+            response: Full (200) HTTP response
+
+        """
+        total = int(response.headers.get("Content-Length", 0))
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if total <= 0 or not (etag or last_modified):
+            return
+        save_resume_state(
+            dest,
+            ResumeState(
+                url=url,
+                total=total,
+                etag=etag,
+                last_modified=last_modified,
+            ),
         )
 
     async def _download_without_progress(
         self,
         response: aiohttp.ClientResponse,
         dest: Path,
+        mode: Literal["ab", "wb"] = "wb",
+        hasher: DownloadHasher | None = None,
     ) -> None:
         """Download file without progress tracking.
 
@@ -143,6 +1144,8 @@ class DownloadService:
         Args:
             response: HTTP response to read from
             dest: Destination path for the file
+            mode: File open mode ("ab" appends to a resumed partial file)
+            hasher: Optional hasher fed with every downloaded chunk
 
         Raises:
             aiohttp.ClientError: If download fails
@@ -150,12 +1153,16 @@ class DownloadService:
 
         """
         if HAS_AIOFILES:
-            async with aiofiles.open(dest, mode="wb") as f:
+            async with aiofiles.open(dest, mode=mode) as f:
                 async for chunk in response.content.iter_chunked(CHUNK_SIZE):
                     if chunk:
                         await f.write(chunk)
+                        if hasher:
+                            hasher.update(chunk)
         else:
-            await self._download_sync_fallback(response, dest)
+            await self._download_sync_fallback(
+                response, dest, mode=mode, hasher=hasher
+            )
 
     async def _download_with_progress(
         self,
@@ -163,6 +1170,9 @@ class DownloadService:
         dest: Path,
         total: int,
         progress_type: ProgressType,
+        offset: int = 0,
+        mode: Literal["ab", "wb"] = "wb",
+        hasher: DownloadHasher | None = None,
     ) -> None:
         """Download file with progress tracking via ProgressReporter.
 
@@ -171,6 +1181,9 @@ class DownloadService:
             dest: Destination path for the file
             total: Total file size in bytes
             progress_type: Type of progress operation
+            offset: Bytes already present when resuming a partial file
+            mode: File open mode ("ab" appends to a resumed partial file)
+            hasher: Optional hasher fed with every downloaded chunk
 
         Raises:
             aiohttp.ClientError: If download fails
@@ -179,32 +1192,41 @@ class DownloadService:
         """
         # Create progress task with total in bytes
         task_id = await self.progress_reporter.add_task(
-            name=dest.name,
+            name=dest.name.removesuffix(PART_SUFFIX),
             progress_type=progress_type,
             total=total,  # Keep in bytes for accurate calculations
         )
 
         success = False
-        downloaded_bytes = 0
+        downloaded_bytes = offset
 
         try:
             chunk_count = 0
-            last_progress_update = 0.0
+            last_progress_update = float(offset)
+            if offset:
+                await self.progress_reporter.update_task(
+                    task_id, completed=offset
+                )
+            counter = self._progress_counter(task_id)
 
             if HAS_AIOFILES:
-                async with aiofiles.open(dest, mode="wb") as f:
+                async with aiofiles.open(dest, mode=mode) as f:
                     async for chunk in response.content.iter_chunked(
                         CHUNK_SIZE
                     ):
                         if chunk:
                             await f.write(chunk)
+                            if hasher:
+                                hasher.update(chunk)
                             downloaded_bytes += len(chunk)
                             chunk_count += 1
 
                             mb_threshold_bytes = (
                                 PROGRESS_MB_THRESHOLD * 1024 * 1024
                             )
-                            if (
+                            if counter is not None:
+                                counter.add(len(chunk))
+                            elif (
                                 downloaded_bytes - last_progress_update
                                 >= mb_threshold_bytes
                             ) or (chunk_count % 100 == 0):
@@ -219,6 +1241,10 @@ class DownloadService:
                         response,
                         dest,
                         task_id,
+                        offset=offset,
+                        mode=mode,
+                        hasher=hasher,
+                        counter=counter,
                     )
                 )
 
@@ -246,6 +1272,9 @@ class DownloadService:
     async def download_appimage(self, asset: Asset, dest: Path) -> Path:
         """Download an AppImage file.
 
+        Digests computed while downloading are kept until collected with
+        ``pop_computed_digests``.
+
         Args:
             asset: GitHub asset containing download information
             dest: Destination path for the AppImage
@@ -257,17 +1286,33 @@ class DownloadService:
             aiohttp.ClientError: If download fails
 
         """
-        await self.download_file(
+        digests = await self.download_file(
             asset.browser_download_url,
             dest,
             progress_type=ProgressType.DOWNLOAD,
+            size=asset.size,
         )
+        self._computed_digests[dest] = digests
         return dest
 
+    def pop_computed_digests(self, dest: Path) -> dict[str, str] | None:
+        """Return and forget the digests computed while downloading ``dest``.
+
+        Args:
+            dest: Destination path passed to ``download_appimage``
+
+        Returns:
+            Hex digests keyed by algorithm name, or None if unavailable
+
+        """
+        return self._computed_digests.pop(dest, None)
+
     async def _download_sync_fallback(
         self,
         response: aiohttp.ClientResponse,
         dest: Path,
+        mode: Literal["ab", "wb"] = "wb",
+        hasher: DownloadHasher | None = None,
     ) -> None:
         """Fallback download using sync I/O in thread executor.
 
@@ -277,6 +1322,8 @@ class DownloadService:
         Args:
             response: HTTP response to read from
             dest: Destination path for the file
+            mode: File open mode ("ab" appends to a resumed partial file)
+            hasher: Optional hasher fed with every downloaded chunk
 
         """
         loop = asyncio.get_running_loop()
@@ -284,16 +1331,22 @@ class DownloadService:
         def write_chunk(f: IO[bytes], chunk: bytes) -> None:
             f.write(chunk)
 
-        with dest.open("wb") as f:
+        with dest.open(mode) as f:
             async for chunk in response.content.iter_chunked(CHUNK_SIZE):
                 if chunk:
                     await loop.run_in_executor(None, write_chunk, f, chunk)
+                    if hasher:
+                        hasher.update(chunk)
 
     async def _download_sync_fallback_with_progress(
         self,
         response: aiohttp.ClientResponse,
         dest: Path,
         task_id: str,
+        offset: int = 0,
+        mode: Literal["ab", "wb"] = "wb",
+        hasher: DownloadHasher | None = None,
+        counter: ProgressCounter | None = None,
     ) -> int:
         """Fallback download with progress using sync I/O in thread executor.
 
@@ -301,28 +1354,37 @@ class DownloadService:
             response: HTTP response to read from
             dest: Destination path for the file
             task_id: Progress task ID for updates
+            offset: Bytes already present when resuming a partial file
+            mode: File open mode ("ab" appends to a resumed partial file)
+            hasher: Optional hasher fed with every downloaded chunk
+            counter: Progress counter of the task, used instead of
+                update_task() when given
 
         Returns:
-            Total bytes downloaded
+            Total bytes in the file, including the resumed offset
 
         """
         loop = asyncio.get_running_loop()
-        downloaded_bytes = 0
+        downloaded_bytes = offset
         chunk_count = 0
-        last_progress_update = 0.0
+        last_progress_update = float(offset)
 
         def write_chunk(f: IO[bytes], chunk: bytes) -> None:
             f.write(chunk)
 
-        with dest.open("wb") as f:
+        with dest.open(mode) as f:
             async for chunk in response.content.iter_chunked(CHUNK_SIZE):
                 if chunk:
                     await loop.run_in_executor(None, write_chunk, f, chunk)
+                    if hasher:
+                        hasher.update(chunk)
                     downloaded_bytes += len(chunk)
                     chunk_count += 1
 
                     mb_threshold_bytes = PROGRESS_MB_THRESHOLD * 1024 * 1024
-                    if (
+                    if counter is not None:
+                        counter.add(len(chunk))
+                    elif (
                         downloaded_bytes - last_progress_update
                         >= mb_threshold_bytes
                     ) or (chunk_count % 100 == 0):
@@ -376,10 +1438,19 @@ class DownloadService:
             checksum_url, process, f"checksum file {checksum_url}"
         )
 
+    def _load_network_config(self) -> dict:
+        """Return the ``[network]`` section of the global configuration.
+
+        Loaded at most once per service, so requests do no config file I/O.
+        """
+        if self._network_config is None:
+            config = ConfigManager()
+            self._network_config = dict(config.load_global_config()["network"])
+        return self._network_config
+
     def _get_network_config(self) -> tuple[int, aiohttp.ClientTimeout]:
         """Get network configuration (retries and timeout)."""
-        config = ConfigManager()
-        network_cfg = config.load_global_config()["network"]
+        network_cfg = self._load_network_config()
         retry_attempts = int(network_cfg.get("retry_attempts", 3))
         timeout_seconds = int(network_cfg.get("timeout_seconds", 10))
 
@@ -396,12 +1467,27 @@ class DownloadService:
         process_callback: Callable[[aiohttp.ClientResponse], Awaitable[T]],
         description: str,
         cleanup_callback: Callable[[], None] | None = None,
+        discard_callback: Callable[[], None] | None = None,
+        headers_factory: Callable[[], dict[str, str]] | None = None,
     ) -> T:
-        """Make HTTP request with retry logic."""
+        """Make HTTP request with retry logic.
+
+        Args:
+            url: URL to request
+            process_callback: Coroutine that consumes the response
+            description: Human readable description for log messages
+            cleanup_callback: Called after each failed attempt
+            discard_callback: Called on non-retryable errors instead of
+                cleanup_callback (defaults to cleanup_callback)
+            headers_factory: Builds extra request headers per attempt,
+                e.g. a ``Range`` header for resuming a partial download
+
+        """
         retry_attempts, timeout = self._get_network_config()
-        headers = self.auth_manager.apply_auth({})
 
         for attempt in range(1, retry_attempts + 1):
+            extra_headers = headers_factory() if headers_factory else {}
+            headers = self.auth_manager.apply_auth(extra_headers)
             try:
                 async with self.session.get(
                     url, headers=headers, timeout=timeout
@@ -435,8 +1521,9 @@ class DownloadService:
                 await asyncio.sleep(backoff)
             except Exception as e:
                 logger.exception("%s failed", description)
-                if cleanup_callback:
-                    cleanup_callback()
+                discard = discard_callback or cleanup_callback
+                if discard:
+                    discard()
                 msg = f"Failed to download {description}"
                 raise DownloadError(msg) from e
 
@@ -9,6 +9,7 @@ import shutil
 from pathlib import Path
 
 from my_unicorn.core.icon import AppImageIconExtractor, IconExtractionError
+from my_unicorn.core.icon_cache import IconCache
 from my_unicorn.logger import get_logger
 
 logger = get_logger(__name__)
@@ -156,11 +157,14 @@ class FileOperations:
         return clean_name.removesuffix(".AppImage").removesuffix(".appimage")
 
 
-async def extract_icon_from_appimage(
+async def extract_icon_from_appimage(  # noqa: PLR0913
     appimage_path: Path,
     icon_dir: Path,
     app_name: str,
     icon_filename: str | None = None,
+    *,
+    icon_cache: IconCache | None = None,
+    appimage_digest: str | None = None,
 ) -> Path | None:
     """Extract icon from AppImage file.
 
@@ -173,6 +177,8 @@ async def extract_icon_from_appimage(
         icon_dir: Directory where icons should be saved
         app_name: Application name for icon matching
         icon_filename: Icon filename or None (defaults to app_name.png)
+        icon_cache: Cache used to reuse an unchanged icon (optional)
+        appimage_digest: SHA-256 hex digest of the AppImage (optional)
 
     Returns:
         Path to extracted icon or None if extraction failed
@@ -197,11 +203,12 @@ async def extract_icon_from_appimage(
 
     try:
         # Use AppImageIconExtractor to perform extraction
-        extractor = AppImageIconExtractor()
+        extractor = AppImageIconExtractor(icon_cache)
         extracted_icon = await extractor.extract_icon(
             appimage_path=appimage_path,
             dest_path=dest_path,
             app_name=app_name,
+            appimage_digest=appimage_digest,
         )
 
         if extracted_icon:
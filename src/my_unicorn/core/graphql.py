@@ -0,0 +1,265 @@
+"""Batched GitHub release lookups through the GraphQL API.
+
+Update checks normally need one or two REST calls per app. When a token is
+configured, GraphQLReleaseClient fetches the latest stable release and the
+latest prerelease of many repositories in a single aliased query instead,
+so checking 50 apps takes two round trips.
+
+The lookup is best effort: repositories missing from the response, or a
+failed query, are left to the regular REST path in ReleaseFetcher.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from my_unicorn.constants import (
+    GITHUB_GRAPHQL_URL,
+    GRAPHQL_ASSETS_PER_RELEASE,
+    GRAPHQL_RELEASES_PER_REPO,
+    GRAPHQL_REPOS_PER_QUERY,
+)
+from my_unicorn.core.api import Release, create_api_timeout
+from my_unicorn.logger import get_logger, timing_span
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from my_unicorn.core.auth import GitHubAuthManager
+
+logger = get_logger(__name__)
+
+_RELEASE_FIELDS = f"""
+fragment ReleaseFields on Release {{
+  tagName
+  isPrerelease
+  isDraft
+  releaseAssets(first: {GRAPHQL_ASSETS_PER_RELEASE}) {{
+    nodes {{ name size digest downloadUrl }}
+  }}
+}}
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class BatchedReleases:
+    """Latest releases of one repository from a batched lookup.
+
+    Attributes:
+        stable: Latest stable release, or None if the repo has none
+        prerelease: Most recent prerelease, or None if the repo has none
+
+    """
+
+    stable: Release | None
+    prerelease: Release | None
+
+
+def build_releases_query(repos: list[tuple[str, str]]) -> str:
+    """Build an aliased query for the releases of several repositories.
+
+    Owners and names are passed as variables ``o<i>``/``n<i>`` rather
+    than interpolated into the query text.
+
+    Args:
+        repos: (owner, repo) pairs; each gets the alias ``r<index>``
+
+    Returns:
+        GraphQL query document
+
+    """
+    variables = ", ".join(
+        f"$o{i}: String!, $n{i}: String!" for i in range(len(repos))
+    )
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{\n"
+        "    latestRelease { ...ReleaseFields }\n"
+        f"    releases(first: {GRAPHQL_RELEASES_PER_REPO}, "
+        "orderBy: {field: CREATED_AT, direction: DESC}) {\n"
+        "      nodes { ...ReleaseFields }\n"
+        "    }\n"
+        "  }"
+        for i in range(len(repos))
+    )
+    return f"query({variables}) {{\n{fields}\n}}\n{_RELEASE_FIELDS}"
+
+
+def _to_release(owner: str, repo: str, node: dict[str, Any]) -> Release:
+    """Convert a GraphQL release node into a platform-filtered Release.
+
+    The node is reshaped into the REST release format so that version
+    normalization and asset parsing stay in Release.from_api_response.
+    """
+    asset_nodes = (node.get("releaseAssets") or {}).get("nodes") or []
+    api_data = {
+        "tag_name": node.get("tagName") or "",
+        "prerelease": bool(node.get("isPrerelease")),
+        "assets": [
+            {
+                "name": asset.get("name"),
+                "size": asset.get("size"),
+                "digest": asset.get("digest") or "",
+                "browser_download_url": asset.get("downloadUrl"),
+            }
+            for asset in asset_nodes
+            if isinstance(asset, dict)
+        ],
+    }
+    release = Release.from_api_response(owner, repo, api_data)
+    return release.filter_for_platform()
+
+
+def parse_repository_node(
+    owner: str, repo: str, node: dict[str, Any]
+) -> BatchedReleases:
+    """Pick the latest stable release and prerelease of a repository.
+
+    Mirrors the REST lookups: ``latestRelease`` matches
+    ``/releases/latest`` and the prerelease is the newest non-draft
+    release flagged as a prerelease.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        node: ``repository`` object from the GraphQL response
+
+    Returns:
+        BatchedReleases for the repository
+
+    """
+    stable = None
+    latest = node.get("latestRelease")
+    if isinstance(latest, dict) and not latest.get("isPrerelease"):
+        stable = _to_release(owner, repo, latest)
+
+    prerelease = None
+    for release in (node.get("releases") or {}).get("nodes") or []:
+        if (
+            isinstance(release, dict)
+            and release.get("isPrerelease")
+            and not release.get("isDraft")
+        ):
+            prerelease = _to_release(owner, repo, release)
+            break
+
+    return BatchedReleases(stable=stable, prerelease=prerelease)
+
+
+class GraphQLReleaseClient:
+    """Fetches releases for many repositories with aliased GraphQL queries.
+
+    GitHub's GraphQL API rejects anonymous requests, so the client is only
+    usable when the auth manager holds a token.
+
+    Usage:
+        client = GraphQLReleaseClient(session, auth_manager)
+        if client.is_available():
+            releases = await client.fetch_latest_releases(
+                [("owner", "repo"), ("other", "project")]
+            )
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        auth_manager: GitHubAuthManager,
+        timeout_seconds: int = 10,
+    ) -> None:
+        """Initialize the GraphQL client.
+
+        Args:
+            session: aiohttp session for making requests
+            auth_manager: GitHub authentication manager
+            timeout_seconds: Base timeout from network configuration
+
+        """
+        self.session = session
+        self.auth_manager = auth_manager
+        self._timeout_seconds = timeout_seconds
+
+    def is_available(self) -> bool:
+        """Return whether a token is configured for GraphQL requests."""
+        token = self.auth_manager.get_token()
+        return isinstance(token, str) and bool(token.strip())
+
+    async def fetch_latest_releases(
+        self, repos: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], BatchedReleases]:
+        """Fetch latest stable releases and prereleases for repositories.
+
+        Repositories are queried in chunks of GRAPHQL_REPOS_PER_QUERY.
+
+        Args:
+            repos: (owner, repo) pairs to look up; duplicates are ignored
+
+        Returns:
+            Mapping of (owner, repo) to BatchedReleases. Repositories that
+            could not be resolved are omitted.
+
+        """
+        unique = list(dict.fromkeys(repos))
+        results: dict[tuple[str, str], BatchedReleases] = {}
+        for start in range(0, len(unique), GRAPHQL_REPOS_PER_QUERY):
+            chunk = unique[start : start + GRAPHQL_REPOS_PER_QUERY]
+            results.update(await self._fetch_chunk(chunk))
+        return results
+
+    async def _fetch_chunk(
+        self, repos: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], BatchedReleases]:
+        """Run one aliased query; failures yield an empty result."""
+        variables: dict[str, str] = {}
+        for i, (owner, repo) in enumerate(repos):
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = repo
+        payload = {
+            "query": build_releases_query(repos),
+            "variables": variables,
+        }
+        headers = self.auth_manager.apply_auth(
+            {"Content-Type": "application/json"}
+        )
+
+        try:
+            async with (
+                timing_span("api"),
+                self.session.post(
+                    GITHUB_GRAPHQL_URL,
+                    json=payload,
+                    headers=headers,
+                    timeout=create_api_timeout(self._timeout_seconds),
+                ) as response,
+            ):
+                response.raise_for_status()
+                body = await response.json()
+        except (aiohttp.ClientError, TimeoutError, ValueError) as e:
+            logger.warning(
+                "Batched GraphQL release lookup failed, using REST: %s", e
+            )
+            return {}
+
+        data = body.get("data") if isinstance(body, dict) else None
+        if not isinstance(data, dict):
+            logger.warning(
+                "Batched GraphQL release lookup returned no data: %s",
+                body.get("errors") if isinstance(body, dict) else body,
+            )
+            return {}
+        if body.get("errors"):
+            # Partial results: unknown repos come back as null nodes.
+            logger.debug("GraphQL lookup errors: %s", body["errors"])
+
+        results: dict[tuple[str, str], BatchedReleases] = {}
+        for i, (owner, repo) in enumerate(repos):
+            node = data.get(f"r{i}")
+            if isinstance(node, dict):
+                results[owner, repo] = parse_repository_node(owner, repo, node)
+        logger.debug(
+            "GraphQL resolved releases for %d/%d repositories",
+            len(results),
+            len(repos),
+        )
+        return results
@@ -2,18 +2,34 @@
 
 This module provides icon extraction functionality from AppImage files.
 Icon management is handled through file_ops.extract_icon_from_appimage().
+
+Icons are read directly from the AppImage's squashfs image when possible,
+so only the few candidate files are decompressed. AppImages the in-process
+reader cannot handle are unpacked with ``--appimage-extract`` instead.
+With an IconCache, an icon that is already installed and unchanged in the
+new AppImage is reused without extracting or scoring candidates.
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
+import posixpath
 import re
 import shutil
+import stat
 import tempfile
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
+
+from my_unicorn.core.icon_cache import CachedIcon, IconCache, icon_digest
+from my_unicorn.core.squashfs import SquashfsError, SquashfsImage
+from my_unicorn.logger import get_logger, timing_span
 
-from my_unicorn.logger import get_logger
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 logger = get_logger(__name__)
 
@@ -22,6 +38,20 @@ class IconExtractionError(Exception):
     """Raised when icon extraction from AppImage fails."""
 
 
+@dataclass(frozen=True, slots=True)
+class IconCandidate:
+    """An icon found while scanning an extracted AppImage."""
+
+    path: Path
+    score: int
+    resolution: int  # Size of the theme directory, 0 if unknown
+
+    @property
+    def rank(self) -> tuple[int, int]:
+        """Sort key; higher resolution breaks ties between equal scores."""
+        return self.score, self.resolution
+
+
 class AppImageIconExtractor:
     """Handles extraction and processing of icons from AppImage files."""
 
@@ -36,12 +66,32 @@ class AppImageIconExtractor:
 
     # Resolution preferences for raster formats
     RESOLUTION_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"(\d+)x\d+")
+    # Resolution of icons in "scalable" theme directories
+    SCALABLE_RESOLUTION = 1 << 16
+
+    # Extensions scanned regardless of the file name
+    SCAN_SUFFIXES: ClassVar[frozenset[str]] = frozenset(
+        {".svg", ".png", ".ico"}
+    )
+
+    # Directories of the image searched for named icons
+    ICON_DIRECTORIES: ClassVar[tuple[str, ...]] = (
+        "usr/share/icons",
+        "usr/share/pixmaps",
+    )
 
     # Constants for magic values
     MIN_ICON_SIZE_BYTES = 20  # Lowered to allow small test files
+    MAX_ICON_SIZE_BYTES = 16 * 1024 * 1024  # Never read huge files
 
-    def __init__(self) -> None:
-        """Initialize the AppImage icon extractor."""
+    def __init__(self, icon_cache: IconCache | None = None) -> None:
+        """Initialize the AppImage icon extractor.
+
+        Args:
+            icon_cache: Cache of previously extracted icons (optional)
+
+        """
+        self.icon_cache = icon_cache
 
     def is_recoverable_error(self, error_msg: str) -> bool:
         """Check if an extraction error is recoverable/expected.
@@ -61,7 +111,11 @@ class AppImageIconExtractor:
         return any(pattern in error_msg for pattern in recoverable_patterns)
 
     async def extract_icon(
-        self, appimage_path: Path, dest_path: Path, app_name: str
+        self,
+        appimage_path: Path,
+        dest_path: Path,
+        app_name: str,
+        appimage_digest: str | None = None,
     ) -> Path | None:
         """Extract the best available icon from an AppImage.
 
@@ -69,6 +123,8 @@ class AppImageIconExtractor:
             appimage_path: Path to the AppImage file
             dest_path: Destination path for the extracted icon
             app_name: Application name for icon matching
+            appimage_digest: SHA-256 hex digest of the AppImage, used to
+                look up the icon cache (optional)
 
         Returns:
             Path to extracted icon or None if extraction failed
@@ -77,51 +133,390 @@ class AppImageIconExtractor:
             IconExtractionError: If extraction process fails
 
         """
-        if not appimage_path.exists():
+        if not await asyncio.to_thread(appimage_path.exists):
             logger.error("AppImage not found: %s", appimage_path)
             return None
 
-        if not appimage_path.is_file():
+        if not await asyncio.to_thread(appimage_path.is_file):
             logger.error("AppImage path is not a file: %s", appimage_path)
             return None
 
+        if await self._reuse_cached_icon(
+            appimage_path, dest_path, appimage_digest
+        ):
+            logger.info("✓ Icon unchanged, reusing %s", dest_path)
+            return dest_path
+
         logger.info("Extracting icon from AppImage: %s", appimage_path.name)
 
-        with tempfile.TemporaryDirectory(
-            prefix="my-unicorn-icon-"
-        ) as temp_dir:
+        with (
+            timing_span("icon"),
+            tempfile.TemporaryDirectory(prefix="my-unicorn-icon-") as temp_dir,
+        ):
             temp_path = Path(temp_dir)
 
             try:
-                # Extract AppImage
-                await self._extract_appimage(appimage_path, temp_path)
-
-                # Find the best icon
                 squashfs_root = temp_path / "squashfs-root"
-                if not squashfs_root.exists():
-                    logger.warning(
-                        "No squashfs-root directory found after extraction"
-                    )
-                    return None
-
-                best_icon = self._find_best_icon(squashfs_root, app_name)
+                best_icon = await self._choose_icon(
+                    appimage_path, squashfs_root, app_name
+                )
                 if not best_icon:
                     logger.warning("No suitable icon found for %s", app_name)
                     return None
 
                 # Copy icon to destination
-                return await self._copy_icon(best_icon, dest_path)
+                copied = await self._copy_icon(best_icon, dest_path)
 
             except IconExtractionError:
                 # Re-raise IconExtractionError as-is (already logged)
                 raise
             except Exception as e:
                 logger.exception(
-                    "× Failed to extract icon from %s",
+                    "x Failed to extract icon from %s",
                     appimage_path.name,
                 )
                 error_msg = f"Icon extraction failed: {e}"
                 raise IconExtractionError(error_msg) from e
+            else:
+                self._cache_icon(
+                    copied, best_icon, squashfs_root, appimage_digest
+                )
+                return copied
+
+    async def _choose_icon(
+        self, appimage_path: Path, squashfs_root: Path, app_name: str
+    ) -> Path | None:
+        """Extract icon candidates and pick the best one.
+
+        Candidates are read in-process first; the whole AppImage is
+        extracted if that is not possible or finds no icon.
+
+        Args:
+            appimage_path: Path to the AppImage file
+            squashfs_root: Directory to extract to
+            app_name: Application name for icon matching
+
+        Returns:
+            Path to the best icon below ``squashfs_root``, or None
+
+        """
+        if await self._extract_icon_files(
+            appimage_path, squashfs_root, app_name
+        ):
+            best_icon = self._find_best_icon(squashfs_root, app_name)
+            if best_icon is not None:
+                return best_icon
+
+        # Fall back to extracting the whole AppImage
+        shutil.rmtree(squashfs_root, ignore_errors=True)
+        await self._extract_appimage(appimage_path, squashfs_root.parent)
+        if not await asyncio.to_thread(squashfs_root.exists):
+            logger.warning("No squashfs-root directory found after extraction")
+            return None
+        return self._find_best_icon(squashfs_root, app_name)
+
+    async def _reuse_cached_icon(
+        self,
+        appimage_path: Path,
+        dest_path: Path,
+        appimage_digest: str | None,
+    ) -> bool:
+        """Check whether the installed icon can be kept for an AppImage.
+
+        The icon is kept if it was extracted from the same AppImage before,
+        or if the file it was extracted from has identical bytes in this
+        AppImage's squashfs image.
+
+        Args:
+            appimage_path: Path to the AppImage file
+            dest_path: Destination path for the extracted icon
+            appimage_digest: SHA-256 hex digest of the AppImage, if known
+
+        Returns:
+            True if ``dest_path`` already holds the AppImage's icon
+
+        """
+        if self.icon_cache is None:
+            return False
+        cached = self.icon_cache.get(dest_path)
+        if cached is None or not self.icon_cache.is_installed(cached):
+            return False
+        if appimage_digest and self.icon_cache.has_appimage(
+            appimage_digest, dest_path
+        ):
+            return True
+
+        loop = asyncio.get_running_loop()
+        digest = await loop.run_in_executor(
+            None, self._read_cached_icon_digest, appimage_path, cached
+        )
+        if digest != cached.icon_sha256:
+            return False
+        self.icon_cache.record(
+            dest_path,
+            cached.image_path,
+            cached.icon_sha256,
+            cached.icon_size,
+            appimage_digest,
+        )
+        return True
+
+    def _read_cached_icon_digest(
+        self, appimage_path: Path, cached: CachedIcon
+    ) -> str | None:
+        """Hash the file at a cached icon's path in the AppImage.
+
+        Args:
+            appimage_path: Path to the AppImage file
+            cached: Cached icon entry
+
+        Returns:
+            SHA-256 hex digest, or None if the file is missing, has another
+            size or the image cannot be read in-process
+
+        """
+        try:
+            with SquashfsImage.open(appimage_path) as image:
+                found = image.lookup(cached.image_path)
+                if (
+                    found is None
+                    or found[1].kind != "file"
+                    or found[1].file_size != cached.icon_size
+                ):
+                    return None
+                return icon_digest(image.read_file(found[1]))
+        except (SquashfsError, OSError) as e:
+            logger.debug(
+                "Cannot compare cached icon with %s: %s",
+                appimage_path.name,
+                e,
+            )
+            return None
+
+    def _cache_icon(
+        self,
+        icon_file: Path,
+        source: Path,
+        squashfs_root: Path,
+        appimage_digest: str | None,
+    ) -> None:
+        """Record an extracted icon in the icon cache.
+
+        Args:
+            icon_file: Installed icon
+            source: Chosen icon below ``squashfs_root``
+            squashfs_root: Extracted (or partially extracted) image root
+            appimage_digest: SHA-256 hex digest of the AppImage, if known
+
+        """
+        if self.icon_cache is None:
+            return
+        try:
+            image_path = source.resolve().relative_to(squashfs_root.resolve())
+            data = icon_file.read_bytes()
+        except (OSError, ValueError) as e:
+            logger.debug("Not caching icon %s: %s", icon_file, e)
+            return
+        self.icon_cache.record(
+            icon_file,
+            image_path.as_posix(),
+            icon_digest(data),
+            len(data),
+            appimage_digest,
+        )
+
+    async def _extract_icon_files(
+        self, appimage_path: Path, squashfs_root: Path, app_name: str
+    ) -> bool:
+        """Copy icon candidates out of the AppImage without running it.
+
+        The candidates are written below ``squashfs_root`` at their paths
+        inside the image, so the result looks like a partial
+        ``--appimage-extract``.
+
+        Args:
+            appimage_path: Path to the AppImage file
+            squashfs_root: Directory to write the candidates to
+            app_name: Application name for icon matching
+
+        Returns:
+            True if any candidate was extracted, False if the AppImage must
+            be extracted in full
+
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            count = await loop.run_in_executor(
+                None,
+                self._copy_icon_files,
+                appimage_path,
+                squashfs_root,
+                app_name,
+            )
+        except (SquashfsError, OSError) as e:
+            logger.debug(
+                "Cannot read icons from %s in-process: %s",
+                appimage_path.name,
+                e,
+            )
+            return False
+        logger.debug(
+            "Read %d icon candidates from %s", count, appimage_path.name
+        )
+        return count > 0
+
+    def _copy_icon_files(
+        self, appimage_path: Path, squashfs_root: Path, app_name: str
+    ) -> int:
+        """Write icon candidates from the AppImage's squashfs image.
+
+        Args:
+            appimage_path: Path to the AppImage file
+            squashfs_root: Directory to write the candidates to
+            app_name: Application name for icon matching
+
+        Returns:
+            Number of files written
+
+        Raises:
+            SquashfsError: If the image cannot be read in-process
+
+        """
+        with SquashfsImage.open(appimage_path) as image:
+            written: set[str] = set()
+            for path in self._find_icon_candidates(image, app_name):
+                self._copy_image_entry(image, path, squashfs_root, written)
+        return len(written)
+
+    def _find_icon_candidates(
+        self, image: SquashfsImage, app_name: str
+    ) -> list[str]:
+        """List image paths that may hold the application icon.
+
+        Candidates are ``.DirIcon`` and other icons in the image root, the
+        ``Icon=`` target of the root desktop files and icons in
+        ICON_DIRECTORIES named after that target or the application.
+
+        Args:
+            image: Open squashfs image
+            app_name: Application name for icon matching
+
+        Returns:
+            Paths relative to the image root
+
+        """
+        candidates: list[str] = []
+        icon_names = {"icon"}
+        for entry in image.listdir(image.root):
+            suffix = posixpath.splitext(entry.name)[1].lower()
+            if entry.name == ".DirIcon" or suffix in self.FORMAT_SCORES:
+                candidates.append(entry.name)
+            elif suffix == ".desktop":
+                icon = self._read_desktop_icon(image, entry.name)
+                if not icon:
+                    continue
+                if "/" in icon:
+                    candidates.append(icon)
+                else:
+                    stem, icon_suffix = posixpath.splitext(icon)
+                    if icon_suffix.lower() not in self.FORMAT_SCORES:
+                        stem = icon
+                    icon_names.add(stem.lower())
+
+        candidates.extend(
+            self._find_named_icons(image, icon_names, app_name.lower())
+        )
+        return candidates
+
+    def _find_named_icons(
+        self, image: SquashfsImage, icon_names: set[str], app_name: str
+    ) -> list[str]:
+        """List icons in ICON_DIRECTORIES matching an icon or app name.
+
+        Args:
+            image: Open squashfs image
+            icon_names: Lowercase icon names matched exactly
+            app_name: Lowercase application name matched as a substring
+
+        Returns:
+            Paths relative to the image root
+
+        """
+        found: list[str] = []
+        for directory in self.ICON_DIRECTORIES:
+            for path, _entry, inode in image.walk(directory):
+                if inode.kind not in {"file", "symlink"}:
+                    continue
+                stem, suffix = posixpath.splitext(posixpath.basename(path))
+                if suffix.lower() not in self.FORMAT_SCORES:
+                    continue
+                stem = stem.lower()
+                if stem in icon_names or app_name in stem:
+                    found.append(path)
+        return found
+
+    def _read_desktop_icon(
+        self, image: SquashfsImage, path: str
+    ) -> str | None:
+        """Return the ``Icon=`` value of a desktop file in the image."""
+        found = image.lookup(path)
+        if found is None or found[1].kind != "file":
+            return None
+        if found[1].file_size > self.MAX_ICON_SIZE_BYTES:
+            return None
+        content = image.read_file(found[1]).decode("utf-8", errors="ignore")
+        for line in content.splitlines():
+            key, separator, value = line.partition("=")
+            if separator and key.strip() == "Icon" and value.strip():
+                return value.strip()
+        return None
+
+    def _copy_image_entry(
+        self,
+        image: SquashfsImage,
+        path: str,
+        squashfs_root: Path,
+        written: set[str],
+    ) -> None:
+        """Write one image file or symlink below ``squashfs_root``.
+
+        Symlinks are recreated relative to their resolved target inside
+        the image, and the target is written as well.
+
+        Args:
+            image: Open squashfs image
+            path: Path relative to the image root
+            squashfs_root: Directory to write to
+            written: Canonical paths already written; updated in place
+
+        """
+        found = image.lookup(path, follow_symlinks=False)
+        if found is None or found[0] in written or not found[0]:
+            return
+        canonical, inode = found
+        destination = squashfs_root / canonical
+        if inode.kind == "symlink":
+            target = image.lookup(canonical)
+            if target is None or target[1].kind != "file":
+                return
+            self._copy_image_entry(image, target[0], squashfs_root, written)
+            if target[0] not in written:
+                return
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.symlink_to(
+                posixpath.relpath(
+                    target[0], posixpath.dirname(canonical) or "."
+                )
+            )
+        elif (
+            inode.kind == "file"
+            and inode.file_size <= self.MAX_ICON_SIZE_BYTES
+        ):
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_bytes(image.read_file(inode))
+        else:
+            return
+        written.add(canonical)
 
     async def _extract_appimage(
         self, appimage_path: Path, temp_dir: Path
@@ -138,7 +533,7 @@ class AppImageIconExtractor:
         """
         try:
             # Make AppImage executable if needed
-            appimage_path.chmod(0o755)
+            await asyncio.to_thread(appimage_path.chmod, 0o755)
 
             # Run extraction command
             process = await asyncio.create_subprocess_exec(
@@ -207,6 +602,10 @@ class AppImageIconExtractor:
     ) -> Path | None:
         """Find the best available icon in the extracted AppImage.
 
+        The tree is walked once. Each entry is classified by its name,
+        scored as it is found, and only the best candidate is kept, so the
+        cost is linear in the number of files.
+
         Args:
             squashfs_root: Path to the extracted squashfs-root directory
             app_name: Application name for icon matching
@@ -215,96 +614,123 @@ class AppImageIconExtractor:
             Path to the best icon found or None
 
         """
-        candidate_icons: list[dict[str, int | Path]] = []
-
-        # Search for icons in common locations
-        search_locations = [
-            squashfs_root,  # Root level symlinks
-            squashfs_root
-            / "usr"
-            / "share"
-            / "icons",  # Standard icon directory
-            squashfs_root
-            / "usr"
-            / "share"
-            / "pixmaps",  # Alternative icon location
-            squashfs_root
-            / "opt"
-            / "**"
-            / "icons",  # Application-specific icons
-        ]
-
-        for location in search_locations:
-            if location.exists():
-                candidate_icons.extend(
-                    self._scan_directory_for_icons(location, app_name)
-                )
+        best: IconCandidate | None = None
+        for icon_path, is_symlink in self._scan_directory_for_icons(
+            squashfs_root, app_name
+        ):
+            candidate = self._classify_icon(
+                icon_path, app_name, is_symlink=is_symlink
+            )
+            if candidate is not None and (
+                best is None or candidate.rank > best.rank
+            ):
+                best = candidate
 
-        if not candidate_icons:
+        if best is None:
             logger.debug("No candidate icons found")
             return None
 
-        # Score and select the best icon
-        best_icon = self._select_best_icon(candidate_icons)
-        logger.info(
-            "Selected icon: %s (score: %s)",
-            best_icon["path"],
-            best_icon["score"],
-        )
-
-        best_icon_path = best_icon["path"]
-        if not isinstance(best_icon_path, Path):
-            msg = "Invalid icon path type"
-            raise IconExtractionError(msg)
-        return best_icon_path
+        logger.info("Selected icon: %s (score: %s)", best.path, best.score)
+        return best.path
 
     def _scan_directory_for_icons(
         self, directory: Path, app_name: str
-    ) -> list[dict[str, int | Path]]:
-        """Scan directory for icon files.
+    ) -> Iterator[tuple[Path, bool]]:
+        """Walk a directory once, yielding entries named like icons.
+
+        Directories are visited breadth-first, so shallower entries such as
+        the root ``.DirIcon`` come first. Symlinked directories are not
+        followed.
 
         Args:
             directory: Directory to scan
             app_name: Application name for matching
 
-        Returns:
-            List of candidate icon dictionaries
+        Yields:
+            Tuples of (path, whether the entry is a symlink)
 
         """
-        candidates: list[dict[str, int | Path]] = []
+        app_name_lower = app_name.lower()
+        pending = deque([directory])
+        while pending:
+            current = pending.popleft()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                        elif self._is_icon_name(
+                            entry.name, app_name, app_name_lower
+                        ):
+                            yield Path(entry.path), entry.is_symlink()
+            except OSError as e:
+                logger.debug("Error scanning %s: %s", current, e)
+
+    def _is_icon_name(
+        self, name: str, app_name: str, app_name_lower: str
+    ) -> bool:
+        """Check whether a file name may belong to an icon.
+
+        Matches ``.DirIcon``, files with a SCAN_SUFFIXES extension and
+        files named after the application or ``icon``.
+        """
+        if name == ".DirIcon":
+            return True
+        stem, dot, suffix = name.rpartition(".")
+        if not dot or not stem:
+            return False
+        return (
+            f".{suffix.lower()}" in self.SCAN_SUFFIXES
+            or name.startswith((f"{app_name}.", "icon."))
+            or app_name_lower in stem
+        )
+
+    def _classify_icon(
+        self, icon_path: Path, app_name: str, *, is_symlink: bool
+    ) -> IconCandidate | None:
+        """Score a scanned entry with a single stat call.
+
+        Args:
+            icon_path: Scanned entry
+            app_name: Application name for relevance scoring
+            is_symlink: Whether the entry is a symlink
 
+        Returns:
+            Candidate, or None if the entry is not a usable icon
+
+        """
+        resolved = (
+            self._resolve_icon_path(icon_path) if is_symlink else icon_path
+        )
+        if resolved is None:
+            return None
         try:
-            # Use glob patterns to find icons
-            patterns = [
-                f"**/{app_name}.*",
-                f"**/*{app_name.lower()}*.*",
-                "**/icon.*",
-                "**/.DirIcon",
-                "**/*.svg",
-                "**/*.png",
-                "**/*.ico",
-            ]
-
-            for pattern in patterns:
-                for icon_path in directory.glob(pattern):
-                    if icon_path.is_file() or icon_path.is_symlink():
-                        # Resolve symlinks
-                        resolved_path = self._resolve_icon_path(icon_path)
-                        if resolved_path and resolved_path.exists():
-                            score = self._score_icon(resolved_path, app_name)
-                            if score > 0:  # Only include valid icons
-                                candidates.append(
-                                    {
-                                        "path": resolved_path,
-                                        "score": score,
-                                        "original_path": icon_path,
-                                    }
-                                )
-
-        except (OSError, PermissionError) as e:
-            logger.debug("Error scanning %s: %s", directory, e)
+            file_stat = resolved.stat()
+        except OSError:
+            return None
+        if (
+            not stat.S_ISREG(file_stat.st_mode)
+            or file_stat.st_size < self.MIN_ICON_SIZE_BYTES
+        ):
+            return None
+        score = self._score_name(resolved, app_name)
+        if score <= 0:
+            return None
+        return IconCandidate(resolved, score, self._icon_resolution(resolved))
 
-        return candidates
+    def _icon_resolution(self, icon_path: Path) -> int:
+        """Return the size of an icon's theme directory.
+
+        ``256x256`` yields 256 and ``scalable`` yields SCALABLE_RESOLUTION;
+        icons outside size directories yield 0.
+        """
+        for part in reversed(icon_path.parts[:-1]):
+            if part == "scalable":
+                return self.SCALABLE_RESOLUTION
+            match = self.RESOLUTION_PATTERN.match(part)
+            if match:
+                return int(match.group(1))
+        return 0
 
     def _resolve_icon_path(self, icon_path: Path) -> Path | None:
         """Resolve symlink to actual icon file.
@@ -344,20 +770,17 @@ class AppImageIconExtractor:
             logger.debug("Failed to resolve icon path %s: %s", icon_path, e)
             return None
 
-    def _score_icon(self, icon_path: Path, app_name: str) -> int:
-        """Score an icon based on simple format and name preferences.
+    def _score_name(self, icon_path: Path, app_name: str) -> int:
+        """Score an icon by its file name alone.
 
         Args:
             icon_path: Path to the icon file
             app_name: Application name for relevance scoring
 
         Returns:
-            Icon score (higher is better)
+            Format score plus name relevance bonus
 
         """
-        if not icon_path.exists():
-            return 0
-
         suffix = icon_path.suffix.lower()
         filename_stem = icon_path.stem.lower()
         app_name_lower = app_name.lower()
@@ -375,54 +798,8 @@ class AppImageIconExtractor:
         elif filename_stem in ["icon", "app"]:
             score += 10  # Generic names
 
-        # Simple size check - avoid tiny files
-        try:
-            file_size = icon_path.stat().st_size
-            if file_size < self.MIN_ICON_SIZE_BYTES:
-                return 0  # Skip very small files entirely
-        except OSError:
-            return 0  # Skip files we can't read
-
         return score
 
-    def _select_best_icon(
-        self, candidates: list[dict[str, int | Path]]
-    ) -> dict[str, int | Path]:
-        """Select the best icon from candidates.
-
-        Args:
-            candidates: List of candidate icon dictionaries
-
-        Returns:
-            Best icon dictionary
-
-        """
-        if not candidates:
-            msg = "No icon candidates available"
-            raise IconExtractionError(msg)
-
-        # Sort by score (highest first)
-        def get_score(candidate: dict[str, int | Path]) -> int:
-            score = candidate["score"]
-            if not isinstance(score, int):
-                msg = "Invalid score type"
-                raise TypeError(msg)
-            return score
-
-        candidates.sort(key=get_score, reverse=True)
-
-        # Log top candidates for debugging
-        logger.debug("Icon candidates (top 5):")
-        for i, candidate in enumerate(candidates[:5]):
-            logger.debug(
-                "  %d. %s (score: %s)",
-                i + 1,
-                candidate["path"],
-                candidate["score"],
-            )
-
-        return candidates[0]
-
     async def _copy_icon(self, source: Path, dest: Path) -> Path:
         """Copy icon to final destination.
 
@@ -0,0 +1,345 @@
+"""Persistent cache of icons extracted from AppImages.
+
+Every extracted icon is recorded with the SHA-256 digest of the AppImage
+it came from and with the path, size and digest of the chosen icon inside
+the AppImage's squashfs image. When an update installs an AppImage that
+was seen before, or whose icon at the recorded path still has the same
+bytes, the icon already in the icon directory is reused instead of
+extracting and scoring icons again.
+
+Entries live in one SQLite database (``cache/icons/icons.db``). Icons are
+keyed by their installed path, so each app has at most one entry, and
+only the most recent AppImage digests are kept for each icon.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from my_unicorn.constants import ICON_CACHE_DIRNAME
+from my_unicorn.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from my_unicorn.types import GlobalConfig
+
+logger = get_logger(__name__)
+
+ICON_CACHE_DB_NAME = "icons.db"
+
+# AppImage digests remembered per icon; older ones are evicted
+ICON_CACHE_MAX_APPIMAGES = 5
+
+_SCHEMA = """
+PRAGMA foreign_keys = ON;
+CREATE TABLE IF NOT EXISTS icons (
+    icon_file TEXT PRIMARY KEY,
+    image_path TEXT NOT NULL,
+    icon_size INTEGER NOT NULL,
+    icon_sha256 TEXT NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS appimages (
+    appimage_sha256 TEXT NOT NULL,
+    icon_file TEXT NOT NULL
+        REFERENCES icons (icon_file) ON DELETE CASCADE,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (appimage_sha256, icon_file)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS appimages_icon_file
+    ON appimages (icon_file, used_at);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedIcon:
+    """An installed icon and the squashfs file it was extracted from."""
+
+    icon_file: Path
+    image_path: str
+    icon_size: int
+    icon_sha256: str
+
+
+def icon_digest(data: bytes) -> str:
+    """Return the SHA-256 hex digest of icon bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class IconCache:
+    """SQLite index of extracted icons.
+
+    Database errors are logged and treated as cache misses, so a broken
+    cache never prevents icon extraction.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+
+        """
+        self.cache_dir = cache_dir
+        self.db_path = cache_dir / ICON_CACHE_DB_NAME
+        self._database_ready = False
+
+    @classmethod
+    def from_global_config(
+        cls, global_config: GlobalConfig
+    ) -> IconCache | None:
+        """Create the cache inside the configured cache directory.
+
+        Args:
+            global_config: Global configuration
+
+        Returns:
+            IconCache instance, or None if no cache directory is configured
+
+        """
+        cache_dir = global_config["directory"].get("cache")
+        if not cache_dir:
+            return None
+        return cls(Path(cache_dir) / ICON_CACHE_DIRNAME)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the cache database for one transaction."""
+        if not self._database_ready:
+            self._init_database()
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            connection.execute("PRAGMA foreign_keys = ON")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _init_database(self) -> None:
+        """Create the schema, replacing an unreadable database."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self._create_schema()
+        except sqlite3.DatabaseError as e:
+            if isinstance(e, sqlite3.OperationalError):
+                raise
+            logger.warning("Icon cache database corrupted, resetting: %s", e)
+            self.db_path.unlink(missing_ok=True)
+            self._create_schema()
+        self._database_ready = True
+
+    def _create_schema(self) -> None:
+        """Create the cache tables and indexes if they do not exist."""
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            connection.executescript(_SCHEMA)
+        finally:
+            connection.close()
+
+    def get(self, icon_file: Path) -> CachedIcon | None:
+        """Return the entry of an installed icon.
+
+        Args:
+            icon_file: Path of the icon in the icon directory
+
+        Returns:
+            Cached entry, or None if the icon is not cached
+
+        """
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT image_path, icon_size, icon_sha256 FROM icons "
+                    "WHERE icon_file = ?",
+                    (str(icon_file),),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Failed to read icon cache: %s", e)
+            return None
+        if row is None:
+            return None
+        return CachedIcon(icon_file, *row)
+
+    def is_installed(self, entry: CachedIcon) -> bool:
+        """Check that the cached icon file still holds the cached bytes.
+
+        Args:
+            entry: Cached entry
+
+        Returns:
+            True if the icon file exists unmodified
+
+        """
+        try:
+            if entry.icon_file.stat().st_size != entry.icon_size:
+                return False
+            data = entry.icon_file.read_bytes()
+        except OSError:
+            return False
+        return icon_digest(data) == entry.icon_sha256
+
+    def has_appimage(self, appimage_sha256: str, icon_file: Path) -> bool:
+        """Check whether an AppImage's icon was already installed.
+
+        Args:
+            appimage_sha256: SHA-256 hex digest of the AppImage
+            icon_file: Path of the icon in the icon directory
+
+        Returns:
+            True if the icon was extracted from this AppImage before
+
+        """
+        try:
+            with self._connect() as connection:
+                updated = connection.execute(
+                    "UPDATE appimages SET used_at = ? "
+                    "WHERE appimage_sha256 = ? AND icon_file = ?",
+                    (time.time(), appimage_sha256.lower(), str(icon_file)),
+                ).rowcount
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Failed to read icon cache: %s", e)
+            return False
+        return updated > 0
+
+    def record(
+        self,
+        icon_file: Path,
+        image_path: str,
+        icon_sha256: str,
+        icon_size: int,
+        appimage_sha256: str | None = None,
+    ) -> None:
+        """Record an installed icon and the AppImage it came from.
+
+        Args:
+            icon_file: Path of the icon in the icon directory
+            image_path: Path of the icon inside the squashfs image
+            icon_sha256: SHA-256 hex digest of the icon
+            icon_size: Icon size in bytes
+            appimage_sha256: SHA-256 hex digest of the AppImage, if known
+
+        """
+        now = time.time()
+        key = str(icon_file)
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT icon_sha256 FROM icons WHERE icon_file = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and row[0] != icon_sha256:
+                    # AppImages of the old icon no longer map to this file
+                    connection.execute(
+                        "DELETE FROM appimages WHERE icon_file = ?", (key,)
+                    )
+                connection.execute(
+                    "INSERT INTO icons VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (icon_file) DO UPDATE SET "
+                    "image_path = excluded.image_path, "
+                    "icon_size = excluded.icon_size, "
+                    "icon_sha256 = excluded.icon_sha256, "
+                    "updated_at = excluded.updated_at",
+                    (key, image_path, icon_size, icon_sha256, now),
+                )
+                if appimage_sha256:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO appimages VALUES (?, ?, ?)",
+                        (appimage_sha256.lower(), key, now),
+                    )
+                connection.execute(
+                    "DELETE FROM appimages WHERE icon_file = ? AND "
+                    "appimage_sha256 NOT IN (SELECT appimage_sha256 "
+                    "FROM appimages WHERE icon_file = ? "
+                    "ORDER BY used_at DESC LIMIT ?)",
+                    (key, key, ICON_CACHE_MAX_APPIMAGES),
+                )
+                self._evict_missing(connection)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to update icon cache: %s", e)
+
+    def _evict_missing(self, connection: sqlite3.Connection) -> int:
+        """Remove entries of icons deleted from the icon directory."""
+        missing = [
+            (icon_file,)
+            for (icon_file,) in connection.execute(
+                "SELECT icon_file FROM icons"
+            )
+            if not Path(icon_file).exists()
+        ]
+        connection.executemany(
+            "DELETE FROM icons WHERE icon_file = ?", missing
+        )
+        if missing:
+            logger.debug("Evicted %d missing icons from cache", len(missing))
+        return len(missing)
+
+    def evict_missing(self) -> int:
+        """Remove entries whose icon file no longer exists.
+
+        Returns:
+            Number of icon entries removed
+
+        """
+        try:
+            with self._connect() as connection:
+                return self._evict_missing(connection)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to evict icon cache entries: %s", e)
+            return 0
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of icon entries removed
+
+        """
+        try:
+            with self._connect() as connection:
+                removed = connection.execute("DELETE FROM icons").rowcount
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to clear icon cache: %s", e)
+            return 0
+        logger.debug("Cleared %d icon cache entries", removed)
+        return removed
+
+    def get_stats(self) -> dict[str, int | str]:
+        """Get icon cache statistics.
+
+        Returns:
+            Dictionary with the number of icons, AppImages and icon bytes
+            indexed, and icons whose file is missing
+
+        """
+        stats: dict[str, int | str] = {
+            "cache_directory": str(self.cache_dir),
+            "icons": 0,
+            "appimages": 0,
+            "icon_bytes": 0,
+            "missing_icons": 0,
+        }
+        try:
+            with self._connect() as connection:
+                rows = connection.execute(
+                    "SELECT icon_file, icon_size FROM icons"
+                ).fetchall()
+                (appimages,) = connection.execute(
+                    "SELECT COUNT(*) FROM appimages"
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            stats["error"] = str(e)
+            return stats
+        stats["icons"] = len(rows)
+        stats["appimages"] = appimages
+        stats["icon_bytes"] = sum(size for _, size in rows)
+        stats["missing_icons"] = sum(
+            1 for icon_file, _ in rows if not Path(icon_file).exists()
+        )
+        return stats
@@ -38,7 +38,7 @@ from my_unicorn.exceptions import (
     InstallError,
     VerificationError,
 )
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
 from my_unicorn.utils.appimage_utils import select_best_appimage_asset
 from my_unicorn.utils.error_formatters import build_install_error_result
 from my_unicorn.utils.github_utils import parse_github_url
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
     import aiohttp
 
     from my_unicorn.config import ConfigManager
+    from my_unicorn.types import GlobalConfig
 
 
 logger = get_logger(__name__)
@@ -238,15 +239,27 @@ async def install_workflow(
         source,
     )
 
+    checksum_prefetch = None
     try:
+        github_config = get_github_config(app_config)
+        if verify:
+            # Fetch the checksum file while the AppImage downloads
+            checksum_prefetch = post_download_processor.prefetch_checksums(
+                app_name=app_name,
+                asset=asset,
+                release=release,
+                app_config=app_config,
+                catalog_entry=None,
+                owner=github_config.owner,
+                repo=github_config.repo,
+            )
+
         download_path = download_dir / asset.name
         logger.info("Downloading %s", app_name)
         downloaded_path = await download_service.download_appimage(
             asset, download_path
         )
 
-        github_config = get_github_config(app_config)
-
         context = PostDownloadContext(
             app_name=app_name,
             downloaded_path=downloaded_path,
@@ -259,6 +272,10 @@ async def install_workflow(
             repo=github_config.repo,
             verify_downloads=verify,
             source=source,
+            precomputed_hashes=download_service.pop_computed_digests(
+                downloaded_path
+            ),
+            checksum_prefetch=checksum_prefetch,
         )
 
         result = await post_download_processor.process(context)
@@ -297,6 +314,9 @@ async def install_workflow(
             },
             cause=error,
         ) from error
+    finally:
+        if checksum_prefetch is not None:
+            checksum_prefetch.close()
 
 
 # ---------------------------------------------------------------------------
@@ -613,6 +633,8 @@ class InstallHandler:
         github_client: GitHub API client for release fetching.
         progress_reporter: Progress reporter for tracking installation steps.
         post_download_processor: Processor for post-download workflow.
+        global_config: Global configuration snapshot, loaded through
+            config_manager when not injected.
 
     Thread Safety:
         Each install operation should use a separate InstallHandler instance
@@ -636,6 +658,7 @@ class InstallHandler:
         github_client: GitHubClient,
         post_download_processor: PostDownloadProcessor,
         progress_reporter: ProgressReporter | None = None,
+        global_config: GlobalConfig | None = None,
     ) -> None:
         self.download_service = download_service
         self.storage_service = storage_service
@@ -643,19 +666,22 @@ class InstallHandler:
         self.github_client = github_client
         self.progress_reporter = progress_reporter or NullProgressReporter()
         self.post_download_processor = post_download_processor
+        self.global_config = global_config
 
     # ------------------------------------------------------------------
     # Factory
     # ------------------------------------------------------------------
 
     @classmethod
-    def create_default(
+    def create_default(  # noqa: PLR0913
         cls,
         session: aiohttp.ClientSession,
         config_manager: ConfigManager,
         github_client: GitHubClient,
         install_dir: Path,
         progress_reporter: ProgressReporter | None = None,
+        *,
+        global_config: GlobalConfig | None = None,
     ) -> InstallHandler:
         """Create an InstallHandler with sensible default dependencies.
 
@@ -665,6 +691,7 @@ class InstallHandler:
             github_client: Authenticated GitHub client.
             install_dir: Directory where AppImages will be stored.
             progress_reporter: Optional UI progress reporter.
+            global_config: Optional global configuration snapshot.
 
         Returns:
             Fully configured InstallHandler.
@@ -677,6 +704,7 @@ class InstallHandler:
             storage_service=storage_service,
             config_manager=config_manager,
             progress_reporter=progress_reporter,
+            global_config=global_config,
         )
         return cls(
             download_service=download_service,
@@ -685,6 +713,7 @@ class InstallHandler:
             github_client=github_client,
             post_download_processor=post_download_processor,
             progress_reporter=progress_reporter,
+            global_config=global_config,
         )
 
     # ------------------------------------------------------------------
@@ -762,7 +791,9 @@ class InstallHandler:
             List of result dicts, one per app/URL.
 
         """
-        global_config = self.config_manager.load_global_config()
+        global_config = (
+            self.global_config or self.config_manager.load_global_config()
+        )
         concurrent = options.get(
             "concurrent",
             global_config["max_concurrent_downloads"],
@@ -770,7 +801,7 @@ class InstallHandler:
         semaphore = asyncio.Semaphore(int(concurrent))
 
         async def install_one(app_or_url: str, is_url: bool) -> dict[str, Any]:
-            async with semaphore:
+            async with semaphore, timing_span("install", app=app_or_url):
                 try:
                     if is_url:
                         return await self.install_from_url(
@@ -13,20 +13,27 @@ from typing import Any
 from my_unicorn.config import ConfigManager
 from my_unicorn.core.api import Asset, Release
 from my_unicorn.core.backup import BackupService
+from my_unicorn.core.blob_store import BlobStore
+from my_unicorn.core.checksum_prefetch import ChecksumPrefetch
 from my_unicorn.core.download import DownloadService
 from my_unicorn.core.file_ops import FileOperations
+from my_unicorn.core.icon_cache import IconCache
 from my_unicorn.core.protocols.progress import (
     NullProgressReporter,
     ProgressReporter,
 )
 from my_unicorn.core.verify import VerificationService
 from my_unicorn.logger import get_logger
+from my_unicorn.types import GlobalConfig
 from my_unicorn.utils.appimage_setup import (
     create_desktop_entry,
     rename_appimage,
     setup_appimage_icon,
 )
-from my_unicorn.utils.appimage_utils import verify_appimage_download
+from my_unicorn.utils.appimage_utils import (
+    start_checksum_prefetch,
+    verify_appimage_download,
+)
 from my_unicorn.utils.config_builders import (
     create_app_config_v2,
     get_stored_hash,
@@ -62,6 +69,10 @@ class PostDownloadContext:
         repo: GitHub repository name.
         verify_downloads: Whether to verify downloaded file hash.
         source: Installation source ("catalog" or "url").
+        precomputed_hashes: Digests computed while downloading, keyed by
+            algorithm name, so verification can skip re-reading the file.
+        checksum_prefetch: Checksum file fetched while downloading, from
+            PostDownloadProcessor.prefetch_checksums().
 
     """
 
@@ -76,6 +87,8 @@ class PostDownloadContext:
     repo: str
     verify_downloads: bool = True
     source: str = "catalog"  # "catalog" or "url"
+    precomputed_hashes: dict[str, str] | None = None
+    checksum_prefetch: ChecksumPrefetch | None = None
 
 
 @dataclass
@@ -162,6 +175,7 @@ class PostDownloadProcessor:
         verification_service: VerificationService | None = None,
         backup_service: BackupService | None = None,
         progress_reporter: ProgressReporter | None = None,
+        global_config: GlobalConfig | None = None,
     ) -> None:
         """Initialize post-download processor.
 
@@ -172,6 +186,8 @@ class PostDownloadProcessor:
             verification_service: Optional verification service
             backup_service: Optional backup service (required for updates)
             progress_reporter: Optional progress reporter for tracking
+            global_config: Optional global configuration snapshot
+                (loaded once from config_manager if None)
 
         """
         self.download_service = download_service
@@ -181,6 +197,14 @@ class PostDownloadProcessor:
         self.backup_service = backup_service
         # Apply null object pattern for progress reporter
         self.progress_reporter = progress_reporter or NullProgressReporter()
+        self._global_config = global_config
+
+    @property
+    def global_config(self) -> GlobalConfig:
+        """Global configuration, loaded at most once per processor."""
+        if self._global_config is None:
+            self._global_config = self.config_manager.load_global_config()
+        return self._global_config
 
     async def process(
         self, context: PostDownloadContext
@@ -285,6 +309,48 @@ class PostDownloadProcessor:
                 error=str(error),
             )
 
+    def prefetch_checksums(  # noqa: PLR0913
+        self,
+        *,
+        app_name: str,
+        asset: Asset,
+        release: Release,
+        app_config: dict[str, Any],
+        catalog_entry: dict[str, Any] | None,
+        owner: str,
+        repo: str,
+    ) -> ChecksumPrefetch | None:
+        """Start fetching the checksum file before the download finishes.
+
+        Call this as soon as the release is known and pass the result as
+        PostDownloadContext.checksum_prefetch, so verification only has
+        to compare hashes once the AppImage is on disk. The caller closes
+        the prefetch when processing is done.
+
+        Args:
+            app_name: Name of the application being downloaded
+            asset: GitHub asset being downloaded
+            release: GitHub release information
+            app_config: Application configuration dictionary (v2 format)
+            catalog_entry: Catalog entry if installed from catalog
+            owner: GitHub repository owner
+            repo: GitHub repository name
+
+        Returns:
+            The running prefetch, or None when there is nothing to fetch
+
+        """
+        return start_checksum_prefetch(
+            asset=asset,
+            release=release,
+            app_name=app_name,
+            verification_service=self._get_verification_service(),
+            verification_config=app_config.get("verification"),
+            catalog_entry=catalog_entry,
+            owner=owner,
+            repo=repo,
+        )
+
     async def _setup_progress_tracking(
         self, app_name: str, with_verification: bool
     ) -> tuple[str | None, str | None]:
@@ -332,28 +398,32 @@ class PostDownloadProcessor:
         if not context.verify_downloads:
             return None
 
-        # Lazy initialization of verification service
-        if self._verification_service is None:
-            progress_reporter = getattr(
-                self.download_service, "progress_reporter", None
-            )
-            self._verification_service = VerificationService(
-                self.download_service, progress_reporter
-            )
-
         return await verify_appimage_download(
             file_path=context.downloaded_path,
             asset=context.asset,
             release=context.release,
             app_name=context.app_name,
-            verification_service=self._verification_service,
+            verification_service=self._get_verification_service(),
             verification_config=context.app_config.get("verification"),
             catalog_entry=context.catalog_entry,
             owner=context.owner,
             repo=context.repo,
             progress_task_id=verification_task_id,
+            precomputed_hashes=context.precomputed_hashes,
+            checksum_prefetch=context.checksum_prefetch,
         )
 
+    def _get_verification_service(self) -> VerificationService:
+        """Return the verification service, creating it on first use."""
+        if self._verification_service is None:
+            progress_reporter = getattr(
+                self.download_service, "progress_reporter", None
+            )
+            self._verification_service = VerificationService(
+                self.download_service, progress_reporter
+            )
+        return self._verification_service
+
     async def _install_and_rename(self, context: PostDownloadContext) -> Path:
         """Move AppImage to install directory and rename.
 
@@ -380,8 +450,29 @@ class PostDownloadProcessor:
         )
 
         logger.debug("Installed to path: %s", appimage_path)
+        self._store_installed_file(appimage_path, context.precomputed_hashes)
         return appimage_path
 
+    def _store_installed_file(
+        self, install_path: Path, digests: dict[str, str] | None
+    ) -> None:
+        """Link the installed AppImage into the blob store.
+
+        Uses the SHA-256 digest computed while downloading, so later
+        backups of this install neither copy nor rehash it.
+
+        Args:
+            install_path: Path of the installed AppImage
+            digests: Digests computed while downloading, if available
+
+        """
+        sha256 = (digests or {}).get("sha256")
+        if not sha256:
+            return
+        blob_store = BlobStore.from_global_config(self.global_config)
+        if blob_store is not None:
+            blob_store.add(install_path, sha256)
+
     async def _setup_icon(
         self, context: PostDownloadContext, install_path: Path
     ) -> dict[str, Any]:
@@ -396,7 +487,7 @@ class PostDownloadProcessor:
 
         """
         logger.info("Extracting icon for %s", context.app_name)
-        global_config = self.config_manager.load_global_config()
+        global_config = self.global_config
         icon_dir = Path(global_config["directory"]["icon"])
 
         return await setup_appimage_icon(
@@ -405,6 +496,8 @@ class PostDownloadProcessor:
             icon_dir=icon_dir,
             app_config=context.app_config,
             catalog_entry=context.catalog_entry,
+            icon_cache=IconCache.from_global_config(global_config),
+            appimage_digest=(context.precomputed_hashes or {}).get("sha256"),
         )
 
     async def _create_or_update_config(
@@ -501,6 +594,7 @@ class PostDownloadProcessor:
                 app_name=context.app_name,
                 icon_result=icon_result,
                 config_manager=self.config_manager,
+                global_config=self.global_config,
             )
         except Exception as e:
             logger.warning(
@@ -11,18 +11,29 @@ Design notes:
 - Timing: Uses `time.monotonic()` for intervals to handle system clock changes.
 - Output: Supports TTY detection, cursor control, and debounced
     non-interactive output.
+- Incremental rendering: Every task carries a version bumped on each
+    change. Frames where no task changed (and no spinner advanced) are
+    skipped, formatted lines of unchanged tasks are reused, and in
+    interactive mode only the lines that differ from the previous frame
+    are rewritten using cursor addressing.
+- Counters: Downloads may report through a `ProgressCounter` they
+    increment without awaiting or locking. Each render tick copies the
+    counter values into their tasks and derives the speed from a ring
+    buffer of (time, completed) samples.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import shutil
 import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import TextIO
+from typing import TYPE_CHECKING, TextIO
 
 from my_unicorn.constants import APPIMAGE_SUFFIX
 from my_unicorn.logger import get_logger
@@ -37,6 +48,7 @@ from my_unicorn.utils.progress_utils import (
 
 from .progress_types import (
     DEFAULT_BAR_WIDTH,
+    DEFAULT_MAX_SPEED_HISTORY,
     DEFAULT_MIN_NAME_WIDTH,
     DEFAULT_SPINNER_FPS,
     OPERATION_NAMES,
@@ -46,6 +58,11 @@ from .progress_types import (
     TaskState,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+    from my_unicorn.core.protocols.progress import ProgressCounter
+
 logger = get_logger(__name__)
 
 
@@ -143,6 +160,9 @@ class AsciiProgressBackend:
             cfg, "min_name_width", DEFAULT_MIN_NAME_WIDTH
         )
         self._spinner_fps = getattr(cfg, "spinner_fps", DEFAULT_SPINNER_FPS)
+        self._speed_samples = getattr(
+            cfg, "max_speed_history", DEFAULT_MAX_SPEED_HISTORY
+        )
 
         # Create section render config for delegated rendering functions
         self._section_config = SectionRenderConfig(
@@ -159,6 +179,20 @@ class AsciiProgressBackend:
         # (writers may be called from non-async contexts)
         self._sync_lock = threading.Lock()
 
+        # Incremental rendering state: the state version bumped by every
+        # task change, the version and spinner frame of the last rendered
+        # frame, and the formatted lines of each task
+        self._state_version = 0
+        self._rendered_version = -1
+        self._rendered_spinner_frame: int | None = None
+        self._line_cache = TaskLineCache()
+
+        # Counters of tasks reporting without update_task(), with a ring
+        # buffer of (monotonic time, completed) samples for the speed
+        self._counters: dict[
+            str, tuple[ProgressCounter, deque[tuple[float, float]]]
+        ] = {}
+
         # Terminal writer for managing output
         self._writer = TerminalWriter(self.output, self.interactive)
 
@@ -197,6 +231,7 @@ class AsciiProgressBackend:
         )
         # Protect modifications with sync lock
         with self._sync_lock:
+            self._touch(task)
             self.tasks[task_id] = task
             if task_id not in self._task_order:
                 self._task_order.append(task_id)
@@ -237,6 +272,44 @@ class AsciiProgressBackend:
             if speed is not None:
                 task.speed = speed
             task.last_update = time.monotonic()
+            self._touch(task)
+
+    def attach_counter(self, task_id: str, counter: ProgressCounter) -> None:
+        """Read the progress of a task from a counter on every render.
+
+        The counter is detached when the task finishes.
+
+        Args:
+            task_id: Task identifier
+            counter: Counter incremented by the task's producer
+
+        """
+        samples: deque[tuple[float, float]] = deque(
+            maxlen=max(2, self._speed_samples)
+        )
+        samples.append((time.monotonic(), counter.completed))
+        with self._sync_lock:
+            self._counters[task_id] = (counter, samples)
+
+    def _poll_counters(self) -> None:
+        """Copy counter values into their tasks.
+
+        The speed is the average over the sampled window. The caller holds
+        ``_sync_lock``.
+        """
+        now = time.monotonic()
+        for task_id, (counter, samples) in self._counters.items():
+            task = self.tasks.get(task_id)
+            completed = counter.completed
+            if task is None or completed == task.completed:
+                continue
+            samples.append((now, completed))
+            first_time, first_completed = samples[0]
+            if now > first_time:
+                task.speed = (completed - first_completed) / (now - first_time)
+            task.completed = completed
+            task.last_update = now
+            self._touch(task)
 
     def finish_task(
         self,
@@ -254,6 +327,7 @@ class AsciiProgressBackend:
         """
         # Protect read/modify of shared state
         with self._sync_lock:
+            self._counters.pop(task_id, None)
             if task_id not in self.tasks:
                 logger.warning(
                     "Attempted to finish non-existent task: %s", task_id
@@ -269,6 +343,28 @@ class AsciiProgressBackend:
                     task.error_message = description
                 task.description = description
             task.last_update = time.monotonic()
+            self._touch(task)
+
+    def _touch(self, task: TaskState) -> None:
+        """Record a change of a task; the caller holds ``_sync_lock``."""
+        self._state_version += 1
+        task.version = self._state_version
+
+    def _spinner_frame(self) -> int:
+        """Return the index of the current spinner frame."""
+        return int(time.monotonic() * self._spinner_fps)
+
+    def _frame_changed(self) -> bool:
+        """Return whether the next frame can differ from the last one.
+
+        The caller holds ``_sync_lock``.
+        """
+        if self._state_version != self._rendered_version:
+            return True
+        return (
+            self._rendered_spinner_frame is not None
+            and self._spinner_frame() != self._rendered_spinner_frame
+        )
 
     def _build_output(self) -> str:
         """Build complete output string.
@@ -297,8 +393,14 @@ class AsciiProgressBackend:
         to update the display.
         """
         async with self._lock:
-            # Snapshot shared state quickly under sync lock
+            # Snapshot shared state quickly under sync lock, unless nothing
+            # changed since the last frame
             with self._sync_lock:
+                if self._counters:
+                    self._poll_counters()
+                if not self._frame_changed():
+                    return
+                version = self._state_version
                 tasks_snapshot = dict(self.tasks)
                 order_snapshot = list(self._task_order)
                 written_snapshot = set(self._writer._written_sections)  # noqa: SLF001
@@ -307,12 +409,18 @@ class AsciiProgressBackend:
             output = self._build_output_from_snapshot(
                 tasks_snapshot, order_snapshot
             )
+            self._rendered_version = version
+            self._rendered_spinner_frame = (
+                self._spinner_frame()
+                if has_spinner(tasks_snapshot.values())
+                else None
+            )
 
             if not output:
                 return
 
             if self.interactive:
-                lines_written = self._writer.write_interactive(output)
+                lines_written = self._writer.write_interactive_diff(output)
                 # Update writer state under sync lock
                 with self._sync_lock:
                     self._writer._last_output_lines = lines_written  # noqa: SLF001
@@ -339,9 +447,11 @@ class AsciiProgressBackend:
                     self.output.write(output + "\n")
                     self.output.flush()
                 self._writer._last_output_lines = 0  # noqa: SLF001
+                self._writer._last_lines = []  # noqa: SLF001
 
             # Reset written sections for next session
             self._writer._written_sections.clear()  # noqa: SLF001
+            self._rendered_version = -1
 
     def _build_output_from_snapshot(
         self, tasks_snapshot: dict[str, TaskState], order_snapshot: list[str]
@@ -358,16 +468,25 @@ class AsciiProgressBackend:
             Complete output string with all sections
 
         """
+        cache = self._line_cache
         lines: list[str] = []
-        lines.extend(render_api_section(tasks_snapshot, order_snapshot))
+        lines.extend(
+            render_api_section(tasks_snapshot, order_snapshot, cache=cache)
+        )
         lines.extend(
             render_downloads_section(
-                tasks_snapshot, order_snapshot, self._section_config
+                tasks_snapshot,
+                order_snapshot,
+                self._section_config,
+                cache=cache,
             )
         )
         lines.extend(
             render_processing_section(
-                tasks_snapshot, order_snapshot, self._section_config
+                tasks_snapshot,
+                order_snapshot,
+                self._section_config,
+                cache=cache,
             )
         )
         return "\n".join(lines)
@@ -384,6 +503,7 @@ class TerminalWriter:
         output: Output stream (typically sys.stdout or StringIO for tests)
         interactive: Whether to use interactive mode with cursor control
         _last_output_lines: Number of lines written (interactive mode)
+        _last_lines: Lines of the frame on screen (interactive mode)
         _written_sections: Set of section signatures written (non-interactive)
         _last_noninteractive_output: Cached output (non-interactive)
         _last_noninteractive_write_time: Last write timestamp (non-interactive)
@@ -402,6 +522,7 @@ class TerminalWriter:
 
         # State for interactive mode
         self._last_output_lines = 0
+        self._last_lines: list[str] = []
 
         # State for non-interactive mode
         self._written_sections: set[str] = set()
@@ -484,13 +605,83 @@ class TerminalWriter:
             # Return number of lines written and update writer state
             lines_written = len(lines)
             self._last_output_lines = lines_written
+            self._last_lines = lines
 
             return lines_written
 
         # Ensure last output lines is zero when nothing was written
         self._last_output_lines = 0
+        self._last_lines = []
         return 0
 
+    def write_interactive_diff(self, output: str) -> int:
+        """Write output in interactive mode, redrawing only changed lines.
+
+        When the frame has as many lines as the one on screen, the cursor
+        is moved to each changed line and only that line is rewritten.
+        When the line count differs, everything from the first changed
+        line down is redrawn. Falls back to write_interactive() when the
+        frame on screen is unknown.
+
+        Args:
+            output: Output string to write
+
+        Returns:
+            Number of lines on screen
+
+        """
+        lines = output.split("\n")
+        if lines and lines[-1] == "":
+            lines = lines[:-1]
+
+        previous = self._last_lines
+        if not previous or len(previous) != self._last_output_lines:
+            return self.write_interactive(output)
+        if lines == previous:
+            return len(lines)
+
+        if len(lines) == len(previous):
+            text = self._rewrite_changed_lines(previous, lines)
+        else:
+            text = self._redraw_from_first_change(previous, lines)
+        self._write_output_safe(text)
+        self._last_output_lines = len(lines)
+        self._last_lines = lines
+        return len(lines)
+
+    @staticmethod
+    def _rewrite_changed_lines(previous: list[str], lines: list[str]) -> str:
+        """Return escape sequences rewriting the lines that changed.
+
+        The cursor starts and ends on the row below the frame.
+        """
+        height = len(previous)
+        row = height
+        parts: list[str] = []
+        for index, (old, new) in enumerate(zip(previous, lines, strict=True)):
+            if old != new:
+                parts.append(f"{_move_cursor(row, index)}\r{new}\033[K")
+                row = index
+        parts.append(_move_cursor(row, height) + "\r")
+        return "".join(parts)
+
+    @staticmethod
+    def _redraw_from_first_change(
+        previous: list[str], lines: list[str]
+    ) -> str:
+        """Return escape sequences redrawing from the first changed line."""
+        first = 0
+        for old, new in zip(previous, lines, strict=False):
+            if old != new:
+                break
+            first += 1
+        text = ""
+        if first < len(previous):
+            text = f"\033[{len(previous) - first}A\r\033[J"
+        if lines[first:]:
+            text += "\n".join(lines[first:]) + "\n"
+        return text
+
     def write_noninteractive(
         self, output: str, known_sections: set[str] | None = None
     ) -> set[str]:
@@ -529,12 +720,97 @@ class TerminalWriter:
         return added_signatures
 
 
+def _move_cursor(row: int, target: int) -> str:
+    """Return the escape sequence moving the cursor between frame rows."""
+    if target < row:
+        return f"\033[{row - target}A"
+    if target > row:
+        return f"\033[{target - row}B"
+    return ""
+
+
+class TaskLineCache:
+    """Formatted lines of each task, reused while the task is unchanged.
+
+    Entries are keyed by task ID and hold the key the lines were built
+    for: the task version plus every other input of the formatter (name
+    width, spinner frame).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._lines: dict[str, tuple[Hashable, list[str]]] = {}
+
+    def get(
+        self,
+        task: TaskState,
+        key: Hashable,
+        build: Callable[[], list[str]],
+    ) -> list[str]:
+        """Return the lines of a task, building them if the key changed.
+
+        Args:
+            task: Task to format
+            key: Inputs the lines depend on besides the task version
+            build: Formats the task
+
+        Returns:
+            Formatted lines of the task
+
+        """
+        full_key = (task.version, key)
+        entry = self._lines.get(task.task_id)
+        if entry is not None and entry[0] == full_key:
+            return entry[1]
+        lines = build()
+        self._lines[task.task_id] = (full_key, lines)
+        return lines
+
+
+def _cached_lines(
+    cache: TaskLineCache | None,
+    task: TaskState,
+    key: Hashable,
+    build: Callable[[], list[str]],
+) -> list[str]:
+    """Format a task through the line cache when one is given."""
+    if cache is None:
+        return build()
+    return cache.get(task, key, build)
+
+
+def has_spinner(tasks: Iterable[TaskState]) -> bool:
+    """Return whether any task is rendered with an animated spinner.
+
+    Args:
+        tasks: Tasks of the frame
+
+    Returns:
+        True if an unfinished processing task is present
+    """
+    return any(
+        not task.is_finished and task.progress_type in PROCESSING_TYPES
+        for task in tasks
+    )
+
+
 # ASCII section rendering module.
 # Pure functions for rendering progress sections (API, downloads, processing).
 # These functions were extracted from AsciiProgressBackend to improve separation
 # of concerns and testability.
 
 
+# Progress types rendered in the processing section
+PROCESSING_TYPES = frozenset(
+    {
+        ProgressType.VERIFICATION,
+        ProgressType.ICON_EXTRACTION,
+        ProgressType.INSTALLATION,
+        ProgressType.UPDATE,
+    }
+)
+
+
 @dataclass(frozen=True, slots=True)
 class SectionRenderConfig:
     """Configuration for section rendering.
@@ -685,13 +961,10 @@ def compute_max_name_width(
         Maximum width needed for alignment
 
     """
-    max_name_width = 0
-    for display_name in display_names:
-        name_width = calculate_dynamic_name_width(interactive, min_name_width)
-        max_name_width = max(
-            max_name_width, min(name_width, len(display_name))
-        )
-    return max_name_width
+    if not display_names:
+        return 0
+    name_width = calculate_dynamic_name_width(interactive, min_name_width)
+    return min(name_width, max(len(name) for name in display_names))
 
 
 def format_download_lines(
@@ -817,12 +1090,14 @@ def format_processing_task_lines(
 def render_api_section(
     tasks: dict[str, TaskState],
     order: list[str],
+    cache: TaskLineCache | None = None,
 ) -> list[str]:
     """Render API fetching section.
 
     Args:
         tasks: Dictionary of all tasks
         order: List of task IDs in order
+        cache: Line cache reusing lines of unchanged tasks
 
     Returns:
         List of formatted output lines for API section
@@ -842,36 +1117,54 @@ def render_api_section(
     lines = ["Fetching from API:"]
     for task_id in api_tasks:
         task = tasks[task_id]
-        name = truncate_text(task.name, 18)
-
-        if task.total > 0:
-            completed = int(task.completed)
-            total = int(task.total)
-            if task.is_finished or completed >= total:
-                if "cached" in task.description.lower():
-                    status = f"{total}/{total} Retrieved from cache"
-                else:
-                    status = f"{total}/{total} Retrieved"
-            else:
-                status = f"{completed}/{total} Fetching..."
-        elif task.is_finished:
+        lines.extend(
+            _cached_lines(
+                cache, task, None, functools.partial(format_api_lines, task)
+            )
+        )
+
+    lines.append("")
+    return lines
+
+
+def format_api_lines(task: TaskState) -> list[str]:
+    """Format the line of an API fetching task.
+
+    Args:
+        task: TaskState to format
+
+    Returns:
+        List with the formatted output line
+
+    """
+    name = truncate_text(task.name, 18)
+
+    if task.total > 0:
+        completed = int(task.completed)
+        total = int(task.total)
+        if task.is_finished or completed >= total:
             if "cached" in task.description.lower():
-                status = "Retrieved from cache"
+                status = f"{total}/{total} Retrieved from cache"
             else:
-                status = "Retrieved"
+                status = f"{total}/{total} Retrieved"
+        else:
+            status = f"{completed}/{total} Fetching..."
+    elif task.is_finished:
+        if "cached" in task.description.lower():
+            status = "Retrieved from cache"
         else:
-            status = "Fetching..."
+            status = "Retrieved"
+    else:
+        status = "Fetching..."
 
-        lines.append(f"{name:20} {status}")
-
-    lines.append("")
-    return lines
+    return [f"{name:20} {status}"]
 
 
 def render_downloads_section(
     tasks: dict[str, TaskState],
     order: list[str],
     config: SectionRenderConfig,
+    cache: TaskLineCache | None = None,
 ) -> list[str]:
     """Render downloads section with progress bars.
 
@@ -879,6 +1172,7 @@ def render_downloads_section(
         tasks: Dictionary of all tasks
         order: List of task IDs in order
         config: SectionRenderConfig with rendering options
+        cache: Line cache reusing lines of unchanged tasks
 
     Returns:
         List of formatted output lines for downloads section
@@ -911,7 +1205,17 @@ def render_downloads_section(
     for task_id in download_tasks:
         task = tasks[task_id]
         lines.extend(
-            format_download_lines(task, max_name_width, config.bar_width)
+            _cached_lines(
+                cache,
+                task,
+                (max_name_width, config.bar_width),
+                functools.partial(
+                    format_download_lines,
+                    task,
+                    max_name_width,
+                    config.bar_width,
+                ),
+            )
         )
 
     lines.append("")
@@ -922,6 +1226,7 @@ def render_processing_section(
     tasks: dict[str, TaskState],
     order: list[str],
     config: SectionRenderConfig,
+    cache: TaskLineCache | None = None,
 ) -> list[str]:
     """Render installation/verification/post-processing section.
 
@@ -929,6 +1234,7 @@ def render_processing_section(
         tasks: Dictionary of all tasks
         order: List of task IDs in order
         config: SectionRenderConfig with rendering options
+        cache: Line cache reusing lines of unchanged tasks
 
     Returns:
         List of formatted output lines for processing section
@@ -938,14 +1244,7 @@ def render_processing_section(
         t
         for t in order
         # Use .get() to guard against order/tasks snapshot divergence,
-        if (task := tasks.get(t))
-        and task.progress_type
-        in (
-            ProgressType.VERIFICATION,
-            ProgressType.ICON_EXTRACTION,
-            ProgressType.INSTALLATION,
-            ProgressType.UPDATE,
-        )
+        if (task := tasks.get(t)) and task.progress_type in PROCESSING_TYPES
     ]
 
     if not post_tasks:
@@ -975,16 +1274,24 @@ def render_processing_section(
         app_name = task.name
         app_tasks.setdefault(app_name, []).append(task)
 
+    name_width = calculate_dynamic_name_width(
+        config.interactive, config.min_name_width
+    )
     for app_task_list in app_tasks.values():
         tasks_sorted = sorted(app_task_list, key=lambda t: t.phase)
 
-        name_width = calculate_dynamic_name_width(
-            config.interactive, config.min_name_width
-        )
-
         for task in tasks_sorted:
+            # The spinner only shows on unfinished tasks
+            key = (name_width, None if task.is_finished else spinner)
             lines.extend(
-                format_processing_task_lines(task, name_width, spinner)
+                _cached_lines(
+                    cache,
+                    task,
+                    key,
+                    functools.partial(
+                        format_processing_task_lines, task, name_width, spinner
+                    ),
+                )
             )
 
     lines.append("")
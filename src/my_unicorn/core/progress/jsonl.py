@@ -0,0 +1,309 @@
+"""JSON lines progress backend for unattended runs.
+
+This module provides a drop-in alternative to `AsciiProgressBackend` that
+writes one compact JSON object per line instead of rendering text, so
+timers, CI jobs and log collectors can consume progress without parsing
+terminal output.
+
+Events (every event carries ``event``, ``time`` and ``task``):
+- ``added``: a task was created (``name``, ``type``, ``total``)
+- ``progress``: a task advanced (``completed``, ``total``, and ``speed``
+    in bytes per second for downloads). Emitted from the render loop at
+    most once per ``ProgressConfig.event_interval`` per task, and only if
+    the task advanced since its previous event.
+- ``finished``: a task succeeded (``completed``, ``total``, ``elapsed``
+    and the average ``speed`` for downloads)
+- ``error``: a task failed (same fields as ``finished`` plus ``error``)
+
+Design notes:
+- Speed is measured between consecutive events of a task, so no sample
+    history is kept and no formatting work happens between events.
+- Output goes to stdout or to a path opened on the first event, e.g. a
+    FIFO read by a metrics collector. Opening a FIFO blocks until it has
+    a reader. The CLI moves console logging to stderr in jsonl mode, so
+    stdout holds nothing but events.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TextIO
+
+import orjson
+
+from my_unicorn.logger import get_logger
+
+from .progress_types import (
+    DEFAULT_EVENT_INTERVAL,
+    ProgressConfig,
+    ProgressType,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from my_unicorn.core.protocols.progress import ProgressCounter
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class _TaskStream:
+    """Event state of a single task."""
+
+    task_id: str
+    name: str
+    progress_type: ProgressType
+    total: float
+    started_at: float
+    completed: float = 0.0
+    counter: ProgressCounter | None = None
+    # Monotonic time and completed units of the task's last event
+    emitted_at: float = 0.0
+    emitted_completed: float = 0.0
+
+    def current(self) -> float:
+        """Return the completed units, preferring the attached counter."""
+        if self.counter is not None:
+            return max(self.completed, self.counter.completed)
+        return self.completed
+
+
+class JsonlProgressBackend:
+    """Progress backend writing rate-limited JSON lines events.
+
+    Implements the same interface as `AsciiProgressBackend` so
+    `ProgressDisplay` can use either one.
+    """
+
+    def __init__(
+        self,
+        output: TextIO | None = None,
+        output_path: Path | None = None,
+        config: ProgressConfig | None = None,
+    ) -> None:
+        """Initialize JSON lines progress backend.
+
+        Args:
+            output: Output stream (defaults to sys.stdout unless
+                `output_path` is given)
+            output_path: File or FIFO to append events to, opened on the
+                first event and closed by cleanup()
+            config: Optional `ProgressConfig` (the event interval is taken
+                from `config`)
+
+        """
+        self.output = output
+        self.output_path = output_path
+        cfg = config or ProgressConfig()
+        self._event_interval = getattr(
+            cfg, "event_interval", DEFAULT_EVENT_INTERVAL
+        )
+
+        self.tasks: dict[str, _TaskStream] = {}
+        # Synchronous lock to protect task state from sync writers
+        self._sync_lock = threading.Lock()
+        # Serializes writes so events are never interleaved
+        self._write_lock = threading.Lock()
+        self._owned_output: TextIO | None = None
+
+    def add_task(  # noqa: PLR0913
+        self,
+        task_id: str,
+        name: str,
+        progress_type: ProgressType,
+        total: float = 0.0,
+        parent_task_id: str | None = None,  # noqa: ARG002
+        phase: int = 1,  # noqa: ARG002
+        total_phases: int = 1,  # noqa: ARG002
+    ) -> None:
+        """Add a new task and emit its ``added`` event.
+
+        Args:
+            task_id: Unique task identifier
+            name: Task name
+            progress_type: Type of progress operation
+            total: Total units for the task
+            parent_task_id: Parent task ID (unused)
+            phase: Current phase number (unused)
+            total_phases: Total number of phases (unused)
+
+        """
+        now = time.monotonic()
+        with self._sync_lock:
+            self.tasks[task_id] = _TaskStream(
+                task_id=task_id,
+                name=name,
+                progress_type=progress_type,
+                total=total,
+                started_at=now,
+                emitted_at=now,
+            )
+        self._emit(
+            {
+                "event": "added",
+                "time": time.time(),
+                "task": task_id,
+                "name": name,
+                "type": progress_type.name.lower(),
+                "total": total,
+            }
+        )
+
+    def update_task(
+        self,
+        task_id: str,
+        completed: float | None = None,
+        total: float | None = None,
+        description: str | None = None,  # noqa: ARG002
+        speed: float | None = None,  # noqa: ARG002
+    ) -> None:
+        """Record task progress; events are emitted by render_once().
+
+        Args:
+            task_id: Task identifier
+            completed: Completed units (if updating)
+            total: Total units (if updating)
+            description: Task description (unused)
+            speed: Download speed (unused, measured between events)
+
+        """
+        with self._sync_lock:
+            task = self.tasks.get(task_id)
+            if task is None:
+                logger.warning(
+                    "Attempted to update non-existent task: %s", task_id
+                )
+                return
+            if completed is not None:
+                task.completed = completed
+            if total is not None:
+                task.total = total
+
+    def attach_counter(self, task_id: str, counter: ProgressCounter) -> None:
+        """Read the progress of a task from a counter on every render.
+
+        Args:
+            task_id: Task identifier
+            counter: Counter incremented by the task's producer
+
+        """
+        with self._sync_lock:
+            task = self.tasks.get(task_id)
+            if task is not None:
+                task.counter = counter
+
+    def finish_task(
+        self,
+        task_id: str,
+        success: bool = True,  # noqa: FBT001, FBT002
+        description: str | None = None,
+    ) -> None:
+        """Emit the ``finished`` or ``error`` event of a task.
+
+        Args:
+            task_id: Task identifier
+            success: Whether the task succeeded
+            description: Final description (reported as the error if the
+                task failed)
+
+        """
+        with self._sync_lock:
+            task = self.tasks.pop(task_id, None)
+        if task is None:
+            logger.warning(
+                "Attempted to finish non-existent task: %s", task_id
+            )
+            return
+
+        now = time.monotonic()
+        completed = task.current()
+        elapsed = now - task.started_at
+        event: dict[str, object] = {
+            "event": "finished" if success else "error",
+            "time": time.time(),
+            "task": task_id,
+            "completed": completed,
+            "total": task.total,
+            "elapsed": round(elapsed, 3),
+        }
+        if task.progress_type == ProgressType.DOWNLOAD:
+            event["speed"] = completed / elapsed if elapsed > 0 else 0.0
+        if not success:
+            event["error"] = description or ""
+        self._emit(event)
+
+    async def render_once(self) -> None:
+        """Emit ``progress`` events of tasks that advanced.
+
+        Called by the render loop; each task gets at most one event per
+        event interval.
+        """
+        now = time.monotonic()
+        events: list[dict[str, object]] = []
+        with self._sync_lock:
+            for task in self.tasks.values():
+                completed = task.current()
+                if (
+                    completed == task.emitted_completed
+                    or now - task.emitted_at < self._event_interval
+                ):
+                    continue
+                event: dict[str, object] = {
+                    "event": "progress",
+                    "time": time.time(),
+                    "task": task.task_id,
+                    "completed": completed,
+                    "total": task.total,
+                }
+                if task.progress_type == ProgressType.DOWNLOAD:
+                    event["speed"] = (completed - task.emitted_completed) / (
+                        now - task.emitted_at
+                    )
+                task.emitted_at = now
+                task.emitted_completed = completed
+                events.append(event)
+
+        for event in events:
+            self._emit(event)
+
+    async def cleanup(self) -> None:
+        """Forget unfinished tasks and close an output opened by path."""
+        with self._sync_lock:
+            self.tasks.clear()
+        with self._write_lock:
+            if self._owned_output is not None:
+                try:
+                    self._owned_output.close()
+                except OSError as exc:
+                    logger.debug("Failed to close progress output: %s", exc)
+                self._owned_output = None
+
+    def _stream(self) -> TextIO:
+        """Return the output stream, opening ``output_path`` if needed.
+
+        The caller holds ``_write_lock``.
+        """
+        if self.output is not None:
+            return self.output
+        if self.output_path is None:
+            return sys.stdout
+        if self._owned_output is None:
+            self._owned_output = self.output_path.open(
+                "a", encoding="utf-8", buffering=1
+            )
+        return self._owned_output
+
+    def _emit(self, event: dict[str, object]) -> None:
+        """Write one event as a JSON line, suppressing IO errors."""
+        line = orjson.dumps(event).decode() + "\n"
+        with self._write_lock:
+            try:
+                stream = self._stream()
+                stream.write(line)
+                stream.flush()
+            except OSError as exc:
+                logger.debug("Failed to write progress event: %s", exc)
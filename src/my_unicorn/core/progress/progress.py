@@ -1,7 +1,8 @@
 """Progress display with ASCII rendering backend.
 
 This module provides a centralized progress display UI component that handles
-different types of operations with ASCII-based visual feedback.
+different types of operations with ASCII-based visual feedback, or with
+JSON lines events for unattended runs (`JsonlProgressBackend`).
 
 Design notes:
 - Concurrency: the backend (`AsciiProgressBackend`) uses an
@@ -42,6 +43,7 @@ from logging.handlers import RotatingFileHandler
 from typing import TYPE_CHECKING, Any
 
 from my_unicorn.core.progress.ascii import AsciiProgressBackend
+from my_unicorn.core.progress.jsonl import JsonlProgressBackend
 from my_unicorn.core.progress.progress_types import (
     ID_CACHE_LIMIT,
     OPERATION_NAMES,
@@ -52,6 +54,7 @@ from my_unicorn.core.progress.progress_types import (
     TaskState,
 )
 from my_unicorn.core.protocols.progress import (
+    ProgressCounter,
     ProgressReporter,
     ProgressTaskInfo,
 )
@@ -81,6 +84,7 @@ _PROGRESS_TYPE_PREFIXES: dict[ProgressType, str] = {
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, AsyncIterator
+    from pathlib import Path
     from typing import Self
 
     from my_unicorn.core.protocols.progress import ProgressTaskInfo
@@ -90,6 +94,7 @@ __all__ = [
     "ID_CACHE_LIMIT",
     "OPERATION_NAMES",
     "AsciiProgressBackend",
+    "JsonlProgressBackend",
     "ProgressConfig",
     "ProgressDisplay",
     "ProgressType",
@@ -226,6 +231,8 @@ class ProgressDisplay(ProgressReporter):
         self,
         config: ProgressConfig | None = None,
         interactive: bool | None = None,
+        mode: str = "ascii",
+        output_path: Path | None = None,
     ) -> None:
         """Initialize progress display.
 
@@ -233,15 +240,33 @@ class ProgressDisplay(ProgressReporter):
             config: Progress configuration
             interactive: Whether to use interactive mode
                         (auto-detected if None)
+            mode: "ascii" to render progress bars, "jsonl" to write
+                machine-readable JSON lines events
+            output_path: File or FIFO for JSON lines events
+                (stdout if None; ignored in ascii mode)
+
+        Raises:
+            ValueError: If mode is unknown
 
         """
         self.config = config or ProgressConfig()
-        self._backend = AsciiProgressBackend(
-            config=self.config, interactive=interactive
-        )
+        self._backend: AsciiProgressBackend | JsonlProgressBackend
+        if mode == "ascii":
+            self._backend = AsciiProgressBackend(
+                config=self.config, interactive=interactive
+            )
+        elif mode == "jsonl":
+            self._backend = JsonlProgressBackend(
+                output_path=output_path, config=self.config
+            )
+        else:
+            msg = f"Unknown progress mode: {mode}"
+            raise ValueError(msg)
 
         # Task management
         self._task_registry = TaskRegistry()
+        # Counters handed out by progress_counter(), by task ID
+        self._counters: dict[str, ProgressCounter] = {}
 
         # ID generation
         self._id_generator = IDGenerator()
@@ -535,6 +560,32 @@ class ProgressDisplay(ProgressReporter):
         # pick up rapid updates. For short-lived phases we trigger an
         # initial render in `add_task` to ensure phase visibility.
 
+    def progress_counter(self, task_id: str) -> ProgressCounter | None:
+        """Return a counter the task's producer increments without awaiting.
+
+        The render loop reads the counter on every tick and derives speed
+        and ETA from its samples, so high-frequency producers (download
+        chunks) skip the task registry lock and the per-update speed
+        calculation of update_task().
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Counter starting at the task's completed units, or None if the
+            task is not found
+
+        """
+        task_info = self._task_registry.get_task_info_full_sync(task_id)
+        if task_info is None:
+            logger.warning("Task not found: %s", task_id)
+            return None
+
+        counter = ProgressCounter(task_info.completed)
+        self._backend.attach_counter(task_id, counter)
+        self._counters[task_id] = counter
+        return counter
+
     async def update_task_total(self, task_id: str, total: float) -> None:
         """Update task total separately.
 
@@ -566,6 +617,12 @@ class ProgressDisplay(ProgressReporter):
             logger.warning("Task not found: %s", task_id)
             return
 
+        counter = self._counters.pop(task_id, None)
+        if counter is not None and counter.completed > task_info.completed:
+            await self._task_registry.update_task(
+                task_id, completed=counter.completed
+            )
+
         # Use registry finish_task method
         await self._task_registry.finish_task(
             task_id, success=success, description=description
@@ -614,7 +671,11 @@ class ProgressDisplay(ProgressReporter):
             Returns empty defaults if task not found.
 
         """
-        return self._task_registry.get_task_info_sync(task_id)
+        info = self._task_registry.get_task_info_sync(task_id)
+        counter = self._counters.get(task_id)
+        if counter is not None:
+            info["completed"] = counter.completed
+        return info
 
     def get_task_info_full(self, task_id: str) -> TaskInfo | None:
         """Get full task information by ID (internal use).
@@ -1043,7 +1104,7 @@ class SessionManager:
     def __init__(
         self,
         config: ProgressConfig,
-        backend: AsciiProgressBackend,
+        backend: AsciiProgressBackend | JsonlProgressBackend,
         logger_suppression: LoggerSuppression,
         id_generator: IDGenerator,
     ) -> None:
@@ -1051,7 +1112,7 @@ class SessionManager:
 
         Args:
             config: Progress configuration
-            backend: ASCII progress backend for rendering
+            backend: Progress backend for rendering
             logger_suppression: Logger suppression context manager
             id_generator: ID generator for cache cleanup
         """
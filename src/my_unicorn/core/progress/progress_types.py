@@ -34,6 +34,8 @@ DEFAULT_MIN_NAME_WIDTH: int = 15
 DEFAULT_SPINNER_FPS: int = 4
 DEFAULT_MAX_SPEED_HISTORY: int = 10
 DEFAULT_BAR_WIDTH: int = 30
+# Minimum seconds between JSON lines progress events of a task
+DEFAULT_EVENT_INTERVAL: float = 1.0
 
 # Spinner frames for in-progress tasks
 SPINNER_FRAMES: list[str] = [
@@ -70,6 +72,8 @@ class TaskState:
     parent_task_id: str | None = None  # For tracking related tasks
     phase: int = 1  # Current phase (1 for verify, 2 for install)
     total_phases: int = 1  # Total number of phases
+    # Bumped on every change; lets the renderer reuse unchanged lines
+    version: int = 0
 
 
 @dataclass(frozen=True, slots=True)
@@ -107,20 +111,32 @@ class ProgressConfig:
     spinner_fps: int = DEFAULT_SPINNER_FPS
     max_name_width: int = 20
 
+    # JSON lines output tuning
+    event_interval: float = DEFAULT_EVENT_INTERVAL
+
     def __post_init__(self) -> None:
         """Validate config fields to prevent invalid runtime values."""
         if self.refresh_per_second < 1:
-            raise ValueError("refresh_per_second must be >= 1")
+            msg = "refresh_per_second must be >= 1"
+            raise ValueError(msg)
         if self.bar_width < 1:
-            raise ValueError("bar_width must be >= 1")
+            msg = "bar_width must be >= 1"
+            raise ValueError(msg)
         if self.spinner_fps < 1:
-            raise ValueError("spinner_fps must be >= 1")
+            msg = "spinner_fps must be >= 1"
+            raise ValueError(msg)
         if self.ui_update_interval <= 0:
-            raise ValueError("ui_update_interval must be > 0")
+            msg = "ui_update_interval must be > 0"
+            raise ValueError(msg)
         if self.speed_calculation_interval <= 0:
-            raise ValueError("speed_calculation_interval must be > 0")
+            msg = "speed_calculation_interval must be > 0"
+            raise ValueError(msg)
         if self.max_speed_history < 1:
-            raise ValueError("max_speed_history must be >= 1")
+            msg = "max_speed_history must be >= 1"
+            raise ValueError(msg)
+        if self.event_interval <= 0:
+            msg = "event_interval must be > 0"
+            raise ValueError(msg)
 
 
 @dataclass(slots=True)
@@ -160,9 +176,11 @@ class TaskInfo:
     def __post_init__(self) -> None:
         """Initialize speed history deque."""
         if self.completed < 0:
-            raise ValueError("completed must be >= 0")
+            msg = "completed must be >= 0"
+            raise ValueError(msg)
         if self.total < 0:
-            raise ValueError("total must be >= 0")
+            msg = "total must be >= 0"
+            raise ValueError(msg)
         if self.speed_history is None:
             # use the instance-level value so ProgressConfig.max_speed_history
             # is actually respected at runtime.
@@ -6,6 +6,7 @@ This follows the Dependency Inversion Principle (DIP) from SOLID.
 
 Available protocols:
     ProgressReporter: Abstract interface for progress reporting
+    SupportsProgressCounter: Reporters offering lock-free ProgressCounters
 
 Available context managers:
     github_api_progress_task: Manage GitHub API progress task lifecycle
@@ -18,18 +19,22 @@ Usage:
 
 from .progress import (
     NullProgressReporter,
+    ProgressCounter,
     ProgressReporter,
     ProgressTaskInfo,
     ProgressType,
+    SupportsProgressCounter,
     github_api_progress_task,
     operation_progress_session,
 )
 
 __all__ = [
     "NullProgressReporter",
+    "ProgressCounter",
     "ProgressReporter",
     "ProgressTaskInfo",
     "ProgressType",
+    "SupportsProgressCounter",
     "github_api_progress_task",
     "operation_progress_session",
 ]
@@ -242,6 +242,57 @@ class ProgressReporter(Protocol):
         ...
 
 
+class ProgressCounter:
+    """Completed-units counter of one task, written without awaiting.
+
+    High-frequency producers such as downloads add to the counter for
+    every chunk instead of awaiting ``update_task``. The progress display
+    reads it once per render tick and derives speed and ETA from the
+    sampled values. Producers and the display share the event loop
+    thread, so no lock is needed.
+
+    Attributes:
+        completed: Units completed so far (e.g. bytes downloaded)
+
+    """
+
+    __slots__ = ("completed",)
+
+    def __init__(self, completed: float = 0.0) -> None:
+        """Initialize the counter.
+
+        Args:
+            completed: Units already completed (e.g. a resumed offset)
+
+        """
+        self.completed = completed
+
+    def add(self, amount: float) -> None:
+        """Add completed units."""
+        self.completed += amount
+
+
+@runtime_checkable
+class SupportsProgressCounter(Protocol):
+    """Progress reporter offering counters for high-frequency updates."""
+
+    def progress_counter(self, task_id: str) -> ProgressCounter | None:
+        """Return a counter feeding the completed units of a task.
+
+        Once a counter is returned, the reporter reads the task's progress
+        from it; ``update_task`` may still be called, e.g. for a final
+        exact value.
+
+        Args:
+            task_id: Identifier returned from add_task().
+
+        Returns:
+            Counter for the task, or None if the task is unknown.
+
+        """
+        ...
+
+
 class NullProgressReporter:
     """No-op progress reporter for when progress display is disabled.
 
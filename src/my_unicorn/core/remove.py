@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any
 
 import my_unicorn.core.desktop_entry as desktop_entry_module
 from my_unicorn.config import ConfigManager
+from my_unicorn.core.blob_store import BlobStore
 from my_unicorn.core.cache import ReleaseCacheManager
 from my_unicorn.logger import get_logger
 
@@ -61,6 +62,7 @@ class RemoveService:
     - Remove desktop entries
     - Remove icon files
     - Remove app config (optionally)
+    - Prune blobs no longer referenced by any install or backup
 
     Usage:
         # Create with explicit dependencies:
@@ -159,6 +161,7 @@ class RemoveService:
             appimage_op = self._remove_appimage_files(app_config)
             cache_op = await self._clear_cache(app_config)
             backup_op = self._remove_backups(app_name)
+            self._prune_blobs()
             desktop_op = self._remove_desktop_entry(app_name)
             icon_op = self._remove_icon(app_config)
             config_op = (
@@ -369,6 +372,17 @@ class RemoveService:
             )
             return RemovalOperation(success=False, metadata={})
 
+    def _prune_blobs(self) -> int:
+        """Remove blobs only the removed AppImage and backups referenced."""
+        blob_store = BlobStore.from_global_config(self.global_config)
+        if blob_store is None:
+            return 0
+        try:
+            return blob_store.prune()
+        except OSError as prune_exc:  # pragma: no cover - logging
+            logger.warning("Failed to prune blob store: %s", prune_exc)
+            return 0
+
     def _remove_desktop_entry(self, app_name: str) -> RemovalOperation:
         """Attempt to remove a desktop entry for the app."""
         try:
@@ -376,6 +390,7 @@ class RemoveService:
                 desktop_entry_module.DesktopEntry.remove_desktop_entry_for_app(
                     app_name,
                     config_manager=self.config_manager,
+                    global_config=self.global_config,
                 )
             )
             if removed:
@@ -0,0 +1,134 @@
+"""Background refresh of stale release cache entries.
+
+Update checks may answer from a cached release that is past its TTL but
+still inside the configured stale window (stale-while-revalidate). The
+expired entries are then refreshed by StaleReleaseRefresher while the
+command goes on, so the next run finds fresh data in the cache.
+
+Refreshes use conditional requests through ReleaseFetcher, so an
+unchanged release costs a ``304 Not Modified`` reply that does not count
+against the rate limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from my_unicorn.constants import STALE_REFRESH_MAX_CONCURRENT
+from my_unicorn.core.api import ReleaseFetcher
+from my_unicorn.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from my_unicorn.core.auth import GitHubAuthManager
+    from my_unicorn.core.cache import ReleaseCacheManager
+
+logger = get_logger(__name__)
+
+
+class StaleReleaseRefresher:
+    """Refreshes stale release cache entries with bounded concurrency.
+
+    Refreshes run on a session owned by the refresher, so they can outlive
+    the session of the command that scheduled them. Call ``drain`` before
+    exiting to finish them and close the session.
+
+    Usage:
+        refresher = StaleReleaseRefresher(cache_manager, auth_manager)
+        fetcher = ReleaseFetcher(
+            owner, repo, session, cache_manager, stale_refresher=refresher
+        )
+        release = await fetcher.fetch_latest_release()
+        ...
+        await refresher.drain()
+    """
+
+    def __init__(
+        self,
+        cache_manager: ReleaseCacheManager,
+        auth_manager: GitHubAuthManager,
+        max_concurrent: int = STALE_REFRESH_MAX_CONCURRENT,
+        network_config: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Initialize the refresher.
+
+        Args:
+            cache_manager: Cache manager receiving the refreshed releases
+            auth_manager: GitHub authentication manager
+            max_concurrent: Maximum refreshes in flight at once
+            network_config: ``[network]`` section of the global config
+                passed to each fetcher
+
+        """
+        self.cache_manager = cache_manager
+        self.auth_manager = auth_manager
+        self.network_config = network_config
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._session: aiohttp.ClientSession | None = None
+        self._tasks: dict[tuple[str, str, str], asyncio.Task[None]] = {}
+
+    def schedule(self, owner: str, repo: str, cache_type: str) -> None:
+        """Start refreshing a cache entry unless already scheduled.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            cache_type: Cache type ('stable' or 'prerelease')
+
+        """
+        key = (owner, repo, cache_type)
+        if key in self._tasks:
+            return
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        logger.debug(
+            "Scheduling background refresh of %s release for %s/%s",
+            cache_type,
+            owner,
+            repo,
+        )
+        self._tasks[key] = asyncio.create_task(self._refresh(*key))
+
+    def is_scheduled(self, owner: str, repo: str) -> bool:
+        """Return whether any entry of a repository was served stale."""
+        return any(key[:2] == (owner, repo) for key in self._tasks)
+
+    @property
+    def scheduled_count(self) -> int:
+        """Number of cache entries scheduled for refresh."""
+        return len(self._tasks)
+
+    async def _refresh(self, owner: str, repo: str, cache_type: str) -> None:
+        """Revalidate one cache entry; failures keep the stale entry."""
+        async with self._semaphore:
+            if self._session is None:
+                return
+            fetcher = ReleaseFetcher(
+                owner,
+                repo,
+                self._session,
+                cache_manager=self.cache_manager,
+                auth_manager=self.auth_manager,
+                network_config=self.network_config,
+            )
+            try:
+                await fetcher.revalidate(cache_type)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(
+                    "Background refresh failed for %s/%s: %s", owner, repo, e
+                )
+
+    async def drain(self) -> None:
+        """Wait for scheduled refreshes and close the session."""
+        if self._tasks:
+            logger.debug(
+                "Waiting for %d background cache refreshes", len(self._tasks)
+            )
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
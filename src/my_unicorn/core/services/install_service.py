@@ -23,7 +23,7 @@ from my_unicorn.core.protocols.progress import (
     operation_progress_session,
 )
 from my_unicorn.logger import get_logger
-from my_unicorn.types import InstallPlan
+from my_unicorn.types import GlobalConfig, InstallPlan
 
 logger = get_logger(__name__)
 
@@ -55,13 +55,15 @@ class InstallApplicationService:
     - Service initialization and coordination
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         session: aiohttp.ClientSession,
         github_client: GitHubClient,
         config_manager: ConfigManager,
         install_dir: Path,
         progress_reporter: ProgressReporter | None = None,
+        *,
+        global_config: GlobalConfig | None = None,
     ) -> None:
         """Initialize install application service.
 
@@ -71,6 +73,7 @@ class InstallApplicationService:
             config_manager: Configuration manager
             install_dir: Installation directory
             progress_reporter: Optional progress reporter for tracking
+            global_config: Optional global configuration snapshot
 
         """
         self.session = session
@@ -78,6 +81,7 @@ class InstallApplicationService:
         self.config = config_manager
         self.install_dir = install_dir
         self.progress_reporter = progress_reporter or NullProgressReporter()
+        self.global_config = global_config
 
         # Initialized on demand
         self._download_service: DownloadService | None = None
@@ -102,6 +106,7 @@ class InstallApplicationService:
                 storage_service=storage_service,
                 config_manager=self.config,
                 progress_reporter=self.progress_reporter,
+                global_config=self.global_config,
             )
             self._install_handler = InstallHandler(
                 download_service=self.download_service,
@@ -110,6 +115,7 @@ class InstallApplicationService:
                 github_client=self.github,
                 post_download_processor=post_download_processor,
                 progress_reporter=self.progress_reporter,
+                global_config=self.global_config,
             )
         return self._install_handler
 
@@ -179,18 +179,22 @@ class UpdateApplicationService:
         app_names: list[str] | None = None,
         *,
         refresh_cache: bool = False,
+        allow_stale: bool = False,
     ) -> dict:
         """Check for available updates with validation.
 
         Args:
             app_names: Specific apps to check, or None for all
             refresh_cache: Whether to bypass cache
+            allow_stale: Whether expired cache entries within the stale
+                window may answer; see ``finish_background_refresh``
 
         Returns:
             Dictionary with:
                 available_updates: List of dicts with update info
                 up_to_date: List of app names that are current
                 invalid_apps: List of app names not found
+                stale_apps: List of app names answered from stale cache
 
         """
         valid_apps, invalid_apps = self._validate_app_names(app_names)
@@ -205,6 +209,7 @@ class UpdateApplicationService:
         update_infos = await self.update_manager.check_updates(
             app_names=valid_apps,
             refresh_cache=refresh_cache,
+            allow_stale=allow_stale,
         )
 
         available = [info for info in update_infos if info.has_update]
@@ -218,13 +223,21 @@ class UpdateApplicationService:
                     "app_name": info.app_name,
                     "current_version": info.current_version,
                     "latest_version": info.latest_version,
+                    "stale": info.stale,
                 }
                 for info in available
             ],
             "up_to_date": up_to_date,
             "invalid_apps": invalid_apps,
+            "stale_apps": [
+                info.app_name for info in update_infos if info.stale
+            ],
         }
 
+    async def finish_background_refresh(self) -> None:
+        """Persist fresh data for results that were answered stale."""
+        await self.update_manager.finish_background_refresh()
+
     async def perform_updates(
         self,
         app_names: list[str] | None = None,
@@ -0,0 +1,558 @@
+"""Read-only access to the squashfs image embedded in an AppImage.
+
+A type 2 AppImage is an ELF runtime followed by a squashfs 4.0 image. The
+image starts right after the ELF section header table, so its offset is
+read from the ELF header instead of running the AppImage.
+
+Only what icon discovery needs is implemented: walking directories,
+resolving symlinks and reading regular files. Metadata blocks are
+decompressed on demand, so listing a few directories of a large image
+reads kilobytes instead of unpacking the whole filesystem.
+
+Supported compressors are gzip, xz and lzma from the standard library and
+zstd when the optional ``zstandard`` package is installed. Other images
+raise SquashfsError and callers fall back to ``--appimage-extract``.
+"""
+
+from __future__ import annotations
+
+import lzma
+import posixpath
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, BinaryIO, Self
+
+from my_unicorn.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from types import TracebackType
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = get_logger(__name__)
+
+SQUASHFS_MAGIC = b"hsqs"
+SQUASHFS_MAX_BLOCK_SIZE = 1024 * 1024
+
+ELF_MAGIC = b"\x7fELF"
+
+# Superblock layout of squashfs 4.0 (96 bytes, little endian)
+_SUPERBLOCK = struct.Struct("<4sIIIIHHHHHHQQQQQQQQ")
+
+# Metadata block header flag: block is stored uncompressed
+_METADATA_UNCOMPRESSED = 0x8000
+# Data block size flag: block is stored uncompressed
+_DATA_UNCOMPRESSED = 1 << 24
+_NO_FRAGMENT = 0xFFFFFFFF
+_FRAGMENT_ENTRY_SIZE = 16
+_METADATA_SIZE = 8192
+
+# Inode types
+_BASIC_DIR = 1
+_BASIC_FILE = 2
+_BASIC_SYMLINK = 3
+_EXT_DIR = 8
+_EXT_FILE = 9
+_EXT_SYMLINK = 10
+
+_COMPRESSOR_NAMES = {
+    1: "gzip",
+    2: "lzma",
+    3: "lzo",
+    4: "xz",
+    5: "lz4",
+    6: "zstd",
+}
+
+# Guards against symlink loops while resolving paths
+_MAX_SYMLINK_HOPS = 40
+
+
+class SquashfsError(Exception):
+    """Raised when an image cannot be read in-process."""
+
+
+@dataclass(frozen=True, slots=True)
+class Inode:
+    """A squashfs inode reduced to the fields needed for reading."""
+
+    kind: str  # "dir", "file", "symlink" or "other"
+    dir_block: int = 0
+    dir_offset: int = 0
+    dir_size: int = 0
+    blocks_start: int = 0
+    file_size: int = 0
+    fragment: int = _NO_FRAGMENT
+    fragment_offset: int = 0
+    block_sizes: tuple[int, ...] = field(default=())
+    target: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class DirEntry:
+    """A directory entry pointing at an inode."""
+
+    name: str
+    inode_ref: int
+
+
+def _decompressor(compressor: int) -> Callable[[bytes], bytes]:
+    """Return the decompression function for a squashfs compressor id."""
+    if compressor == 1:
+        return zlib.decompress
+    if compressor == 4:  # noqa: PLR2004
+        return lambda data: lzma.decompress(data, format=lzma.FORMAT_XZ)
+    if compressor == 2:  # noqa: PLR2004
+        return lambda data: lzma.decompress(data, format=lzma.FORMAT_ALONE)
+    if compressor == 6 and zstandard is not None:  # noqa: PLR2004
+        decompressor = zstandard.ZstdDecompressor()
+        return lambda data: decompressor.decompress(
+            data, max_output_size=SQUASHFS_MAX_BLOCK_SIZE
+        )
+    name = _COMPRESSOR_NAMES.get(compressor, str(compressor))
+    msg = f"Unsupported squashfs compression: {name}"
+    raise SquashfsError(msg)
+
+
+def find_squashfs_offset(f: BinaryIO) -> int:
+    """Locate the squashfs image in an AppImage.
+
+    Args:
+        f: AppImage opened in binary mode
+
+    Returns:
+        Byte offset of the squashfs superblock
+
+    Raises:
+        SquashfsError: If the file is not a type 2 AppImage
+
+    """
+    f.seek(0)
+    header = f.read(64)
+    if header[:4] == SQUASHFS_MAGIC:
+        return 0
+    if header[:4] != ELF_MAGIC or len(header) < 64:  # noqa: PLR2004
+        msg = "Not an ELF file"
+        raise SquashfsError(msg)
+
+    endian = "<" if header[5] == 1 else ">"
+    if header[4] == 2:  # noqa: PLR2004 - ELFCLASS64
+        (section_offset,) = struct.unpack_from(f"{endian}Q", header, 0x28)
+        entry_size, entry_count = struct.unpack_from(
+            f"{endian}HH", header, 0x3A
+        )
+    elif header[4] == 1:  # ELFCLASS32
+        (section_offset,) = struct.unpack_from(f"{endian}I", header, 0x20)
+        entry_size, entry_count = struct.unpack_from(
+            f"{endian}HH", header, 0x2E
+        )
+    else:
+        msg = "Unknown ELF class"
+        raise SquashfsError(msg)
+
+    offset: int = section_offset + entry_size * entry_count
+    f.seek(offset)
+    if f.read(4) != SQUASHFS_MAGIC:
+        msg = "No squashfs image after the AppImage runtime"
+        raise SquashfsError(msg)
+    return offset
+
+
+class _MetadataCursor:
+    """Sequential reader over a chain of metadata blocks."""
+
+    def __init__(
+        self, image: SquashfsImage, position: int, offset: int
+    ) -> None:
+        """Start reading at ``offset`` in the block at ``position``."""
+        self._image = image
+        self._data, self._next = image.read_metadata_block(position)
+        self._offset = offset
+
+    def read(self, size: int) -> bytes:
+        """Read ``size`` bytes, continuing into following blocks."""
+        chunks = []
+        while size > 0:
+            if self._offset >= len(self._data):
+                self._data, self._next = self._image.read_metadata_block(
+                    self._next
+                )
+                self._offset = 0
+            chunk = self._data[self._offset : self._offset + size]
+            chunks.append(chunk)
+            self._offset += len(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+
+class SquashfsImage:
+    """Read-only view of a squashfs image inside a file.
+
+    Usage:
+        with SquashfsImage.open(appimage_path) as image:
+            for entry in image.listdir(image.root):
+                ...
+    """
+
+    def __init__(self, f: BinaryIO, offset: int) -> None:
+        """Read the superblock of the image at ``offset`` in ``f``.
+
+        Args:
+            f: File opened in binary mode
+            offset: Byte offset of the squashfs superblock
+
+        Raises:
+            SquashfsError: If the superblock is invalid or unsupported
+
+        """
+        self._file = f
+        self._offset = offset
+        f.seek(offset)
+        raw = f.read(_SUPERBLOCK.size)
+        if len(raw) < _SUPERBLOCK.size:
+            msg = "Truncated squashfs superblock"
+            raise SquashfsError(msg)
+        (
+            magic,
+            _inode_count,
+            _mod_time,
+            self.block_size,
+            _fragment_count,
+            compressor,
+            _block_log,
+            _flags,
+            _id_count,
+            version_major,
+            _version_minor,
+            root_inode_ref,
+            _bytes_used,
+            _id_table_start,
+            _xattr_table_start,
+            self._inode_table_start,
+            self._directory_table_start,
+            self._fragment_table_start,
+            _export_table_start,
+        ) = _SUPERBLOCK.unpack(raw)
+        if magic != SQUASHFS_MAGIC or version_major != 4:  # noqa: PLR2004
+            msg = "Not a squashfs 4.0 image"
+            raise SquashfsError(msg)
+        self._decompress = _decompressor(compressor)
+        self._metadata_cache: dict[int, tuple[bytes, int]] = {}
+        self._fragment_cache: dict[int, bytes] = {}
+        self.root = self.read_inode(root_inode_ref)
+
+    @classmethod
+    def open(cls, path: Path) -> Self:
+        """Open the squashfs image of an AppImage.
+
+        Args:
+            path: AppImage or bare squashfs image
+
+        Returns:
+            SquashfsImage to be used as a context manager
+
+        Raises:
+            SquashfsError: If the file holds no readable squashfs image
+
+        """
+        f = path.open("rb")
+        try:
+            return cls(f, find_squashfs_offset(f))
+        except BaseException:
+            f.close()
+            raise
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        """Return the image."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the underlying file."""
+        self.close()
+
+    def _read_at(self, position: int, size: int) -> bytes:
+        """Read raw bytes at a position relative to the image start."""
+        self._file.seek(self._offset + position)
+        data = self._file.read(size)
+        if len(data) != size:
+            msg = f"Truncated squashfs image at byte {position}"
+            raise SquashfsError(msg)
+        return data
+
+    def read_metadata_block(self, position: int) -> tuple[bytes, int]:
+        """Return a metadata block and the position of the next one."""
+        cached = self._metadata_cache.get(position)
+        if cached is not None:
+            return cached
+        (header,) = struct.unpack("<H", self._read_at(position, 2))
+        size = header & ~_METADATA_UNCOMPRESSED
+        data = self._read_at(position + 2, size)
+        if not header & _METADATA_UNCOMPRESSED:
+            data = self._decompress_block(data)
+        result = (data, position + 2 + size)
+        self._metadata_cache[position] = result
+        return result
+
+    def _decompress_block(self, data: bytes) -> bytes:
+        """Decompress a block, reporting corrupt data as SquashfsError."""
+        try:
+            return self._decompress(data)
+        except (zlib.error, lzma.LZMAError, ValueError) as e:
+            msg = f"Corrupt squashfs block: {e}"
+            raise SquashfsError(msg) from e
+
+    def read_inode(self, inode_ref: int) -> Inode:
+        """Read the inode referenced by a squashfs inode reference.
+
+        Args:
+            inode_ref: Block position (upper bits) and offset (lower 16)
+
+        Returns:
+            Parsed inode
+
+        """
+        cursor = _MetadataCursor(
+            self,
+            self._inode_table_start + (inode_ref >> 16),
+            inode_ref & 0xFFFF,
+        )
+        (inode_type,) = struct.unpack_from("<H", cursor.read(16))
+
+        if inode_type == _BASIC_DIR:
+            block, _links, size, offset, _parent = struct.unpack(
+                "<IIHHI", cursor.read(16)
+            )
+            return Inode(
+                "dir", dir_block=block, dir_offset=offset, dir_size=size
+            )
+        if inode_type == _EXT_DIR:
+            _links, size, block, _parent, _count, offset, _xattr = (
+                struct.unpack("<IIIIHHI", cursor.read(24))
+            )
+            return Inode(
+                "dir", dir_block=block, dir_offset=offset, dir_size=size
+            )
+        if inode_type == _BASIC_FILE:
+            start, fragment, fragment_offset, size = struct.unpack(
+                "<IIII", cursor.read(16)
+            )
+        elif inode_type == _EXT_FILE:
+            (
+                start,
+                size,
+                _sparse,
+                _links,
+                fragment,
+                fragment_offset,
+                _xattr,
+            ) = struct.unpack("<QQQIIII", cursor.read(40))
+        elif inode_type in {_BASIC_SYMLINK, _EXT_SYMLINK}:
+            _links, target_size = struct.unpack("<II", cursor.read(8))
+            target = cursor.read(target_size).decode(
+                "utf-8", errors="surrogateescape"
+            )
+            return Inode("symlink", target=target)
+        else:
+            return Inode("other")
+
+        if fragment == _NO_FRAGMENT:
+            count = -(-size // self.block_size)
+        else:
+            count = size // self.block_size
+        block_sizes = struct.unpack(f"<{count}I", cursor.read(4 * count))
+        return Inode(
+            "file",
+            blocks_start=start,
+            file_size=size,
+            fragment=fragment,
+            fragment_offset=fragment_offset,
+            block_sizes=block_sizes,
+        )
+
+    def listdir(self, directory: Inode) -> list[DirEntry]:
+        """List the entries of a directory inode.
+
+        Args:
+            directory: Directory inode
+
+        Returns:
+            Directory entries in on-disk (sorted) order
+
+        """
+        if directory.kind != "dir":
+            msg = "Not a directory"
+            raise SquashfsError(msg)
+        entries: list[DirEntry] = []
+        # The stored size includes the implicit "." and ".." entries
+        remaining = directory.dir_size - 3
+        if remaining <= 0:
+            return entries
+        cursor = _MetadataCursor(
+            self,
+            self._directory_table_start + directory.dir_block,
+            directory.dir_offset,
+        )
+        while remaining > 0:
+            count, start, _base = struct.unpack("<III", cursor.read(12))
+            remaining -= 12
+            for _ in range(count + 1):
+                offset, _delta, _type, name_size = struct.unpack(
+                    "<HhHH", cursor.read(8)
+                )
+                name = cursor.read(name_size + 1).decode(
+                    "utf-8", errors="surrogateescape"
+                )
+                remaining -= 8 + name_size + 1
+                entries.append(DirEntry(name, (start << 16) | offset))
+        return entries
+
+    def lookup(
+        self, path: str, *, follow_symlinks: bool = True
+    ) -> tuple[str, Inode] | None:
+        """Find the inode at a path inside the image.
+
+        Args:
+            path: Slash-separated path relative to the image root
+            follow_symlinks: Resolve a symlink in the last component
+
+        Returns:
+            Tuple of (canonical path, inode), or None if not found
+
+        """
+        parts = [part for part in path.split("/") if part not in {"", "."}]
+        resolved: list[str] = []
+        inode = self.root
+        hops = 0
+        while parts:
+            part = parts.pop(0)
+            if part == "..":
+                if resolved:
+                    resolved.pop()
+                inode = self._lookup_parts(resolved)
+                continue
+            if inode.kind != "dir":
+                return None
+            entry = next(
+                (e for e in self.listdir(inode) if e.name == part), None
+            )
+            if entry is None:
+                return None
+            child = self.read_inode(entry.inode_ref)
+            if child.kind == "symlink" and (parts or follow_symlinks):
+                hops += 1
+                if hops > _MAX_SYMLINK_HOPS:
+                    return None
+                target = [p for p in child.target.split("/") if p]
+                if child.target.startswith("/"):
+                    resolved = []
+                    inode = self.root
+                parts = target + parts
+                continue
+            resolved.append(part)
+            inode = child
+        return "/".join(resolved), inode
+
+    def _lookup_parts(self, parts: list[str]) -> Inode:
+        """Return the inode of an already resolved directory path."""
+        found = self.lookup("/".join(parts), follow_symlinks=False)
+        return found[1] if found else self.root
+
+    def walk(self, path: str) -> Iterator[tuple[str, DirEntry, Inode]]:
+        """Recursively yield entries below a directory.
+
+        Symlinks are yielded but not followed.
+
+        Args:
+            path: Directory path relative to the image root
+
+        Yields:
+            Tuples of (entry path, directory entry, inode)
+
+        """
+        found = self.lookup(path)
+        if found is None or found[1].kind != "dir":
+            return
+        pending = [found]
+        while pending:
+            directory_path, directory = pending.pop()
+            for entry in self.listdir(directory):
+                entry_path = posixpath.join(directory_path, entry.name)
+                inode = self.read_inode(entry.inode_ref)
+                yield entry_path, entry, inode
+                if inode.kind == "dir":
+                    pending.append((entry_path, inode))
+
+    def read_file(self, inode: Inode) -> bytes:
+        """Read the contents of a regular file.
+
+        Args:
+            inode: File inode
+
+        Returns:
+            File contents
+
+        """
+        if inode.kind != "file":
+            msg = "Not a regular file"
+            raise SquashfsError(msg)
+        data = bytearray()
+        position = inode.blocks_start
+        for raw_size in inode.block_sizes:
+            size = raw_size & ~_DATA_UNCOMPRESSED
+            if size == 0:
+                # Sparse block of zeros
+                data += bytes(
+                    min(self.block_size, inode.file_size - len(data))
+                )
+                continue
+            block = self._read_at(position, size)
+            position += size
+            if not raw_size & _DATA_UNCOMPRESSED:
+                block = self._decompress_block(block)
+            data += block
+        if inode.fragment != _NO_FRAGMENT:
+            fragment = self._read_fragment(inode.fragment)
+            tail = inode.file_size - len(data)
+            start = inode.fragment_offset
+            data += fragment[start : start + tail]
+        if len(data) < inode.file_size:
+            msg = "Truncated squashfs file"
+            raise SquashfsError(msg)
+        return bytes(data[: inode.file_size])
+
+    def _read_fragment(self, index: int) -> bytes:
+        """Return the decompressed fragment block with the given index."""
+        cached = self._fragment_cache.get(index)
+        if cached is not None:
+            return cached
+        entry_position = index * _FRAGMENT_ENTRY_SIZE
+        table_index, entry_offset = divmod(entry_position, _METADATA_SIZE)
+        (block_position,) = struct.unpack(
+            "<Q",
+            self._read_at(self._fragment_table_start + 8 * table_index, 8),
+        )
+        table, _ = self.read_metadata_block(block_position)
+        start, raw_size, _unused = struct.unpack_from(
+            "<QII", table, entry_offset
+        )
+        size = raw_size & ~_DATA_UNCOMPRESSED
+        block = self._read_at(start, size)
+        if not raw_size & _DATA_UNCOMPRESSED:
+            block = self._decompress_block(block)
+        self._fragment_cache[index] = block
+        return block
@@ -10,7 +10,7 @@ import re
 import keyring
 from keyring.backends import SecretService
 
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
 
 logger = get_logger(__name__)
 
@@ -218,7 +218,8 @@ class KeyringTokenStore:
             return None
 
         try:
-            token = keyring.get_password(self.service, self.username)
+            with timing_span("keyring"):
+                token = keyring.get_password(self.service, self.username)
         except Exception:  # noqa: BLE001
             # Keyring unavailable is expected in headless environments
             # Security: Don't log exception details
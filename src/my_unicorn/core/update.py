@@ -32,6 +32,7 @@ from my_unicorn.core.backup import BackupService
 from my_unicorn.core.cache import ReleaseCacheManager
 from my_unicorn.core.download import DownloadService
 from my_unicorn.core.file_ops import FileOperations
+from my_unicorn.core.graphql import BatchedReleases, GraphQLReleaseClient
 from my_unicorn.core.post_download import (
     OperationType,
     PostDownloadContext,
@@ -41,13 +42,14 @@ from my_unicorn.core.protocols.progress import (
     NullProgressReporter,
     ProgressReporter,
 )
+from my_unicorn.core.revalidation import StaleReleaseRefresher
 from my_unicorn.core.verify import VerificationService
 from my_unicorn.exceptions import (
     ConfigurationError,
     UpdateError,
     VerificationError,
 )
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
 from my_unicorn.utils.appimage_utils import select_best_appimage_asset
 from my_unicorn.utils.download_utils import extract_filename_from_url
 from my_unicorn.utils.version_utils import compare_versions
@@ -112,6 +114,7 @@ class UpdateManager:
         auth_manager: GitHubAuthManager | None = None,
         cache_manager: ReleaseCacheManager | None = None,
         progress_reporter: ProgressReporter | None = None,
+        global_config: GlobalConfig | None = None,
     ) -> None:
         """Initialize update manager.
 
@@ -120,13 +123,17 @@ class UpdateManager:
             auth_manager: GitHub authentication manager instance
             cache_manager: Optional release cache manager instance
             progress_reporter: Optional progress reporter for tracking updates
+            global_config: Optional global configuration snapshot
+                (loaded through config_manager if not provided)
 
         """
         self.config_manager = config_manager or ConfigManager()
-        self.global_config = self.config_manager.load_global_config()
+        self.global_config = (
+            global_config or self.config_manager.load_global_config()
+        )
         self.auth_manager = auth_manager or GitHubAuthManager.create_default()
         self.cache_manager = cache_manager or ReleaseCacheManager(
-            self.config_manager, ttl_hours=24
+            self.config_manager, global_config=self.global_config
         )
 
         # Initialize storage service with install directory
@@ -152,6 +159,13 @@ class UpdateManager:
         # Shared API task ID for progress tracking across update operations
         self._shared_api_task_id: str | None = None
 
+        # Releases resolved by a batched GraphQL lookup in check_updates
+        self._batched_releases: dict[tuple[str, str], BatchedReleases] = {}
+
+        # Background refresher for stale cache hits, set by check_updates
+        # when stale results are allowed
+        self._stale_refresher: StaleReleaseRefresher | None = None
+
     @classmethod
     def create_default(
         cls,
@@ -184,7 +198,7 @@ class UpdateManager:
 
         """
         self.download_service = DownloadService(
-            session, self.progress_reporter
+            session, self.progress_reporter, global_config=self.global_config
         )
         # Get progress reporter from download service
         progress_reporter = self.download_service.progress_reporter
@@ -202,6 +216,7 @@ class UpdateManager:
             verification_service=self.verification_service,
             backup_service=self.backup_service,
             progress_reporter=self.progress_reporter,
+            global_config=self.global_config,
         )
 
     async def _fetch_release_data(
@@ -229,12 +244,28 @@ class UpdateManager:
             aiohttp.ClientError: If API request fails
 
         """
+        batched = self._batched_releases.get((owner, repo))
+        if batched:
+            # Same preference order as the REST fallbacks below
+            release = (
+                batched.prerelease or batched.stable
+                if should_use_prerelease
+                else batched.stable or batched.prerelease
+            )
+            if release:
+                logger.debug(
+                    "Using batched release data for %s/%s", owner, repo
+                )
+                return release
+
         fetcher = ReleaseFetcher(
             owner,
             repo,
             session,
             cache_manager=self.cache_manager,
             auth_manager=self.auth_manager,
+            stale_refresher=self._stale_refresher,
+            network_config=self.global_config.get("network"),
         )
         if should_use_prerelease:
             logger.debug("Fetching latest prerelease for %s/%s", owner, repo)
@@ -342,14 +373,20 @@ class UpdateManager:
             )
 
             # Fetch latest release
-            release_data = await self._fetch_release_data(
-                owner, repo, should_use_prerelease, session, refresh_cache
-            )
+            async with timing_span("check", app=app_name):
+                release_data = await self._fetch_release_data(
+                    owner, repo, should_use_prerelease, session, refresh_cache
+                )
 
             # Build and return update info
-            return await self._build_update_info(
+            info = await self._build_update_info(
                 app_name, app_config, release_data
             )
+            if self._stale_refresher and self._stale_refresher.is_scheduled(
+                owner, repo
+            ):
+                info.stale = True
+            return info
 
         except aiohttp.client_exceptions.ClientResponseError as e:
             # Handle HTTP errors (401, 403, 404, etc.)
@@ -388,6 +425,8 @@ class UpdateManager:
         self,
         app_names: list[str] | None = None,
         refresh_cache: bool = False,
+        *,
+        allow_stale: bool = False,
     ) -> list[UpdateInfo]:
         """Check for updates for all or specified apps.
 
@@ -396,6 +435,9 @@ class UpdateManager:
                 apps
             refresh_cache: If True, bypass cache and fetch fresh data from
                 API
+            allow_stale: If True, answer from expired cache entries within
+                the stale window and refresh them in the background. Call
+                ``finish_background_refresh`` once the results are shown.
 
         Returns:
             List of UpdateInfo objects, one per app. Errors are captured in
@@ -416,9 +458,28 @@ class UpdateManager:
             logger.info("No installed apps found")
             return []
 
+        # Load all configs in one parallel pass; the per-app loads below
+        # are then answered from the config store. Errors are reported by
+        # check_single_update.
+        self.config_manager.load_all_app_configs(app_names)
+
         logger.info("🔄 Checking %d app(s) for updates...", len(app_names))
 
+        self._stale_refresher = None
+        if (
+            allow_stale
+            and not refresh_cache
+            and self.cache_manager
+            and self.cache_manager.stale_hours > 0
+        ):
+            self._stale_refresher = StaleReleaseRefresher(
+                self.cache_manager,
+                self.auth_manager,
+                network_config=self.global_config.get("network"),
+            )
+
         async with aiohttp.ClientSession() as session:
+            await self._prefetch_releases(app_names, session, refresh_cache)
             tasks = [
                 self.check_single_update(
                     app, session, refresh_cache=refresh_cache
@@ -427,6 +488,94 @@ class UpdateManager:
             ]
             return await asyncio.gather(*tasks)
 
+    async def finish_background_refresh(self) -> None:
+        """Wait for background refreshes of stale cache entries.
+
+        The refreshed releases are persisted to the cache for the next run.
+        Does nothing unless ``check_updates`` served stale results.
+        """
+        refresher, self._stale_refresher = self._stale_refresher, None
+        if refresher is None:
+            return
+        if refresher.scheduled_count:
+            logger.debug(
+                "Refreshing %d stale release cache entries",
+                refresher.scheduled_count,
+            )
+        await refresher.drain()
+
+    async def _prefetch_releases(
+        self,
+        app_names: list[str],
+        session: aiohttp.ClientSession,
+        refresh_cache: bool,
+    ) -> None:
+        """Resolve releases for many apps with batched GraphQL queries.
+
+        Only runs when a GitHub token is configured. Apps whose preferred
+        release is still cached (one bulk cache query) are skipped unless
+        ``refresh_cache`` is set; with stale results allowed, entries within
+        the stale window count as cached. Results are cached and kept in
+        ``_batched_releases`` for ``_fetch_release_data``; anything
+        unresolved falls back to REST.
+
+        Args:
+            app_names: Names of the apps being checked
+            session: aiohttp session
+            refresh_cache: Whether cached releases should be ignored
+
+        """
+        self._batched_releases = {}
+        client = GraphQLReleaseClient(
+            session,
+            self.auth_manager,
+            timeout_seconds=int(
+                self.global_config.get("network", {}).get(
+                    "timeout_seconds", 10
+                )
+            ),
+        )
+        if not client.is_available():
+            return
+
+        wanted: list[tuple[str, str, str]] = []
+        for app_name in app_names:
+            app_config = self.config_manager.load_app_config(app_name)
+            if not app_config:
+                continue
+            try:
+                github_config = get_github_config(app_config)
+            except (ConfigurationError, ValueError):
+                # Reported by check_single_update
+                continue
+            cache_type = "prerelease" if github_config.prerelease else "stable"
+            wanted.append(
+                (github_config.owner, github_config.repo, cache_type)
+            )
+
+        cached: dict[tuple[str, str, str], Any] = {}
+        if not refresh_cache and self.cache_manager:
+            cached = await self.cache_manager.get_cached_releases(
+                wanted, include_stale=self._stale_refresher is not None
+            )
+        repos = [(key[0], key[1]) for key in wanted if key not in cached]
+
+        if not repos:
+            return
+
+        self._batched_releases = await client.fetch_latest_releases(repos)
+        if not self.cache_manager:
+            return
+        for (owner, repo), batched in self._batched_releases.items():
+            for cache_type, release in (
+                ("stable", batched.stable),
+                ("prerelease", batched.prerelease),
+            ):
+                if release:
+                    await self.cache_manager.update_release_data(
+                        owner, repo, release.to_dict(), cache_type=cache_type
+                    )
+
     def _load_app_config_or_fail(
         self, app_name: str, context: str = ""
     ) -> dict[str, Any]:
@@ -658,6 +807,10 @@ async def update_single_app(
         VerificationError: If hash verification fails
 
     """
+    # Backup and installed path when the backup moved the installed file
+    moved_backup: tuple[Path, Path] | None = None
+    checksum_prefetch = None
+    updated = False
     try:
         # Prepare update context
         context, error = await prepare_context_func(
@@ -677,6 +830,24 @@ async def update_single_app(
         update_info = update_info_raw
         appimage_asset = context["appimage_asset"]
 
+        # release_data is guaranteed to exist at this point
+        if update_info.release_data is None:
+            raise UpdateError(
+                message="release_data must be available",
+                context={"app_name": app_name},
+            )
+
+        # Fetch the checksum file while the AppImage downloads
+        checksum_prefetch = post_download_processor.prefetch_checksums(
+            app_name=app_name,
+            asset=appimage_asset,
+            release=update_info.release_data,
+            app_config=app_config,
+            catalog_entry=context["catalog_entry"],
+            owner=context["owner"],
+            repo=context["repo"],
+        )
+
         # Setup paths
         storage_dir = Path(global_config["directory"]["storage"])
         download_dir = Path(global_config["directory"]["download"])
@@ -687,26 +858,10 @@ async def update_single_app(
         )
         download_path = download_dir / filename
 
-        # Backup current version
-        installed_path_str = app_config.get("state", {}).get(
-            "installed_path", ""
-        )
-        current_appimage_path = (
-            Path(installed_path_str)
-            if installed_path_str
-            else storage_dir / f"{app_name}.AppImage"
-        )
-        if current_appimage_path.exists():
-            backup_path = backup_service.create_backup(
-                current_appimage_path,
-                app_name,
-                update_info.current_version,
-            )
-            if backup_path:
-                logger.debug("Backup created: %s", backup_path)
-
         if download_service is None:
-            download_service = DownloadService(session)
+            download_service = DownloadService(
+                session, global_config=global_config
+            )
 
         downloaded_path = await download_service.download_appimage(
             appimage_asset, download_path
@@ -720,12 +875,14 @@ async def update_single_app(
                 },
             )
 
-        # release_data is guaranteed to exist at this point
-        if update_info.release_data is None:
-            raise UpdateError(
-                message="release_data must be available",
-                context={"app_name": app_name},
-            )
+        # Backup current version; it stays installed during the download
+        moved_backup = await _backup_installed_appimage(
+            backup_service,
+            app_name,
+            app_config,
+            storage_dir,
+            update_info.current_version,
+        )
 
         # Create processing context
         post_context = PostDownloadContext(
@@ -740,6 +897,10 @@ async def update_single_app(
             repo=context["repo"],
             verify_downloads=True,  # Always verify updates
             source="catalog" if context.get("catalog_entry") else "url",
+            precomputed_hashes=download_service.pop_computed_digests(
+                downloaded_path
+            ),
+            checksum_prefetch=checksum_prefetch,
         )
 
         # Process download
@@ -751,6 +912,7 @@ async def update_single_app(
                 app_name,
                 update_info.latest_version,
             )
+            updated = True
             return True, None
         return False, result.error or "Post-download processing failed"
 
@@ -769,6 +931,81 @@ async def update_single_app(
             },
             cause=e,
         ) from e
+    finally:
+        # Also covers cancellation and Ctrl-C during processing
+        if not updated:
+            _reinstate_moved_backup(backup_service, moved_backup)
+        if checksum_prefetch is not None:
+            checksum_prefetch.close()
+
+
+async def _backup_installed_appimage(
+    backup_service: BackupService,
+    app_name: str,
+    app_config: dict[str, Any],
+    storage_dir: Path,
+    current_version: str,
+) -> tuple[Path, Path] | None:
+    """Back up the installed AppImage, moving it into the backup if possible.
+
+    Args:
+        backup_service: Backup service instance
+        app_name: Name of the app being updated
+        app_config: App configuration with the installed path
+        storage_dir: Storage directory used when no path is recorded
+        current_version: Installed version recorded in the backup
+
+    Returns:
+        Backup path and original installed path when the installed file
+        was moved into the backup, otherwise None
+
+    """
+    installed_path_str = app_config.get("state", {}).get("installed_path", "")
+    current_appimage_path = (
+        Path(installed_path_str)
+        if installed_path_str
+        else storage_dir / f"{app_name}.AppImage"
+    )
+    if not current_appimage_path.exists():
+        return None
+    backup_path = await backup_service.create_backup_async(
+        current_appimage_path,
+        app_name,
+        current_version,
+        replace_source=True,
+    )
+    if not backup_path:
+        return None
+    logger.debug("Backup created: %s", backup_path)
+    if current_appimage_path.exists():
+        return None
+    return backup_path, current_appimage_path
+
+
+def _reinstate_moved_backup(
+    backup_service: BackupService,
+    moved_backup: tuple[Path, Path] | None,
+) -> None:
+    """Put back an installed AppImage that a failed update moved away.
+
+    Args:
+        backup_service: Backup service that created the backup
+        moved_backup: Backup path and original installed path, or None
+            if the installed file was not moved
+
+    """
+    if moved_backup is None:
+        return
+    backup_path, installed_path = moved_backup
+    if installed_path.exists():
+        return
+    try:
+        backup_service.reinstate_backup(backup_path, installed_path)
+    except OSError:
+        logger.exception(
+            "Failed to put back %s; restore it with 'my-unicorn backup'",
+            installed_path,
+        )
 
 
 async def update_multiple_apps(
@@ -844,7 +1081,7 @@ async def update_multiple_apps(
                         from_cache=not refresh_cache,
                     )
 
-                async with semaphore:
+                async with semaphore, timing_span("update", app=app_name):
                     success, error_reason = await update_single_app_func(
                         app_name, session, force, cached_info
                     )
@@ -1241,7 +1478,9 @@ def display_check_results(results: dict) -> None:
         logger.info("Updates available:")
         for info in results["available_updates"]:
             logger.info(
-                "  %s: %s → %s",
+                "  %s: %s → %s (cached)"
+                if info.get("stale")
+                else "  %s: %s → %s",
                 info["app_name"],
                 info["current_version"],
                 info["latest_version"],
@@ -1250,6 +1489,13 @@ def display_check_results(results: dict) -> None:
     else:
         logger.info("✓ All apps are up to date")
 
+    stale_apps = results.get("stale_apps", [])
+    if stale_apps:
+        logger.info(
+            "%d result(s) from expired cache, refreshed for the next run",
+            len(stale_apps),
+        )
+
 
 def display_update_results(results: dict) -> None:
     """Display update operation results from update service.
@@ -1348,6 +1594,8 @@ class UpdateInfo:
         release_data: Cached Release object from GitHub API.
         app_config: Cached loaded application configuration.
         error_reason: Error message if update check failed, None on success.
+        stale: True if the release came from an expired cache entry that
+            is being refreshed in the background.
 
     Example:
         >>> info = await manager.check_single_update("firefox", session)
@@ -1370,6 +1618,7 @@ class UpdateInfo:
     release_data: Release | None = None
     app_config: dict[str, Any] | None = None  # Cached loaded config
     error_reason: str | None = None
+    stale: bool = False
 
     def __post_init__(self) -> None:
         """Post-initialization processing."""
@@ -14,7 +14,6 @@ Logging Strategy:
 from __future__ import annotations
 
 import asyncio
-import hashlib
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -32,24 +31,27 @@ from my_unicorn.constants import (
 from my_unicorn.core.api import Asset, AssetSelector
 from my_unicorn.core.checksum_parser import (
     ChecksumFileResult,
+    ChecksumManifest,
     convert_base64_to_hex,
     detect_hash_type_from_checksum_filename,
     parse_all_checksums,
     parse_checksum_file,
 )
+from my_unicorn.core.hashing import hash_file, run_in_hash_executor
 from my_unicorn.core.protocols.progress import (
     NullProgressReporter,
     ProgressReporter,
     ProgressType,
 )
 from my_unicorn.exceptions import VerificationError
-from my_unicorn.logger import get_logger
+from my_unicorn.logger import get_logger, timing_span
 from my_unicorn.types import ChecksumFileInfo
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from my_unicorn.core.cache import ReleaseCacheManager
+    from my_unicorn.core.checksum_prefetch import ChecksumPrefetch
     from my_unicorn.core.download import DownloadService
 
 
@@ -59,10 +61,6 @@ logger = get_logger(__name__, enable_file_logging=True)
 
 BYTES_PER_UNIT = 1024.0
 
-# Files larger than this threshold are hashed in a ThreadPoolExecutor to
-# avoid blocking the event loop during CPU-intensive hash computation.
-LARGE_FILE_THRESHOLD = 100 * 1024 * 1024  # 100 MB
-
 
 @dataclass(slots=True, frozen=True)
 class MethodResult:
@@ -174,6 +172,10 @@ class VerificationContext:
     app_name: str
     assets: list[Asset] | None
     progress_task_id: Any | None
+    # Digests computed while downloading, keyed by algorithm name
+    precomputed_hashes: dict[str, str] | None = None
+    # Checksum file fetched concurrently with the download
+    checksum_prefetch: ChecksumPrefetch | None = None
     # Populated during _prepare_verification
     has_digest: bool = False
     checksum_files: list[ChecksumFileInfo] | None = None
@@ -312,6 +314,8 @@ class VerificationService:
         app_name: str,
         assets: list[Asset] | None = None,
         progress_task_id: Any | None = None,
+        precomputed_hashes: dict[str, str] | None = None,
+        checksum_prefetch: ChecksumPrefetch | None = None,
     ) -> VerificationResult:
         """Perform comprehensive file verification.
 
@@ -325,6 +329,11 @@ class VerificationService:
             app_name: Application name for logging.
             assets: All GitHub release assets (enables auto-detection).
             progress_task_id: Optional progress task ID for tracking.
+            precomputed_hashes: Digests computed while the file was
+                downloaded, keyed by algorithm. Used instead of reading
+                the file back when present.
+            checksum_prefetch: Checksum file fetched while the file was
+                downloaded; used instead of downloading it again.
 
         Returns:
             VerificationResult with success status and methods used.
@@ -343,6 +352,8 @@ class VerificationService:
             app_name=app_name,
             assets=assets,
             progress_task_id=progress_task_id,
+            precomputed_hashes=precomputed_hashes,
+            checksum_prefetch=checksum_prefetch,
         )
 
         # Phase 1: Prepare — detect methods, check skip conditions.
@@ -433,7 +444,9 @@ class VerificationService:
                 warning="Not verified - developer did not provide checksums",
             )
 
-        context.verifier = Verifier(context.file_path)
+        context.verifier = Verifier(
+            context.file_path, context.precomputed_hashes
+        )
         return None
 
     async def _finalize_verification(
@@ -691,21 +704,53 @@ class Verifier:
     """Handles hash computation and low-level file verification.
 
     Supports sha256 and sha512 only (sha1/md5 are intentionally excluded).
-    Large files (> LARGE_FILE_THRESHOLD) are hashed in a ThreadPoolExecutor
-    via ``compute_hash_async`` to keep the event loop responsive.
+    Hashing is done by ``core.hashing``; async callers run the verify
+    methods on its dedicated thread pool (``compute_hash_async`` or
+    ``run_in_hash_executor``) to keep the event loop responsive.
+    Digests computed while downloading are used without reading the file.
     """
 
-    def __init__(self, file_path: Path) -> None:
+    def __init__(
+        self,
+        file_path: Path,
+        precomputed_hashes: dict[str, str] | None = None,
+    ) -> None:
         """Create a verifier for a downloaded file.
 
         Args:
             file_path: Path to the file to verify.
+            precomputed_hashes: Hex digests already computed for the file,
+                keyed by algorithm name (e.g. from the download stream).
 
         """
         self.file_path: Path = file_path
+        self.precomputed_hashes: dict[str, str] = dict(
+            precomputed_hashes or {}
+        )
         self._last_computed_hash: str | None = None
         self._log_file_info()
 
+    def _get_precomputed_hash(self, hash_type: HashType) -> str | None:
+        """Return a digest computed during download, if one is available.
+
+        Args:
+            hash_type: Hash algorithm — sha256 or sha512.
+
+        Returns:
+            Lowercase hexadecimal digest string, or None.
+
+        """
+        precomputed = self.precomputed_hashes.get(hash_type)
+        if not precomputed:
+            return None
+        logger.debug(
+            "🧮 Using %s hash computed during download for %s",
+            hash_type.upper(),
+            self.file_path.name,
+        )
+        self._last_computed_hash = precomputed.lower()
+        return self._last_computed_hash
+
     def _log_file_info(self) -> None:
         """Log basic file metadata at debug level."""
         if self.file_path.exists():
@@ -834,14 +879,17 @@ class Verifier:
             ValueError: If ``hash_type`` is unsupported.
 
         """
-        return self._compute_hash_sync(hash_type)
+        precomputed = self._get_precomputed_hash(hash_type)
+        if precomputed:
+            return precomputed
+        with timing_span("hash"):
+            return self._compute_hash_sync(hash_type)
 
     async def compute_hash_async(self, hash_type: HashType) -> str:
-        """Compute the file hash, offloading large files to a thread pool.
+        """Compute the file hash on the hashing thread pool.
 
-        Files smaller than ``LARGE_FILE_THRESHOLD`` are hashed synchronously.
-        Larger files run in a ``ThreadPoolExecutor`` so the event loop
-        remains responsive.
+        Files of every size are hashed off the event loop, so concurrent
+        downloads and progress rendering are never stalled.
 
         Args:
             hash_type: Hash algorithm — sha256 or sha512.
@@ -854,30 +902,14 @@ class Verifier:
             ValueError: If ``hash_type`` is unsupported.
 
         """
-        if not self.file_path.exists():
-            msg = f"File not found: {self.file_path}"
-            logger.error("× %s", msg)
-            raise FileNotFoundError(msg)
+        precomputed = self._get_precomputed_hash(hash_type)
+        if precomputed:
+            return precomputed
 
-        file_size = self.file_path.stat().st_size
-
-        if file_size < LARGE_FILE_THRESHOLD:
-            logger.debug(
-                "📁 File size %s < threshold, using sync hash computation",
-                format_bytes(file_size),
+        with timing_span("hash"):
+            return await run_in_hash_executor(
+                self._compute_hash_sync, hash_type
             )
-            return self._compute_hash_sync(hash_type)
-
-        logger.debug(
-            "📁 File size %s >= threshold, offloading to ThreadPoolExecutor",
-            format_bytes(file_size),
-        )
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            self._compute_hash_sync,
-            hash_type,
-        )
 
     def _compute_hash_sync(self, hash_type: HashType) -> str:
         """Synchronous hash computation implementation.
@@ -898,12 +930,7 @@ class Verifier:
             logger.error("× %s", msg)
             raise FileNotFoundError(msg)
 
-        hash_algorithms = {
-            "sha256": hashlib.sha256,
-            "sha512": hashlib.sha512,
-        }
-
-        if hash_type not in hash_algorithms:
+        if hash_type not in SUPPORTED_HASH_ALGORITHMS:
             msg = f"Unsupported hash type: {hash_type}"
             logger.error("× %s", msg)
             raise ValueError(msg)
@@ -914,22 +941,14 @@ class Verifier:
             self.file_path.name,
         )
 
-        hasher = hash_algorithms[hash_type]()
-        bytes_processed = 0
-        chunk_size = 8192
-
-        with self.file_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                hasher.update(chunk)
-                bytes_processed += len(chunk)
-
-        computed_hash = hasher.hexdigest()
+        computed_hash = hash_file(self.file_path, hash_type)
         self._last_computed_hash = computed_hash
 
+        file_size = self.file_path.stat().st_size
         logger.debug(
             "   Processed: %s (%d bytes)",
-            format_bytes(bytes_processed),
-            bytes_processed,
+            format_bytes(file_size),
+            file_size,
         )
         logger.debug("   Hash: %s", computed_hash)
         return computed_hash
@@ -983,15 +1002,19 @@ class Verifier:
         logger.debug("✓ Found expected hash in checksum file")
         logger.debug("   Expected hash: %s", expected_hash)
 
-        self.verify_hash(expected_hash, hash_type)
+        await run_in_hash_executor(self.verify_hash, expected_hash, hash_type)
 
     def parse_checksum_file(
-        self, content: str, filename: str, hash_type: HashType
+        self,
+        content: str | ChecksumManifest,
+        filename: str,
+        hash_type: HashType,
     ) -> str | None:
         """Expose checksum parsing for callers that already have the content.
 
         Args:
-            content: Raw checksum file content.
+            content: Raw checksum file content, or the already parsed
+                manifest.
             filename: Filename to look up in the checksum file.
             hash_type: Expected hash algorithm.
 
@@ -999,7 +1022,10 @@ class Verifier:
             Hex hash string, or None if the filename was not found.
 
         """
-        return parse_checksum_file(content, filename, hash_type)
+        if isinstance(content, str):
+            return parse_checksum_file(content, filename, hash_type)
+        entry = content.find(filename, hash_type)
+        return entry.hash_value if entry else None
 
     def detect_hash_type_from_filename(self, filename: str) -> HashType:
         """Infer hash type from a checksum filename, falling back to default.
@@ -1065,7 +1091,7 @@ async def verify_digest(
 
         # verify_digest reads the file once and raises on mismatch.
         # We do NOT call compute_hash separately to avoid a second read.
-        verifier.verify_digest(digest)
+        await run_in_hash_executor(verifier.verify_digest, digest)
 
         # Verification passed — the hash portion of the digest equals the
         # computed hash, so we can safely expose it without re-reading.
@@ -1135,7 +1161,8 @@ async def verify_checksum_file(
         app_name: Application name used in log messages.
         download_service: Service for downloading the checksum file.
         cache_manager: Optional cache manager for storing parsed hashes.
-        context: Verification context used for cache storage keys.
+        context: Verification context used for cache storage keys and
+            the checksum file prefetched during the download.
 
     Returns:
         MethodResult with ``passed=True`` on a hash match, or
@@ -1149,9 +1176,16 @@ async def verify_checksum_file(
             checksum_file.format_type,
         )
 
-        content = await download_service.download_checksum_file(
-            checksum_file.url
+        prefetch = context.checksum_prefetch if context else None
+        manifest = (
+            await prefetch.manifest_for(checksum_file) if prefetch else None
         )
+        if manifest is None:
+            content = await download_service.download_checksum_file(
+                checksum_file.url
+            )
+            # Parse once for both the lookup and the checksum cache
+            manifest = ChecksumManifest.parse(content)
 
         # Resolve hash type: YAML files always use YAML_DEFAULT_HASH (sha512);
         # traditional files are inferred from the filename.
@@ -1169,7 +1203,7 @@ async def verify_checksum_file(
             )
 
         expected_hash = verifier.parse_checksum_file(
-            content, target_filename, hash_type
+            manifest, target_filename, hash_type
         )
         if not expected_hash:
             logger.error("Checksum file verification FAILED - hash not found!")
@@ -1199,7 +1233,9 @@ async def verify_checksum_file(
             expected_hash,
         )
 
-        computed_hash = verifier.compute_hash(hash_type)
+        computed_hash = await run_in_hash_executor(
+            verifier.compute_hash, hash_type
+        )
         logger.debug(
             "   🧮 Computed hash (%s): %s",
             hash_type.upper(),
@@ -1219,13 +1255,14 @@ async def verify_checksum_file(
                 "✓ Checksum file verification PASSED! (%s)",
                 hash_type.upper(),
             )
-            await cache_checksum_file_data(
-                content,
-                checksum_file,
-                hash_type,
-                cache_manager,
-                context,
-            )
+            if not manifest.cached:
+                await cache_checksum_file_data(
+                    manifest,
+                    checksum_file,
+                    hash_type,
+                    cache_manager,
+                    context,
+                )
             return MethodResult(
                 passed=True,
                 hash=expected_hash,
@@ -1264,7 +1301,7 @@ async def verify_checksum_file(
 
 
 async def cache_checksum_file_data(
-    content: str,
+    content: str | ChecksumManifest,
     checksum_file: ChecksumFileInfo,
     hash_type: HashType,
     cache_manager: ReleaseCacheManager | None,
@@ -1276,7 +1313,8 @@ async def cache_checksum_file_data(
     verification runs can skip the download.
 
     Args:
-        content: Raw downloaded checksum file content.
+        content: Raw downloaded checksum file content, or the manifest
+            already parsed from it.
         checksum_file: Metadata for the checksum file.
         hash_type: Algorithm that was used for verification.
         cache_manager: Cache manager; silently skipped when None.
@@ -1287,7 +1325,12 @@ async def cache_checksum_file_data(
         return
 
     try:
-        all_hashes = parse_all_checksums(content)
+        if isinstance(content, ChecksumManifest):
+            all_hashes = content.hashes
+            format_type = content.format_type
+        else:
+            all_hashes = parse_all_checksums(content)
+            format_type = None
         if not all_hashes:
             logger.debug(
                 "No hashes parsed from checksum file: %s",
@@ -1304,6 +1347,7 @@ async def cache_checksum_file_data(
             filename=checksum_file.filename,
             algorithm=algorithm,
             hashes=all_hashes,
+            format_type=format_type,
         )
 
         stored = await cache_manager.store_checksum_file(
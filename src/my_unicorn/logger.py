@@ -63,7 +63,9 @@ This module contains the core public API for the my-unicorn logging system:
 - setup_logging(): Configure logging with async-safe QueueHandler architecture
 - get_logger(): Get or create logger instance with singleton pattern
 - flush_all_handlers(): Ensure all pending log records are written to disk
+- set_console_stream(): Redirect console logging, e.g. to stderr
 - clear_logger_state(): Clear global logger state for testing
+- timing_span(): Time a phase of the run for the ``--timings`` report
 
 These functions maintain the singleton logger pattern and ensure proper
 initialization and cleanup of the logging system.
@@ -71,13 +73,19 @@ initialization and cleanup of the logging system.
 
 import atexit
 import contextlib
+import contextvars
 import logging
 import os
 import queue
 import sys
 import threading
+import time
 from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from types import TracebackType
+from typing import Any, TextIO
+
+import orjson
 
 from my_unicorn.constants import (
     DEFAULT_CONSOLE_LOG_LEVEL,
@@ -163,6 +171,26 @@ def flush_all_handlers() -> None:
     state.queue_listener.start()
 
 
+def set_console_stream(stream: TextIO) -> None:
+    """Write console log records to another stream.
+
+    Used by ``--progress=jsonl`` to keep stdout free for progress events,
+    so consumers reading one JSON object per line never see log lines.
+
+    Args:
+        stream: New console stream (e.g. sys.stderr)
+
+    """
+    state = get_state()
+    if state.queue_listener is None:
+        return
+    for handler in state.queue_listener.handlers:
+        if isinstance(handler, logging.StreamHandler) and not isinstance(
+            handler, RotatingFileHandler
+        ):
+            handler.setStream(stream)
+
+
 def _cleanup_logging() -> None:
     """Clean up QueueListener on application exit.
 
@@ -787,3 +815,214 @@ def update_logger_from_config() -> None:
             f"[my-unicorn logger] Warning: could not apply config settings: {e}",
             file=sys.stderr,
         )
+
+
+# ---------------------------------------------------------------------------
+# Timing spans (``--timings``)
+# ---------------------------------------------------------------------------
+
+
+class _TimingState:
+    """Collected timing spans of the current run.
+
+    Attributes:
+        lock: Thread lock for recording spans from worker threads
+        enabled: Whether spans are recorded
+        started: perf_counter value when timings were enabled
+        spans: Recorded (phase, app, seconds) tuples
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize timing state (disabled)."""
+        self.lock = threading.Lock()
+        self.enabled = False
+        self.started = 0.0
+        self.spans: list[tuple[str, str | None, float]] = []
+
+
+_timing = _TimingState()
+
+# App the current task is working on; set by spans with an app and
+# inherited by nested spans and by asyncio tasks created inside them
+_timing_app: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "my_unicorn_timing_app", default=None
+)
+
+
+class _Span:
+    """Context manager recording the duration of one phase."""
+
+    __slots__ = ("_app", "_phase", "_start", "_token")
+
+    def __init__(self, phase: str, app: str | None) -> None:
+        self._phase = phase
+        self._app = app
+        self._start = 0.0
+        self._token: contextvars.Token[str | None] | None = None
+
+    def __enter__(self) -> None:
+        if self._app is not None:
+            self._token = _timing_app.set(self._app)
+        else:
+            self._app = _timing_app.get()
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        elapsed = time.perf_counter() - self._start
+        if self._token is not None:
+            _timing_app.reset(self._token)
+        with _timing.lock:
+            _timing.spans.append((self._phase, self._app, elapsed))
+
+    async def __aenter__(self) -> None:
+        self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.__exit__(exc_type, exc, traceback)
+
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def enable_timings() -> None:
+    """Start recording timing spans, discarding earlier ones."""
+    with _timing.lock:
+        _timing.spans.clear()
+        _timing.started = time.perf_counter()
+        _timing.enabled = True
+
+
+def disable_timings() -> None:
+    """Stop recording timing spans and discard recorded ones."""
+    with _timing.lock:
+        _timing.enabled = False
+        _timing.spans.clear()
+
+
+def timings_enabled() -> bool:
+    """Return whether timing spans are being recorded."""
+    return _timing.enabled
+
+
+def timing_span(
+    phase: str, app: str | None = None
+) -> _Span | contextlib.nullcontext[None]:
+    """Time a phase of the run for the ``--timings`` report.
+
+    Costs nothing but a function call while timings are disabled. Works
+    with ``with`` and ``async with``; the span covers everything inside the
+    block, including awaits.
+
+    Args:
+        phase: Phase name (e.g. ``"download"``, ``"hash"``)
+        app: App the work belongs to. Nested spans and tasks started inside
+            the block inherit it; without it the enclosing app is used.
+
+    Example:
+        >>> with timing_span("update", app="obsidian"):
+        ...     with timing_span("download"):
+        ...         await download()
+
+    """
+    if not _timing.enabled:
+        return _NULL_SPAN
+    return _Span(phase, app)
+
+
+def timing_report() -> dict[str, Any]:
+    """Summarize the recorded spans.
+
+    Returns:
+        Dictionary with the wall time since timings were enabled, the total
+        seconds and span count per phase, and the seconds per phase for
+        every app. Nested spans are counted in both phases.
+
+    """
+    with _timing.lock:
+        spans = list(_timing.spans)
+        wall = time.perf_counter() - _timing.started if _timing.enabled else 0
+
+    phases: dict[str, dict[str, float]] = {}
+    apps: dict[str, dict[str, float]] = {}
+    for phase, app, seconds in spans:
+        totals = phases.setdefault(phase, {"seconds": 0.0, "count": 0})
+        totals["seconds"] += seconds
+        totals["count"] += 1
+        if app is not None:
+            app_phases = apps.setdefault(app, {})
+            app_phases[phase] = app_phases.get(phase, 0.0) + seconds
+
+    return {
+        "wall_seconds": round(wall, 6),
+        "phases": {
+            phase: {
+                "seconds": round(totals["seconds"], 6),
+                "count": int(totals["count"]),
+            }
+            for phase, totals in sorted(
+                phases.items(), key=lambda item: -item[1]["seconds"]
+            )
+        },
+        "apps": {
+            app: {phase: round(secs, 6) for phase, secs in app_phases.items()}
+            for app, app_phases in sorted(
+                apps.items(), key=lambda item: -sum(item[1].values())
+            )
+        },
+    }
+
+
+def format_timing_report(report: dict[str, Any]) -> str:
+    """Format a timing report as a per-phase and per-app table.
+
+    Args:
+        report: Report returned by timing_report()
+
+    Returns:
+        Multi-line table, slowest phases and apps first
+
+    """
+    lines = [f"Timings (wall {report['wall_seconds']:.2f}s)"]
+    lines.append(f"  {'phase':<20} {'count':>6} {'seconds':>9}")
+    for phase, totals in report["phases"].items():
+        lines.append(
+            f"  {phase:<20} {totals['count']:>6} {totals['seconds']:>9.3f}"
+        )
+
+    if report["apps"]:
+        phase_names = list(report["phases"])
+        lines.append("")
+        header = "".join(f" {phase[:10]:>10}" for phase in phase_names)
+        lines.append(f"  {'app':<24}{header}")
+        for app, app_phases in report["apps"].items():
+            cells = "".join(
+                f" {app_phases[phase]:>10.3f}"
+                if phase in app_phases
+                else f" {'-':>10}"
+                for phase in phase_names
+            )
+            lines.append(f"  {app[:24]:<24}{cells}")
+    return "\n".join(lines)
+
+
+def write_timing_report(report: dict[str, Any], path: Path) -> None:
+    """Write a timing report as JSON, for tracking trends across runs.
+
+    Args:
+        report: Report returned by timing_report()
+        path: Destination file (parent directories are created)
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
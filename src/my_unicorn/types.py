@@ -7,7 +7,7 @@ any IO or infrastructure dependencies.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -23,6 +23,10 @@ class NetworkConfig(TypedDict):
 
     retry_attempts: int
     timeout_seconds: int
+    download_segments: int
+    segment_threshold_mb: int
+    cache_ttl_hours: int
+    cache_stale_hours: int
 
 
 class DirectoryConfig(TypedDict):
@@ -43,6 +47,7 @@ class GlobalConfig(TypedDict):
     config_version: str
     max_concurrent_downloads: int
     max_backup: int
+    backup_strategy: str
     log_level: str
     console_log_level: str
     network: NetworkConfig
@@ -60,6 +65,8 @@ class CacheEntry(TypedDict):
     cached_at: str  # ISO 8601 timestamp
     ttl_hours: int  # Cache TTL in hours
     release_data: dict[str, Any]  # GitHubReleaseDetails structure
+    etag: NotRequired[str]  # ETag of the API response, for If-None-Match
+    last_modified: NotRequired[str]  # Last-Modified, for If-Modified-Since
 
 
 # =============================================================================
@@ -10,7 +10,9 @@ from typing import Any
 from my_unicorn.constants import ERROR_DESKTOP_ENTRY_FAILED
 from my_unicorn.core.desktop_entry import DesktopEntry
 from my_unicorn.core.file_ops import FileOperations, extract_icon_from_appimage
+from my_unicorn.core.icon_cache import IconCache
 from my_unicorn.logger import get_logger
+from my_unicorn.types import GlobalConfig
 
 logger = get_logger(__name__)
 
@@ -59,13 +61,15 @@ def rename_appimage(
     return renamed_path
 
 
-async def setup_appimage_icon(
+async def setup_appimage_icon(  # noqa: PLR0913
     *,
     appimage_path: Path,
     app_name: str,
     icon_dir: Path,
     app_config: dict[str, Any],
     catalog_entry: dict[str, Any] | None,
+    icon_cache: IconCache | None = None,
+    appimage_digest: str | None = None,
 ) -> dict[str, Any]:
     """Extract icon from AppImage.
 
@@ -77,6 +81,8 @@ async def setup_appimage_icon(
         icon_dir: Directory where icons should be saved
         app_config: App configuration dictionary
         catalog_entry: Catalog entry if available (optional)
+        icon_cache: Cache used to reuse an unchanged icon (optional)
+        appimage_digest: SHA-256 hex digest of the AppImage (optional)
 
     Returns:
         Icon extraction result dictionary with keys:
@@ -122,6 +128,8 @@ async def setup_appimage_icon(
             icon_dir=icon_dir,
             app_name=app_name,
             icon_filename=icon_filename,
+            icon_cache=icon_cache,
+            appimage_digest=appimage_digest,
         )
     except (OSError, PermissionError):
         logger.exception("Icon extraction failed for %s", app_name)
@@ -168,6 +176,7 @@ def create_desktop_entry(
     app_name: str,
     icon_result: dict[str, Any],
     config_manager: Any,  # noqa: ANN401
+    global_config: GlobalConfig | None = None,
 ) -> dict[str, Any]:
     """Create desktop entry for application.
 
@@ -178,6 +187,7 @@ def create_desktop_entry(
         app_name: Application name
         icon_result: Icon extraction result from setup_appimage_icon()
         config_manager: Configuration manager instance
+        global_config: Optional global configuration snapshot
 
     Returns:
         Desktop entry creation result dictionary with keys:
@@ -200,6 +210,7 @@ def create_desktop_entry(
             appimage_path=appimage_path,
             icon_path=icon_path,
             config_manager=config_manager,
+            global_config=global_config,
         )
 
         desktop_path = desktop.create_desktop_file()
@@ -7,7 +7,13 @@ to eliminate code duplication.
 from pathlib import Path
 from typing import Any
 
+import aiohttp
+
 from my_unicorn.core.api import Asset, AssetSelector, Release
+from my_unicorn.core.checksum_prefetch import (
+    ChecksumPrefetch,
+    prefetch_checksum_file,
+)
 from my_unicorn.core.verify import VerificationService
 from my_unicorn.exceptions import InstallationError
 from my_unicorn.logger import get_logger
@@ -119,6 +125,93 @@ def _get_catalog_preferred_suffixes(
     return [arch for arch in architectures if isinstance(arch, str)]
 
 
+def _load_verification_config(
+    app_name: str,
+    verification_config: dict[str, Any] | None,
+    catalog_entry: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Load verification config from catalog or app config."""
+    if catalog_entry and catalog_entry.get("verification"):
+        config = dict(catalog_entry["verification"])
+        logger.debug(
+            "📋 Using catalog verification config for %s: %s",
+            app_name,
+            config,
+        )
+        return config
+    if verification_config:
+        config = dict(verification_config)
+        logger.debug(
+            "📋 Using app config verification config for %s: %s",
+            app_name,
+            config,
+        )
+        return config
+    return {}
+
+
+def _resolve_owner_repo(
+    owner: str, repo: str, catalog_entry: dict[str, Any] | None
+) -> tuple[str, str]:
+    """Extract owner/repo from catalog if not provided."""
+    if not owner and catalog_entry:
+        owner = catalog_entry.get("source", {}).get("owner", "")
+    if not repo and catalog_entry:
+        repo = catalog_entry.get("source", {}).get("repo", "")
+    return owner, repo
+
+
+def start_checksum_prefetch(  # noqa: PLR0913
+    *,
+    asset: Asset,
+    release: Release,
+    app_name: str,
+    verification_service: VerificationService,
+    verification_config: dict[str, Any] | None = None,
+    catalog_entry: dict[str, Any] | None = None,
+    owner: str = "",
+    repo: str = "",
+) -> ChecksumPrefetch | None:
+    """Start fetching the checksum file of an AppImage being downloaded.
+
+    Uses the same config resolution as verify_appimage_download() so the
+    prefetched file is the one verification selects.
+
+    Args:
+        asset: GitHub asset being downloaded
+        release: Release data containing tag and assets
+        app_name: Application name for logging
+        verification_service: Pre-initialized verification service
+        verification_config: Verification configuration from app config
+        catalog_entry: Catalog entry with verification settings
+        owner: Repository owner (required if not in catalog_entry)
+        repo: Repository name (required if not in catalog_entry)
+
+    Returns:
+        The running prefetch to pass to verify_appimage_download(), or
+        None when no checksum file is available or the prefetch could not
+        be started.
+
+    """
+    config = _load_verification_config(
+        app_name, verification_config, catalog_entry
+    )
+    owner, repo = _resolve_owner_repo(owner, repo, catalog_entry)
+    try:
+        return prefetch_checksum_file(
+            verification_service,
+            asset,
+            config,
+            owner=owner,
+            repo=repo,
+            tag_name=release.original_tag_name or "unknown",
+            assets=release.assets,
+        )
+    except (aiohttp.ClientError, TimeoutError, OSError, ValueError) as e:
+        logger.debug("Checksum prefetch not started for %s: %s", app_name, e)
+        return None
+
+
 async def verify_appimage_download(  # noqa: PLR0913
     *,
     file_path: Path,
@@ -131,6 +224,8 @@ async def verify_appimage_download(  # noqa: PLR0913
     owner: str = "",
     repo: str = "",
     progress_task_id: str | None = None,
+    precomputed_hashes: dict[str, str] | None = None,
+    checksum_prefetch: ChecksumPrefetch | None = None,
 ) -> dict[str, Any]:
     """Verify downloaded AppImage file.
 
@@ -148,6 +243,9 @@ async def verify_appimage_download(  # noqa: PLR0913
         owner: Repository owner (required if not in catalog_entry)
         repo: Repository name (required if not in catalog_entry)
         progress_task_id: Progress task ID for tracking (optional)
+        precomputed_hashes: Digests computed while downloading (optional)
+        checksum_prefetch: Checksum file fetched while downloading, from
+            start_checksum_prefetch() (optional)
 
     Returns:
         Verification result dictionary with keys:
@@ -158,28 +256,10 @@ async def verify_appimage_download(  # noqa: PLR0913
             - error (str): Error message if verification failed
 
     """
-    # Load verification config from catalog or app config
-    config: dict[str, Any] = {}
-    if catalog_entry and catalog_entry.get("verification"):
-        config = dict(catalog_entry["verification"])
-        logger.debug(
-            "📋 Using catalog verification config for %s: %s",
-            app_name,
-            config,
-        )
-    elif verification_config:
-        config = dict(verification_config)
-        logger.debug(
-            "📋 Using app config verification config for %s: %s",
-            app_name,
-            config,
-        )
-
-    # Extract owner/repo from catalog if not provided
-    if not owner and catalog_entry:
-        owner = catalog_entry.get("source", {}).get("owner", "")
-    if not repo and catalog_entry:
-        repo = catalog_entry.get("source", {}).get("repo", "")
+    config = _load_verification_config(
+        app_name, verification_config, catalog_entry
+    )
+    owner, repo = _resolve_owner_repo(owner, repo, catalog_entry)
 
     # Get tag name and assets from release data
     tag_name = release.original_tag_name or "unknown"
@@ -202,6 +282,8 @@ async def verify_appimage_download(  # noqa: PLR0913
             app_name=app_name,
             assets=assets,
             progress_task_id=progress_task_id,
+            precomputed_hashes=precomputed_hashes,
+            checksum_prefetch=checksum_prefetch,
         )
     except Exception:
         logger.exception("Verification failed for %s", app_name)
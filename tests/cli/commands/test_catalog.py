@@ -41,6 +41,16 @@ def mock_config_manager() -> MagicMock:
 
     config_manager.load_catalog.side_effect = load_catalog
     config_manager.load_app_config.side_effect = load_config
+    config_manager.load_all_app_configs.return_value = (
+        {},
+        {
+            app: (
+                f"Config for '{app}' is version 1.0.0, expected 2.0.0. "
+                "Run 'my-unicorn migrate' to upgrade."
+            )
+            for app in config_manager.list_installed_apps.return_value
+        },
+    )
     return config_manager
 
 
@@ -56,6 +56,7 @@ async def test_update_handler_check_only_mode(
 
     mock_service = MagicMock()
     mock_service.check_for_updates = AsyncMock(return_value=mock_results)
+    mock_service.finish_background_refresh = AsyncMock()
 
     mock_container = MagicMock()
     mock_container.create_update_application_service.return_value = (
@@ -82,11 +83,15 @@ async def test_update_handler_check_only_mode(
         mock_service.check_for_updates.assert_awaited_once_with(
             app_names=["app1"],
             refresh_cache=False,
+            allow_stale=True,
         )
 
         # Verify cleanup was called
         mock_container.cleanup.assert_awaited_once()
 
+        # Stale results are refreshed after display
+        mock_service.finish_background_refresh.assert_awaited_once()
+
 
 @pytest.mark.asyncio
 async def test_update_handler_perform_updates(
@@ -104,6 +109,7 @@ async def test_update_handler_perform_updates(
 
     mock_service = MagicMock()
     mock_service.perform_updates = AsyncMock(return_value=mock_results)
+    mock_service.finish_background_refresh = AsyncMock()
 
     mock_container = MagicMock()
     mock_container.create_update_application_service.return_value = (
@@ -643,25 +643,40 @@ class TestNullProgressReporterDefault:
 class TestGlobalConfigCaching:
     """Tests for global configuration caching behavior."""
 
-    def test_global_config_loaded_once(self) -> None:
-        """Global config should be loaded once and cached."""
+    def test_global_config_uses_shared_snapshot(self) -> None:
+        """Global config should come from the shared snapshot."""
         config = MagicMock(spec=ConfigManager)
-        config.load_global_config.return_value = {
-            "directory": {"storage": MagicMock()}
-        }
+        snapshot = {"directory": {"storage": MagicMock()}}
+        config.global_config_snapshot.return_value = snapshot
         container = ServiceContainer(config_manager=config)
 
-        _ = container.global_config
-        _ = container.global_config
-        _ = container.global_config
+        assert container.global_config is snapshot
+        config.load_global_config.assert_not_called()
 
-        config.load_global_config.assert_called_once()
+    def test_global_config_injected_into_services(self) -> None:
+        """Services should receive the snapshot instead of loading it."""
+        config = MagicMock(spec=ConfigManager)
+        snapshot = {"directory": {"storage": MagicMock()}, "network": {}}
+        config.global_config_snapshot.return_value = snapshot
+        container = ServiceContainer(config_manager=config)
+
+        with (
+            patch("my_unicorn.cli.container.aiohttp.ClientSession"),
+            patch("my_unicorn.cli.container.GitHubAuthManager.create_default"),
+            patch("my_unicorn.cli.container.DownloadService") as mock_dl,
+            patch("my_unicorn.cli.container.ReleaseCacheManager") as mock_rc,
+        ):
+            _ = container.download_service
+            _ = container.cache_manager
+
+        assert mock_dl.call_args.kwargs["global_config"] is snapshot
+        assert mock_rc.call_args.kwargs["global_config"] is snapshot
 
     def test_install_dir_from_global_config(self) -> None:
         """install_dir should return storage path from global config."""
         config = MagicMock(spec=ConfigManager)
         mock_path = MagicMock()
-        config.load_global_config.return_value = {
+        config.global_config_snapshot.return_value = {
             "directory": {"storage": mock_path}
         }
         container = ServiceContainer(config_manager=config)
@@ -46,10 +46,28 @@ def test_install_command_with_options(cli_parser):
         assert args.verbose
 
 
+def test_progress_jsonl_option(cli_parser, tmp_path):
+    fifo = tmp_path / "progress.fifo"
+    with patch(
+        "sys.argv",
+        [
+            "my-unicorn",
+            "--progress=jsonl",
+            "--progress-output",
+            str(fifo),
+            "update",
+        ],
+    ):
+        args = cli_parser.parse_args()
+        assert args.progress == "jsonl"
+        assert args.progress_output == fifo
+
+
 def test_update_command_all(cli_parser):
     with patch("sys.argv", ["my-unicorn", "update"]):
         args = cli_parser.parse_args()
         assert args.command == "update"
+        assert args.progress == "ascii"
         assert args.apps == []
         assert not args.check_only
 
@@ -1,15 +1,20 @@
 """Tests for CLI runner module."""
 
 import logging
+import os
+import subprocess
 import sys
 from argparse import Namespace
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 
 from my_unicorn.cli import runner
 from my_unicorn.exceptions import LockError
+from my_unicorn.logger import disable_timings
 
 
 @pytest.fixture(autouse=True)
@@ -305,3 +310,92 @@ async def test_cli_runner_version_flag_skips_lock(
 
     # Verify LockManager constructor was never called for --version
     assert not lock_manager_constructor_mock.called
+
+
+@pytest.mark.asyncio
+async def test_cli_runner_writes_timings_json(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: tuple[runner.CLIRunner, dict[str, Any]],
+    tmp_path: Path,
+) -> None:
+    """Test that --timings-json writes the timing report after the run."""
+    r, _ = cli_runner
+    timings_path = tmp_path / "timings.json"
+
+    class DummyParser:
+        def __init__(self, config: Any) -> None:
+            pass
+
+        def parse_args(self) -> Namespace:
+            return Namespace(
+                version=True, timings=False, timings_json=timings_path
+            )
+
+    monkeypatch.setattr(runner, "CLIParser", DummyParser)
+
+    try:
+        await r.run()
+    finally:
+        disable_timings()
+
+    report = orjson.loads(timings_path.read_bytes())
+    assert set(report) == {"wall_seconds", "phases", "apps"}
+
+
+@pytest.mark.asyncio
+async def test_jsonl_progress_moves_console_logging_to_stderr(
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: tuple[runner.CLIRunner, dict[str, Any]],
+) -> None:
+    """Test --progress=jsonl keeps log lines out of the stdout stream."""
+    r, _ = cli_runner
+    set_stream = MagicMock()
+    monkeypatch.setattr(runner, "set_console_stream", set_stream)
+
+    class DummyParser:
+        def __init__(self, config: Any) -> None:
+            pass
+
+        def parse_args(self) -> Namespace:
+            return Namespace(version=True, progress="jsonl")
+
+    monkeypatch.setattr(runner, "CLIParser", DummyParser)
+
+    await r.run()
+
+    set_stream.assert_called_once_with(sys.stderr)
+
+
+def test_command_modules_are_imported_on_dispatch() -> None:
+    """Startup and non-network commands do not load network modules."""
+    code = (
+        "import sys\n"
+        "from my_unicorn.cli import runner\n"
+        "import my_unicorn.cli.commands.catalog\n"
+        "import my_unicorn.cli.commands.config\n"
+        "network = {'aiohttp', 'jsonschema', 'keyring'}\n"
+        "print(sorted(network & set(sys.modules)))"
+    )
+    src_dir = Path(runner.__file__).parents[2]
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src_dir)},
+    )
+
+    assert result.stdout.strip() == "[]"
+    assert set(runner.COMMAND_HANDLERS) == {
+        "install",
+        "update",
+        "upgrade",
+        "catalog",
+        "migrate",
+        "remove",
+        "backup",
+        "cache",
+        "token",
+        "auth",
+        "config",
+    }
@@ -0,0 +1,139 @@
+"""Tests for the legacy JSON release cache migration."""
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+
+from my_unicorn.config.migration.release_cache import (
+    migrate_json_release_cache,
+    parse_legacy_cache_filename,
+)
+
+
+def make_entry(owner: str, repo: str) -> dict[str, Any]:
+    """Create a legacy cache file payload."""
+    return {
+        "cached_at": "2025-02-01T12:00:00+00:00",
+        "ttl_hours": 24,
+        "release_data": {"owner": owner, "repo": repo, "version": "1.0.0"},
+    }
+
+
+class TestParseLegacyCacheFilename:
+    """Test cases for parse_legacy_cache_filename."""
+
+    @pytest.mark.parametrize(
+        ("stem", "expected"),
+        [
+            ("owner_repo", ("owner", "repo", "stable")),
+            ("owner_repo_prerelease", ("owner", "repo", "prerelease")),
+            ("owner_repo_latest", ("owner", "repo", "latest")),
+            ("owner_my_repo", ("owner", "my_repo", "stable")),
+        ],
+    )
+    def test_without_release_metadata(
+        self, stem: str, expected: tuple[str, str, str]
+    ) -> None:
+        """Test splitting the filename at the first underscore."""
+        assert parse_legacy_cache_filename(stem, {}) == expected
+
+    def test_prefers_release_metadata(self) -> None:
+        """Test that owner/repo stored in the entry resolve ambiguity."""
+        release_data = {"owner": "owner", "repo": "app_latest"}
+
+        result = parse_legacy_cache_filename("owner_app_latest", release_data)
+
+        assert result == ("owner", "app_latest", "stable")
+
+    def test_unrecognized_name(self) -> None:
+        """Test that names without an owner separator are rejected."""
+        assert parse_legacy_cache_filename("releases", {}) is None
+
+
+class TestMigrateJsonReleaseCache:
+    """Test cases for migrate_json_release_cache."""
+
+    def test_migrates_and_removes_files(self, tmp_path: Path) -> None:
+        """Test that entries are saved and their files removed."""
+        (tmp_path / "owner_repo.json").write_bytes(
+            orjson.dumps(make_entry("owner", "repo"))
+        )
+        (tmp_path / "owner_repo_prerelease.json").write_bytes(
+            orjson.dumps(make_entry("owner", "repo"))
+        )
+        saved: list[tuple[str, str, str, Any]] = []
+
+        count = migrate_json_release_cache(
+            tmp_path, lambda *args: saved.append(args)
+        )
+
+        assert count == 2
+        assert sorted(key[:3] for key in saved) == [
+            ("owner", "repo", "prerelease"),
+            ("owner", "repo", "stable"),
+        ]
+        assert saved[0][3]["release_data"]["version"] == "1.0.0"
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_discards_unreadable_files(self, tmp_path: Path) -> None:
+        """Test that corrupted files are removed without being saved."""
+        (tmp_path / "owner_repo.json").write_text("{not json")
+        saved: list[Any] = []
+
+        count = migrate_json_release_cache(
+            tmp_path, lambda *args: saved.append(args)
+        )
+
+        assert count == 0
+        assert saved == []
+        assert not (tmp_path / "owner_repo.json").exists()
+
+    def test_keeps_files_when_save_fails(self, tmp_path: Path) -> None:
+        """Test that a failing store leaves the file for a later retry."""
+        cache_file = tmp_path / "owner_repo.json"
+        cache_file.write_bytes(orjson.dumps(make_entry("owner", "repo")))
+
+        def failing_save(*args: Any) -> None:
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            migrate_json_release_cache(tmp_path, failing_save)
+
+        assert cache_file.exists()
+
+    def test_discards_invalid_timestamp_and_continues(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a bad cached_at does not stop later files migrating."""
+        bad_entry = make_entry("a", "b")
+        bad_entry["cached_at"] = "not-a-date"
+        (tmp_path / "a_b.json").write_bytes(orjson.dumps(bad_entry))
+        (tmp_path / "c_d.json").write_bytes(orjson.dumps(make_entry("c", "d")))
+        saved: list[tuple[str, str, str, Any]] = []
+
+        count = migrate_json_release_cache(
+            tmp_path, lambda *args: saved.append(args)
+        )
+
+        assert count == 1
+        assert [key[:3] for key in saved] == [("c", "d", "stable")]
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_discards_entries_rejected_by_store(self, tmp_path: Path) -> None:
+        """Test that a ValueError from the store discards only that file."""
+        (tmp_path / "a_b.json").write_bytes(orjson.dumps(make_entry("a", "b")))
+        (tmp_path / "c_d.json").write_bytes(orjson.dumps(make_entry("c", "d")))
+        saved: list[str] = []
+
+        def picky_save(owner: str, *args: Any) -> None:
+            if owner == "a":
+                raise ValueError("invalid entry")
+            saved.append(owner)
+
+        count = migrate_json_release_cache(tmp_path, picky_save)
+
+        assert count == 1
+        assert saved == ["c"]
+        assert not list(tmp_path.glob("*.json"))
@@ -0,0 +1,93 @@
+"""Tests for fast-path checks compiled from JSON schemas."""
+
+import copy
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+from jsonschema import Draft7Validator
+
+from my_unicorn.config.schemas.fast_check import (
+    UnsupportedSchemaError,
+    compile_schema,
+)
+from my_unicorn.config.schemas.validator import (
+    APP_STATE_V2_SCHEMA_PATH,
+    CACHE_RELEASE_SCHEMA_PATH,
+    SCHEMA_DIR,
+)
+
+WRONG_VALUES: list[Any] = [None, "", "other", 0, 1.5, True, [], {}]
+
+
+def _load(path: Path) -> Any:
+    return orjson.loads(path.read_bytes())
+
+
+def _mutations(config: Any) -> Iterator[Any]:
+    """Yield copies of a config with one value removed, replaced or added."""
+    if isinstance(config, dict):
+        for key in config:
+            removed = copy.deepcopy(config)
+            del removed[key]
+            yield removed
+            for wrong in WRONG_VALUES:
+                yield {**config, key: wrong}
+            for mutated in _mutations(config[key]):
+                yield {**config, key: mutated}
+        yield {**config, "unexpected": 1}
+    elif isinstance(config, list):
+        yield []
+        for i, item in enumerate(config):
+            for mutated in _mutations(item):
+                yield [*config[:i], mutated, *config[i + 1 :]]
+
+
+@pytest.mark.parametrize(
+    "schema_path", sorted(SCHEMA_DIR.glob("*.schema.json")), ids=str
+)
+def test_bundled_schemas_compile(schema_path: Path) -> None:
+    """Every bundled schema has a fast-path check."""
+    compile_schema(_load(schema_path))
+
+
+@pytest.mark.parametrize(
+    ("schema_path", "example_dir"),
+    [
+        (APP_STATE_V2_SCHEMA_PATH, "example_app_state_configs"),
+        (CACHE_RELEASE_SCHEMA_PATH, "example_cache_configs"),
+    ],
+)
+def test_check_agrees_with_jsonschema(
+    schema_path: Path, example_dir: str, test_data_root: Path
+) -> None:
+    """The check accepts exactly what jsonschema accepts."""
+    schema = _load(schema_path)
+    check = compile_schema(schema)
+    validator = Draft7Validator(schema)
+
+    examples = [
+        _load(path)
+        for path in sorted((test_data_root / example_dir).glob("*.json"))
+    ]
+    valid = [config for config in examples if validator.is_valid(config)]
+    assert valid
+    for config in valid:
+        assert check(config)
+        for mutated in _mutations(config):
+            assert check(mutated) == validator.is_valid(mutated), mutated
+
+
+def test_unsupported_keyword_is_rejected() -> None:
+    """Schemas with keywords the compiler does not know are not compiled."""
+    with pytest.raises(UnsupportedSchemaError, match="uniqueItems"):
+        compile_schema({"type": "array", "uniqueItems": True})
+
+
+def test_booleans_are_not_numbers() -> None:
+    """Booleans do not satisfy numeric types or constants."""
+    assert not compile_schema({"type": "integer"})(True)
+    assert not compile_schema({"const": 1})(True)
+    assert compile_schema({"type": "number"})(1.5)
@@ -122,7 +122,7 @@ class TestLegacyCacheFileLoading:
     @pytest.mark.asyncio
     async def test_load_legacy_cache_file_without_checksum_files(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
         legacy_cache_entry_no_checksum_files: dict[str, Any],
     ) -> None:
@@ -134,6 +134,8 @@ class TestLegacyCacheFileLoading:
         cache_file.write_bytes(
             orjson.dumps(legacy_cache_entry_no_checksum_files)
         )
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         result = await cache_manager.get_cached_release(
             "test", "legacy-app", ignore_ttl=True
@@ -148,7 +150,7 @@ class TestLegacyCacheFileLoading:
     @pytest.mark.asyncio
     async def test_load_legacy_cache_preserves_all_data(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
         legacy_cache_entry_no_checksum_files: dict[str, Any],
     ) -> None:
@@ -160,6 +162,8 @@ class TestLegacyCacheFileLoading:
         cache_file.write_bytes(
             orjson.dumps(legacy_cache_entry_no_checksum_files)
         )
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         result = await cache_manager.get_cached_release(
             "test", "legacy-app", ignore_ttl=True
@@ -175,7 +179,7 @@ class TestLegacyCacheFileLoading:
     @pytest.mark.asyncio
     async def test_operations_continue_normally_after_loading_legacy(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
         legacy_cache_entry_no_checksum_files: dict[str, Any],
     ) -> None:
@@ -187,6 +191,8 @@ class TestLegacyCacheFileLoading:
         cache_file.write_bytes(
             orjson.dumps(legacy_cache_entry_no_checksum_files)
         )
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         loaded = await cache_manager.get_cached_release(
             "test", "legacy-app", ignore_ttl=True
@@ -371,7 +377,7 @@ class TestLegacyCacheHelperMethods:
     @pytest.mark.asyncio
     async def test_get_checksum_file_returns_none_for_legacy_cache(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
         legacy_cache_entry: dict[str, Any],
     ) -> None:
@@ -381,6 +387,8 @@ class TestLegacyCacheHelperMethods:
         """
         cache_file = tmp_cache_dir / "helper_legacy-helper-app.json"
         cache_file.write_bytes(orjson.dumps(legacy_cache_entry))
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         result = await cache_manager.get_checksum_file(
             owner="helper",
@@ -394,7 +402,7 @@ class TestLegacyCacheHelperMethods:
     @pytest.mark.asyncio
     async def test_has_checksum_file_returns_false_for_legacy_cache(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
         legacy_cache_entry: dict[str, Any],
     ) -> None:
@@ -404,6 +412,8 @@ class TestLegacyCacheHelperMethods:
         """
         cache_file = tmp_cache_dir / "helper_legacy-helper-app.json"
         cache_file.write_bytes(orjson.dumps(legacy_cache_entry))
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         result = await cache_manager.has_checksum_file(
             owner="helper",
@@ -417,7 +427,7 @@ class TestLegacyCacheHelperMethods:
     @pytest.mark.asyncio
     async def test_store_checksum_file_works_on_legacy_cache(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
         legacy_cache_entry: dict[str, Any],
     ) -> None:
@@ -427,6 +437,8 @@ class TestLegacyCacheHelperMethods:
         """
         cache_file = tmp_cache_dir / "helper_legacy-helper-app.json"
         cache_file.write_bytes(orjson.dumps(legacy_cache_entry))
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         checksum_file_data = {
             "source": (
@@ -483,7 +495,7 @@ class TestLegacyCacheCacheTypes:
     @pytest.mark.asyncio
     async def test_legacy_cache_loads_for_stable_type(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
     ) -> None:
         """Legacy stable cache should load correctly."""
@@ -502,6 +514,8 @@ class TestLegacyCacheCacheTypes:
 
         cache_file = tmp_cache_dir / "test_stable-app.json"
         cache_file.write_bytes(orjson.dumps(legacy_entry))
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         result = await cache_manager.get_cached_release(
             "test", "stable-app", ignore_ttl=True, cache_type="stable"
@@ -513,7 +527,7 @@ class TestLegacyCacheCacheTypes:
     @pytest.mark.asyncio
     async def test_legacy_cache_loads_for_prerelease_type(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
     ) -> None:
         """Legacy prerelease cache should load correctly."""
@@ -532,6 +546,8 @@ class TestLegacyCacheCacheTypes:
 
         cache_file = tmp_cache_dir / "test_prerelease-app_prerelease.json"
         cache_file.write_bytes(orjson.dumps(legacy_entry))
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         result = await cache_manager.get_cached_release(
             "test", "prerelease-app", ignore_ttl=True, cache_type="prerelease"
@@ -544,7 +560,7 @@ class TestLegacyCacheCacheTypes:
     @pytest.mark.asyncio
     async def test_legacy_cache_loads_for_latest_type(
         self,
-        cache_manager: ReleaseCacheManager,
+        mock_config_manager: MagicMock,
         tmp_cache_dir: Path,
     ) -> None:
         """Legacy latest cache should load correctly."""
@@ -563,6 +579,8 @@ class TestLegacyCacheCacheTypes:
 
         cache_file = tmp_cache_dir / "test_latest-app_latest.json"
         cache_file.write_bytes(orjson.dumps(legacy_entry))
+        # Legacy files are imported when the manager starts
+        cache_manager = ReleaseCacheManager(mock_config_manager, ttl_hours=24)
 
         result = await cache_manager.get_cached_release(
             "test", "latest-app", ignore_ttl=True, cache_type="latest"
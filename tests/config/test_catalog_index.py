@@ -0,0 +1,265 @@
+"""Tests for the precompiled catalog index."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from my_unicorn.config.catalog import CatalogLoader
+from my_unicorn.config.catalog_index import (
+    CATALOG_INDEX_NAME,
+    CatalogIndex,
+    CatalogIndexError,
+    cached_index_name,
+)
+from my_unicorn.config.paths import Paths
+
+
+def _write_entry(catalog_dir: Path, name: str, repo: str) -> Path:
+    path = catalog_dir / f"{name}.json"
+    path.write_bytes(
+        orjson.dumps({"source": {"owner": "owner", "repo": repo}})
+    )
+    return path
+
+
+@pytest.fixture
+def catalog_dir(tmp_path: Path) -> Path:
+    """Catalog directory with two valid entries and an invalid one."""
+    directory = tmp_path / "catalog"
+    directory.mkdir()
+    _write_entry(directory, "app1", "repo1")
+    _write_entry(directory, "app2", "repo2")
+    (directory / "broken.json").write_text("{invalid")
+    return directory
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    """User cache directory for rebuilt indexes (created on write)."""
+    return tmp_path / "cache" / "catalog"
+
+
+def _cached_index(catalog_dir: Path, cache_dir: Path) -> Path:
+    return cache_dir / cached_index_name(catalog_dir)
+
+
+def _set_mtime(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_open_writes_index_to_cache_dir(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """The first open builds the index into the cache, not the catalog."""
+    index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert _cached_index(catalog_dir, cache_dir).exists()
+    assert not (catalog_dir / CATALOG_INDEX_NAME).exists()
+    assert index.names() == ["app1", "app2", "broken"]
+    assert index.get("app2")["source"]["repo"] == "repo2"
+
+
+def test_lookup_does_not_read_json_files(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """A fresh index answers lookups without parsing per-app files."""
+    CatalogIndex.open(catalog_dir, cache_dir)
+    loader = CatalogLoader(catalog_dir, cache_dir)
+
+    with patch.object(
+        CatalogIndex, "build", side_effect=AssertionError("rebuilt")
+    ):
+        assert loader.load("app1")["source"]["repo"] == "repo1"
+        assert loader.exists("app2")
+        assert sorted(loader.list_apps()) == ["app1", "app2", "broken"]
+
+
+def test_errors_match_json_loading(catalog_dir: Path) -> None:
+    """Missing and invalid entries raise the loader's usual errors."""
+    loader = CatalogLoader(catalog_dir)
+
+    with pytest.raises(FileNotFoundError, match="not found for 'missing'"):
+        loader.load("missing")
+    with pytest.raises(ValueError, match=r"Invalid JSON.*'broken'"):
+        loader.load("broken")
+
+    entries, failed = loader.load_all()
+    assert sorted(entries) == ["app1", "app2"]
+    assert failed == ["broken"]
+
+
+def test_modified_entry_rebuilds_index(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """A catalog file newer than the index triggers a rebuild."""
+    CatalogIndex.open(catalog_dir, cache_dir)
+    cached = _cached_index(catalog_dir, cache_dir)
+    path = _write_entry(catalog_dir, "app1", "changed")
+    _set_mtime(path, cached.stat().st_mtime_ns + 10**9)
+
+    index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert index.get("app1")["source"]["repo"] == "changed"
+    reloaded = CatalogIndex.from_bytes(cached.read_bytes())
+    assert reloaded.get("app1")["source"]["repo"] == "changed"
+
+
+def test_installed_index_with_older_sources_is_used(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """A shipped index newer than every JSON file is not rebuilt."""
+    shipped = catalog_dir / CATALOG_INDEX_NAME
+    CatalogIndex.build(catalog_dir).write(shipped)
+    # Installers give every file a new mtime; only the order matters
+    for offset, path in enumerate(sorted(catalog_dir.glob("*.json"))):
+        _set_mtime(path, shipped.stat().st_mtime_ns - 10**9 + offset)
+
+    with patch.object(
+        CatalogIndex, "build", side_effect=AssertionError("rebuilt")
+    ):
+        index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert index.get("app1")["source"]["repo"] == "repo1"
+    assert not cache_dir.exists()
+
+
+def test_shipped_index_with_newer_unchanged_sources_is_used(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """JSON files newer than the index but with the same content pass."""
+    shipped = catalog_dir / CATALOG_INDEX_NAME
+    CatalogIndex.build(catalog_dir).write(shipped)
+    # Checkouts and installers may write the index before the JSON files
+    _set_mtime(shipped, 0)
+
+    with patch.object(
+        CatalogIndex, "build", side_effect=AssertionError("rebuilt")
+    ):
+        index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert index.get("app1")["source"]["repo"] == "repo1"
+    assert _cached_index(catalog_dir, cache_dir).exists()
+
+
+def test_verified_index_skips_digest_check_on_next_open(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """An index that passed the digest check is cached as verified."""
+    shipped = catalog_dir / CATALOG_INDEX_NAME
+    CatalogIndex.build(catalog_dir).write(shipped)
+    _set_mtime(shipped, 0)
+    CatalogIndex.open(catalog_dir, cache_dir)
+    cached = _cached_index(catalog_dir, cache_dir)
+
+    # Content changed without a newer mtime is only seen by a digest check
+    path = _write_entry(catalog_dir, "app1", "changed")
+    _set_mtime(path, cached.stat().st_mtime_ns - 1)
+    index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert index.get("app1")["source"]["repo"] == "repo1"
+
+
+def test_stale_shipped_index_is_rebuilt_once(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """A stale shipped index is left alone and rebuilt into the cache."""
+    shipped = catalog_dir / CATALOG_INDEX_NAME
+    CatalogIndex.build(catalog_dir).write(shipped)
+    shipped_bytes = shipped.read_bytes()
+    _set_mtime(shipped, 0)
+    _write_entry(catalog_dir, "app2", "changed")
+
+    CatalogIndex.open(catalog_dir, cache_dir)
+    with patch.object(
+        CatalogIndex, "build", side_effect=AssertionError("rebuilt")
+    ):
+        index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert index.get("app2")["source"]["repo"] == "changed"
+    assert shipped.read_bytes() == shipped_bytes
+    assert _cached_index(catalog_dir, cache_dir).exists()
+
+
+def test_added_entry_is_found_by_loader(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """Entries created after the loader read the index are loaded."""
+    loader = CatalogLoader(catalog_dir, cache_dir)
+    assert not loader.exists("app3")
+
+    _write_entry(catalog_dir, "app3", "repo3")
+
+    assert loader.load("app3")["source"]["repo"] == "repo3"
+    assert "app3" in loader.list_apps()
+
+
+def test_loader_opens_index_once(catalog_dir: Path, cache_dir: Path) -> None:
+    """Listing and loading all entries reuse the loaded index."""
+    loader = CatalogLoader(catalog_dir, cache_dir)
+
+    with patch.object(
+        CatalogIndex, "open", wraps=CatalogIndex.open
+    ) as mock_open:
+        loader.list_apps()
+        loader.load_all()
+        loader.list_apps()
+        loader.validate_catalog()
+
+    mock_open.assert_called_once()
+
+
+def test_removed_entry_is_dropped(catalog_dir: Path, cache_dir: Path) -> None:
+    """Deleted catalog files disappear from the index."""
+    CatalogIndex.open(catalog_dir, cache_dir)
+    (catalog_dir / "app2.json").unlink()
+
+    assert "app2" not in CatalogIndex.open(catalog_dir, cache_dir)
+
+
+def test_corrupted_index_is_rebuilt(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """An unreadable index file is ignored and replaced in the cache."""
+    (catalog_dir / CATALOG_INDEX_NAME).write_bytes(b"garbage")
+
+    index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert index.get("app1")["source"]["repo"] == "repo1"
+    CatalogIndex.from_bytes(_cached_index(catalog_dir, cache_dir).read_bytes())
+
+
+def test_truncated_index_is_rejected(catalog_dir: Path) -> None:
+    """Index data cut short fails to load."""
+    data = CatalogIndex.build(catalog_dir).to_bytes()
+
+    with pytest.raises(CatalogIndexError):
+        CatalogIndex.from_bytes(data[:-10])
+
+
+def test_read_only_cache_keeps_index_in_memory(
+    catalog_dir: Path, cache_dir: Path
+) -> None:
+    """The index still works when it cannot be written."""
+    with patch(
+        "my_unicorn.config.catalog_index.tempfile.mkstemp",
+        side_effect=PermissionError("read-only"),
+    ):
+        index = CatalogIndex.open(catalog_dir, cache_dir)
+
+    assert index.get("app1")["source"]["repo"] == "repo1"
+    assert not _cached_index(catalog_dir, cache_dir).exists()
+
+
+def test_bundled_index_matches_catalog() -> None:
+    """The committed catalog index is rebuilt from the catalog JSON files.
+
+    Run ``scripts/build_catalog_index.py`` after editing the catalog.
+    """
+    shipped = Paths.CATALOG_DIR / CATALOG_INDEX_NAME
+
+    assert shipped.read_bytes() == (
+        CatalogIndex.build(Paths.CATALOG_DIR).to_bytes()
+    )
@@ -1,7 +1,10 @@
 """Tests for ConfigManager facade and specialized manager classes."""
 
 import configparser
+import copy
+import os
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import orjson
 import pytest
@@ -26,6 +29,56 @@ def test_load_and_save_global_config(config_manager: ConfigManager) -> None:
     assert loaded["max_backup"] == test_max_backup
 
 
+def test_segmented_download_settings(config_manager: ConfigManager) -> None:
+    """Test segmented download settings default, persist and clamp."""
+    config = config_manager.load_global_config()
+    assert config["network"]["download_segments"] == 4
+    assert config["network"]["segment_threshold_mb"] == 50
+
+    config["network"]["download_segments"] = 99
+    config["network"]["segment_threshold_mb"] = 200
+    config_manager.save_global_config(config)
+    content = config_manager.settings_file.read_text()
+    assert "segment_threshold_mb = 200" in content
+
+    loaded = config_manager.load_global_config()
+    assert loaded["network"]["download_segments"] == 16
+    assert loaded["network"]["segment_threshold_mb"] == 200
+
+
+def test_release_cache_settings(config_manager: ConfigManager) -> None:
+    """Test release cache TTL and stale window default and persist."""
+    config = config_manager.load_global_config()
+    assert config["network"]["cache_ttl_hours"] == 24
+    assert config["network"]["cache_stale_hours"] == 168
+
+    config["network"]["cache_ttl_hours"] = 6
+    config["network"]["cache_stale_hours"] = -5
+    config_manager.save_global_config(config)
+    content = config_manager.settings_file.read_text()
+    assert "cache_ttl_hours = 6" in content
+
+    loaded = config_manager.load_global_config()
+    assert loaded["network"]["cache_ttl_hours"] == 6
+    assert loaded["network"]["cache_stale_hours"] == 0
+
+
+def test_backup_strategy_setting(config_manager: ConfigManager) -> None:
+    """Test backup strategy default, persist and fallback."""
+    config = config_manager.load_global_config()
+    assert config["backup_strategy"] == "auto"
+
+    config["backup_strategy"] = "reflink"
+    config_manager.save_global_config(config)
+    content = config_manager.settings_file.read_text()
+    assert "backup_strategy = reflink" in content
+    assert config_manager.load_global_config()["backup_strategy"] == "reflink"
+
+    config["backup_strategy"] = "symlink"
+    config_manager.save_global_config(config)
+    assert config_manager.load_global_config()["backup_strategy"] == "auto"
+
+
 def test_load_app_config_and_migration(config_manager: ConfigManager) -> None:
     """Test saving and loading app config with v2.0.0 format."""
     app_name = "testapp"
@@ -298,6 +351,34 @@ def test_global_config_manager(config_dir: Path) -> None:
     assert "network" in converted
 
 
+def test_global_config_snapshot(config_dir: Path) -> None:
+    """The snapshot is shared, read-only and reloaded on file changes."""
+    global_manager = GlobalConfigManager(config_dir)
+    snapshot = global_manager.load_global_config_snapshot()
+
+    with patch.object(
+        GlobalConfigManager,
+        "load_global_config",
+        side_effect=AssertionError("reparsed"),
+    ):
+        assert GlobalConfigManager(
+            config_dir
+        ).load_global_config_snapshot() is (snapshot)
+    with pytest.raises(TypeError):
+        snapshot["network"]["retry_attempts"] = 1
+    editable = copy.deepcopy(snapshot)
+    editable["max_backup"] = 5
+    assert type(editable["network"]) is dict
+
+    global_manager.save_global_config(editable)
+    settings = global_manager.settings_file
+    stat = settings.stat()
+    os.utime(settings, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reloaded = global_manager.load_global_config_snapshot()
+    assert reloaded is not snapshot
+    assert reloaded["max_backup"] == 5
+
+
 def test_app_config_manager(config_dir: Path) -> None:
     """Test AppConfigManager functionality."""
     apps_dir = config_dir / "apps"
@@ -361,6 +442,123 @@ def test_app_config_manager(config_dir: Path) -> None:
     assert nonexistent is None
 
 
+def _write_app_state(
+    apps_dir: Path, version: str, app_name: str = "testapp"
+) -> Path:
+    """Write a minimal catalog app state and return its path."""
+    app_file = apps_dir / f"{app_name}.json"
+    app_config = {
+        "config_version": "2.0.0",
+        "source": "catalog",
+        "catalog_ref": "testapp",
+        "state": {
+            "version": version,
+            "installed_date": "2024-01-01T12:00:00",
+            "installed_path": "",
+            "verification": {
+                "passed": False,
+                "methods": [{"type": "skip", "status": "skipped"}],
+            },
+            "icon": {"installed": False, "method": "none"},
+        },
+    }
+    mtime_ns = app_file.stat().st_mtime_ns if app_file.exists() else 0
+    app_file.write_bytes(orjson.dumps(app_config))
+    # Make sure the modification time changes on coarse filesystems
+    stat = app_file.stat()
+    os.utime(
+        app_file,
+        ns=(stat.st_atime_ns, max(stat.st_mtime_ns, mtime_ns + 10**9)),
+    )
+    return app_file
+
+
+def test_app_config_validation_is_cached(config_dir: Path) -> None:
+    """Unchanged app state files are not validated again."""
+    apps_dir = config_dir / "apps"
+    apps_dir.mkdir(parents=True, exist_ok=True)
+    _write_app_state(apps_dir, "1.0.0")
+    app_manager = AppConfigManager(apps_dir)
+
+    with patch("my_unicorn.config.app.validate_app_state") as mock_validate:
+        app_manager.load_raw_app_config("testapp")
+        app_manager.load_raw_app_config("testapp")
+        assert mock_validate.call_count == 1
+
+        _write_app_state(apps_dir, "1.0.1")
+        loaded = app_manager.load_raw_app_config("testapp")
+        assert mock_validate.call_count == 2
+
+    assert loaded is not None
+    assert loaded["state"]["version"] == "1.0.1"
+
+
+def test_app_config_store_caches_effective_config(config_dir: Path) -> None:
+    """Effective configs are built once and handed out as copies."""
+    apps_dir = config_dir / "apps"
+    apps_dir.mkdir(parents=True, exist_ok=True)
+    _write_app_state(apps_dir, "1.0.0")
+    catalog = MagicMock()
+    catalog.load.return_value = {"source": {"owner": "o", "repo": "r"}}
+    app_manager = AppConfigManager(apps_dir, catalog)
+
+    first = app_manager.load_app_config("testapp")
+    assert first is not None
+    first["source"]["repo"] = "changed"
+    second = app_manager.load_app_config("testapp")
+
+    assert second is not None
+    assert second["source"]["repo"] == "r"
+    assert catalog.load.call_count == 1
+
+
+def test_app_config_store_follows_saves(config_dir: Path) -> None:
+    """Saved and removed configs replace the stored ones."""
+    apps_dir = config_dir / "apps"
+    apps_dir.mkdir(parents=True, exist_ok=True)
+    _write_app_state(apps_dir, "1.0.0")
+    app_manager = AppConfigManager(apps_dir)
+
+    raw = app_manager.load_raw_app_config("testapp")
+    assert raw is not None
+    raw["state"]["version"] = "2.0.0"
+    app_manager.save_app_config("testapp", raw)
+
+    loaded = app_manager.load_app_config("testapp")
+    assert loaded is not None
+    assert loaded["state"]["version"] == "2.0.0"
+
+    app_manager.remove_app_config("testapp")
+    assert app_manager.load_raw_app_config("testapp") is None
+
+
+def test_load_all_app_configs(config_dir: Path) -> None:
+    """All state files are loaded at once, with per-app errors."""
+    apps_dir = config_dir / "apps"
+    apps_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(10):
+        _write_app_state(apps_dir, f"1.0.{i}", f"app{i}")
+    (apps_dir / "broken.json").write_text("{invalid")
+    (apps_dir / "old.json").write_bytes(
+        orjson.dumps({"config_version": "1.0.0"})
+    )
+    app_manager = AppConfigManager(apps_dir)
+
+    configs, errors = app_manager.load_all_app_configs()
+
+    assert list(configs) == [f"app{i}" for i in range(10)]
+    assert configs["app3"]["state"]["version"] == "1.0.3"
+    assert "Invalid JSON" in errors["broken"]
+    assert "my-unicorn migrate" in errors["old"]
+
+    with patch.object(
+        AppConfigManager, "_read_app_file", side_effect=AssertionError
+    ):
+        assert app_manager.load_app_config("app3") == configs["app3"]
+        subset, _ = app_manager.load_all_app_configs(["app1", "missing"])
+    assert list(subset) == ["app1"]
+
+
 def test_catalog_manager(config_dir: Path) -> None:
     """Test CatalogLoader functionality."""
     # Create catalog directory with test data
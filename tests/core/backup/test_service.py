@@ -3,13 +3,16 @@
 Tests for backup creation, cleanup, listing, and info retrieval operations.
 """
 
+import hashlib
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import orjson
+import pytest
 
-from my_unicorn.core.backup import BackupMetadata
+from my_unicorn.core.backup import BackupMetadata, BackupService
 
 
 class TestBackupServiceCreate:
@@ -52,6 +55,153 @@ class TestBackupServiceCreate:
         assert backup is None
 
 
+class TestBackupServiceBlobStore:
+    """Test backups sharing AppImage bytes through the blob store."""
+
+    def test_backup_links_stored_install_without_hashing(
+        self, dummy_config: Any, tmp_path: Path
+    ) -> None:
+        """Test that a stored install is backed up by linking it."""
+        config_manager, global_config, _, storage_dir = dummy_config
+        global_config["directory"]["cache"] = tmp_path / "cache"
+        service = BackupService(config_manager, global_config)
+        assert service.blob_store is not None
+
+        file_path = storage_dir / "app1.AppImage"
+        file_path.write_text("app content")
+        first = service.create_backup(file_path, "app1", "1.0.0")
+
+        with patch("my_unicorn.core.backup.hash_file") as mock_hash:
+            second = service.create_backup(file_path, "app1", "1.0.1")
+
+        mock_hash.assert_not_called()
+        assert first is not None
+        assert second is not None
+        assert first.samefile(file_path)
+        assert second.samefile(file_path)
+        sha256 = service.blob_store.find_digest(file_path)
+        metadata = BackupMetadata(second.parent)
+        assert metadata.get_version_info("1.0.1")["sha256"] == sha256
+
+    def test_integrity_detects_corrupted_linked_backup(
+        self, dummy_config: Any, tmp_path: Path
+    ) -> None:
+        """Test that a backup corrupted together with its blob fails."""
+        config_manager, global_config, _, storage_dir = dummy_config
+        global_config["directory"]["cache"] = tmp_path / "cache"
+        service = BackupService(config_manager, global_config)
+
+        file_path = storage_dir / "app1.AppImage"
+        file_path.write_text("app content")
+        backup_path = service.create_backup(file_path, "app1", "1.0.0")
+        assert backup_path is not None
+        metadata = BackupMetadata(backup_path.parent)
+        assert metadata.verify_backup_integrity("1.0.0", backup_path)
+
+        # Same size, modified in place through the shared inode
+        with backup_path.open("r+b") as f:
+            f.write(b"APP")
+
+        assert not metadata.verify_backup_integrity("1.0.0", backup_path)
+
+    def test_cleanup_prunes_unreferenced_blobs(
+        self, dummy_config: Any, tmp_path: Path
+    ) -> None:
+        """Test that blobs go away with their last backup."""
+        config_manager, global_config, _, storage_dir = dummy_config
+        global_config["directory"]["cache"] = tmp_path / "cache"
+        global_config["max_backup"] = 1
+        service = BackupService(config_manager, global_config)
+        assert service.blob_store is not None
+
+        for version in ["1.0.0", "1.1.0"]:
+            file_path = storage_dir / "app1.AppImage"
+            file_path.unlink(missing_ok=True)
+            file_path.write_text(f"content {version}")
+            service.create_backup(file_path, "app1", version)
+
+        assert len(list(service.blob_store.root.iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_backup_hashes_off_event_loop(
+        self, dummy_config: Any, tmp_path: Path
+    ) -> None:
+        """Test that async backups hash on the hashing thread pool."""
+        config_manager, global_config, _, storage_dir = dummy_config
+        global_config["directory"]["cache"] = tmp_path / "cache"
+        service = BackupService(config_manager, global_config)
+        assert service.blob_store is not None
+
+        file_path = storage_dir / "app1.AppImage"
+        file_path.write_text("app content")
+        sha256 = hashlib.sha256(b"app content").hexdigest()
+
+        with (
+            patch(
+                "my_unicorn.core.backup.hash_file_async",
+                AsyncMock(return_value=sha256),
+            ) as mock_hash_async,
+            patch("my_unicorn.core.backup.hash_file") as mock_hash,
+        ):
+            backup_path = await service.create_backup_async(
+                file_path, "app1", "1.0.0", replace_source=True
+            )
+
+        mock_hash_async.assert_awaited_once_with(file_path, "sha256")
+        mock_hash.assert_not_called()
+        assert backup_path is not None
+        assert service.blob_store.is_blob_of(sha256, backup_path)
+        metadata = BackupMetadata(backup_path.parent)
+        assert metadata.get_version_info("1.0.0")["sha256"] == sha256
+
+
+class TestBackupServiceStrategy:
+    """Test the configurable backup strategy."""
+
+    def test_copy_strategy_creates_independent_backup(
+        self, dummy_config: Any
+    ) -> None:
+        """Test that the copy strategy never shares the installed file."""
+        config_manager, global_config, _, storage_dir = dummy_config
+        global_config["backup_strategy"] = "copy"
+        service = BackupService(config_manager, global_config)
+
+        file_path = storage_dir / "app1.AppImage"
+        file_path.write_text("app content")
+        backup_path = service.create_backup(file_path, "app1", "1.0.0")
+
+        assert backup_path is not None
+        assert backup_path.read_text() == "app content"
+        assert not backup_path.samefile(file_path)
+
+    def test_move_strategy_requires_replace_source(
+        self, dummy_config: Any
+    ) -> None:
+        """Test that only replaced files are moved into the backup."""
+        config_manager, global_config, _, storage_dir = dummy_config
+        global_config["backup_strategy"] = "move"
+        service = BackupService(config_manager, global_config)
+
+        file_path = storage_dir / "app1.AppImage"
+        file_path.write_text("app content")
+        kept = service.create_backup(file_path, "app1", "1.0.0")
+        assert kept is not None
+        assert file_path.exists()
+
+        moved = service.create_backup(
+            file_path, "app1", "1.0.1", replace_source=True
+        )
+
+        assert moved is not None
+        assert moved.read_text() == "app content"
+        assert not file_path.exists()
+
+        service.reinstate_backup(moved, file_path)
+
+        assert file_path.read_text() == "app content"
+        assert moved.exists()
+
+
 class TestBackupServiceCleanup:
     """Test BackupService cleanup functionality."""
 
@@ -76,6 +76,30 @@ class TestChecksumFileHelperMethods:
         assert len(cached["checksum_files"]) == 1
         assert cached["checksum_files"][0]["filename"] == "SHA256SUMS.txt"
 
+    @pytest.mark.asyncio
+    async def test_store_checksum_file_keeps_validators(
+        self,
+        cache_manager: Any,
+        base_release_data: dict[str, Any],
+        checksum_file_data: dict[str, Any],
+    ) -> None:
+        """Verify storing a checksum file keeps the entry's ETag."""
+        await cache_manager.save_release_data(
+            "test", "helper-app", base_release_data, etag='"v2"'
+        )
+
+        await cache_manager.store_checksum_file(
+            owner="test",
+            repo="helper-app",
+            version="2.0.0",
+            file_data=checksum_file_data,
+        )
+
+        validators = await cache_manager.get_cache_validators(
+            "test", "helper-app"
+        )
+        assert validators == ('"v2"', None)
+
     @pytest.mark.asyncio
     async def test_store_checksum_file_returns_false_when_no_cache(
         self, cache_manager: Any, checksum_file_data: dict[str, Any]
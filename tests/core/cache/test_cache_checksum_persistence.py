@@ -6,7 +6,6 @@ checksum data in ReleaseCacheManager.
 
 from typing import Any
 
-import orjson
 import pytest
 
 
@@ -80,15 +79,14 @@ class TestChecksumFilesPersistence:
         cache_manager: Any,
         release_data_with_checksum_files: dict[str, Any],
     ) -> None:
-        """Verify checksum_files array is persisted to cache JSON."""
+        """Verify checksum_files array is persisted to the cache."""
         await cache_manager.save_release_data(
             "test", "app", release_data_with_checksum_files
         )
 
-        cache_file = cache_manager._get_cache_file_path("test", "app")
-        assert cache_file.exists()
+        cache_data = cache_manager._read_cache_entry("test", "app", "stable")
+        assert cache_data is not None
 
-        cache_data = orjson.loads(cache_file.read_bytes())
         saved_release = cache_data["release_data"]
 
         assert "checksum_files" in saved_release
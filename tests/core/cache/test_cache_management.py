@@ -4,16 +4,39 @@ This module tests cache management operations including clearing,
 cleanup, and statistics gathering.
 """
 
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import patch
 
-import orjson
 import pytest
 
 from my_unicorn.types import CacheEntry
 
 
+def has_entry(cache_manager: Any, owner: str, repo: str) -> bool:
+    """Return whether a stable entry exists, regardless of its age."""
+    return cache_manager._read_cache_entry(owner, repo, "stable") is not None
+
+
+def write_aged_entry(
+    cache_manager: Any, owner: str, repo: str, age: timedelta, data: Any
+) -> None:
+    """Store a stable cache entry that was cached ``age`` ago."""
+    cache_manager._write_cache_entry(
+        owner,
+        repo,
+        "stable",
+        CacheEntry(
+            {
+                "cached_at": (datetime.now(UTC) - age).isoformat(),
+                "ttl_hours": 24,
+                "release_data": data,
+            }
+        ),
+    )
+
+
 class TestReleaseCacheManager:
     """Test suite for ReleaseCacheManager cache management operations."""
 
@@ -22,23 +45,33 @@ class TestReleaseCacheManager:
         self, cache_manager: Any, sample_release_data: Any
     ) -> None:
         """Test clearing cache for a specific app."""
-        # Create cache file
+        # Create cache entries, including a prerelease entry
         await cache_manager.save_release_data(
             "owner", "repo", sample_release_data
         )
-        cache_file = cache_manager._get_cache_file_path("owner", "repo")
-        assert cache_file.exists()
+        await cache_manager.save_release_data(
+            "owner", "repo", sample_release_data, "prerelease"
+        )
+        await cache_manager.save_release_data(
+            "owner", "other", sample_release_data
+        )
+        assert has_entry(cache_manager, "owner", "repo")
 
         # Clear specific app cache
         await cache_manager.clear_cache("owner", "repo")
-        assert not cache_file.exists()
+        assert not has_entry(cache_manager, "owner", "repo")
+        assert (
+            cache_manager._read_cache_entry("owner", "repo", "prerelease")
+            is None
+        )
+        assert has_entry(cache_manager, "owner", "other")
 
     @pytest.mark.asyncio
     async def test_clear_cache_all(
         self, cache_manager: Any, sample_release_data: Any
     ) -> None:
         """Test clearing all cache entries."""
-        # Create multiple cache files
+        # Create multiple cache entries
         await cache_manager.save_release_data(
             "owner1", "repo1", sample_release_data
         )
@@ -46,26 +79,24 @@ class TestReleaseCacheManager:
             "owner2", "repo2", sample_release_data
         )
 
-        cache_file1 = cache_manager._get_cache_file_path("owner1", "repo1")
-        cache_file2 = cache_manager._get_cache_file_path("owner2", "repo2")
-
-        assert cache_file1.exists()
-        assert cache_file2.exists()
+        assert has_entry(cache_manager, "owner1", "repo1")
+        assert has_entry(cache_manager, "owner2", "repo2")
 
         # Clear all cache
         await cache_manager.clear_cache()
 
-        assert not cache_file1.exists()
-        assert not cache_file2.exists()
+        assert not has_entry(cache_manager, "owner1", "repo1")
+        assert not has_entry(cache_manager, "owner2", "repo2")
 
     @pytest.mark.asyncio
     async def test_clear_cache_error_handling(
         self, cache_manager: Any
     ) -> None:
         """Test error handling in cache clearing."""
-        # Mock an error during file deletion
+        # Mock an error while opening the database
         with patch(
-            "pathlib.Path.unlink", side_effect=OSError("Permission denied")
+            "my_unicorn.core.cache.sqlite3.connect",
+            side_effect=sqlite3.OperationalError("database is locked"),
         ):
             # Should not raise exception
             await cache_manager.clear_cache("owner", "repo")
@@ -81,47 +112,24 @@ class TestReleaseCacheManager:
         )
 
         # Create old cache by manually setting timestamp
-        old_cache_file = cache_manager._get_cache_file_path("owner2", "repo2")
-        old_timestamp = datetime.now(UTC) - timedelta(days=35)
-        old_cache_entry = CacheEntry(
-            {
-                "cached_at": old_timestamp.isoformat(),
-                "ttl_hours": 24,
-                "release_data": sample_release_data,
-            }
+        write_aged_entry(
+            cache_manager,
+            "owner2",
+            "repo2",
+            timedelta(days=35),
+            sample_release_data,
         )
-        old_cache_file.write_bytes(orjson.dumps(old_cache_entry))  # pylint: disable=no-member
 
-        fresh_cache_file = cache_manager._get_cache_file_path(
-            "owner1", "repo1"
-        )
-
-        # Both files should exist initially
-        assert fresh_cache_file.exists()
-        assert old_cache_file.exists()
+        # Both entries should exist initially
+        assert has_entry(cache_manager, "owner1", "repo1")
+        assert has_entry(cache_manager, "owner2", "repo2")
 
         # Cleanup with 30-day threshold
         await cache_manager.cleanup_expired_cache(max_age_days=30)
 
-        # Only fresh file should remain
-        assert fresh_cache_file.exists()
-        assert not old_cache_file.exists()
-
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_cache_corrupted_files(
-        self, cache_manager: Any
-    ) -> None:
-        """Test cleanup removes corrupted cache files."""
-        # Create corrupted cache file
-        corrupted_file = cache_manager.cache_dir / "corrupted.json"
-        corrupted_file.write_bytes(b"invalid json")
-
-        assert corrupted_file.exists()
-
-        await cache_manager.cleanup_expired_cache()
-
-        # Corrupted file should be removed
-        assert not corrupted_file.exists()
+        # Only fresh entry should remain
+        assert has_entry(cache_manager, "owner1", "repo1")
+        assert not has_entry(cache_manager, "owner2", "repo2")
 
     @pytest.mark.asyncio
     async def test_get_cache_stats(
@@ -134,27 +142,20 @@ class TestReleaseCacheManager:
         )
 
         # Create expired cache
-        expired_file = cache_manager._get_cache_file_path("owner2", "repo2")
-        old_timestamp = datetime.now(UTC) - timedelta(hours=25)  # Expired
-        expired_entry = CacheEntry(
-            {
-                "cached_at": old_timestamp.isoformat(),
-                "ttl_hours": 24,
-                "release_data": sample_release_data,
-            }
+        write_aged_entry(
+            cache_manager,
+            "owner2",
+            "repo2",
+            timedelta(hours=25),
+            sample_release_data,
         )
-        expired_file.write_bytes(orjson.dumps(expired_entry))  # pylint: disable=no-member
-
-        # Create corrupted cache
-        corrupted_file = cache_manager.cache_dir / "corrupted.json"
-        corrupted_file.write_bytes(b"invalid json")
 
         stats = await cache_manager.get_cache_stats()
 
-        assert stats["total_entries"] == 3
+        assert stats["total_entries"] == 2
         assert stats["fresh_entries"] == 1
         assert stats["expired_entries"] == 1
-        assert stats["corrupted_entries"] == 1
+        assert stats["corrupted_entries"] == 0
         assert stats["ttl_hours"] == 24
         assert "cache_directory" in stats
 
@@ -163,8 +164,10 @@ class TestReleaseCacheManager:
         self, cache_manager: Any
     ) -> None:
         """Test cache stats error handling."""
-        # Mock the glob method at the module level where it's called
-        with patch("pathlib.Path.glob", side_effect=OSError("Access denied")):
+        with patch(
+            "my_unicorn.core.cache.sqlite3.connect",
+            side_effect=sqlite3.OperationalError("unable to open database"),
+        ):
             stats = await cache_manager.get_cache_stats()
 
             assert stats["total_entries"] == 0
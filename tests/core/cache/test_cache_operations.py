@@ -1,15 +1,15 @@
 """Tests for cache operations in ReleaseCacheManager.
 
 This module tests basic cache operations including initialization,
-cache file path generation, freshness checks, retrieval, and saving.
+database creation, freshness checks, retrieval, and saving.
 """
 
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
-import orjson
 import pytest
 
 from my_unicorn.core.cache import ReleaseCacheManager
@@ -49,24 +49,37 @@ class TestReleaseCacheManager:
             assert cache_manager.config_manager == mock_config
             assert cache_manager.ttl_hours == 24
 
-    def test_get_cache_file_path(
+    @pytest.mark.asyncio
+    async def test_database_created_on_first_use(
         self, cache_manager: ReleaseCacheManager
     ) -> None:
-        """Test cache file path generation."""
-        # Test stable cache (default)
-        path = cache_manager._get_cache_file_path("owner", "repo")
-        assert path.name == "owner_repo.json"
-        assert path.parent.name == "releases"
-
-        # Test prerelease cache
-        path = cache_manager._get_cache_file_path(
-            "owner", "repo", "prerelease"
-        )
-        assert path.name == "owner_repo_prerelease.json"
+        """Test the cache database is created inside the cache directory."""
+        assert cache_manager.db_path.name == "releases.db"
+        assert cache_manager.db_path.parent.name == "releases"
+        assert not cache_manager.db_path.exists()
+
+        await cache_manager.get_cached_release("owner", "repo")
 
-        # Test latest cache
-        path = cache_manager._get_cache_file_path("owner", "repo", "latest")
-        assert path.name == "owner_repo_latest.json"
+        assert cache_manager.db_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_corrupted_database_is_replaced(
+        self, mock_config_manager: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test an unreadable database file is replaced on first use."""
+        db_path = tmp_path / "cache" / "releases" / "releases.db"
+        db_path.parent.mkdir(parents=True)
+        db_path.write_bytes(b"not a database" * 100)
+
+        cache_manager = ReleaseCacheManager(mock_config_manager)
+        result = await cache_manager.get_cached_release("owner", "repo")
+
+        assert result is None
+        with sqlite3.connect(cache_manager.db_path) as connection:
+            count = connection.execute(
+                "SELECT COUNT(*) FROM releases"
+            ).fetchone()
+        assert count == (0,)
 
     def test_is_cache_fresh_valid_cache(
         self, cache_manager: ReleaseCacheManager
@@ -147,7 +160,6 @@ class TestReleaseCacheManager:
     ) -> None:
         """Test getting cached release with fresh cache."""
         # Create a fresh cache file
-        cache_file = cache_manager._get_cache_file_path("owner", "repo")
         cache_entry = CacheEntry(
             {
                 "cached_at": datetime.now(UTC).isoformat(),
@@ -156,7 +168,9 @@ class TestReleaseCacheManager:
             }
         )
 
-        cache_file.write_bytes(orjson.dumps(cache_entry))  # pylint: disable=no-member
+        cache_manager._write_cache_entry(
+            "owner", "repo", "stable", cache_entry
+        )
 
         result = await cache_manager.get_cached_release("owner", "repo")
         assert result == sample_release_data
@@ -169,7 +183,6 @@ class TestReleaseCacheManager:
     ) -> None:
         """Test getting cached release with expired cache."""
         # Create an expired cache file
-        cache_file = cache_manager._get_cache_file_path("owner", "repo")
         cached_at = datetime.now(UTC) - timedelta(
             hours=25
         )  # 25h old, expires after 24h
@@ -181,7 +194,9 @@ class TestReleaseCacheManager:
             }
         )
 
-        cache_file.write_bytes(orjson.dumps(cache_entry))  # pylint: disable=no-member
+        cache_manager._write_cache_entry(
+            "owner", "repo", "stable", cache_entry
+        )
 
         result = await cache_manager.get_cached_release("owner", "repo")
         assert result is None
@@ -194,7 +209,6 @@ class TestReleaseCacheManager:
     ) -> None:
         """Test getting cached release while ignoring TTL."""
         # Create an expired cache file
-        cache_file = cache_manager._get_cache_file_path("owner", "repo")
         cached_at = datetime.now(UTC) - timedelta(hours=25)  # Expired
         cache_entry = CacheEntry(
             {
@@ -204,7 +218,9 @@ class TestReleaseCacheManager:
             }
         )
 
-        cache_file.write_bytes(orjson.dumps(cache_entry))  # pylint: disable=no-member
+        cache_manager._write_cache_entry(
+            "owner", "repo", "stable", cache_entry
+        )
 
         # Should return data even if expired when ignore_ttl=True
         result = await cache_manager.get_cached_release(
@@ -216,17 +232,29 @@ class TestReleaseCacheManager:
     async def test_get_cached_release_corrupted_file(
         self, cache_manager: ReleaseCacheManager
     ) -> None:
-        """Test getting cached release with corrupted cache file."""
-        cache_file = cache_manager._get_cache_file_path("owner", "repo")
-
-        # Write invalid JSON
-        cache_file.write_bytes(b"invalid json content")
+        """Test getting cached release with a corrupted payload."""
+        with cache_manager._connect() as connection:
+            connection.execute(
+                "INSERT INTO releases VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    "owner",
+                    "repo",
+                    "stable",
+                    datetime.now(UTC).timestamp(),
+                    24,
+                    None,
+                    None,
+                    b"invalid json content",
+                ),
+            )
 
         result = await cache_manager.get_cached_release("owner", "repo")
         assert result is None
 
-        # Corrupted file should be removed
-        assert not cache_file.exists()
+        # Corrupted entry should be removed
+        assert (
+            cache_manager._read_cache_entry("owner", "repo", "stable") is None
+        )
 
     @pytest.mark.asyncio
     async def test_save_release_data(
@@ -239,11 +267,10 @@ class TestReleaseCacheManager:
             "owner", "repo", sample_release_data
         )
 
-        cache_file = cache_manager._get_cache_file_path("owner", "repo")
-        assert cache_file.exists()
+        cache_data = cache_manager._read_cache_entry("owner", "repo", "stable")
+        assert cache_data is not None
 
         # Verify cache content
-        cache_data = orjson.loads(cache_file.read_bytes())  # pylint: disable=no-member
         assert "cached_at" in cache_data
         assert "ttl_hours" in cache_data
         assert "release_data" in cache_data
@@ -272,42 +299,218 @@ class TestReleaseCacheManager:
             "owner", "repo", sample_release_data, "latest"
         )
 
-        # Check that separate files were created
-        stable_file = cache_manager._get_cache_file_path(
-            "owner", "repo", "stable"
+        # Check that separate entries were created
+        for cache_type in ("stable", "prerelease", "latest"):
+            assert (
+                await cache_manager.get_cached_release(
+                    "owner", "repo", cache_type=cache_type
+                )
+                == sample_release_data
+            )
+
+    @pytest.mark.asyncio
+    async def test_save_release_data_failed_write(
+        self,
+        cache_manager: ReleaseCacheManager,
+        sample_release_data: dict[str, Any],
+    ) -> None:
+        """Test that a failed write leaves no partial entry behind."""
+        with patch(
+            "my_unicorn.core.cache.orjson.dumps",
+            side_effect=TypeError("Simulated write failure"),
+        ):
+            # This should handle the error gracefully
+            await cache_manager.save_release_data(
+                "owner", "repo", sample_release_data
+            )
+
+        assert (
+            cache_manager._read_cache_entry("owner", "repo", "stable") is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_release_data_stores_validators(
+        self,
+        cache_manager: ReleaseCacheManager,
+        sample_release_data: dict[str, Any],
+    ) -> None:
+        """HTTP validators are stored next to the release data."""
+        await cache_manager.save_release_data(
+            "owner",
+            "repo",
+            sample_release_data,
+            etag='"abc"',
+            last_modified="Tue, 01 Sep 2025 00:00:00 GMT",
+        )
+
+        validators = await cache_manager.get_cache_validators("owner", "repo")
+        assert validators == ('"abc"', "Tue, 01 Sep 2025 00:00:00 GMT")
+
+    @pytest.mark.asyncio
+    async def test_get_cache_validators_without_entry(
+        self, cache_manager: ReleaseCacheManager
+    ) -> None:
+        """Missing cache entries have no validators."""
+        validators = await cache_manager.get_cache_validators("owner", "repo")
+        assert validators == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_refresh_cached_release_bumps_timestamp(
+        self,
+        cache_manager: ReleaseCacheManager,
+        sample_release_data: dict[str, Any],
+    ) -> None:
+        """Revalidating an expired entry makes it fresh again."""
+        cached_at = datetime.now(UTC) - timedelta(hours=25)
+        cache_manager._write_cache_entry(
+            "owner",
+            "repo",
+            "stable",
+            CacheEntry(
+                {
+                    "cached_at": cached_at.isoformat(),
+                    "ttl_hours": 24,
+                    "release_data": sample_release_data,
+                    "etag": '"abc"',
+                }
+            ),
         )
-        prerelease_file = cache_manager._get_cache_file_path(
-            "owner", "repo", "prerelease"
+
+        result = await cache_manager.refresh_cached_release("owner", "repo")
+
+        assert result == sample_release_data
+        assert (
+            await cache_manager.get_cached_release("owner", "repo")
+            == sample_release_data
         )
-        latest_file = cache_manager._get_cache_file_path(
-            "owner", "repo", "latest"
+        validators = await cache_manager.get_cache_validators("owner", "repo")
+        assert validators == ('"abc"', None)
+
+    @pytest.mark.asyncio
+    async def test_update_release_data_keeps_validators(
+        self,
+        cache_manager: ReleaseCacheManager,
+        sample_release_data: dict[str, Any],
+    ) -> None:
+        """Data without validators keeps the stored ETag and checksums."""
+        release = {**sample_release_data, "original_tag_name": "v1.0.0"}
+        await cache_manager.save_release_data(
+            "owner",
+            "repo",
+            {**release, "checksum_files": [{"filename": "SHA256SUMS"}]},
+            etag='"abc"',
         )
 
-        assert stable_file.exists()
-        assert prerelease_file.exists()
-        assert latest_file.exists()
+        await cache_manager.update_release_data("owner", "repo", release)
+
+        cached = await cache_manager.get_cached_release("owner", "repo")
+        assert cached is not None
+        assert cached["checksum_files"] == [{"filename": "SHA256SUMS"}]
+        validators = await cache_manager.get_cache_validators("owner", "repo")
+        assert validators == ('"abc"', None)
+
+        newer = {**release, "original_tag_name": "v2.0.0"}
+        await cache_manager.update_release_data("owner", "repo", newer)
+
+        assert await cache_manager.get_cached_release("owner", "repo") == newer
+        validators = await cache_manager.get_cache_validators("owner", "repo")
+        assert validators == ('"abc"', None)
 
     @pytest.mark.asyncio
-    async def test_save_release_data_atomic_write(
+    async def test_get_cached_releases_bulk_lookup(
         self,
         cache_manager: ReleaseCacheManager,
         sample_release_data: dict[str, Any],
     ) -> None:
-        """Test that save_release_data uses atomic writes."""
-        # Mock a write failure during the rename step
-        original_replace = Path.replace
+        """Fresh entries for many repositories are returned together."""
+        await cache_manager.save_release_data(
+            "owner", "fresh", sample_release_data
+        )
+        await cache_manager.save_release_data(
+            "owner", "pre", sample_release_data, "prerelease"
+        )
+        cache_manager._write_cache_entry(
+            "owner",
+            "expired",
+            "stable",
+            CacheEntry(
+                {
+                    "cached_at": (
+                        datetime.now(UTC) - timedelta(hours=25)
+                    ).isoformat(),
+                    "ttl_hours": 24,
+                    "release_data": sample_release_data,
+                }
+            ),
+        )
 
-        def mock_replace(self: Path, target: Path) -> Path:
-            if str(self).endswith(".tmp"):
-                raise OSError("Simulated write failure")
-            return original_replace(self, target)
+        result = await cache_manager.get_cached_releases(
+            [
+                ("owner", "fresh", "stable"),
+                ("owner", "pre", "prerelease"),
+                ("owner", "pre", "stable"),
+                ("owner", "expired", "stable"),
+                ("owner", "missing", "stable"),
+            ]
+        )
 
-        with patch.object(Path, "replace", mock_replace):
-            # This should handle the error gracefully
-            await cache_manager.save_release_data(
-                "owner", "repo", sample_release_data
+        assert result == {
+            ("owner", "fresh", "stable"): sample_release_data,
+            ("owner", "pre", "prerelease"): sample_release_data,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_stale_release_within_window(
+        self,
+        cache_manager: ReleaseCacheManager,
+        sample_release_data: dict[str, Any],
+    ) -> None:
+        """Expired entries are served until the stale window ends."""
+        for repo, age in (("stale", 48), ("ancient", 24 * 30)):
+            cache_manager._write_cache_entry(
+                "owner",
+                repo,
+                "stable",
+                CacheEntry(
+                    {
+                        "cached_at": (
+                            datetime.now(UTC) - timedelta(hours=age)
+                        ).isoformat(),
+                        "ttl_hours": 24,
+                        "release_data": sample_release_data,
+                    }
+                ),
             )
 
-            # Cache file should not exist due to failed write
-            cache_file = cache_manager._get_cache_file_path("owner", "repo")
-            assert not cache_file.exists()
+        assert await cache_manager.get_cached_release("owner", "stale") is None
+        assert (
+            await cache_manager.get_stale_release("owner", "stale")
+            == sample_release_data
+        )
+        assert (
+            await cache_manager.get_stale_release("owner", "ancient") is None
+        )
+
+        stale = await cache_manager.get_cached_releases(
+            [("owner", "stale", "stable"), ("owner", "ancient", "stable")],
+            include_stale=True,
+        )
+        assert list(stale) == [("owner", "stale", "stable")]
+
+        cache_manager.stale_hours = 0
+        assert await cache_manager.get_stale_release("owner", "stale") is None
+
+    def test_settings_from_network_config(
+        self, mock_config_manager: MagicMock
+    ) -> None:
+        """TTL and stale window default to the network settings."""
+        global_config = mock_config_manager.load_global_config.return_value
+        global_config["network"] = {
+            "cache_ttl_hours": 6,
+            "cache_stale_hours": 12,
+        }
+
+        cache_manager = ReleaseCacheManager(mock_config_manager)
+
+        assert cache_manager.ttl_hours == 6
+        assert cache_manager.stale_hours == 12
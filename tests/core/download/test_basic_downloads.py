@@ -4,6 +4,7 @@ Tests basic download operations including file downloads, appimage downloads,
 and checksum file downloads.
 """
 
+import hashlib
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -94,6 +95,36 @@ async def test_download_appimage_success(
     assert tmp_file.read_bytes() == content
 
 
+@pytest.mark.asyncio
+async def test_download_appimage_records_digests(
+    tmp_file: Any, mock_session: Any, patch_logger: Any
+) -> None:
+    """Digests are computed while streaming and can be collected once."""
+    asset = Asset(
+        name="test.AppImage",
+        size=100,
+        browser_download_url="http://example.com/appimage",
+        digest=None,
+    )
+    chunks = [b"app", b"image"]
+    mock_response = AsyncMock()
+    mock_response.__aenter__.return_value = mock_response
+    mock_response.__aexit__.return_value = None
+    mock_response.headers = {"Content-Length": "8"}
+    mock_response.content.iter_chunked = lambda size: async_chunk_gen(chunks)
+    mock_response.raise_for_status = MagicMock()
+    mock_session.get.return_value = mock_response
+
+    service = DownloadService(mock_session)
+    await service.download_appimage(asset, tmp_file)
+
+    assert service.pop_computed_digests(tmp_file) == {
+        "sha256": hashlib.sha256(b"appimage").hexdigest(),
+        "sha512": hashlib.sha512(b"appimage").hexdigest(),
+    }
+    assert service.pop_computed_digests(tmp_file) is None
+
+
 def test_get_filename_from_url() -> None:
     """Test get_filename_from_url extracts filename."""
     service = DownloadService(MagicMock())
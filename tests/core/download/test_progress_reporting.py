@@ -11,10 +11,25 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from my_unicorn.core.download import DownloadService
-from my_unicorn.core.protocols import ProgressType
+from my_unicorn.core.protocols import ProgressCounter, ProgressType
 from tests.core.conftest import MockProgressReporter, async_chunk_gen
 
 
+class CountingProgressReporter(MockProgressReporter):
+    """Mock reporter that hands out progress counters."""
+
+    def __init__(self) -> None:
+        """Initialize the reporter with no counters."""
+        super().__init__()
+        self.counters: dict[str, ProgressCounter] = {}
+
+    def progress_counter(self, task_id: str) -> ProgressCounter:
+        """Create a counter for a task."""
+        counter = ProgressCounter()
+        self.counters[task_id] = counter
+        return counter
+
+
 class TestDownloadServiceProgressReporting:
     """Test progress reporting during downloads."""
 
@@ -79,6 +94,35 @@ class TestDownloadServiceProgressReporting:
         final_completed = reporter.updates[-1][1]
         assert final_completed == len(content)
 
+    @pytest.mark.asyncio
+    async def test_download_with_progress_uses_counter(
+        self, tmp_file: Any, mock_session: Any, patch_logger: Any
+    ) -> None:
+        """Chunks go to the reporter's counter instead of update_task."""
+        content = b"x" * (2 * 1024 * 1024)
+        mock_response = AsyncMock()
+        mock_response.__aenter__.return_value = mock_response
+        mock_response.__aexit__.return_value = None
+        mock_response.headers = {"Content-Length": str(len(content))}
+        mock_response.content.iter_chunked = lambda size: async_chunk_gen(
+            [content[i : i + 8192] for i in range(0, len(content), 8192)]
+        )
+        mock_response.raise_for_status = MagicMock()
+        mock_session.get.return_value = mock_response
+
+        reporter = CountingProgressReporter()
+        service = DownloadService(mock_session, progress_reporter=reporter)
+
+        await service.download_file(
+            url="http://example.com/large.bin",
+            dest=tmp_file,
+        )
+
+        task_id = next(iter(reporter.counters))
+        assert reporter.counters[task_id].completed == len(content)
+        completed_updates = [u for u in reporter.updates if u[1]]
+        assert completed_updates == [(task_id, len(content), None)]
+
     @pytest.mark.asyncio
     async def test_download_with_progress_finishes_task(
         self, tmp_file: Any, mock_session: Any, patch_logger: Any
@@ -0,0 +1,256 @@
+"""Tests for resumable downloads in DownloadService.
+
+Tests HTTP Range resume of partial ``.part`` files, validation of
+``Content-Range``/``ETag`` on ranged responses and persistence of resume
+metadata across service instances.
+"""
+
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import aiohttp
+import orjson
+import pytest
+
+from my_unicorn.core.download import (
+    DownloadError,
+    DownloadService,
+    ResumeState,
+    get_part_path,
+    get_resume_state_path,
+    load_resume_state,
+    parse_content_range,
+    save_resume_state,
+)
+from tests.core.conftest import async_chunk_gen
+
+URL = "https://example.com/app.AppImage"
+ETAG = '"abc123"'
+
+
+@pytest.fixture(autouse=True)
+def mock_network_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use predictable network settings and skip retry backoff."""
+
+    class MockConfigManager:
+        def load_global_config(self) -> dict:
+            return {"network": {"retry_attempts": 2, "timeout_seconds": 10}}
+
+    async def instant_sleep(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(
+        "my_unicorn.core.download.ConfigManager", MockConfigManager
+    )
+    monkeypatch.setattr(asyncio, "sleep", instant_sleep)
+
+
+@pytest.fixture
+def service() -> DownloadService:
+    """DownloadService with a mocked session and pass-through auth."""
+    auth_manager = MagicMock()
+    auth_manager.apply_auth.side_effect = lambda headers: headers
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    return DownloadService(session, auth_manager=auth_manager)
+
+
+def make_response(
+    chunks: list[bytes], status: int = 200, headers: dict | None = None
+) -> AsyncMock:
+    """Create a mock response streaming the given chunks."""
+    response = AsyncMock()
+    response.status = status
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    response.content.iter_chunked = lambda size: async_chunk_gen(chunks)
+    return response
+
+
+def request_headers(service: DownloadService, call: int) -> dict[str, str]:
+    """Return the headers passed to the given session.get call."""
+    return service.session.get.call_args_list[call].kwargs["headers"]
+
+
+def test_parse_content_range() -> None:
+    """Content-Range headers are parsed into (start, total)."""
+    assert parse_content_range("bytes 100-199/1000") == (100, 1000)
+    assert parse_content_range("bytes 5-9/*") == (5, None)
+    assert parse_content_range("items 0-1/2") is None
+    assert parse_content_range(None) is None
+
+
+def test_resume_state_roundtrip(tmp_path: Path) -> None:
+    """Resume metadata is persisted next to the partial file."""
+    dest = tmp_path / "app.AppImage"
+    state = ResumeState(url=URL, total=10, etag=ETAG)
+
+    save_resume_state(dest, state)
+
+    assert get_resume_state_path(dest).name == "app.AppImage.part.json"
+    assert load_resume_state(dest) == state
+
+
+def test_load_resume_state_ignores_corrupt_file(tmp_path: Path) -> None:
+    """Corrupt metadata is treated as missing."""
+    dest = tmp_path / "app.AppImage"
+    get_resume_state_path(dest).write_text("{not json")
+
+    assert load_resume_state(dest) is None
+
+
+@pytest.mark.asyncio
+async def test_resumes_partial_download_with_range(
+    service: DownloadService, tmp_path: Path
+) -> None:
+    """A resumable partial file is continued with a Range request."""
+    dest = tmp_path / "app.AppImage"
+    get_part_path(dest).write_bytes(b"hello ")
+    save_resume_state(dest, ResumeState(url=URL, total=11, etag=ETAG))
+
+    response = make_response(
+        [b"world"],
+        status=206,
+        headers={
+            "Content-Length": "5",
+            "Content-Range": "bytes 6-10/11",
+            "ETag": ETAG,
+        },
+    )
+    service.session.get.return_value.__aenter__.return_value = response
+
+    digests = await service.download_file(URL, dest)
+
+    headers = request_headers(service, 0)
+    assert headers["Range"] == "bytes=6-"
+    assert headers["If-Range"] == ETAG
+    assert dest.read_bytes() == b"hello world"
+    assert digests["sha256"] == hashlib.sha256(b"hello world").hexdigest()
+    assert not get_part_path(dest).exists()
+    assert not get_resume_state_path(dest).exists()
+
+
+@pytest.mark.asyncio
+async def test_full_response_to_range_request_restarts(
+    service: DownloadService, tmp_path: Path
+) -> None:
+    """A 200 reply to a Range request replaces the partial file."""
+    dest = tmp_path / "app.AppImage"
+    get_part_path(dest).write_bytes(b"stale")
+    save_resume_state(dest, ResumeState(url=URL, total=11, etag=ETAG))
+
+    response = make_response(
+        [b"new content"],
+        headers={"Content-Length": "11", "ETag": '"changed"'},
+    )
+    service.session.get.return_value.__aenter__.return_value = response
+
+    await service.download_file(URL, dest)
+
+    assert dest.read_bytes() == b"new content"
+
+
+@pytest.mark.asyncio
+async def test_changed_etag_falls_back_to_full_download(
+    service: DownloadService, tmp_path: Path
+) -> None:
+    """A ranged response for a changed asset restarts from byte zero."""
+    dest = tmp_path / "app.AppImage"
+    get_part_path(dest).write_bytes(b"hello ")
+    save_resume_state(dest, ResumeState(url=URL, total=11, etag=ETAG))
+
+    ranged = make_response(
+        [b"WORLD"],
+        status=206,
+        headers={
+            "Content-Length": "5",
+            "Content-Range": "bytes 6-10/11",
+            "ETag": '"changed"',
+        },
+    )
+    full = make_response(
+        [b"fresh bytes"],
+        headers={"Content-Length": "11", "ETag": '"changed"'},
+    )
+    service.session.get.return_value.__aenter__.side_effect = [ranged, full]
+
+    await service.download_file(URL, dest)
+
+    assert "Range" not in request_headers(service, 1)
+    assert dest.read_bytes() == b"fresh bytes"
+
+
+@pytest.mark.asyncio
+async def test_interrupted_download_resumes_on_retry(
+    service: DownloadService, tmp_path: Path
+) -> None:
+    """A dropped connection keeps the partial file for the next attempt."""
+    dest = tmp_path / "app.AppImage"
+
+    async def failing_chunks() -> Any:
+        yield b"hello "
+        raise aiohttp.ClientPayloadError("Connection reset")
+
+    first = make_response([], headers={"Content-Length": "11", "ETag": ETAG})
+    first.content.iter_chunked = lambda size: failing_chunks()
+    second = make_response(
+        [b"world"],
+        status=206,
+        headers={
+            "Content-Length": "5",
+            "Content-Range": "bytes 6-10/11",
+            "ETag": ETAG,
+        },
+    )
+    service.session.get.return_value.__aenter__.side_effect = [first, second]
+
+    await service.download_file(URL, dest)
+
+    assert request_headers(service, 1)["Range"] == "bytes=6-"
+    assert dest.read_bytes() == b"hello world"
+
+
+@pytest.mark.asyncio
+async def test_partial_download_persists_after_failure(
+    service: DownloadService, tmp_path: Path
+) -> None:
+    """Resume metadata survives a failed run for a later process."""
+    dest = tmp_path / "app.AppImage"
+
+    async def failing_chunks() -> Any:
+        yield b"hello "
+        raise aiohttp.ClientPayloadError("Connection reset")
+
+    response = make_response(
+        [], headers={"Content-Length": "11", "ETag": ETAG}
+    )
+    response.content.iter_chunked = lambda size: failing_chunks()
+    service.session.get.return_value.__aenter__.return_value = response
+
+    with pytest.raises(DownloadError):
+        await service.download_file(URL, dest)
+
+    assert not dest.exists()
+    assert get_part_path(dest).read_bytes() == b"hello "
+    stored = orjson.loads(get_resume_state_path(dest).read_bytes())
+    assert stored["etag"] == ETAG
+    assert stored["total"] == 11
+
+
+@pytest.mark.asyncio
+async def test_partial_without_validator_is_discarded(
+    service: DownloadService, tmp_path: Path
+) -> None:
+    """Partial files from servers without validators are not resumed."""
+    dest = tmp_path / "app.AppImage"
+    get_part_path(dest).write_bytes(b"partial")
+
+    response = make_response([b"complete"], headers={"Content-Length": "8"})
+    service.session.get.return_value.__aenter__.return_value = response
+
+    await service.download_file(URL, dest)
+
+    assert "Range" not in request_headers(service, 0)
+    assert dest.read_bytes() == b"complete"
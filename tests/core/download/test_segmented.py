@@ -0,0 +1,331 @@
+"""Tests for parallel segmented downloads in DownloadService.
+
+Tests byte range splitting, concurrent range fetching into a preallocated
+file, single-task progress reporting and fallback to a single stream when
+the server ignores range requests.
+"""
+
+import asyncio
+import hashlib
+import re
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import aiohttp
+import pytest
+
+from my_unicorn.core.download import (
+    DownloadError,
+    DownloadService,
+    ResumeState,
+    _SegmentedDownload,
+    get_part_path,
+    get_resume_state_path,
+    load_resume_state,
+    split_byte_ranges,
+)
+from tests.core.conftest import MockProgressReporter, async_chunk_gen
+
+URL = "https://example.com/big.AppImage"
+MB = 1024 * 1024
+CHUNK = 8192
+
+
+async def dropped_chunk_gen(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    """Yield chunks, then fail like a dropped connection."""
+    for chunk in chunks:
+        yield chunk
+    msg = "connection reset"
+    raise aiohttp.ClientPayloadError(msg)
+
+
+@pytest.fixture(autouse=True)
+def mock_network_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Segment files of 1MB or more into 4 ranges, skip retry backoff."""
+
+    class MockConfigManager:
+        def load_global_config(self) -> dict:
+            return {
+                "network": {
+                    "retry_attempts": 2,
+                    "timeout_seconds": 10,
+                    "download_segments": 4,
+                    "segment_threshold_mb": 1,
+                }
+            }
+
+    async def instant_sleep(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(
+        "my_unicorn.core.download.ConfigManager", MockConfigManager
+    )
+    monkeypatch.setattr(asyncio, "sleep", instant_sleep)
+
+
+def make_service(
+    content: bytes,
+    *,
+    honour_ranges: bool = True,
+    reporter: MockProgressReporter | None = None,
+    fail_after: int | None = None,
+) -> DownloadService:
+    """Create a service whose session serves ``content`` by byte range.
+
+    With ``fail_after``, the connection serving the first range drops
+    after that many bytes, and every retry of that range fails.
+    """
+    session = MagicMock(spec=aiohttp.ClientSession)
+
+    def get(url: str, headers: dict, timeout: Any) -> MagicMock:
+        response = AsyncMock()
+        response.raise_for_status = Mock()
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", headers.get("Range", ""))
+        if match and honour_ranges:
+            start = int(match.group(1))
+            end = int(match.group(2) or len(content) - 1)
+            body = content[start : end + 1]
+            response.status = 206
+            response.headers = {
+                "Content-Length": str(len(body)),
+                "Content-Range": f"bytes {start}-{end}/{len(content)}",
+                "ETag": '"v1"',
+            }
+        else:
+            body = content
+            response.status = 200
+            response.headers = {"Content-Length": str(len(body))}
+        chunks = [body[i : i + CHUNK] for i in range(0, len(body), CHUNK)]
+        offset = int(match.group(1)) if match else 0
+        if fail_after is not None and offset < len(content) // 4:
+            # Retries of the first range fail before sending any data
+            sent = chunks[: fail_after // CHUNK] if offset == 0 else []
+            response.content.iter_chunked = lambda size: dropped_chunk_gen(
+                sent
+            )
+        else:
+            response.content.iter_chunked = lambda size: async_chunk_gen(
+                chunks
+            )
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=None)
+        return context
+
+    session.get.side_effect = get
+    auth_manager = MagicMock()
+    auth_manager.apply_auth.side_effect = lambda headers: headers
+    return DownloadService(
+        session, progress_reporter=reporter, auth_manager=auth_manager
+    )
+
+
+def range_headers(service: DownloadService) -> list[str]:
+    """Return the Range headers sent by the service."""
+    return [
+        call.kwargs["headers"].get("Range", "")
+        for call in service.session.get.call_args_list
+    ]
+
+
+def test_split_byte_ranges_covers_file() -> None:
+    """Ranges are contiguous and cover every byte exactly once."""
+    ranges = split_byte_ranges(10, 3)
+
+    assert ranges == [(0, 3), (4, 6), (7, 9)]
+
+
+def test_split_byte_ranges_never_exceeds_size() -> None:
+    """Tiny files never produce empty ranges."""
+    assert split_byte_ranges(2, 8) == [(0, 0), (1, 1)]
+
+
+@pytest.mark.asyncio
+async def test_segmented_download_assembles_file(tmp_path: Path) -> None:
+    """Large files are fetched as concurrent ranges and reassembled."""
+    content = bytes(range(256)) * (8 * 1024)  # 2MB
+    dest = tmp_path / "big.AppImage"
+    service = make_service(content)
+
+    digests = await service.download_file(URL, dest, size=len(content))
+
+    assert dest.read_bytes() == content
+    assert not get_part_path(dest).exists()
+    assert digests == {
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "sha512": hashlib.sha512(content).hexdigest(),
+    }
+    assert sorted(range_headers(service)) == sorted(
+        f"bytes={start}-{end}"
+        for start, end in split_byte_ranges(len(content), 4)
+    )
+
+
+@pytest.mark.asyncio
+async def test_segmented_download_reports_single_task(tmp_path: Path) -> None:
+    """Progress for all segments is reported as one task."""
+    content = b"x" * (2 * MB)
+    reporter = MockProgressReporter()
+    service = make_service(content, reporter=reporter)
+
+    await service.download_file(
+        URL, tmp_path / "big.AppImage", size=len(content)
+    )
+
+    assert len(reporter.tasks) == 1
+    assert reporter.updates[-1][1] == len(content)
+    assert reporter.finished[0][1] is True
+
+
+@pytest.mark.asyncio
+async def test_falls_back_when_ranges_ignored(tmp_path: Path) -> None:
+    """A 200 reply to a range request falls back to a single stream."""
+    content = b"y" * (2 * MB)
+    dest = tmp_path / "big.AppImage"
+    service = make_service(content, honour_ranges=False)
+
+    await service.download_file(URL, dest, size=len(content))
+
+    assert dest.read_bytes() == content
+    assert "" in range_headers(service)
+
+
+@pytest.mark.asyncio
+async def test_range_ignored_by_one_segment_cancels_others(
+    tmp_path: Path,
+) -> None:
+    """Segments still running stop once one segment gets a 200 reply."""
+    content = b"w" * (2 * MB)
+    dest = tmp_path / "big.AppImage"
+    service = make_service(content)
+    serve_range = service.session.get.side_effect
+    stalled = asyncio.Event()
+
+    async def stalled_chunk_gen() -> AsyncIterator[bytes]:
+        await stalled.wait()
+        yield b""
+
+    def get(url: str, headers: dict, timeout: Any) -> MagicMock:
+        context = serve_range(url, headers, timeout)
+        response = context.__aenter__.return_value
+        range_header = headers.get("Range", "")
+        if range_header.startswith("bytes=0-"):
+            # The first segment is answered with the whole file
+            response.status = 200
+            response.headers = {"Content-Length": str(len(content))}
+        elif range_header:
+            response.content.iter_chunked = lambda size: stalled_chunk_gen()
+        return context
+
+    service.session.get.side_effect = get
+
+    await asyncio.wait_for(
+        service.download_file(URL, dest, size=len(content)), timeout=5
+    )
+
+    assert dest.read_bytes() == content
+    assert range_headers(service)[-1] == ""
+    assert not stalled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_small_files_use_single_stream(tmp_path: Path) -> None:
+    """Files below the threshold are not segmented."""
+    content = b"small"
+    dest = tmp_path / "small.AppImage"
+    service = make_service(content)
+
+    await service.download_file(URL, dest, size=len(content))
+
+    assert dest.read_bytes() == content
+    assert range_headers(service) == [""]
+
+
+@pytest.mark.asyncio
+async def test_failed_segment_discards_partial_file(tmp_path: Path) -> None:
+    """A segment failing all retries removes the preallocated file."""
+    content = b"z" * (2 * MB)
+    dest = tmp_path / "big.AppImage"
+    service = make_service(content)
+    service.session.get.side_effect = aiohttp.ClientError("boom")
+
+    with pytest.raises(DownloadError):
+        await service.download_file(URL, dest, size=len(content))
+
+    assert not dest.exists()
+    assert not get_part_path(dest).exists()
+
+
+@pytest.mark.asyncio
+async def test_interrupted_segments_resume_from_stored_offsets(
+    tmp_path: Path,
+) -> None:
+    """A failed segmented download keeps its offsets and resumes them."""
+    content = bytes(range(256)) * (32 * 1024)  # 8MB, 2MB per segment
+    dest = tmp_path / "big.AppImage"
+    failing = make_service(content, fail_after=MB + 4 * CHUNK)
+
+    with pytest.raises(DownloadError):
+        await failing.download_file(URL, dest, size=len(content))
+
+    state = load_resume_state(dest)
+    assert state is not None
+    assert state.etag == '"v1"'
+    assert state.segments is not None
+    assert state.segments[0][2] == MB
+    assert get_part_path(dest).stat().st_size == len(content)
+
+    service = make_service(content)
+    digests = await service.download_file(URL, dest, size=len(content))
+
+    assert dest.read_bytes() == content
+    assert not get_resume_state_path(dest).exists()
+    assert digests["sha256"] == hashlib.sha256(content).hexdigest()
+    # Every range continues from the offset stored for it
+    assert sorted(range_headers(service)) == sorted(
+        f"bytes={start + written}-{end}"
+        for start, end, written in state.segments
+        if start + written <= end
+    )
+    assert f"bytes={MB}-{2 * MB - 1}" in range_headers(service)
+
+
+def test_resume_offsets_are_saved_at_most_once_per_interval(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Chunk writes within the interval do not rewrite the sidecar file."""
+    dest = tmp_path / "big.AppImage"
+    now = [100.0]
+    monkeypatch.setattr(
+        "my_unicorn.core.download.time.monotonic", lambda: now[0]
+    )
+    saves: list[list[list[int]]] = []
+    monkeypatch.setattr(
+        "my_unicorn.core.download.save_resume_state",
+        lambda _dest, state: saves.append(state.segments),
+    )
+    download = _SegmentedDownload(
+        URL,
+        dest,
+        4 * MB,
+        [(0, 2 * MB - 1), (2 * MB, 4 * MB - 1)],
+        [0, 0],
+        ResumeState(url=URL, total=4 * MB, etag='"v1"'),
+    )
+
+    for _ in range(8):
+        download.record_write(0, CHUNK)
+    assert saves == []
+
+    now[0] += 1.0
+    download.record_write(1, CHUNK)
+    assert saves == [[[0, 2 * MB - 1, 8 * CHUNK], [2 * MB, 4 * MB - 1, CHUNK]]]
+
+    download.record_write(0, 2 * MB - 8 * CHUNK)
+    assert saves[-1][0][2] == 2 * MB  # A completed range is saved at once
+
+    download.record_write(1, CHUNK)
+    download.cleanup()
+    assert saves[-1][1][2] == 2 * CHUNK  # Kept partial files get the rest
@@ -131,6 +131,7 @@ def mock_download_service() -> AsyncMock:
     Includes pre-configured methods for:
     - download_appimage: Returns Path to downloaded file
     - download_file: Returns Path to downloaded checksum file
+    - pop_computed_digests: Returns None (no streamed digests)
     - progress_reporter: Returns a mock progress reporter
 
     Returns:
@@ -144,6 +145,7 @@ def mock_download_service() -> AsyncMock:
     mock.download_file = AsyncMock(
         return_value=Path("/test/download/SHA256SUMS.txt")
     )
+    mock.pop_computed_digests = MagicMock(return_value=None)
     mock.progress_reporter = MagicMock()
     return mock
 
@@ -214,6 +214,62 @@ async def test_install_workflow_verification_disabled(  # noqa: PLR0913
     assert call_args is not None
     context = call_args[0][0]
     assert context.verify_downloads is False
+    mock_post_download_processor.prefetch_checksums.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_install_workflow_prefetches_checksums(  # noqa: PLR0913
+    sample_asset: Asset,
+    sample_release: Release,
+    sample_app_config: dict[str, Any],
+    mock_download_service: AsyncMock,
+    mock_post_download_processor: AsyncMock,
+    sample_post_download_result: PostDownloadResult,
+) -> None:
+    """Test checksum prefetch starts before the download and is closed.
+
+    Verifies that the prefetch is handed to post-download processing so
+    verification does not fetch the checksum file after the download.
+    """
+    # Arrange
+    calls: list[str] = []
+    prefetch = MagicMock()
+    mock_post_download_processor.prefetch_checksums = MagicMock(
+        side_effect=lambda **_: calls.append("prefetch") or prefetch
+    )
+    mock_download_service.download_appimage.side_effect = lambda *_: (
+        calls.append("download")
+        or Path("/test/download/QOwnNotes-1.0.0-x86_64.AppImage")
+    )
+    mock_post_download_processor.process.return_value = (
+        sample_post_download_result
+    )
+
+    mock_github_config = MagicMock()
+    mock_github_config.owner = "pbek"
+    mock_github_config.repo = "QOwnNotes"
+
+    # Act
+    with patch(
+        "my_unicorn.core.install.get_github_config",
+        return_value=mock_github_config,
+    ):
+        await install_workflow(
+            app_name="qownnotes",
+            asset=sample_asset,
+            release=sample_release,
+            app_config=sample_app_config,
+            source="catalog",
+            download_service=mock_download_service,
+            post_download_processor=mock_post_download_processor,
+            download_dir=Path("/test/download"),
+        )
+
+    # Assert
+    assert calls == ["prefetch", "download"]
+    context = mock_post_download_processor.process.call_args[0][0]
+    assert context.checksum_prefetch is prefetch
+    prefetch.close.assert_called_once()
 
 
 @pytest.mark.asyncio
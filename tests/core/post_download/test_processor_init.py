@@ -85,3 +85,46 @@ class TestProcessorInitialization:
 
         assert processor is not None
         assert isinstance(processor.progress_reporter, NullProgressReporter)
+
+    def test_processor_uses_injected_global_config(
+        self,
+        mock_download_service_post: MagicMock,
+        mock_storage_service_post: MagicMock,
+        mock_config_manager_post: MagicMock,
+    ) -> None:
+        """Verify an injected snapshot is used without reading settings.
+
+        Args:
+            mock_download_service_post: Mocked download service.
+            mock_storage_service_post: Mocked storage service.
+            mock_config_manager_post: Mocked config manager.
+
+        """
+        snapshot = {"directory": {"icon": "/tmp/icons"}}
+        processor = PostDownloadProcessor(
+            download_service=mock_download_service_post,
+            storage_service=mock_storage_service_post,
+            config_manager=mock_config_manager_post,
+            global_config=snapshot,  # type: ignore[arg-type]
+        )
+
+        assert processor.global_config is snapshot
+        mock_config_manager_post.load_global_config.assert_not_called()
+
+    def test_processor_loads_global_config_once(
+        self,
+        processor_instance: PostDownloadProcessor,
+        mock_config_manager_post: MagicMock,
+    ) -> None:
+        """Verify the fallback global config is loaded at most once.
+
+        Args:
+            processor_instance: Processor without an injected snapshot.
+            mock_config_manager_post: Mocked config manager.
+
+        """
+        first = processor_instance.global_config
+        second = processor_instance.global_config
+
+        assert first is second
+        mock_config_manager_post.load_global_config.assert_called_once()
@@ -150,6 +150,26 @@ class TestVerifyDownload:
 
             mock_verify.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_verify_download_passes_precomputed_hashes(
+        self,
+        processor_instance: PostDownloadProcessor,
+        install_context: PostDownloadContext,
+    ) -> None:
+        """Digests computed while downloading reach the verifier."""
+        install_context.precomputed_hashes = {"sha256": "abc123"}
+        with patch(
+            "my_unicorn.core.post_download.verify_appimage_download",
+            new_callable=AsyncMock,
+        ) as mock_verify:
+            mock_verify.return_value = {"passed": True, "methods": {}}
+
+            await processor_instance._verify_download(install_context, None)
+
+            assert mock_verify.call_args.kwargs["precomputed_hashes"] == {
+                "sha256": "abc123"
+            }
+
     @pytest.mark.asyncio
     async def test_verify_download_with_verification_disabled(
         self,
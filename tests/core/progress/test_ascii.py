@@ -6,6 +6,7 @@ from my_unicorn.core.progress.progress import (
     AsciiProgressBackend,
     ProgressType,
 )
+from my_unicorn.core.protocols import ProgressCounter
 
 
 @pytest.fixture
@@ -128,6 +129,58 @@ class TestAsciiProgressBackend:
         output_value = ascii_backend.output.getvalue()  # type: ignore[attr-defined]
         assert len(output_value) > 0
 
+    @pytest.mark.asyncio
+    async def test_render_once_skips_unchanged_frames(self) -> None:
+        """Frames are only rendered after a task changed."""
+        output = io.StringIO()
+        backend = AsciiProgressBackend(output=output, interactive=True)
+        backend.add_task(
+            "dl_1", "test.AppImage", ProgressType.DOWNLOAD, total=1000.0
+        )
+        await backend.render_once()
+        written = output.getvalue()
+
+        await backend.render_once()
+        assert output.getvalue() == written
+
+        backend.update_task("dl_1", completed=500.0)
+        await backend.render_once()
+        assert output.getvalue() != written
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tasks_reuse_formatted_lines(self) -> None:
+        """Lines of tasks that did not change are not formatted again."""
+        backend = AsciiProgressBackend(output=io.StringIO(), interactive=True)
+        backend.add_task("dl_1", "a.AppImage", ProgressType.DOWNLOAD, 10.0)
+        backend.add_task("dl_2", "b.AppImage", ProgressType.DOWNLOAD, 10.0)
+        await backend.render_once()
+        first_lines = backend._line_cache._lines["dl_1"][1]
+
+        backend.update_task("dl_2", completed=5.0)
+        await backend.render_once()
+
+        assert backend._line_cache._lines["dl_1"][1] is first_lines
+        assert "50%" in backend._writer._last_lines[2]
+
+    @pytest.mark.asyncio
+    async def test_attached_counter_is_read_on_render(self) -> None:
+        """Counter increments reach the task at the next render."""
+        backend = AsciiProgressBackend(output=io.StringIO(), interactive=True)
+        backend.add_task("dl_1", "a.AppImage", ProgressType.DOWNLOAD, 100.0)
+        counter = ProgressCounter()
+        backend.attach_counter("dl_1", counter)
+
+        counter.add(40.0)
+        assert backend.tasks["dl_1"].completed == 0.0
+        await backend.render_once()
+
+        assert backend.tasks["dl_1"].completed == 40.0
+        assert backend.tasks["dl_1"].speed > 0
+        assert any("40%" in line for line in backend._writer._last_lines)
+
+        backend.finish_task("dl_1")
+        assert "dl_1" not in backend._counters
+
     def test_backend_interactive_vs_noninteractive(self) -> None:
         """Test interactive vs non-interactive mode detection."""
         output = io.StringIO()
@@ -218,6 +218,68 @@ class TestWriteInteractive:
         assert "\033[3A" in result or "New content" in result
 
 
+class TestWriteInteractiveDiff:
+    """Tests for write_interactive_diff method."""
+
+    def test_first_frame_is_written_in_full(self) -> None:
+        """Without a frame on screen the whole output is written."""
+        output = io.StringIO()
+        writer = TerminalWriter(output, interactive=True)
+
+        assert writer.write_interactive_diff("a\nb\n") == 2
+        assert output.getvalue() == "a\nb\n"
+
+    def test_unchanged_frame_writes_nothing(self) -> None:
+        """A frame identical to the one on screen is not written."""
+        output = io.StringIO()
+        writer = TerminalWriter(output, interactive=True)
+        writer.write_interactive_diff("a\nb\n")
+        output.seek(0)
+        output.truncate()
+
+        assert writer.write_interactive_diff("a\nb\n") == 2
+        assert output.getvalue() == ""
+
+    def test_only_changed_lines_are_rewritten(self) -> None:
+        """Changed lines are addressed with cursor movement."""
+        output = io.StringIO()
+        writer = TerminalWriter(output, interactive=True)
+        writer.write_interactive_diff("a\nb\nc\n")
+        output.seek(0)
+        output.truncate()
+
+        writer.write_interactive_diff("a\nB\nc\n")
+
+        # Up two rows to "b", rewrite it, back down two rows
+        assert output.getvalue() == "\033[2A\rB\033[K\033[2B\r"
+        assert writer._last_lines == ["a", "B", "c"]
+
+    def test_line_count_change_redraws_from_first_change(self) -> None:
+        """Added lines redraw the frame from the first changed line."""
+        output = io.StringIO()
+        writer = TerminalWriter(output, interactive=True)
+        writer.write_interactive_diff("a\nb\n")
+        output.seek(0)
+        output.truncate()
+
+        assert writer.write_interactive_diff("a\nB\nc\n") == 3
+        assert output.getvalue() == "\033[1A\r\033[JB\nc\n"
+        assert writer._last_output_lines == 3
+
+    def test_cleared_frame_falls_back_to_full_write(self) -> None:
+        """A frame cleared behind the writer's back is written in full."""
+        output = io.StringIO()
+        writer = TerminalWriter(output, interactive=True)
+        writer.write_interactive_diff("a\nb\n")
+        writer._last_output_lines = 0
+        output.seek(0)
+        output.truncate()
+
+        writer.write_interactive_diff("a\nb\n")
+
+        assert output.getvalue() == "a\nb\n"
+
+
 class TestWriteNoninteractive:
     """Tests for write_noninteractive method."""
 
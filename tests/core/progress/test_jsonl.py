@@ -0,0 +1,113 @@
+"""Tests for the JSON lines progress backend."""
+
+import io
+import os
+
+import orjson
+import pytest
+
+from my_unicorn.core.progress.jsonl import JsonlProgressBackend
+from my_unicorn.core.progress.progress import ProgressDisplay
+from my_unicorn.core.progress.progress_types import (
+    ProgressConfig,
+    ProgressType,
+)
+from my_unicorn.core.protocols import ProgressCounter
+
+
+def read_events(output: io.StringIO) -> list[dict]:
+    """Parse every line written to the output as JSON."""
+    return [orjson.loads(line) for line in output.getvalue().splitlines()]
+
+
+@pytest.fixture
+def output() -> io.StringIO:
+    """Fixture providing the event output stream."""
+    return io.StringIO()
+
+
+def make_backend(output: io.StringIO, interval: float) -> JsonlProgressBackend:
+    """Create a backend writing to output with the given event interval."""
+    return JsonlProgressBackend(
+        output=output, config=ProgressConfig(event_interval=interval)
+    )
+
+
+@pytest.mark.asyncio
+async def test_task_lifecycle_events(output: io.StringIO) -> None:
+    """A task emits added, progress and finished events."""
+    backend = make_backend(output, interval=1e-9)
+    backend.add_task("dl_1", "app.AppImage", ProgressType.DOWNLOAD, 100.0)
+    backend.update_task("dl_1", completed=40.0)
+    await backend.render_once()
+    backend.finish_task("dl_1", success=True)
+
+    events = read_events(output)
+    assert [e["event"] for e in events] == ["added", "progress", "finished"]
+    assert events[0]["type"] == "download"
+    assert events[1]["completed"] == 40.0
+    assert events[1]["speed"] > 0
+    assert events[2]["completed"] == 40.0
+    assert "dl_1" not in backend.tasks
+
+
+@pytest.mark.asyncio
+async def test_progress_events_are_rate_limited(output: io.StringIO) -> None:
+    """No progress event is emitted before the interval or without change."""
+    backend = make_backend(output, interval=3600.0)
+    backend.add_task("dl_1", "app.AppImage", ProgressType.DOWNLOAD, 100.0)
+    backend.update_task("dl_1", completed=10.0)
+    await backend.render_once()
+
+    backend._event_interval = 1e-9
+    backend.update_task("dl_1", completed=20.0)
+    await backend.render_once()
+    await backend.render_once()
+
+    progress = [e for e in read_events(output) if e["event"] == "progress"]
+    assert [e["completed"] for e in progress] == [20.0]
+
+
+@pytest.mark.asyncio
+async def test_counter_and_error_events(output: io.StringIO) -> None:
+    """Counters are read on render and failures emit error events."""
+    backend = make_backend(output, interval=1e-9)
+    backend.add_task("dl_1", "app.AppImage", ProgressType.DOWNLOAD, 100.0)
+    counter = ProgressCounter()
+    backend.attach_counter("dl_1", counter)
+    counter.add(25.0)
+    await backend.render_once()
+    counter.add(5.0)
+    backend.finish_task("dl_1", success=False, description="timeout")
+
+    events = read_events(output)
+    assert events[1]["completed"] == 25.0
+    assert events[2]["event"] == "error"
+    assert events[2]["completed"] == 30.0
+    assert events[2]["error"] == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_to_fifo(tmp_path) -> None:
+    """Events can be streamed to a FIFO given by path."""
+    fifo = tmp_path / "progress.fifo"
+    os.mkfifo(fifo)
+    reader = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        backend = JsonlProgressBackend(output_path=fifo)
+        backend.add_task("vf_1", "app", ProgressType.VERIFICATION, 1.0)
+        await backend.cleanup()
+        data = os.read(reader, 4096)
+    finally:
+        os.close(reader)
+
+    assert orjson.loads(data)["event"] == "added"
+
+
+def test_display_selects_backend_by_mode() -> None:
+    """ProgressDisplay uses the JSON lines backend in jsonl mode."""
+    display = ProgressDisplay(mode="jsonl")
+    assert isinstance(display._backend, JsonlProgressBackend)
+
+    with pytest.raises(ValueError, match="Unknown progress mode"):
+        ProgressDisplay(mode="html")
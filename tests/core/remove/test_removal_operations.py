@@ -4,6 +4,7 @@ Tests for private methods that perform specific removal tasks:
 - _remove_appimage_files
 - _clear_cache
 - _remove_backups
+- _prune_blobs
 - _remove_desktop_entry
 - _remove_icon
 - _remove_config
@@ -14,6 +15,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from my_unicorn.constants import BLOB_STORE_DIRNAME
+from my_unicorn.core.blob_store import BlobStore
 from my_unicorn.core.remove import RemoveService
 from my_unicorn.types import AppStateConfig
 
@@ -237,6 +240,40 @@ class TestRemoveBackups:
             assert result.metadata == {}
 
 
+class TestPruneBlobs:
+    """Tests for _prune_blobs method."""
+
+    def test_prunes_blobs_of_removed_app(
+        self, mock_config_manager: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should drop blobs whose install and backups were removed."""
+        cache_dir = tmp_path / "cache"
+        blob_store = BlobStore(cache_dir / BLOB_STORE_DIRNAME)
+        installed = tmp_path / "test-app.AppImage"
+        installed.write_bytes(b"appimage")
+        digest = "a" * 64
+        assert blob_store.add(installed, digest)
+        kept = tmp_path / "other.AppImage"
+        kept.write_bytes(b"other")
+        assert blob_store.add(kept, "b" * 64)
+        installed.unlink()
+
+        service = RemoveService(
+            config_manager=mock_config_manager,
+            global_config={"directory": {"cache": cache_dir}},
+        )
+
+        assert service._prune_blobs() == 1
+        assert not blob_store.blob_path(digest).exists()
+        assert blob_store.blob_path("b" * 64).exists()
+
+    def test_skips_without_cache_dir(
+        self, remove_service: RemoveService
+    ) -> None:
+        """Should do nothing when no cache directory is configured."""
+        assert remove_service._prune_blobs() == 0
+
+
 class TestRemoveDesktopEntry:
     """Tests for _remove_desktop_entry method."""
 
@@ -254,6 +291,7 @@ class TestRemoveDesktopEntry:
             mock_remove.assert_called_once_with(
                 "test-app",
                 config_manager=mock_config_manager,
+                global_config=remove_service.global_config,
             )
 
     def test_handles_no_desktop_entry(
@@ -0,0 +1,290 @@
+"""Minimal squashfs 4.0 writer for building test AppImages.
+
+Only what the reader needs is written: gzip compressed metadata and data
+blocks, basic directory, file and symlink inodes, one fragment table and a
+single-entry id table. Blocks are stored uncompressed when compression
+does not make them smaller, like mksquashfs does.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import dataclass, field
+
+METADATA_SIZE = 8192
+METADATA_UNCOMPRESSED = 0x8000
+DATA_UNCOMPRESSED = 1 << 24
+NO_FRAGMENT = 0xFFFFFFFF
+NO_TABLE = 0xFFFFFFFFFFFFFFFF
+
+
+@dataclass(frozen=True)
+class Symlink:
+    """Symlink entry for ``build_squashfs``."""
+
+    target: str
+
+
+@dataclass
+class _Node:
+    content: bytes | Symlink | None = None  # None for directories
+    children: dict[str, _Node] = field(default_factory=dict)
+    number: int = 0
+    ref: int = 0
+
+
+def _metadata_block(data: bytes) -> bytes:
+    compressed = zlib.compress(data)
+    if len(compressed) < len(data):
+        return struct.pack("<H", len(compressed)) + compressed
+    return struct.pack("<H", len(data) | METADATA_UNCOMPRESSED) + data
+
+
+class _MetadataWriter:
+    """Packs records into metadata blocks, tracking their references."""
+
+    def __init__(self) -> None:
+        self.blocks = bytearray()
+        self.buffer = bytearray()
+
+    def append(self, record: bytes) -> tuple[int, int]:
+        position = (len(self.blocks), len(self.buffer))
+        self.buffer += record
+        while len(self.buffer) >= METADATA_SIZE:
+            self.blocks += _metadata_block(bytes(self.buffer[:METADATA_SIZE]))
+            del self.buffer[:METADATA_SIZE]
+        return position
+
+    def finish(self) -> bytes:
+        if self.buffer:
+            self.blocks += _metadata_block(bytes(self.buffer))
+            self.buffer.clear()
+        return bytes(self.blocks)
+
+
+def build_squashfs(  # noqa: C901, PLR0915
+    entries: dict[str, bytes | Symlink], block_size: int = 4096
+) -> bytes:
+    """Build a gzip compressed squashfs image.
+
+    Args:
+        entries: Files and symlinks by path; directories are implied
+        block_size: Data block size
+
+    Returns:
+        Image bytes, starting with the superblock
+
+    """
+    root = _Node()
+    for path, content in entries.items():
+        node = root
+        *parents, name = path.split("/")
+        for part in parents:
+            node = node.children.setdefault(part, _Node())
+        node.children[name] = _Node(content)
+
+    numbers = 0
+
+    def number(node: _Node) -> None:
+        nonlocal numbers
+        numbers += 1
+        node.number = numbers
+        for child in node.children.values():
+            number(child)
+
+    number(root)
+
+    superblock_size = 96
+    data = bytearray()
+    fragments: list[tuple[int, int]] = []
+    fragment_buffer = bytearray()
+    file_layout: dict[int, tuple[int, list[int], int, int]] = {}
+
+    def flush_fragment() -> None:
+        if not fragment_buffer:
+            return
+        start = superblock_size + len(data)
+        compressed = zlib.compress(bytes(fragment_buffer))
+        if len(compressed) < len(fragment_buffer):
+            data.extend(compressed)
+            fragments.append((start, len(compressed)))
+        else:
+            data.extend(fragment_buffer)
+            fragments.append((start, len(fragment_buffer) | DATA_UNCOMPRESSED))
+        fragment_buffer.clear()
+
+    def layout_files(node: _Node) -> None:
+        for child in node.children.values():
+            if isinstance(child.content, bytes):
+                content = child.content
+                start = superblock_size + len(data)
+                sizes = []
+                full = len(content) - len(content) % block_size
+                for offset in range(0, full, block_size):
+                    block = content[offset : offset + block_size]
+                    if block == bytes(block_size):
+                        sizes.append(0)
+                        continue
+                    compressed = zlib.compress(block)
+                    if len(compressed) < len(block):
+                        data.extend(compressed)
+                        sizes.append(len(compressed))
+                    else:
+                        data.extend(block)
+                        sizes.append(len(block) | DATA_UNCOMPRESSED)
+                tail = content[full:]
+                fragment, fragment_offset = NO_FRAGMENT, 0
+                if tail:
+                    if len(fragment_buffer) + len(tail) > block_size:
+                        flush_fragment()
+                    fragment = len(fragments)
+                    fragment_offset = len(fragment_buffer)
+                    fragment_buffer.extend(tail)
+                file_layout[child.number] = (
+                    start,
+                    sizes,
+                    fragment,
+                    fragment_offset,
+                )
+            elif child.content is None:
+                layout_files(child)
+
+    layout_files(root)
+    flush_fragment()
+
+    inodes = _MetadataWriter()
+    directories = _MetadataWriter()
+
+    def header(inode_type: int, node: _Node) -> bytes:
+        return struct.pack("<HHHHII", inode_type, 0o755, 0, 0, 0, node.number)
+
+    def write_inode(node: _Node, parent: int) -> None:
+        if isinstance(node.content, bytes):
+            start, sizes, fragment, fragment_offset = file_layout[node.number]
+            record = header(2, node) + struct.pack(
+                f"<IIII{len(sizes)}I",
+                start,
+                fragment,
+                fragment_offset,
+                len(node.content),
+                *sizes,
+            )
+        elif isinstance(node.content, Symlink):
+            target = node.content.target.encode()
+            record = (
+                header(3, node) + struct.pack("<II", 1, len(target)) + target
+            )
+        else:
+            for child in node.children.values():
+                write_inode(child, node.number)
+            listing = bytearray()
+            names = sorted(node.children)
+            groups: list[list[str]] = []
+            for name in names:
+                block = node.children[name].ref >> 16
+                if (
+                    groups
+                    and len(groups[-1]) < 256  # noqa: PLR2004
+                    and node.children[groups[-1][0]].ref >> 16 == block
+                ):
+                    groups[-1].append(name)
+                else:
+                    groups.append([name])
+            for group in groups:
+                first = node.children[group[0]]
+                listing += struct.pack(
+                    "<III", len(group) - 1, first.ref >> 16, first.number
+                )
+                for name in group:
+                    child = node.children[name]
+                    if isinstance(child.content, bytes):
+                        entry_type = 2
+                    elif isinstance(child.content, Symlink):
+                        entry_type = 3
+                    else:
+                        entry_type = 1
+                    encoded = name.encode()
+                    listing += struct.pack(
+                        "<HhHH",
+                        child.ref & 0xFFFF,
+                        child.number - first.number,
+                        entry_type,
+                        len(encoded) - 1,
+                    )
+                    listing += encoded
+            block, offset = directories.append(bytes(listing))
+            record = header(1, node) + struct.pack(
+                "<IIHHI", block, 2, len(listing) + 3, offset, parent
+            )
+        block, offset = inodes.append(record)
+        node.ref = (block << 16) | offset
+
+    write_inode(root, numbers + 1)
+
+    tables = bytearray()
+    table_start = superblock_size + len(data)
+    inode_table_start = table_start
+    tables += inodes.finish()
+    directory_table_start = table_start + len(tables)
+    tables += directories.finish()
+
+    fragment_table_start = NO_TABLE
+    if fragments:
+        entries_position = table_start + len(tables)
+        tables += _metadata_block(
+            b"".join(struct.pack("<QII", s, n, 0) for s, n in fragments)
+        )
+        fragment_table_start = table_start + len(tables)
+        tables += struct.pack("<Q", entries_position)
+
+    ids_position = table_start + len(tables)
+    tables += _metadata_block(struct.pack("<I", 0))
+    id_table_start = table_start + len(tables)
+    tables += struct.pack("<Q", ids_position)
+
+    bytes_used = table_start + len(tables)
+    superblock = struct.pack(
+        "<4sIIIIHHHHHHQQQQQQQQ",
+        b"hsqs",
+        numbers,
+        0,
+        block_size,
+        len(fragments),
+        1,
+        block_size.bit_length() - 1,
+        0,
+        1,
+        4,
+        0,
+        root.ref,
+        bytes_used,
+        id_table_start,
+        NO_TABLE,
+        inode_table_start,
+        directory_table_start,
+        fragment_table_start,
+        NO_TABLE,
+    )
+    return superblock + bytes(data) + bytes(tables)
+
+
+def build_appimage(image: bytes, section_count: int = 3) -> bytes:
+    """Prefix a squashfs image with a fake ELF64 AppImage runtime.
+
+    Args:
+        image: Squashfs image bytes
+        section_count: Number of section headers in the fake runtime
+
+    Returns:
+        AppImage bytes with the image after the section header table
+
+    """
+    section_offset = 64
+    section_size = 64
+    elf_header = bytearray(64)
+    elf_header[:7] = b"\x7fELF\x02\x01\x01"
+    struct.pack_into("<Q", elf_header, 0x28, section_offset)
+    struct.pack_into("<HH", elf_header, 0x3A, section_size, section_count)
+    runtime = bytes(elf_header) + bytes(section_size * section_count)
+    return runtime + image
@@ -1,8 +1,11 @@
 """Tests for GitHub API client functionality."""
 
 import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+
 import aiohttp
 import pytest
 import pytest_asyncio
@@ -16,6 +19,7 @@ from my_unicorn.core.api import (
     extract_and_validate_version,
     extract_github_config,
 )
+from my_unicorn.core.cache import ReleaseCacheManager
 from my_unicorn.types import ChecksumFileInfo
 
 
@@ -596,6 +600,109 @@ async def test_fetch_latest_release_malformed_response(
         await fetcher.fetch_latest_release()
 
 
+STABLE_RELEASE_JSON = {
+    "tag_name": "v1.2.3",
+    "prerelease": False,
+    "assets": [
+        {
+            "name": "app.AppImage",
+            "size": 12345,
+            "digest": "",
+            "browser_download_url": "https://github.com/o/r/releases/download/v1.2.3/app.AppImage",
+        }
+    ],
+}
+
+
+def make_api_response(status, headers=None, json_data=None):
+    """Create a mock API response usable as an async context manager."""
+    response = AsyncMock()
+    response.__aenter__.return_value = response
+    response.status = status
+    response.headers = {"X-RateLimit-Remaining": "5000", **(headers or {})}
+    response.raise_for_status = MagicMock()
+    response.json = AsyncMock(return_value=json_data)
+    return response
+
+
+@pytest.fixture
+def release_cache(tmp_path: Path) -> ReleaseCacheManager:
+    """Provide a ReleaseCacheManager writing to a temporary directory."""
+    config_manager = MagicMock()
+    config_manager.load_global_config.return_value = {
+        "directory": {"cache": tmp_path / "cache"}
+    }
+    return ReleaseCacheManager(config_manager)
+
+
+def expire_cache_entry(cache: ReleaseCacheManager) -> None:
+    """Backdate the stable cache entry for o/r past its TTL."""
+    entry = cache._read_cache_entry("o", "r", "stable")
+    assert entry is not None
+    entry["cached_at"] = (datetime.now(UTC) - timedelta(hours=25)).isoformat()
+    cache._write_cache_entry("o", "r", "stable", entry)
+
+
+@pytest.mark.asyncio
+async def test_fetch_latest_release_stores_etag(
+    mock_session, mock_config, release_cache
+):
+    """ETag and Last-Modified of a full response are cached."""
+    mock_session.get.return_value = make_api_response(
+        200,
+        headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Sep 2025"},
+        json_data=STABLE_RELEASE_JSON,
+    )
+    fetcher = ReleaseFetcher("o", "r", mock_session, release_cache)
+
+    await fetcher.fetch_latest_release()
+
+    assert await release_cache.get_cache_validators("o", "r") == (
+        '"v1"',
+        "Mon, 01 Sep 2025",
+    )
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_revalidated_with_if_none_match(
+    mock_session, mock_config, release_cache
+):
+    """A 304 reply reuses the cached release and refreshes its timestamp."""
+    mock_session.get.return_value = make_api_response(
+        200, headers={"ETag": '"v1"'}, json_data=STABLE_RELEASE_JSON
+    )
+    fetcher = ReleaseFetcher("o", "r", mock_session, release_cache)
+    await fetcher.fetch_latest_release()
+    expire_cache_entry(release_cache)
+
+    not_modified = make_api_response(304)
+    mock_session.get.return_value = not_modified
+    release = await fetcher.fetch_latest_release()
+
+    headers = mock_session.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    not_modified.json.assert_not_called()
+    assert release.version == "1.2.3"
+    assert await release_cache.get_cached_release("o", "r") is not None
+
+
+@pytest.mark.asyncio
+async def test_ignore_cache_skips_conditional_request(
+    mock_session, mock_config, release_cache
+):
+    """Refreshing with ignore_cache always requests the full response."""
+    mock_session.get.return_value = make_api_response(
+        200, headers={"ETag": '"v1"'}, json_data=STABLE_RELEASE_JSON
+    )
+    fetcher = ReleaseFetcher("o", "r", mock_session, release_cache)
+    await fetcher.fetch_latest_release()
+
+    await fetcher.fetch_latest_release(ignore_cache=True)
+
+    headers = mock_session.get.call_args.kwargs["headers"]
+    assert "If-None-Match" not in headers
+
+
 @pytest.mark.asyncio
 async def test_github_client_get_latest_release(mock_session):
     """Test GitHubClient.get_latest_release returns release info."""
@@ -1219,3 +1326,48 @@ class TestExtractAndValidateVersion:
         """Test empty string."""
         result = extract_and_validate_version("")
         assert result is None
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_and_refreshed_in_background(
+    mock_session, mock_config, release_cache
+):
+    """An expired entry within the stale window answers immediately."""
+    mock_session.get.return_value = make_api_response(
+        200, headers={"ETag": '"v1"'}, json_data=STABLE_RELEASE_JSON
+    )
+    await ReleaseFetcher("o", "r", mock_session, release_cache).revalidate()
+    expire_cache_entry(release_cache)
+    mock_session.get.reset_mock()
+
+    refresher = MagicMock()
+    fetcher = ReleaseFetcher(
+        "o", "r", mock_session, release_cache, stale_refresher=refresher
+    )
+    release = await fetcher.fetch_latest_release()
+
+    assert release.version == "1.2.3"
+    mock_session.get.assert_not_called()
+    refresher.schedule.assert_called_once_with("o", "r", "stable")
+
+
+@pytest.mark.asyncio
+async def test_entry_beyond_stale_window_is_fetched(
+    mock_session, mock_config, release_cache
+):
+    """Entries older than TTL plus stale window are not served."""
+    mock_session.get.return_value = make_api_response(
+        200, json_data=STABLE_RELEASE_JSON
+    )
+    await ReleaseFetcher("o", "r", mock_session, release_cache).revalidate()
+    release_cache.stale_hours = 0
+    expire_cache_entry(release_cache)
+
+    refresher = MagicMock()
+    fetcher = ReleaseFetcher(
+        "o", "r", mock_session, release_cache, stale_refresher=refresher
+    )
+    await fetcher.fetch_latest_release()
+
+    refresher.schedule.assert_not_called()
+    assert mock_session.get.call_count == 2
@@ -0,0 +1,185 @@
+"""Tests for the content-addressed AppImage store."""
+
+import errno
+import hashlib
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from my_unicorn.core import blob_store
+from my_unicorn.core.blob_store import BlobStore, replace_file, share_file
+
+CONTENT = b"appimage bytes"
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def app_file(tmp_path: Path) -> Path:
+    """Installed AppImage."""
+    path = tmp_path / "storage" / "app.AppImage"
+    path.parent.mkdir()
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BlobStore:
+    """Blob store on the same filesystem as the AppImage."""
+    return BlobStore(tmp_path / "cache" / "blobs")
+
+
+def test_add_links_file_into_store(store: BlobStore, app_file: Path) -> None:
+    """Storing a file adds a hard link named by its digest."""
+    assert store.add(app_file, DIGEST) is True
+
+    assert store.blob_path(DIGEST).samefile(app_file)
+    assert store.find_digest(app_file) == DIGEST
+    assert store.is_blob_of(DIGEST, app_file)
+
+
+def test_find_digest_of_unstored_file(
+    store: BlobStore, app_file: Path, tmp_path: Path
+) -> None:
+    """Files without a link in the store have no known digest."""
+    other = tmp_path / "other.AppImage"
+    other.write_bytes(CONTENT)
+    store.add(app_file, DIGEST)
+
+    assert store.find_digest(other) is None
+    assert not store.is_blob_of(DIGEST, other)
+
+
+def test_add_without_link_support_stores_nothing(
+    store: BlobStore, app_file: Path
+) -> None:
+    """The store never falls back to a reflink or copy of a file."""
+    with (
+        patch.object(
+            blob_store.os, "link", side_effect=OSError(errno.EXDEV, "xdev")
+        ),
+        patch.object(blob_store, "_reflink") as reflink,
+    ):
+        assert store.add(app_file, DIGEST) is False
+
+    reflink.assert_not_called()
+    assert not store.blob_path(DIGEST).exists()
+    assert list(store.root.iterdir()) == []
+
+
+def test_prune_removes_unreferenced_blobs(
+    store: BlobStore, app_file: Path
+) -> None:
+    """Blobs survive while installs or backups still link to them."""
+    store.add(app_file, DIGEST)
+
+    assert store.prune() == 0
+
+    app_file.unlink()
+
+    assert store.prune() == 1
+    assert not store.blob_path(DIGEST).exists()
+
+
+@pytest.fixture
+def detected_methods() -> Iterator[dict[tuple[int, int], str]]:
+    """Isolate the per-device detection results."""
+    with patch.dict(blob_store._detected_methods, clear=True):
+        yield blob_store._detected_methods
+
+
+def test_auto_strategy_is_detected_once_per_device(
+    app_file: Path,
+    tmp_path: Path,
+    detected_methods: dict[tuple[int, int], str],
+) -> None:
+    """Probing happens on the first share between two devices only."""
+    xdev = OSError(errno.EXDEV, "xdev")
+    with (
+        patch.object(blob_store.os, "link", side_effect=xdev) as link,
+        patch.object(blob_store, "_reflink", return_value=False),
+    ):
+        assert share_file(app_file, tmp_path / "one") == "copy"
+        assert share_file(app_file, tmp_path / "two") == "copy"
+
+    link.assert_called_once()
+    assert list(detected_methods.values()) == ["copy"]
+    assert (tmp_path / "two").read_bytes() == CONTENT
+
+
+def test_auto_strategy_prefers_hardlink(
+    app_file: Path,
+    tmp_path: Path,
+    detected_methods: dict[tuple[int, int], str],
+) -> None:
+    """Hard links are used where the filesystem supports them."""
+    destination = tmp_path / "link"
+
+    assert share_file(app_file, destination) == "hardlink"
+    assert destination.samefile(app_file)
+
+
+@pytest.mark.parametrize("strategy", ["hardlink", "reflink"])
+def test_explicit_strategy_falls_back_to_copy(
+    app_file: Path, tmp_path: Path, strategy: str
+) -> None:
+    """Unsupported explicit strategies still produce a backup."""
+    destination = tmp_path / "copy"
+    with (
+        patch.object(
+            blob_store.os, "link", side_effect=OSError(errno.EPERM, "perm")
+        ),
+        patch.object(blob_store, "_reflink", return_value=False),
+    ):
+        assert share_file(app_file, destination, strategy) == "copy"
+
+    assert destination.read_bytes() == CONTENT
+    assert not destination.samefile(app_file)
+
+
+def test_copy_strategy_writes_independent_file(
+    app_file: Path, tmp_path: Path
+) -> None:
+    """The copy strategy never shares bytes."""
+    destination = tmp_path / "copy"
+
+    assert share_file(app_file, destination, "copy") == "copy"
+    assert not destination.samefile(app_file)
+
+
+def test_move_strategy_renames_source(app_file: Path, tmp_path: Path) -> None:
+    """The move strategy takes over the source's directory entry."""
+    inode = app_file.stat().st_ino
+    destination = tmp_path / "moved"
+
+    assert share_file(app_file, destination, "move") == "move"
+    assert not app_file.exists()
+    assert destination.stat().st_ino == inode
+
+
+def test_replace_file_swaps_destination(
+    app_file: Path, tmp_path: Path
+) -> None:
+    """An existing destination is atomically replaced by a link."""
+    destination = tmp_path / "storage" / "restored.AppImage"
+    destination.write_bytes(b"old")
+
+    replace_file(app_file, destination)
+
+    assert destination.samefile(app_file)
+    assert sorted(p.name for p in destination.parent.iterdir()) == [
+        "app.AppImage",
+        "restored.AppImage",
+    ]
+
+
+def test_from_global_config_requires_cache_dir(tmp_path: Path) -> None:
+    """The store lives in the cache directory when one is configured."""
+    store = BlobStore.from_global_config(
+        {"directory": {"cache": tmp_path}}  # type: ignore[typeddict-item]
+    )
+
+    assert store is not None
+    assert store.root == tmp_path / "blobs"
+    assert BlobStore.from_global_config({"directory": {}}) is None  # type: ignore[typeddict-item]
@@ -0,0 +1,155 @@
+"""Tests for batched GitHub release lookups through the GraphQL API."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from my_unicorn.core.graphql import (
+    GraphQLReleaseClient,
+    build_releases_query,
+    parse_repository_node,
+)
+
+APPIMAGE_URL = (
+    "https://github.com/o/r/releases/download/v2/App-x86_64.AppImage"
+)
+
+
+def release_node(
+    tag: str, prerelease: bool = False, draft: bool = False
+) -> dict:
+    """Create a GraphQL release node with one AppImage and one exe."""
+    return {
+        "tagName": tag,
+        "isPrerelease": prerelease,
+        "isDraft": draft,
+        "releaseAssets": {
+            "nodes": [
+                {
+                    "name": "App-x86_64.AppImage",
+                    "size": 42,
+                    "digest": "sha256:abc",
+                    "downloadUrl": APPIMAGE_URL,
+                },
+                {
+                    "name": "App-setup.exe",
+                    "size": 10,
+                    "digest": None,
+                    "downloadUrl": "https://example.com/App-setup.exe",
+                },
+            ]
+        },
+    }
+
+
+def make_client(json_data: dict | Exception) -> GraphQLReleaseClient:
+    """Create a client whose session answers every query with json_data."""
+    session = MagicMock(spec=aiohttp.ClientSession)
+    response = AsyncMock()
+    response.raise_for_status = MagicMock()
+    if isinstance(json_data, Exception):
+        response.raise_for_status.side_effect = json_data
+    else:
+        response.json = AsyncMock(return_value=json_data)
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=None)
+    session.post.return_value = context
+
+    auth_manager = MagicMock()
+    auth_manager.get_token.return_value = "ghp_token"
+    auth_manager.apply_auth.side_effect = lambda headers: {
+        **headers,
+        "Authorization": "Bearer ghp_token",
+    }
+    return GraphQLReleaseClient(session, auth_manager)
+
+
+def test_build_releases_query_uses_aliases_and_variables() -> None:
+    """Each repository gets an alias and its own variables."""
+    query = build_releases_query([("a", "b"), ("c", "d")])
+
+    assert "query($o0: String!, $n0: String!, $o1: String!" in query
+    assert "r0: repository(owner: $o0, name: $n0)" in query
+    assert "r1: repository(owner: $o1, name: $n1)" in query
+    assert "fragment ReleaseFields on Release" in query
+    assert '"a"' not in query
+
+
+def test_parse_repository_node_selects_releases() -> None:
+    """Stable comes from latestRelease, prerelease skips drafts."""
+    node = {
+        "latestRelease": release_node("v1.0.0"),
+        "releases": {
+            "nodes": [
+                release_node("v3.0.0-rc1", prerelease=True, draft=True),
+                release_node("v2.0.0-beta", prerelease=True),
+                release_node("v1.0.0"),
+            ]
+        },
+    }
+
+    result = parse_repository_node("o", "r", node)
+
+    assert result.stable is not None
+    assert result.stable.version == "1.0.0"
+    assert result.prerelease is not None
+    assert result.prerelease.original_tag_name == "v2.0.0-beta"
+    assert [a.name for a in result.stable.assets] == ["App-x86_64.AppImage"]
+    assert result.stable.assets[0].digest == "sha256:abc"
+    assert result.stable.assets[0].browser_download_url == APPIMAGE_URL
+
+
+def test_parse_repository_node_without_releases() -> None:
+    """A repository without releases yields empty results."""
+    result = parse_repository_node(
+        "o", "r", {"latestRelease": None, "releases": {"nodes": []}}
+    )
+
+    assert result.stable is None
+    assert result.prerelease is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_latest_releases_batches_repositories(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repositories are sent in chunks; missing ones are omitted."""
+    monkeypatch.setattr("my_unicorn.core.graphql.GRAPHQL_REPOS_PER_QUERY", 2)
+    node = {"latestRelease": release_node("v1.0.0"), "releases": None}
+    client = make_client({"data": {"r0": node, "r1": None}})
+
+    result = await client.fetch_latest_releases(
+        [("o", "a"), ("o", "b"), ("o", "c"), ("o", "a")]
+    )
+
+    assert client.session.post.call_count == 2
+    first = client.session.post.call_args_list[0].kwargs
+    assert first["json"]["variables"] == {
+        "o0": "o",
+        "n0": "a",
+        "o1": "o",
+        "n1": "b",
+    }
+    assert first["headers"]["Authorization"] == "Bearer ghp_token"
+    assert set(result) == {("o", "a"), ("o", "c")}
+
+
+@pytest.mark.asyncio
+async def test_fetch_latest_releases_failure_returns_empty() -> None:
+    """HTTP errors and error-only responses fall back to REST."""
+    failing = make_client(aiohttp.ClientError("boom"))
+    errors_only = make_client({"errors": [{"message": "bad"}]})
+
+    assert await failing.fetch_latest_releases([("o", "r")]) == {}
+    assert await errors_only.fetch_latest_releases([("o", "r")]) == {}
+
+
+def test_is_available_requires_token() -> None:
+    """The client is only usable with a non-empty token."""
+    client = make_client({})
+    assert client.is_available()
+
+    client.auth_manager.get_token.return_value = None
+    assert not client.is_available()
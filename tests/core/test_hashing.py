@@ -0,0 +1,89 @@
+"""Tests for the file hashing engine."""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from my_unicorn.core import hashing
+from my_unicorn.core.hashing import (
+    get_hash_executor,
+    hash_file,
+    hash_file_async,
+    run_in_hash_executor,
+)
+
+
+@pytest.fixture
+def data_file(tmp_path: Path) -> tuple[Path, bytes]:
+    """File spanning several read buffers."""
+    data = os.urandom(hashing.HASH_BUFFER_SIZE * 2 + 123)
+    path = tmp_path / "app.AppImage"
+    path.write_bytes(data)
+    return path, data
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha512"])
+def test_hash_file_buffered(
+    data_file: tuple[Path, bytes], algorithm: str
+) -> None:
+    """Chunked readinto hashing matches hashlib."""
+    path, data = data_file
+
+    assert (
+        hash_file(path, algorithm) == hashlib.new(algorithm, data).hexdigest()
+    )
+
+
+def test_hash_file_mmap(
+    data_file: tuple[Path, bytes], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files above the mmap threshold are hashed from a memory map."""
+    path, data = data_file
+    monkeypatch.setattr(hashing, "MMAP_THRESHOLD", 1)
+
+    assert hash_file(path, "sha256") == hashlib.sha256(data).hexdigest()
+
+
+def test_hash_empty_file(tmp_path: Path) -> None:
+    """Empty files never reach the mmap path, which rejects them."""
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+
+    assert hash_file(path, "sha512") == hashlib.sha512().hexdigest()
+
+
+def test_hash_file_rejects_unsupported_algorithm(tmp_path: Path) -> None:
+    """Only sha256 and sha512 are accepted."""
+    path = tmp_path / "file"
+    path.write_bytes(b"x")
+
+    with pytest.raises(ValueError, match="Unsupported hash type"):
+        hash_file(path, "md5")
+
+
+def test_executor_is_shared_and_sized_to_cores() -> None:
+    """One pool with a worker per core serves all hashing."""
+    executor = get_hash_executor()
+
+    assert executor is get_hash_executor()
+    assert executor._max_workers == (os.cpu_count() or 1)
+
+
+@pytest.mark.asyncio
+async def test_async_hashing_runs_off_loop(
+    data_file: tuple[Path, bytes],
+) -> None:
+    """Async hashing runs on the dedicated hashing threads."""
+    path, data = data_file
+
+    thread_name = await run_in_hash_executor(
+        lambda: threading.current_thread().name
+    )
+
+    assert thread_name.startswith("my-unicorn-hash")
+    assert await hash_file_async(path, "sha256") == (
+        hashlib.sha256(data).hexdigest()
+    )
@@ -1,10 +1,23 @@
 """Tests for AppImage icon extraction functionality."""
 
+import os
+import shutil
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from my_unicorn.core.icon import AppImageIconExtractor, IconExtractionError
+from my_unicorn.core.icon_cache import IconCache
+from tests.core.squashfs_builder import Symlink, build_appimage, build_squashfs
+
+
+def _score(extractor: AppImageIconExtractor, icon_path: Path) -> int:
+    """Return the scanner's score of an icon, 0 if it is rejected."""
+    candidate = extractor._classify_icon(
+        icon_path, "testapp", is_symlink=False
+    )
+    return candidate.score if candidate is not None else 0
 
 
 class TestAppImageIconExtractor:
@@ -65,7 +78,7 @@ class TestAppImageIconExtractor:
             extractor.FORMAT_SCORES[".ico"] > extractor.FORMAT_SCORES[".bmp"]
         )
 
-    def test_score_icon_png_best(self, extractor, tmp_path):
+    def test_classify_icon_png_best(self, extractor, tmp_path):
         """Test that PNG icons get higher format scores than SVG due to desktop compatibility."""
         # Create properly sized icons
         svg_icon = tmp_path / "icon.svg"
@@ -76,13 +89,13 @@ class TestAppImageIconExtractor:
         png_icon = tmp_path / "icon.png"
         png_icon.write_bytes(b"mock png data" * 20)  # Large enough
 
-        svg_score = extractor._score_icon(svg_icon, "testapp")
-        png_score = extractor._score_icon(png_icon, "testapp")
+        svg_score = _score(extractor, svg_icon)
+        png_score = _score(extractor, png_icon)
 
         # PNG should get higher format score (100 vs 50) plus same generic name bonus
         assert png_score > svg_score
 
-    def test_score_icon_name_relevance(self, extractor, tmp_path):
+    def test_classify_icon_name_relevance(self, extractor, tmp_path):
         """Test that name matching affects icon scoring."""
         exact_match = tmp_path / "testapp.png"
         exact_match.write_bytes(b"mock png data" * 20)
@@ -93,13 +106,13 @@ class TestAppImageIconExtractor:
         generic_name = tmp_path / "icon.png"
         generic_name.write_bytes(b"mock png data" * 20)
 
-        exact_score = extractor._score_icon(exact_match, "testapp")
-        partial_score = extractor._score_icon(partial_match, "testapp")
-        generic_score = extractor._score_icon(generic_name, "testapp")
+        exact_score = _score(extractor, exact_match)
+        partial_score = _score(extractor, partial_match)
+        generic_score = _score(extractor, generic_name)
 
         assert exact_score > partial_score > generic_score
 
-    def test_score_icon_format_preference(self, extractor, tmp_path):
+    def test_classify_icon_format_preference(self, extractor, tmp_path):
         """Test that different formats get different scores."""
         svg_icon = tmp_path / "testapp.svg"
         svg_icon.write_text(
@@ -112,14 +125,14 @@ class TestAppImageIconExtractor:
         ico_icon = tmp_path / "testapp.ico"
         ico_icon.write_bytes(b"mock ico data" * 20)
 
-        svg_score = extractor._score_icon(svg_icon, "testapp")
-        png_score = extractor._score_icon(png_icon, "testapp")
-        ico_score = extractor._score_icon(ico_icon, "testapp")
+        svg_score = _score(extractor, svg_icon)
+        png_score = _score(extractor, png_icon)
+        ico_score = _score(extractor, ico_icon)
 
         # PNG > SVG > ICO (PNG preferred due to desktop compatibility)
         assert png_score > svg_score > ico_score
 
-    def test_score_icon_skip_small_files(self, extractor, tmp_path):
+    def test_classify_icon_skip_small_files(self, extractor, tmp_path):
         """Test that very small files are skipped."""
         tiny_icon = tmp_path / "tiny.png"
         tiny_icon.write_bytes(b"x")  # Less than MIN_ICON_SIZE_BYTES
@@ -127,8 +140,8 @@ class TestAppImageIconExtractor:
         normal_icon = tmp_path / "normal.png"
         normal_icon.write_bytes(b"mock png data" * 20)
 
-        tiny_score = extractor._score_icon(tiny_icon, "testapp")
-        normal_score = extractor._score_icon(normal_icon, "testapp")
+        tiny_score = _score(extractor, tiny_icon)
+        normal_score = _score(extractor, normal_icon)
 
         # Tiny files should get score of 0 (skipped)
         assert tiny_score == 0
@@ -154,29 +167,52 @@ class TestAppImageIconExtractor:
         assert resolved == target
         assert resolved.exists()
 
-    def test_select_best_icon_empty_candidates(self, extractor):
-        """Test that selecting from empty candidates raises error."""
-        with pytest.raises(
-            IconExtractionError, match="No icon candidates available"
-        ):
-            extractor._select_best_icon([])
+    def test_find_best_icon_prefers_larger_size_directory(
+        self, extractor, tmp_path
+    ):
+        """Equal scores are broken by the theme size directory."""
+        root = tmp_path / "squashfs-root"
+        for size in ("48x48", "512x512", "256x256"):
+            icon_dir = root / "usr/share/icons/hicolor" / size / "apps"
+            icon_dir.mkdir(parents=True)
+            (icon_dir / "testapp.png").write_bytes(b"png" * 20)
 
-    def test_select_best_icon_chooses_highest_score(self, extractor, tmp_path):
-        """Test that the icon with highest score is selected."""
-        icon1 = tmp_path / "icon1.png"
-        icon1.write_bytes(b"test1" * 20)
+        best_icon = extractor._find_best_icon(root, "testapp")
 
-        icon2 = tmp_path / "icon2.svg"
-        icon2.write_text("<svg>test2</svg>")
+        assert best_icon is not None
+        assert best_icon.parent.parent.name == "512x512"
 
-        candidates = [
-            {"path": icon1, "score": 50, "original_path": icon1},
-            {"path": icon2, "score": 150, "original_path": icon2},
-        ]
+    def test_find_best_icon_scans_opt_icons(self, extractor, tmp_path):
+        """Icons nested below opt are found."""
+        root = tmp_path / "squashfs-root"
+        icon_dir = root / "opt" / "TestApp" / "resources" / "icons"
+        icon_dir.mkdir(parents=True)
+        (icon_dir / "testapp.png").write_bytes(b"png" * 20)
+        (icon_dir / "notes.txt").write_bytes(b"text" * 20)
+
+        best_icon = extractor._find_best_icon(root, "testapp")
 
-        best = extractor._select_best_icon(candidates)
-        assert best["path"] == icon2
-        assert best["score"] == 150
+        assert best_icon == icon_dir / "testapp.png"
+
+    def test_find_best_icon_walks_each_directory_once(
+        self, extractor, mock_squashfs_root
+    ):
+        """The tree is scanned in a single pass."""
+        scanned = []
+        real_scandir = os.scandir
+
+        def scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+
+        with patch("my_unicorn.core.icon.os.scandir", side_effect=scandir):
+            extractor._find_best_icon(mock_squashfs_root, "testapp")
+
+        assert len(scanned) == len(set(scanned))
+        directories = [mock_squashfs_root] + [
+            p for p in mock_squashfs_root.rglob("*") if p.is_dir()
+        ]
+        assert len(scanned) == len(directories)
 
     def test_find_best_icon_returns_highest_scored(
         self, extractor, mock_squashfs_root
@@ -278,6 +314,147 @@ class TestAppImageIconExtractor:
         result = await extractor.extract_icon(directory, dest, "testapp")
         assert result is None
 
+    @pytest.fixture
+    def squashfs_appimage(self, tmp_path):
+        """Create an AppImage with a readable squashfs image."""
+        image = build_squashfs(
+            {
+                "testapp.desktop": b"[Desktop Entry]\nIcon=org.test.App\n",
+                ".DirIcon": Symlink("org.test.App.png"),
+                "org.test.App.png": Symlink(
+                    "usr/share/icons/hicolor/256x256/apps/org.test.App.png"
+                ),
+                "usr/share/icons/hicolor/256x256/apps/org.test.App.png": (
+                    b"png icon data" * 10
+                ),
+                "usr/share/icons/hicolor/scalable/apps/org.test.App.svg": (
+                    b"<svg>icon</svg>" * 10
+                ),
+                "usr/share/icons/hicolor/48x48/apps/other.png": b"x" * 100,
+                "usr/lib/huge.so": bytes(50000),
+            }
+        )
+        appimage_path = tmp_path / "test.AppImage"
+        appimage_path.write_bytes(build_appimage(image))
+        return appimage_path
+
+    async def test_extract_icon_reads_image_in_process(
+        self, extractor, squashfs_appimage, tmp_path
+    ):
+        """Icons are read from the image without running the AppImage."""
+        dest = tmp_path / "icons" / "testapp.png"
+
+        with patch.object(extractor, "_extract_appimage") as extract:
+            result = await extractor.extract_icon(
+                squashfs_appimage, dest, "testapp"
+            )
+
+        extract.assert_not_called()
+        assert result == dest
+        assert dest.read_bytes() == b"png icon data" * 10
+
+    def test_copy_icon_files_writes_only_candidates(
+        self, extractor, squashfs_appimage, tmp_path
+    ):
+        """Only icon candidates and their symlink targets are written."""
+        root = tmp_path / "squashfs-root"
+
+        count = extractor._copy_icon_files(squashfs_appimage, root, "testapp")
+
+        files = sorted(
+            str(path.relative_to(root))
+            for path in root.rglob("*")
+            if not path.is_dir()
+        )
+        assert files == [
+            ".DirIcon",
+            "org.test.App.png",
+            "usr/share/icons/hicolor/256x256/apps/org.test.App.png",
+            "usr/share/icons/hicolor/scalable/apps/org.test.App.svg",
+        ]
+        assert count == len(files)
+        assert (root / ".DirIcon").readlink() == Path(
+            "usr/share/icons/hicolor/256x256/apps/org.test.App.png"
+        )
+
+    async def test_extract_icon_falls_back_to_full_extraction(
+        self, extractor, mock_appimage, mock_squashfs_root, tmp_path
+    ):
+        """AppImages the reader cannot open are extracted in full."""
+        dest = tmp_path / "icon.png"
+
+        async def extract(_appimage_path, temp_dir):
+            shutil.copytree(
+                mock_squashfs_root, temp_dir / "squashfs-root", symlinks=True
+            )
+
+        with patch.object(
+            extractor, "_extract_appimage", side_effect=extract
+        ) as mock_extract:
+            result = await extractor.extract_icon(
+                mock_appimage, dest, "testapp"
+            )
+
+        mock_extract.assert_awaited_once()
+        assert result == dest
+        assert dest.exists()
+
+    async def test_unchanged_icon_is_reused(self, squashfs_appimage, tmp_path):
+        """A new AppImage with the same icon keeps the installed icon."""
+        extractor = AppImageIconExtractor(IconCache(tmp_path / "cache"))
+        dest = tmp_path / "icons" / "testapp.png"
+        await extractor.extract_icon(
+            squashfs_appimage, dest, "testapp", appimage_digest="v1"
+        )
+        updated = tmp_path / "updated.AppImage"
+        updated.write_bytes(squashfs_appimage.read_bytes() + b"\0" * 16)
+
+        with patch.object(extractor, "_copy_icon_files") as copy_files:
+            result = await extractor.extract_icon(
+                updated, dest, "testapp", appimage_digest="v2"
+            )
+
+        copy_files.assert_not_called()
+        assert result == dest
+        assert extractor.icon_cache.has_appimage("v2", dest)
+
+        # Known AppImages are matched by digest without opening the image
+        with patch.object(extractor, "_read_cached_icon_digest") as read:
+            assert (
+                await extractor.extract_icon(
+                    updated, dest, "testapp", appimage_digest="v2"
+                )
+                == dest
+            )
+        read.assert_not_called()
+
+    async def test_changed_icon_is_extracted_again(
+        self, squashfs_appimage, tmp_path
+    ):
+        """Icons whose bytes changed in the new AppImage are re-extracted."""
+        extractor = AppImageIconExtractor(IconCache(tmp_path / "cache"))
+        dest = tmp_path / "icons" / "testapp.png"
+        await extractor.extract_icon(squashfs_appimage, dest, "testapp")
+        updated = tmp_path / "updated.AppImage"
+        updated.write_bytes(
+            build_appimage(
+                build_squashfs(
+                    {
+                        ".DirIcon": Symlink("testapp.png"),
+                        "testapp.png": b"new png icon" * 10,
+                    }
+                )
+            )
+        )
+
+        result = await extractor.extract_icon(updated, dest, "testapp")
+
+        assert result == dest
+        assert dest.read_bytes() == b"new png icon" * 10
+        cached = extractor.icon_cache.get(dest)
+        assert cached is not None
+        assert cached.image_path == "testapp.png"
+
 
 class TestIconExtractionError:
     """Test cases for IconExtractionError."""
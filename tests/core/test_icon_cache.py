@@ -0,0 +1,126 @@
+"""Tests for the persistent icon cache."""
+
+from pathlib import Path
+
+import pytest
+
+from my_unicorn.core import icon_cache as icon_cache_module
+from my_unicorn.core.icon_cache import IconCache, icon_digest
+
+ICON = b"png icon data" * 10
+ICON_DIGEST = icon_digest(ICON)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> IconCache:
+    """Icon cache in a temporary cache directory."""
+    return IconCache(tmp_path / "cache" / "icons")
+
+
+@pytest.fixture
+def icon_file(tmp_path: Path) -> Path:
+    """Installed icon."""
+    path = tmp_path / "icons" / "app.png"
+    path.parent.mkdir()
+    path.write_bytes(ICON)
+    return path
+
+
+def test_record_and_get(cache: IconCache, icon_file: Path) -> None:
+    """Recorded icons are found by their installed path."""
+    cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON), "AB12")
+
+    entry = cache.get(icon_file)
+
+    assert entry is not None
+    assert entry.image_path == "app.png"
+    assert entry.icon_sha256 == ICON_DIGEST
+    assert cache.is_installed(entry)
+    assert cache.has_appimage("ab12", icon_file)
+    assert not cache.has_appimage("cd34", icon_file)
+
+
+def test_modified_icon_is_not_installed(
+    cache: IconCache, icon_file: Path
+) -> None:
+    """Icons changed in the icon directory are not reused."""
+    cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON))
+    icon_file.write_bytes(ICON[::-1])
+
+    entry = cache.get(icon_file)
+
+    assert entry is not None
+    assert not cache.is_installed(entry)
+
+
+def test_new_icon_forgets_old_appimages(
+    cache: IconCache, icon_file: Path
+) -> None:
+    """AppImages of a replaced icon no longer map to the icon file."""
+    cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON), "old")
+    cache.record(icon_file, "app.svg", icon_digest(b"svg"), 3, "new")
+
+    assert not cache.has_appimage("old", icon_file)
+    assert cache.has_appimage("new", icon_file)
+
+
+def test_old_appimages_are_evicted(
+    cache: IconCache, icon_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only the most recent AppImage digests are kept per icon."""
+    monkeypatch.setattr(icon_cache_module, "ICON_CACHE_MAX_APPIMAGES", 2)
+    for digest in ("a", "b", "c"):
+        cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON), digest)
+
+    assert not cache.has_appimage("a", icon_file)
+    assert cache.get_stats()["appimages"] == 2
+
+
+def test_missing_icons_are_evicted(
+    cache: IconCache, icon_file: Path, tmp_path: Path
+) -> None:
+    """Entries of deleted icons are dropped with their AppImages."""
+    cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON), "a")
+    icon_file.unlink()
+
+    assert cache.get_stats()["missing_icons"] == 1
+    assert cache.evict_missing() == 1
+    assert cache.get(icon_file) is None
+    assert cache.get_stats()["appimages"] == 0
+
+
+def test_stats_and_clear(cache: IconCache, icon_file: Path) -> None:
+    """Statistics count icons, AppImages and icon bytes."""
+    cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON), "a")
+    cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON), "b")
+
+    stats = cache.get_stats()
+
+    assert stats["icons"] == 1
+    assert stats["appimages"] == 2
+    assert stats["icon_bytes"] == len(ICON)
+    assert cache.clear() == 1
+    assert cache.get_stats()["appimages"] == 0
+
+
+def test_corrupted_database_is_reset(
+    cache: IconCache, icon_file: Path
+) -> None:
+    """An unreadable database is replaced by an empty cache."""
+    cache.cache_dir.mkdir(parents=True)
+    cache.db_path.write_bytes(b"not a database" * 100)
+
+    assert cache.get(icon_file) is None
+    cache.record(icon_file, "app.png", ICON_DIGEST, len(ICON))
+    assert cache.get(icon_file) is not None
+
+
+def test_from_global_config_requires_cache_dir(tmp_path: Path) -> None:
+    """The cache lives in the cache directory when one is configured."""
+    cache = IconCache.from_global_config(
+        {"directory": {"cache": tmp_path}}  # type: ignore[typeddict-item]
+    )
+
+    assert cache is not None
+    assert cache.db_path == tmp_path / "icons" / "icons.db"
+    assert IconCache.from_global_config({"directory": {}}) is None  # type: ignore[typeddict-item]
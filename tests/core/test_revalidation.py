@@ -0,0 +1,91 @@
+"""Tests for background refresh of stale release cache entries."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from my_unicorn.core.revalidation import StaleReleaseRefresher
+
+
+@pytest.fixture
+def mock_client_session() -> Any:
+    """Patch the refresher's aiohttp session."""
+    session = MagicMock()
+    session.close = AsyncMock()
+    with patch(
+        "my_unicorn.core.revalidation.aiohttp.ClientSession",
+        return_value=session,
+    ):
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_refreshes_are_bounded_and_deduplicated(
+    mock_client_session: Any,
+) -> None:
+    """At most max_concurrent refreshes run, each key only once."""
+    running = 0
+    peak = 0
+    refreshed: list[tuple[str, str]] = []
+
+    class FakeFetcher:
+        def __init__(self, owner: str, repo: str, *args: Any, **kwargs: Any):
+            self.key = (owner, repo)
+
+        async def revalidate(self, cache_type: str) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            refreshed.append(self.key)
+
+    refresher = StaleReleaseRefresher(
+        MagicMock(), MagicMock(), max_concurrent=2
+    )
+    with patch("my_unicorn.core.revalidation.ReleaseFetcher", FakeFetcher):
+        for i in range(5):
+            refresher.schedule("owner", f"repo{i}", "stable")
+        refresher.schedule("owner", "repo0", "stable")
+
+        assert refresher.scheduled_count == 5
+        assert refresher.is_scheduled("owner", "repo3")
+        assert not refresher.is_scheduled("owner", "other")
+
+        await refresher.drain()
+
+    assert peak == 2
+    assert sorted(refreshed) == [("owner", f"repo{i}") for i in range(5)]
+    mock_client_session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_does_not_raise(
+    mock_client_session: Any,
+) -> None:
+    """A failing refresh keeps the stale entry and is only logged."""
+    fetcher = MagicMock()
+    fetcher.revalidate = AsyncMock(side_effect=RuntimeError("rate limited"))
+
+    refresher = StaleReleaseRefresher(MagicMock(), MagicMock())
+    with patch(
+        "my_unicorn.core.revalidation.ReleaseFetcher", return_value=fetcher
+    ):
+        refresher.schedule("owner", "repo", "prerelease")
+        await refresher.drain()
+
+    fetcher.revalidate.assert_awaited_once_with("prerelease")
+
+
+@pytest.mark.asyncio
+async def test_drain_without_refreshes_opens_no_session(
+    mock_client_session: Any,
+) -> None:
+    """No session is created when nothing was served stale."""
+    refresher = StaleReleaseRefresher(MagicMock(), MagicMock())
+
+    await refresher.drain()
+
+    mock_client_session.close.assert_not_awaited()
@@ -0,0 +1,142 @@
+"""Tests for the in-process squashfs reader."""
+
+import io
+import os
+import struct
+from pathlib import Path
+
+import pytest
+
+from my_unicorn.core.squashfs import (
+    SquashfsError,
+    SquashfsImage,
+    find_squashfs_offset,
+)
+from tests.core.squashfs_builder import Symlink, build_appimage, build_squashfs
+
+BLOCK_SIZE = 4096
+BIG_FILE = (
+    os.urandom(BLOCK_SIZE + 100)  # stored uncompressed
+    + b"a" * BLOCK_SIZE  # compressed
+    + bytes(BLOCK_SIZE)  # sparse
+    + b"tail"  # fragment
+)
+
+
+@pytest.fixture
+def appimage(tmp_path: Path) -> Path:
+    """AppImage with files, directories, symlinks and many entries."""
+    entries: dict[str, bytes | Symlink] = {
+        "AppRun": b"#!/bin/sh\n",
+        "app.desktop": b"[Desktop Entry]\nIcon=app\n",
+        ".DirIcon": Symlink("usr/share/icons/app.png"),
+        "usr/share/icons/app.png": b"png" * 10,
+        "usr/bin/big": BIG_FILE,
+        "usr/lib/absolute": Symlink("/usr/share/icons/app.png"),
+        "usr/lib/up": Symlink("../share/icons"),
+        "loop": Symlink("loop"),
+    }
+    for i in range(600):
+        entries[f"many/file{i:03d}"] = str(i).encode()
+    path = tmp_path / "app.AppImage"
+    path.write_bytes(build_appimage(build_squashfs(entries, BLOCK_SIZE)))
+    return path
+
+
+@pytest.fixture
+def image(appimage: Path):
+    """Opened image of the test AppImage."""
+    with SquashfsImage.open(appimage) as opened:
+        yield opened
+
+
+def test_offset_follows_elf_section_headers() -> None:
+    """The image starts after the runtime's section header table."""
+    data = build_appimage(build_squashfs({"a": b"a"}), section_count=5)
+
+    assert find_squashfs_offset(io.BytesIO(data)) == 64 + 64 * 5
+
+
+def test_offset_rejects_non_appimage() -> None:
+    """Files that are neither ELF nor squashfs are rejected."""
+    with pytest.raises(SquashfsError, match="Not an ELF file"):
+        find_squashfs_offset(io.BytesIO(b"mock appimage content"))
+
+
+def test_listdir_root(image: SquashfsImage) -> None:
+    """Root entries are listed in sorted order."""
+    names = [entry.name for entry in image.listdir(image.root)]
+
+    assert names == [
+        ".DirIcon",
+        "AppRun",
+        "app.desktop",
+        "loop",
+        "many",
+        "usr",
+    ]
+
+
+def test_read_file_blocks_and_fragment(image: SquashfsImage) -> None:
+    """Compressed, stored and sparse blocks and fragment tails are read."""
+    found = image.lookup("usr/bin/big")
+
+    assert found is not None
+    assert image.read_file(found[1]) == BIG_FILE
+
+
+def test_large_directory_spans_metadata_blocks(image: SquashfsImage) -> None:
+    """Directories and inodes crossing metadata blocks are read."""
+    entries = list(image.walk("many"))
+
+    assert len(entries) == 600
+    found = image.lookup("many/file599")
+    assert found is not None
+    assert image.read_file(found[1]) == b"599"
+
+
+@pytest.mark.parametrize(
+    ("path", "canonical"),
+    [
+        (".DirIcon", "usr/share/icons/app.png"),
+        ("usr/lib/absolute", "usr/share/icons/app.png"),
+        ("usr/lib/up/app.png", "usr/share/icons/app.png"),
+        ("usr/bin/../share/icons/app.png", "usr/share/icons/app.png"),
+    ],
+)
+def test_lookup_resolves_symlinks(
+    image: SquashfsImage, path: str, canonical: str
+) -> None:
+    """Relative, absolute and directory symlinks are resolved."""
+    found = image.lookup(path)
+
+    assert found is not None
+    assert found[0] == canonical
+    assert image.read_file(found[1]) == b"png" * 10
+
+
+def test_lookup_without_following_symlink(image: SquashfsImage) -> None:
+    """The last component can be returned as the symlink itself."""
+    found = image.lookup(".DirIcon", follow_symlinks=False)
+
+    assert found is not None
+    assert found[1].kind == "symlink"
+    assert found[1].target == "usr/share/icons/app.png"
+
+
+def test_lookup_missing_and_looping_paths(image: SquashfsImage) -> None:
+    """Missing paths and symlink loops are not found."""
+    assert image.lookup("usr/missing") is None
+    assert image.lookup("AppRun/child") is None
+    assert image.lookup("loop") is None
+
+
+def test_unsupported_compression(tmp_path: Path) -> None:
+    """Images using compressors without a decoder are rejected."""
+    data = bytearray(build_squashfs({"a": b"a"}))
+    struct.pack_into("<H", data, 20, 3)  # lzo
+    path = tmp_path / "lzo.squashfs"
+    path.write_bytes(data)
+
+    with pytest.raises(SquashfsError, match="lzo"):
+        SquashfsImage.open(path)
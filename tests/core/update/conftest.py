@@ -146,11 +146,13 @@ def mock_backup_service() -> MagicMock:
 
     Returns:
         MagicMock configured for BackupService operations with
-        create_backup returning a Path object.
+        create_backup_async returning a Path object.
 
     """
     mock = MagicMock()
-    mock.create_backup.return_value = Path("/test/backup/app.backup")
+    mock.create_backup_async = AsyncMock(
+        return_value=Path("/test/backup/app.backup")
+    )
     return mock
 
 
@@ -166,6 +168,7 @@ def mock_download_service() -> AsyncMock:
     mock = AsyncMock()
     mock.download_appimage.return_value = Path("/test/download/app.AppImage")
     mock.download_file.return_value = Path("/test/download/checksum.sha256")
+    mock.pop_computed_digests = MagicMock(return_value=None)
     return mock
 
 
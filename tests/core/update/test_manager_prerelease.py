@@ -11,6 +11,7 @@ import aiohttp
 import pytest
 
 from my_unicorn.core.api import Release
+from my_unicorn.core.graphql import BatchedReleases
 from my_unicorn.core.update import UpdateManager
 
 
@@ -249,3 +250,173 @@ class TestFetchReleaseDataPrereleaseLogic:
             # Verify stable release returned
             assert result == stable_release
             assert result.version == "1.5.0"
+
+    @pytest.mark.asyncio
+    async def test_fetch_release_data_uses_batched_releases(
+        self, update_manager: UpdateManager
+    ) -> None:
+        """Releases from a batched lookup skip the REST fetcher."""
+        stable = self._create_mock_release("1.0.0", prerelease=False)
+        prerelease = self._create_mock_release("2.0.0-rc1", prerelease=True)
+        update_manager._batched_releases = {
+            ("owner", "repo"): BatchedReleases(stable, prerelease)
+        }
+
+        with patch(
+            "my_unicorn.core.update.ReleaseFetcher"
+        ) as mock_fetcher_cls:
+            for use_prerelease, expected in (
+                (True, prerelease),
+                (False, stable),
+            ):
+                result = await update_manager._fetch_release_data(
+                    owner="owner",
+                    repo="repo",
+                    should_use_prerelease=use_prerelease,
+                    session=AsyncMock(spec=aiohttp.ClientSession),
+                    refresh_cache=False,
+                )
+                assert result == expected
+
+            mock_fetcher_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_release_data_batched_prerelease_fallback(
+        self, update_manager: UpdateManager
+    ) -> None:
+        """A batched repo without prereleases falls back to stable."""
+        stable = self._create_mock_release("1.0.0", prerelease=False)
+        update_manager._batched_releases = {
+            ("owner", "repo"): BatchedReleases(stable, None)
+        }
+
+        result = await update_manager._fetch_release_data(
+            owner="owner",
+            repo="repo",
+            should_use_prerelease=True,
+            session=AsyncMock(spec=aiohttp.ClientSession),
+            refresh_cache=False,
+        )
+
+        assert result == stable
+
+    @pytest.mark.asyncio
+    async def test_prefetch_releases_batches_uncached_apps(
+        self, update_manager: UpdateManager
+    ) -> None:
+        """Uncached apps are resolved in one batch and cached."""
+        stable = self._create_mock_release("1.0.0", prerelease=False)
+        configs = {
+            "cached": {"source": {"owner": "o", "repo": "cached"}},
+            "fresh": {"source": {"owner": "owner", "repo": "repo"}},
+        }
+        update_manager.config_manager.load_app_config.side_effect = configs.get
+        cache = AsyncMock()
+        cache.get_cached_releases.return_value = {
+            ("o", "cached", "stable"): {"version": "1.0.0"}
+        }
+        update_manager.cache_manager = cache
+
+        with (
+            patch(
+                "my_unicorn.core.update.GraphQLReleaseClient"
+            ) as mock_client_cls,
+            patch("my_unicorn.core.update.get_github_config") as mock_github,
+        ):
+            mock_github.side_effect = lambda config: MagicMock(
+                owner=config["source"]["owner"],
+                repo=config["source"]["repo"],
+                prerelease=False,
+            )
+            client = mock_client_cls.return_value
+            client.is_available.return_value = True
+            client.fetch_latest_releases = AsyncMock(
+                return_value={("owner", "repo"): BatchedReleases(stable, None)}
+            )
+
+            await update_manager._prefetch_releases(
+                ["cached", "fresh"], MagicMock(), refresh_cache=False
+            )
+
+        cache.get_cached_releases.assert_awaited_once_with(
+            [("o", "cached", "stable"), ("owner", "repo", "stable")],
+            include_stale=False,
+        )
+        client.fetch_latest_releases.assert_awaited_once_with(
+            [("owner", "repo")]
+        )
+        cache.update_release_data.assert_awaited_once_with(
+            "owner", "repo", stable.to_dict(), cache_type="stable"
+        )
+        assert update_manager._batched_releases[("owner", "repo")].stable
+
+    @pytest.mark.asyncio
+    async def test_prefetch_releases_requires_token(
+        self, update_manager: UpdateManager
+    ) -> None:
+        """Without a token no batched lookup is attempted."""
+        with patch(
+            "my_unicorn.core.update.GraphQLReleaseClient"
+        ) as mock_client_cls:
+            client = mock_client_cls.return_value
+            client.is_available.return_value = False
+            client.fetch_latest_releases = AsyncMock()
+
+            await update_manager._prefetch_releases(
+                ["app"], MagicMock(), refresh_cache=True
+            )
+
+        client.fetch_latest_releases.assert_not_called()
+        assert update_manager._batched_releases == {}
+
+    @pytest.mark.asyncio
+    async def test_check_single_update_marks_stale_results(
+        self, update_manager: UpdateManager
+    ) -> None:
+        """Results served from a stale cache entry are flagged."""
+        release = self._create_mock_release("2.0.0", prerelease=False)
+        update_manager._stale_refresher = MagicMock()
+        update_manager._stale_refresher.is_scheduled.return_value = True
+        app_config = {
+            "source": {"owner": "owner", "repo": "repo"},
+            "state": {"version": "1.0.0"},
+        }
+
+        with (
+            patch.object(
+                update_manager,
+                "_load_app_config_or_fail",
+                return_value=app_config,
+            ),
+            patch("my_unicorn.core.update.get_github_config") as mock_github,
+            patch.object(
+                update_manager,
+                "_fetch_release_data",
+                AsyncMock(return_value=release),
+            ),
+        ):
+            mock_github.return_value = MagicMock(
+                owner="owner", repo="repo", prerelease=False
+            )
+            info = await update_manager.check_single_update("app", MagicMock())
+
+        assert info.has_update
+        assert info.stale
+        update_manager._stale_refresher.is_scheduled.assert_called_once_with(
+            "owner", "repo"
+        )
+
+    @pytest.mark.asyncio
+    async def test_finish_background_refresh_drains_refresher(
+        self, update_manager: UpdateManager
+    ) -> None:
+        """Pending refreshes are awaited once and the refresher dropped."""
+        refresher = MagicMock()
+        refresher.drain = AsyncMock()
+        update_manager._stale_refresher = refresher
+
+        await update_manager.finish_background_refresh()
+        await update_manager.finish_background_refresh()
+
+        refresher.drain.assert_awaited_once()
+        assert update_manager._stale_refresher is None
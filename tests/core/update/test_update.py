@@ -845,7 +845,9 @@ class TestUpdateManager:
 
             # Verify services were created with correct parameters
             mock_download_cls.assert_called_once_with(
-                mock_session, mock_progress
+                mock_session,
+                mock_progress,
+                global_config=update_manager.global_config,
             )
             mock_verify_cls.assert_called_once_with(
                 mock_download,
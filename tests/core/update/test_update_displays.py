@@ -98,6 +98,31 @@ class TestDisplayCheckResults:
                 "  %s: %s → %s", "app1", "1.0.0", "2.0.0"
             )
 
+    def test_display_check_results_marks_stale(self):
+        """Test results answered from an expired cache are marked."""
+        results = {
+            "available_updates": [
+                {
+                    "app_name": "app1",
+                    "current_version": "1.0.0",
+                    "latest_version": "2.0.0",
+                    "stale": True,
+                }
+            ],
+            "stale_apps": ["app1"],
+        }
+
+        with patch("my_unicorn.core.update.logger") as mock_logger:
+            display_check_results(results)
+
+            mock_logger.info.assert_any_call(
+                "  %s: %s → %s (cached)", "app1", "1.0.0", "2.0.0"
+            )
+            mock_logger.info.assert_any_call(
+                "%d result(s) from expired cache, refreshed for the next run",
+                1,
+            )
+
     def test_display_check_results_no_updates(self):
         """Test display_check_results with no updates."""
         results = {"available_updates": []}
@@ -4,6 +4,8 @@ This module tests individual app update orchestration including context
 preparation, download, processing, and error handling.
 """
 
+import asyncio
+import contextlib
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -62,7 +64,7 @@ class TestUpdateSingleApp:
 
         assert success is True
         assert error is None
-        backup_service.create_backup.assert_not_called()
+        backup_service.create_backup_async.assert_not_called()
         post_processor.process.assert_not_called()
 
     @pytest.mark.asyncio
@@ -110,8 +112,8 @@ class TestUpdateSingleApp:
         prepare_func = AsyncMock(return_value=(context, None))
 
         mock_backup_service = MagicMock()
-        mock_backup_service.create_backup.return_value = Path(
-            "/test/backup/app.backup"
+        mock_backup_service.create_backup_async = AsyncMock(
+            return_value=Path("/test/backup/app.backup")
         )
 
         mock_post_processor = AsyncMock()
@@ -143,7 +145,7 @@ class TestUpdateSingleApp:
 
         assert success is True
         assert error is None
-        mock_backup_service.create_backup.assert_called_once()
+        mock_backup_service.create_backup_async.assert_called_once()
         mock_post_processor.process.assert_called_once()
 
     @pytest.mark.asyncio
@@ -362,3 +364,144 @@ class TestUpdateSingleApp:
 
             assert "Update failed" in str(exc_info.value)
             assert exc_info.value.context.get("app_name") == "test-app"
+
+    @staticmethod
+    def _moved_backup_setup(
+        tmp_path: Path,
+        sample_app_config: dict[str, Any],
+        sample_release_data: Release,
+    ) -> tuple[dict[str, Any], dict[str, Any], UpdateInfo, MagicMock]:
+        """Build config, context and a backup service that moves the file."""
+        storage_dir = tmp_path / "storage"
+        storage_dir.mkdir()
+        (storage_dir / "test-app.AppImage").write_text("old")
+        backup_path = tmp_path / "test-app-1.0.0.AppImage"
+        global_config = {
+            "directory": {
+                "storage": storage_dir,
+                "download": tmp_path / "download",
+            },
+            "max_concurrent_downloads": 3,
+        }
+        update_info = UpdateInfo(
+            app_name="test-app",
+            current_version="1.0.0",
+            latest_version="2.0.0",
+            has_update=True,
+            release_url="https://example.com/release",
+            prerelease=False,
+            original_tag_name="v2.0.0",
+            release_data=sample_release_data,
+            app_config=sample_app_config,
+        )
+        context = {
+            "skip": False,
+            "app_config": sample_app_config,
+            "update_info": update_info,
+            "appimage_asset": sample_release_data.assets[0],
+            "catalog_entry": None,
+            "owner": "test-owner",
+            "repo": "test-repo",
+        }
+
+        def move_backup(file_path: Path, *args: Any, **kwargs: Any) -> Path:
+            assert kwargs["replace_source"] is True
+            file_path.rename(backup_path)
+            return backup_path
+
+        mock_backup_service = MagicMock()
+        mock_backup_service.create_backup_async = AsyncMock(
+            side_effect=move_backup
+        )
+        return global_config, context, update_info, mock_backup_service
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "process_outcome",
+        [
+            MagicMock(success=False, error="Processing failed"),
+            asyncio.CancelledError(),
+        ],
+    )
+    async def test_update_single_app_reinstates_moved_backup(
+        self,
+        mock_session: AsyncMock,
+        sample_app_config: dict[str, Any],
+        sample_release_data: Release,
+        tmp_path: Path,
+        process_outcome: Any,
+    ) -> None:
+        """Test a failed or cancelled update puts back the moved AppImage."""
+        global_config, context, update_info, mock_backup_service = (
+            self._moved_backup_setup(
+                tmp_path, sample_app_config, sample_release_data
+            )
+        )
+        mock_download_service = AsyncMock()
+        mock_download_service.download_appimage.return_value = (
+            tmp_path / "download" / "app.AppImage"
+        )
+        mock_download_service.pop_computed_digests = MagicMock(
+            return_value=None
+        )
+        mock_post_processor = AsyncMock()
+        mock_post_processor.prefetch_checksums = MagicMock(return_value=None)
+        if isinstance(process_outcome, BaseException):
+            mock_post_processor.process.side_effect = process_outcome
+        else:
+            mock_post_processor.process.return_value = process_outcome
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await update_single_app(
+                app_name="test-app",
+                session=mock_session,
+                force=False,
+                update_info=update_info,
+                global_config=global_config,
+                prepare_context_func=AsyncMock(return_value=(context, None)),
+                backup_service=mock_backup_service,
+                post_download_processor=mock_post_processor,
+                download_service=mock_download_service,
+            )
+
+        mock_backup_service.reinstate_backup.assert_called_once_with(
+            tmp_path / "test-app-1.0.0.AppImage",
+            tmp_path / "storage" / "test-app.AppImage",
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_single_app_keeps_app_installed_during_download(
+        self,
+        mock_session: AsyncMock,
+        sample_app_config: dict[str, Any],
+        sample_release_data: Release,
+        tmp_path: Path,
+    ) -> None:
+        """Test a cancelled download never moves the installed AppImage."""
+        global_config, context, update_info, mock_backup_service = (
+            self._moved_backup_setup(
+                tmp_path, sample_app_config, sample_release_data
+            )
+        )
+        mock_download_service = AsyncMock()
+        mock_download_service.download_appimage.side_effect = (
+            asyncio.CancelledError()
+        )
+        mock_post_processor = AsyncMock()
+        mock_post_processor.prefetch_checksums = MagicMock(return_value=None)
+
+        with pytest.raises(asyncio.CancelledError):
+            await update_single_app(
+                app_name="test-app",
+                session=mock_session,
+                force=False,
+                update_info=update_info,
+                global_config=global_config,
+                prepare_context_func=AsyncMock(return_value=(context, None)),
+                backup_service=mock_backup_service,
+                post_download_processor=mock_post_processor,
+                download_service=mock_download_service,
+            )
+
+        mock_backup_service.create_backup_async.assert_not_called()
+        assert (tmp_path / "storage" / "test-app.AppImage").exists()
@@ -61,8 +61,8 @@ class TestUpdateSingleAppAdvanced:
 
         prepare_func = AsyncMock(return_value=(context, None))
         mock_backup_service = MagicMock()
-        mock_backup_service.create_backup.return_value = Path(
-            "/test/backup/app.backup"
+        mock_backup_service.create_backup_async = AsyncMock(
+            return_value=Path("/test/backup/app.backup")
         )
         mock_post_processor = AsyncMock()
         mock_post_processor.process.return_value = MagicMock(success=True)
@@ -91,7 +91,7 @@ class TestUpdateSingleAppAdvanced:
                     post_download_processor=mock_post_processor,
                 )
 
-        call_args = mock_backup_service.create_backup.call_args
+        call_args = mock_backup_service.create_backup_async.call_args
         assert call_args[0][1] == "test-app"
         assert call_args[0][2] == "1.0.0"
 
@@ -1,6 +1,7 @@
 """Tests for checksum file detection and parsing functions.
 
 Functions tested:
+- ChecksumManifest
 - find_checksum_entry
 - parse_checksum_file
 - parse_all_checksums
@@ -12,9 +13,11 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import yaml
 
 from my_unicorn.core.checksum_parser import (
     ChecksumFileResult,
+    ChecksumManifest,
     _is_likely_base64,
     _is_likely_hex,
     _normalize_hash_value,
@@ -442,6 +445,114 @@ xyz_not_hex_at_all another.AppImage"""
         assert hashes == {}
 
 
+class TestChecksumManifest:
+    """Tests for the parse-once checksum manifest."""
+
+    def test_manifest_serves_lookups_and_cache(self) -> None:
+        """One manifest answers lookups and holds all hashes for the cache."""
+        manifest = ChecksumManifest.parse(SIYUAN_SHA256SUMS_CONTENT)
+
+        entry = manifest.find("siyuan-3.2.1-linux.AppImage", "sha256")
+        assert entry is not None
+        assert entry.hash_value == SIYUAN_EXPECTED_HEX
+        assert manifest.find("missing.AppImage", "sha256") is None
+        assert manifest.hashes == parse_all_checksums(
+            SIYUAN_SHA256SUMS_CONTENT
+        )
+
+    def test_manifest_returns_first_matching_line(self) -> None:
+        """Relaxed and path matches keep the order of the checksum file."""
+        first = SIYUAN_EXPECTED_HEX
+        second = "b" * 64
+        content = (
+            f"{first}  app-1-x86_64.AppImage\n"
+            f"{second}  app-x86_64.AppImage\n"
+            f"{second}  build/tool.AppImage\n"
+        )
+        manifest = ChecksumManifest.parse(content)
+
+        entry = manifest.find("app-x86_64.AppImage", "sha256")
+        assert entry is not None
+        assert entry.hash_value == first
+        entry = manifest.find("tool.AppImage", "sha256")
+        assert entry is not None
+        assert entry.hash_value == second
+
+    def test_manifest_loads_yaml_once(self) -> None:
+        """YAML content is loaded once for every lookup and the cache."""
+        with patch(
+            "my_unicorn.core.checksum_parser.yaml.safe_load",
+            wraps=yaml.safe_load,
+        ) as safe_load:
+            manifest = ChecksumManifest.parse(LEGCORD_YAML_CONTENT)
+            entry = manifest.find("Legcord-1.1.5-linux-x86_64.AppImage")
+            _ = manifest.hashes
+
+        assert safe_load.call_count == 1
+        assert manifest.format_type == "yaml"
+        assert entry is not None
+        assert entry.algorithm == "sha512"
+
+    @pytest.mark.parametrize(
+        ("filename", "content", "target"),
+        [
+            (
+                "SHA256SUMS",
+                SIYUAN_SHA256SUMS_CONTENT,
+                "siyuan-3.2.1-linux.AppImage",
+            ),
+            (
+                "latest-linux.yml",
+                LEGCORD_YAML_CONTENT,
+                "Legcord-1.1.5-linux-x86_64.AppImage",
+            ),
+            (
+                "SHA256SUMS",
+                f"SHA256 (test.AppImage) = {SIYUAN_EXPECTED_HEX}",
+                "test.AppImage",
+            ),
+        ],
+    )
+    def test_manifest_from_cache_matches_parsed(
+        self, filename: str, content: str, target: str
+    ) -> None:
+        """A manifest rebuilt from the cache answers like the parsed file."""
+        parsed = ChecksumManifest.parse(content)
+        cache_dict = ChecksumFileResult(
+            source=f"https://example.com/{filename}",
+            filename=filename,
+            algorithm="SHA256",
+            hashes=parsed.hashes,
+            format_type=parsed.format_type,
+        ).to_cache_dict()
+        cached = ChecksumManifest.from_cache(cache_dict)
+
+        assert cached.cached is True
+        assert parsed.cached is False
+        assert cached.format_type == parsed.format_type
+        assert cached.find(target) == parsed.find(target)
+        assert cached.find("missing.AppImage") is None
+
+    @pytest.mark.parametrize("format_type", ["bsd", None])
+    def test_manifest_from_cache_matches_exact_names(
+        self, format_type: str | None
+    ) -> None:
+        """Cached non-traditional entries never match filename variants."""
+        file_data = {
+            "filename": "SHA256SUMS",
+            "hashes": {"app-1.0-x86_64.AppImage": SIYUAN_EXPECTED_HEX},
+        }
+        if format_type:
+            file_data["format_type"] = format_type
+
+        manifest = ChecksumManifest.from_cache(file_data)
+
+        assert manifest.find("app-2.0-x86_64.AppImage") is None
+        entry = manifest.find("app-1.0-x86_64.AppImage")
+        assert entry is not None
+        assert entry.hash_value == SIYUAN_EXPECTED_HEX
+
+
 class TestIsLikelyHex:
     """Tests for _is_likely_hex() encoding detection."""
 
@@ -721,6 +832,7 @@ class TestChecksumFileResult:
         assert cache_dict["filename"] == result.filename
         assert cache_dict["algorithm"] == result.algorithm
         assert cache_dict["hashes"] == result.hashes
+        assert "format_type" not in cache_dict
 
     def test_frozen_dataclass(self) -> None:
         """Test that ChecksumFileResult is immutable."""
@@ -0,0 +1,130 @@
+"""Tests for prefetching checksum files during AppImage downloads."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from my_unicorn.core.api import Asset
+from my_unicorn.core.checksum_parser import ChecksumManifest
+from my_unicorn.core.checksum_prefetch import prefetch_checksum_file
+from my_unicorn.core.verify import VerificationService
+
+# Checksum of the "test content" file created by the test_file_path fixture
+LEGCORD_YAML_CONTENT = (
+    "version: 1.1.5\n"
+    "path: test.AppImage\n"
+    "sha512: DL9MrvOAR7upok5iGpYUhOXSqSF2qFnn6yffND3TTrmNU4psX02hzjAuwlC4"
+    "IcwAHkbMl6cEmIKXGFpN9+mWAg=="
+)
+
+
+class TestChecksumPrefetch:
+    """Tests for checksum files fetched before verification starts."""
+
+    @pytest.mark.asyncio
+    async def test_verify_file_uses_prefetched_checksum_file(
+        self,
+        verification_service: VerificationService,
+        test_file_path: Path,
+        sample_assets: list[Asset],
+    ) -> None:
+        """A checksum file fetched during the download is not fetched again."""
+        asset = Asset(
+            name="test.AppImage",
+            size=12,
+            browser_download_url=(
+                "https://github.com/Legcord/Legcord/releases/download/"
+                "v1.1.5/test.AppImage"
+            ),
+            digest="",
+        )
+        download = AsyncMock(return_value=LEGCORD_YAML_CONTENT)
+        verification_service.download_service.download_checksum_file = (  # type: ignore[method-assign]
+            download
+        )
+
+        prefetch = prefetch_checksum_file(
+            verification_service,
+            asset,
+            {},
+            owner="Legcord",
+            repo="Legcord",
+            tag_name="v1.1.5",
+            assets=sample_assets,
+        )
+        assert prefetch is not None
+        result = await verification_service.verify_file(
+            file_path=test_file_path,
+            asset=asset,
+            config={},
+            owner="Legcord",
+            repo="Legcord",
+            tag_name="v1.1.5",
+            app_name="test.AppImage",
+            assets=sample_assets,
+            checksum_prefetch=prefetch,
+        )
+        prefetch.close()
+
+        assert result.methods["checksum_file"]["passed"] is True
+        download.assert_awaited_once_with(prefetch.checksum_file.url)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_uses_cached_checksum_file(
+        self,
+        mock_download_service: MagicMock,
+        test_file_path: Path,
+        sample_assets: list[Asset],
+    ) -> None:
+        """Cached checksum files are verified against without a download."""
+        asset = Asset(
+            name="test.AppImage",
+            size=12,
+            browser_download_url=(
+                "https://github.com/Legcord/Legcord/releases/download/"
+                "v1.1.5/test.AppImage"
+            ),
+            digest="",
+        )
+        cache_manager = MagicMock()
+        cache_manager.get_checksum_file = AsyncMock(
+            return_value={
+                "source": sample_assets[1].browser_download_url,
+                "filename": "latest-linux.yml",
+                "algorithm": "SHA512",
+                "hashes": ChecksumManifest.parse(LEGCORD_YAML_CONTENT).hashes,
+            }
+        )
+        cache_manager.store_checksum_file = AsyncMock()
+        mock_download_service.download_checksum_file = AsyncMock()
+        service = VerificationService(
+            mock_download_service, cache_manager=cache_manager
+        )
+
+        prefetch = prefetch_checksum_file(
+            service,
+            asset,
+            {},
+            owner="Legcord",
+            repo="Legcord",
+            tag_name="v1.1.5",
+            assets=sample_assets,
+        )
+        assert prefetch is not None
+        result = await service.verify_file(
+            file_path=test_file_path,
+            asset=asset,
+            config={},
+            owner="Legcord",
+            repo="Legcord",
+            tag_name="v1.1.5",
+            app_name="test.AppImage",
+            assets=sample_assets,
+            checksum_prefetch=prefetch,
+        )
+        prefetch.close()
+
+        assert result.methods["checksum_file"]["passed"] is True
+        mock_download_service.download_checksum_file.assert_not_awaited()
+        cache_manager.store_checksum_file.assert_not_awaited()
@@ -173,6 +173,40 @@ class TestVerificationServiceOrchestration:
         assert result.passed is True
         assert "digest" in result.methods
 
+    @pytest.mark.asyncio
+    async def test_verify_file_uses_precomputed_hashes(
+        self,
+        verification_service: VerificationService,
+        test_file_path: Path,
+    ) -> None:
+        """Digests computed during download are compared directly."""
+        correct_hash = hashlib.sha256(b"test content").hexdigest()
+        asset = Asset(
+            name="test.AppImage",
+            size=12,
+            browser_download_url=(
+                "https://github.com/test/repo/releases/download/v1.0.0/"
+                "test.AppImage"
+            ),
+            digest=f"sha256:{correct_hash}",
+        )
+        # Corrupt the file on disk: the streamed digest must be used.
+        test_file_path.write_bytes(b"tampered")
+
+        result = await verification_service.verify_file(
+            file_path=test_file_path,
+            asset=asset,
+            config={"skip": False},
+            owner="test",
+            repo="repo",
+            tag_name="v1.0.0",
+            app_name="test.AppImage",
+            precomputed_hashes={"sha256": correct_hash},
+        )
+
+        assert result.passed is True
+        assert result.methods["digest"]["computed_hash"] == correct_hash
+
 
 class TestVerificationServiceProtocolUsage:
     """Tests for VerificationService protocol compliance."""
@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from my_unicorn.core.api import Asset
+from my_unicorn.core.checksum_parser import ChecksumManifest
 from my_unicorn.core.verify import (
     VerificationContext,
     cache_checksum_file_data,
@@ -421,7 +422,24 @@ class TestCacheChecksumFileData:
 
             mock_cache_manager.store_checksum_file.assert_not_called()
 
-        # Scenario 5: Cache error is handled gracefully
+        # Scenario 5: A parsed manifest is stored without parsing again
+        mock_cache_manager.reset_mock()
+        manifest = ChecksumManifest.parse(f"{'a' * 64}  test.AppImage")
+
+        with patch("my_unicorn.core.verify.parse_all_checksums") as mock_parse:
+            await cache_checksum_file_data(
+                manifest,
+                checksum_file,
+                "sha256",
+                mock_cache_manager,
+                context,
+            )
+
+            mock_parse.assert_not_called()
+            stored = mock_cache_manager.store_checksum_file.call_args.args[3]
+            assert stored["hashes"] == {"test.AppImage": "a" * 64}
+
+        # Scenario 6: Cache error is handled gracefully
         mock_cache_manager.store_checksum_file = AsyncMock(
             side_effect=Exception("Cache write error")
         )
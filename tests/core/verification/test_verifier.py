@@ -2,10 +2,11 @@
 
 import hashlib
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from my_unicorn.core.hashing import run_in_hash_executor
 from my_unicorn.core.verify import VerificationConfig, Verifier
 
 
@@ -119,6 +120,60 @@ async def test_verify_from_checksum_file_not_found(tmp_path: Path) -> None:
         )
 
 
+def test_compute_hash_uses_precomputed_digest(tmp_path: Path) -> None:
+    """Digests computed during download are used without reading the file."""
+    file = tmp_path / "file.bin"
+    file.write_bytes(b"test")
+    verifier = Verifier(file, {"sha256": "ABCDEF"})
+    verifier._compute_hash_sync = MagicMock()  # type: ignore[method-assign]
+
+    assert verifier.compute_hash("sha256") == "abcdef"
+    verifier._compute_hash_sync.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_compute_hash_async_uses_precomputed_digest(
+    tmp_path: Path,
+) -> None:
+    """Async hashing also prefers digests computed during download."""
+    data = b"test"
+    file = tmp_path / "file.bin"
+    file.write_bytes(data)
+    digest = hashlib.sha512(data).hexdigest()
+    verifier = Verifier(file, {"sha512": digest})
+    file.unlink()
+
+    assert await verifier.compute_hash_async("sha512") == digest
+
+
+def test_compute_hash_falls_back_without_precomputed(tmp_path: Path) -> None:
+    """Algorithms missing from the precomputed digests read the file."""
+    file = tmp_path / "file.bin"
+    data = b"test"
+    file.write_bytes(data)
+    verifier = Verifier(file, {"sha512": "unused"})
+
+    assert verifier.compute_hash("sha256") == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_compute_hash_async_small_file_off_loop(tmp_path: Path) -> None:
+    """Small files are hashed on the hashing thread pool as well."""
+    file = tmp_path / "file.bin"
+    data = b"small"
+    file.write_bytes(data)
+    verifier = Verifier(file)
+
+    with patch(
+        "my_unicorn.core.verify.run_in_hash_executor",
+        wraps=run_in_hash_executor,
+    ) as mock_run:
+        digest = await verifier.compute_hash_async("sha256")
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    mock_run.assert_awaited_once()
+
+
 def test_verification_config_init_and_from_dict() -> None:
     """Configuration model stores provided fields."""
     config = VerificationConfig(
@@ -741,9 +741,11 @@ class TestFullWorkflowCacheValidation:
             "test-owner", "test-app", release_data
         )
 
-        # Load cache file directly
-        cache_file = tmp_cache_dir / "test-owner_test-app.json"
-        cache_content = orjson.loads(cache_file.read_bytes())
+        # Load the stored entry directly
+        cache_content = cache_manager._read_cache_entry(
+            "test-owner", "test-app", "stable"
+        )
+        assert cache_content is not None
 
         # Validate against schema
         validate_cache_release(cache_content)
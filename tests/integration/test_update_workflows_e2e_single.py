@@ -140,6 +140,7 @@ async def test_update_single_app_full_workflow_success(
             "my_unicorn.core.update.DownloadService"
         ) as mock_download_cls:
             mock_download = AsyncMock()
+            mock_download.pop_computed_digests = MagicMock(return_value=None)
 
             async def mock_download_side_effect(asset, download_path):
                 download_path.parent.mkdir(parents=True, exist_ok=True)
@@ -210,6 +211,7 @@ async def test_update_single_app_verification_failure(
             "my_unicorn.core.update.DownloadService"
         ) as mock_download_cls:
             mock_download = AsyncMock()
+            mock_download.pop_computed_digests = MagicMock(return_value=None)
 
             async def mock_download_side_effect(asset, download_path):
                 download_path.parent.mkdir(parents=True, exist_ok=True)
@@ -291,6 +293,7 @@ async def test_force_update_already_uptodate(
             "my_unicorn.core.update.DownloadService"
         ) as mock_download_cls:
             mock_download = AsyncMock()
+            mock_download.pop_computed_digests = MagicMock(return_value=None)
 
             async def mock_download_side_effect(asset, download_path):
                 download_path.parent.mkdir(parents=True, exist_ok=True)
@@ -360,6 +363,7 @@ async def test_cache_refresh_workflow(
             "my_unicorn.core.update.DownloadService"
         ) as mock_download_cls:
             mock_download = AsyncMock()
+            mock_download.pop_computed_digests = MagicMock(return_value=None)
 
             async def mock_download_side_effect(asset, download_path):
                 download_path.parent.mkdir(parents=True, exist_ok=True)
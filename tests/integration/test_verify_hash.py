@@ -139,7 +139,7 @@ def _yaml_checksum_content(sha512_b64: str) -> str:
     """Return an electron-builder ``latest-linux.yml``-style YAML file.
 
     The ``files`` list format matches what electron-builder actually produces,
-    which is what ``YAMLChecksumParser`` expects.
+    which is what ``ChecksumManifest`` indexes.
 
     Args:
         sha512_b64: Base64-encoded SHA512 hash to embed.
@@ -1,5 +1,6 @@
 """Tests for the async-safe logger module with QueueHandler architecture."""
 
+import io
 import logging
 from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
@@ -13,6 +14,7 @@ from my_unicorn.logger import (
     clear_logger_state,
     flush_all_handlers,
     get_logger,
+    set_console_stream,
     setup_logging,
 )
 
@@ -63,6 +65,18 @@ def test_console_handler_has_color_formatter():
     assert isinstance(console_handlers[0].formatter, HybridConsoleFormatter)
 
 
+def test_set_console_stream_redirects_console_output():
+    """Test console records go to the stream set by set_console_stream."""
+    logger = get_logger("my_unicorn.stream_test", enable_file_logging=False)
+    stream = io.StringIO()
+
+    set_console_stream(stream)
+    logger.warning("redirected warning")
+    flush_all_handlers()
+
+    assert "redirected warning" in stream.getvalue()
+
+
 def test_child_logger_propagates_to_root():
     """Test child loggers propagate to root logger with QueueHandler."""
     # Get root logger
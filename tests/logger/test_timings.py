@@ -0,0 +1,87 @@
+"""Tests for the timing spans behind --timings."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from my_unicorn.logger import (
+    disable_timings,
+    enable_timings,
+    format_timing_report,
+    timing_report,
+    timing_span,
+    timings_enabled,
+    write_timing_report,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_timings():
+    """Disable timings before and after each test."""
+    disable_timings()
+    yield
+    disable_timings()
+
+
+def test_spans_are_not_recorded_when_disabled():
+    """Spans are no-ops until timings are enabled."""
+    with timing_span("download", app="obsidian"):
+        pass
+
+    assert not timings_enabled()
+    assert timing_report()["phases"] == {}
+
+
+def test_spans_are_grouped_by_phase_and_app():
+    """Nested spans inherit the app of the enclosing span."""
+    enable_timings()
+
+    with timing_span("update", app="obsidian"):
+        with timing_span("download"):
+            pass
+        with timing_span("hash"):
+            pass
+    with timing_span("config"):
+        pass
+
+    report = timing_report()
+    assert report["phases"]["hash"]["count"] == 1
+    assert set(report["phases"]) == {"update", "download", "hash", "config"}
+    assert set(report["apps"]) == {"obsidian"}
+    assert set(report["apps"]["obsidian"]) == {"update", "download", "hash"}
+
+
+async def test_async_tasks_keep_their_own_app():
+    """Concurrent tasks attribute their spans to their own app."""
+    enable_timings()
+
+    async def work(app: str) -> None:
+        async with timing_span("update", app=app):
+            await asyncio.sleep(0)
+            async with timing_span("api"):
+                await asyncio.sleep(0)
+
+    await asyncio.gather(work("joplin"), work("obsidian"))
+
+    report = timing_report()
+    assert report["phases"]["api"]["count"] == 2
+    assert set(report["apps"]) == {"joplin", "obsidian"}
+    for phases in report["apps"].values():
+        assert set(phases) == {"update", "api"}
+
+
+def test_report_is_formatted_and_written(tmp_path):
+    """The report renders as a table and round-trips through JSON."""
+    enable_timings()
+    with timing_span("icon", app="obsidian"):
+        pass
+
+    report = timing_report()
+    table = format_timing_report(report)
+    assert "icon" in table
+    assert "obsidian" in table
+
+    path = tmp_path / "timings" / "run.json"
+    write_timing_report(report, path)
+    assert orjson.loads(path.read_bytes()) == report
@@ -505,3 +505,33 @@ class TestDownloadServiceHelperMethods:
         # Verify file was created with all chunks
         assert dest.exists()
         assert dest.read_bytes() == b"chunk1chunk2chunk3"
+
+    def test_network_config_loaded_once(self, download_service, monkeypatch):
+        """Network settings are read once per service, not per request."""
+        load_global_config = Mock(
+            return_value={"network": {"retry_attempts": "5"}}
+        )
+        monkeypatch.setattr(
+            "my_unicorn.core.download.ConfigManager",
+            lambda: Mock(load_global_config=load_global_config),
+        )
+        service = DownloadService(download_service.session)
+
+        for _ in range(3):
+            assert service._get_network_config()[0] == 5
+        load_global_config.assert_called_once()
+
+    def test_injected_global_config_is_used(self, mock_session, monkeypatch):
+        """An injected global config avoids loading the settings file."""
+        monkeypatch.setattr(
+            "my_unicorn.core.download.ConfigManager",
+            Mock(side_effect=AssertionError("config loaded")),
+        )
+        service = DownloadService(
+            mock_session,
+            global_config={"network": {"retry_attempts": 2}},  # type: ignore[typeddict-item]
+        )
+
+        retry_attempts, timeout = service._get_network_config()
+        assert retry_attempts == 2
+        assert timeout.sock_connect == 10